@@ -0,0 +1,50 @@
+"""Add binary payload and delta chain columns to credit snapshots.
+
+Revision ID: 051_add_credit_snapshots_v2_columns
+Revises: 050_add_cognitive_assessment_tables
+Create Date: 2026-10-16 09:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "051_add_credit_snapshots_v2_columns"
+down_revision: Union[str, None] = "050_add_cognitive_assessment_tables"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+_COLUMNS = (
+    # Existing rows are v1 (JSONB state_data, no chain)
+    ("format_version", "INTEGER NOT NULL DEFAULT 1"),
+    ("compression", "VARCHAR(16)"),
+    ("payload", "BYTEA"),
+    ("raw_size_bytes", "BIGINT"),
+    ("base_snapshot_id", "VARCHAR(36)"),
+    ("parent_snapshot_id", "VARCHAR(36)"),
+    ("chain_length", "INTEGER NOT NULL DEFAULT 0"),
+    ("checksum", "VARCHAR(64)"),
+)
+
+
+def upgrade() -> None:
+    for name, definition in _COLUMNS:
+        op.execute(f"ALTER TABLE IF EXISTS credit_snapshots ADD COLUMN IF NOT EXISTS {name} {definition}")
+    # v2 snapshots store the binary payload instead of JSONB state
+    op.execute("ALTER TABLE IF EXISTS credit_snapshots ALTER COLUMN state_data DROP NOT NULL")
+    # Chain resolution: base snapshot plus its deltas
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_credit_snapshots_base_snapshot_id "
+        "ON credit_snapshots (base_snapshot_id)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_credit_snapshots_base_snapshot_id")
+    # v2 rows have no JSONB state; snapshots are rebuilt from the event journal
+    op.execute("DELETE FROM credit_snapshots WHERE state_data IS NULL")
+    op.execute("ALTER TABLE IF EXISTS credit_snapshots ALTER COLUMN state_data SET NOT NULL")
+    for name, _ in reversed(_COLUMNS):
+        op.execute(f"ALTER TABLE IF EXISTS credit_snapshots DROP COLUMN IF EXISTS {name}")
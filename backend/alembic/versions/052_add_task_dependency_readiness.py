@@ -0,0 +1,48 @@
+"""Add remaining-dependency counter and reverse dependency index to tasks.
+
+Revision ID: 052_add_task_dependency_readiness
+Revises: 051_add_credit_snapshots_v2_columns
+Create Date: 2026-10-16 10:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "052_add_task_dependency_readiness"
+down_revision: Union[str, None] = "051_add_credit_snapshots_v2_columns"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE IF EXISTS tasks ADD COLUMN IF NOT EXISTS remaining_dependencies INTEGER NOT NULL DEFAULT 0"
+    )
+    # Backfill: count dependencies that have not completed yet
+    op.execute(
+        """
+        UPDATE tasks t SET remaining_dependencies = (
+            SELECT COUNT(*) FROM tasks d
+            WHERE t.depends_on ? d.task_id
+            AND d.status <> 'completed'
+        )
+        WHERE jsonb_array_length(t.depends_on) > 0
+        """
+    )
+    # Reverse dependency lookup (depends_on ? :task_id)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_tasks_depends_on ON tasks USING GIN (depends_on)"
+    )
+    # Claim path: ready tasks by priority, FIFO
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_tasks_ready_priority_created ON tasks (priority DESC, created_at) "
+        "WHERE remaining_dependencies = 0 AND status IN ('pending', 'scheduled')"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_tasks_ready_priority_created")
+    op.execute("DROP INDEX IF EXISTS idx_tasks_depends_on")
+    op.execute("ALTER TABLE IF EXISTS tasks DROP COLUMN IF EXISTS remaining_dependencies")
@@ -0,0 +1,28 @@
+"""Add full-text search index over memory content and summary.
+
+Revision ID: 053_add_memory_full_text_index
+Revises: 052_add_task_dependency_readiness
+Create Date: 2026-10-16 18:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "053_add_memory_full_text_index"
+down_revision: Union[str, None] = "052_add_task_dependency_readiness"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Must match memory_search_document() exactly for keyword_search to use it
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_memory_entries_search ON memory_entries USING GIN "
+        "(to_tsvector('simple'::regconfig, (coalesce(content, '') || ' ') || coalesce(summary, '')))"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_memory_entries_search")
@@ -0,0 +1,37 @@
+"""Add arrival rate and in-flight tasks to cluster metrics.
+
+Revision ID: 054_add_cluster_metrics_arrival_rate
+Revises: 053_add_memory_full_text_index
+Create Date: 2026-10-16 20:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "054_add_cluster_metrics_arrival_rate"
+down_revision: Union[str, None] = "053_add_memory_full_text_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Tasks enqueued per minute; NULL until the collector has two snapshots
+    op.execute(
+        "ALTER TABLE IF EXISTS cluster_metrics ADD COLUMN IF NOT EXISTS arrival_rate DOUBLE PRECISION"
+    )
+    op.execute(
+        "ALTER TABLE IF EXISTS cluster_metrics ADD COLUMN IF NOT EXISTS tasks_in_flight INTEGER DEFAULT 0"
+    )
+    # Autoscaler window: latest N rows per cluster
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_cluster_metrics_cluster_timestamp "
+        "ON cluster_metrics (cluster_id, timestamp DESC)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS idx_cluster_metrics_cluster_timestamp")
+    op.execute("ALTER TABLE IF EXISTS cluster_metrics DROP COLUMN IF EXISTS tasks_in_flight")
+    op.execute("ALTER TABLE IF EXISTS cluster_metrics DROP COLUMN IF EXISTS arrival_rate")
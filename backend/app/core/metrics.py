@@ -301,6 +301,48 @@ neurorail_tt_first_signal_ms = Histogram(
 )
 
 
+# ============================================================================
+# LLM Router Metrics
+# ============================================================================
+
+llm_streams_total = Counter(
+    "llm_streams_total",
+    "Total streamed LLM responses",
+    ["provider", "status"]
+)
+
+llm_time_to_first_token_ms = Histogram(
+    "llm_time_to_first_token_ms",
+    "Time from request to first streamed token in milliseconds",
+    ["provider"],
+    buckets=[50, 100, 250, 500, 1000, 2000, 5000, 10000, 30000]
+)
+
+llm_stream_tokens_per_second = Histogram(
+    "llm_stream_tokens_per_second",
+    "Completion tokens per second after the first token",
+    ["provider"],
+    buckets=[1, 5, 10, 20, 40, 80, 160, 320]
+)
+
+llm_cache_requests_total = Counter(
+    "llm_cache_requests_total",
+    "LLM response cache lookups",
+    ["result"]
+)
+
+llm_cache_latency_saved_ms_total = Counter(
+    "llm_cache_latency_saved_ms_total",
+    "Upstream latency avoided by cache hits and coalesced requests in milliseconds"
+)
+
+llm_hedged_requests_total = Counter(
+    "llm_hedged_requests_total",
+    "LLM requests that started a backup provider after the primary's p95 latency",
+    ["provider", "winner"]
+)
+
+
 # ============================================================================
 # Utility Functions
 # ============================================================================
@@ -499,3 +541,54 @@ def record_neurorail_ttfs(job_type: str, ttfs_ms: float):
         ttfs_ms: Time to first signal in milliseconds
     """
     neurorail_tt_first_signal_ms.labels(job_type=job_type).observe(ttfs_ms)
+
+
+# ============================================================================
+# LLM Router Utility Functions
+# ============================================================================
+
+def record_llm_stream(
+    provider: str,
+    success: bool,
+    ttft_ms: Optional[float] = None,
+    tokens_per_second: Optional[float] = None
+):
+    """
+    Record a streamed LLM response.
+
+    Args:
+        provider: ollama, openrouter, openai, ...
+        success: Whether the stream completed
+        ttft_ms: Time to first token in milliseconds (if any token arrived)
+        tokens_per_second: Decode throughput (if measurable)
+    """
+    status = "success" if success else "failure"
+    llm_streams_total.labels(provider=provider, status=status).inc()
+    if ttft_ms is not None:
+        llm_time_to_first_token_ms.labels(provider=provider).observe(ttft_ms)
+    if tokens_per_second is not None:
+        llm_stream_tokens_per_second.labels(provider=provider).observe(tokens_per_second)
+
+
+def record_llm_cache(result: str, latency_saved_ms: float = 0.0):
+    """
+    Record an LLM response cache lookup.
+
+    Args:
+        result: hit, coalesced, or miss
+        latency_saved_ms: Upstream latency the lookup avoided
+    """
+    llm_cache_requests_total.labels(result=result).inc()
+    if latency_saved_ms > 0:
+        llm_cache_latency_saved_ms_total.inc(latency_saved_ms)
+
+
+def record_llm_hedge(provider: str, winner: str):
+    """
+    Record a hedged LLM request.
+
+    Args:
+        provider: Primary provider that exceeded its p95 latency
+        winner: primary, backup, or none (both failed)
+    """
+    llm_hedged_requests_total.labels(provider=provider, winner=winner).inc()
@@ -2,14 +2,29 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import os
 import re
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Pattern, Tuple
 
 from app.modules.telemetry.anonymization import AnonymizationService
 
 from .provider_selector import SanitizationLevel
 
+# Category order is match priority for matches starting at the same position
+_STRICT_CATEGORIES = ("email", "phone", "ip", "card", "path", "secret")
+_MODERATE_CATEGORIES = ("email", "phone", "ip", "secret")
+
+_PLACEHOLDER_PATTERN = re.compile(r"\[(?:%s)_\d+\]" % "|".join(c.upper() for c in _STRICT_CATEGORIES))
+
+# Scan result of one text: literal parts around the matches, and the matches
+# as (category, original); len(parts) == len(matches) + 1
+_Scan = Tuple[Tuple[str, ...], Tuple[Tuple[str, str], ...]]
+
 
 @dataclass
 class SanitizationMapping:
@@ -20,12 +35,22 @@ class SanitizationMapping:
 
 
 class DataSanitizer:
-    """Sanitizes outgoing messages and restores placeholders in responses."""
+    """Sanitizes outgoing messages and restores placeholders in responses.
+
+    Each text is scanned once with a combined pattern of all categories of
+    the level. Scans are cached by content hash, so the unchanged history of
+    a conversation is not rescanned on every turn; placeholders are numbered
+    when rendering, so cached scans yield the same numbering as fresh ones.
+    """
 
     _PATH_PATTERN = re.compile(r"(?:[A-Za-z]:\\[^\s\"'`]+|/(?:[\w.-]+/)+[\w.-]+)")
     _API_KEY_PATTERN = re.compile(r"\b(?:api[-_]?key\s*[:=]\s*)?([A-Za-z0-9_-]{24,}|api-[A-Za-z0-9_-]{10,})\b")
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        cache_chars: Optional[int] = None,
+        offload_chars: Optional[int] = None,
+    ) -> None:
         self._base_patterns = {
             "email": AnonymizationService.PII_PATTERNS["email"],
             "phone": AnonymizationService.PII_PATTERNS["phone"],
@@ -34,6 +59,29 @@ class DataSanitizer:
             "path": self._PATH_PATTERN,
             "secret": self._API_KEY_PATTERN,
         }
+        self._combined = {
+            SanitizationLevel.STRICT: self._combine(_STRICT_CATEGORIES),
+            SanitizationLevel.MODERATE: self._combine(_MODERATE_CATEGORIES),
+        }
+        # Scan cache, bounded by the total length of the cached texts
+        self._cache: "OrderedDict[Tuple[str, bytes], _Scan]" = OrderedDict()
+        self._cache_sizes: Dict[Tuple[str, bytes], int] = {}
+        self._cached_chars = 0
+        self._cache_lock = threading.Lock()
+        self.cache_chars = cache_chars if cache_chars is not None else int(
+            os.getenv("AXE_SANITIZER_CACHE_CHARS", "8000000")
+        )
+        # Payloads at least this long are processed off the event loop
+        self.offload_chars = offload_chars if offload_chars is not None else int(
+            os.getenv("AXE_SANITIZER_OFFLOAD_CHARS", "200000")
+        )
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _combine(self, categories: Tuple[str, ...]) -> Pattern[str]:
+        return re.compile(
+            "|".join(f"(?P<{category}>{self._base_patterns[category].pattern})" for category in categories)
+        )
 
     def sanitize_messages(
         self,
@@ -56,14 +104,33 @@ class DataSanitizer:
 
         return sanitized_messages, mapping
 
+    async def sanitize_messages_async(
+        self,
+        messages: List[Dict[str, Any]],
+        level: SanitizationLevel,
+    ) -> Tuple[List[Dict[str, Any]], SanitizationMapping]:
+        """sanitize_messages, in a worker thread for large payloads."""
+        size = sum(len(m["content"]) for m in messages if isinstance(m.get("content"), str))
+        if level != SanitizationLevel.NONE and size >= self.offload_chars:
+            return await asyncio.to_thread(self.sanitize_messages, messages, level)
+        return self.sanitize_messages(messages, level)
+
     def deanonymize_text(self, text: str, mapping: SanitizationMapping) -> str:
         if not text or not mapping.replacements:
             return text
 
-        restored = text
-        for placeholder in sorted(mapping.replacements, key=len, reverse=True):
-            restored = restored.replace(placeholder, mapping.replacements[placeholder])
-        return restored
+        replacements = mapping.replacements
+        pattern = _PLACEHOLDER_PATTERN
+        if not all(_PLACEHOLDER_PATTERN.fullmatch(placeholder) for placeholder in replacements):
+            # Foreign placeholder format: longest first, like sequential replacement
+            pattern = re.compile("|".join(map(re.escape, sorted(replacements, key=len, reverse=True))))
+        return pattern.sub(lambda match: replacements.get(match.group(0), match.group(0)), text)
+
+    async def deanonymize_text_async(self, text: str, mapping: SanitizationMapping) -> str:
+        """deanonymize_text, in a worker thread for large responses."""
+        if text and mapping.replacements and len(text) >= self.offload_chars:
+            return await asyncio.to_thread(self.deanonymize_text, text, mapping)
+        return self.deanonymize_text(text, mapping)
 
     def _sanitize_text(
         self,
@@ -72,22 +139,46 @@ class DataSanitizer:
         counters: Dict[str, int],
         level: SanitizationLevel,
     ) -> str:
-        sanitized = text
-
-        categories = ["email", "phone", "ip", "card", "path", "secret"]
-        if level == SanitizationLevel.MODERATE:
-            categories = ["email", "phone", "ip", "secret"]
-
-        for category in categories:
-            pattern = self._base_patterns[category]
-
-            def _replace(match: re.Match[str]) -> str:
-                original = match.group(0)
-                counters[category] += 1
-                placeholder = f"[{category.upper()}_{counters[category]}]"
-                mapping.remember(placeholder, original)
-                return placeholder
-
-            sanitized = pattern.sub(_replace, sanitized)
+        parts, matches = self._scan(text, level)
+        if not matches:
+            return text
 
-        return sanitized
+        pieces = [parts[0]]
+        for (category, original), part in zip(matches, parts[1:]):
+            counters[category] += 1
+            placeholder = f"[{category.upper()}_{counters[category]}]"
+            mapping.remember(placeholder, original)
+            pieces.append(placeholder)
+            pieces.append(part)
+        return "".join(pieces)
+
+    def _scan(self, text: str, level: SanitizationLevel) -> _Scan:
+        key = (level.value, hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest())
+        with self._cache_lock:
+            scan = self._cache.get(key)
+            if scan is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return scan
+            self.cache_misses += 1
+
+        parts: List[str] = []
+        matches: List[Tuple[str, str]] = []
+        position = 0
+        for match in self._combined[level].finditer(text):
+            parts.append(text[position:match.start()])
+            matches.append((match.lastgroup, match.group(0)))
+            position = match.end()
+        parts.append(text[position:])
+        scan = (tuple(parts), tuple(matches))
+
+        if len(text) <= self.cache_chars:
+            with self._cache_lock:
+                if key not in self._cache:
+                    self._cache[key] = scan
+                    self._cache_sizes[key] = len(text)
+                    self._cached_chars += len(text)
+                while self._cached_chars > self.cache_chars:
+                    evicted, _ = self._cache.popitem(last=False)
+                    self._cached_chars -= self._cache_sizes.pop(evicted)
+        return scan
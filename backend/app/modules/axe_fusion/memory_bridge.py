@@ -6,9 +6,13 @@ Verbindet AXE Chat mit dem MemoryService und Qdrant für Konversationsgedächtni
 
 from __future__ import annotations
 
+import itertools
 import json
 import os
-from typing import Any, Dict, List, Optional
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
 from datetime import datetime
 from loguru import logger
 import redis.asyncio as redis
@@ -34,6 +38,33 @@ PREFERENCES_COLLECTION = "axe_preferences"
 REDIS_SESSION_PREFIX = "brain:axe:session"
 REDIS_SESSION_TTL = 3600 * 24 * 7  # 7 days
 
+# In-process session context windows
+SESSION_WINDOW_TURNS = 10
+SESSION_WINDOW_TTL_SECONDS = float(os.getenv("AXE_SESSION_WINDOW_TTL_SECONDS", "30"))
+SESSION_WINDOW_MAX_SESSIONS = int(os.getenv("AXE_SESSION_WINDOW_MAX_SESSIONS", "1000"))
+
+_window_versions = itertools.count(1)
+
+
+@dataclass
+class SessionContextWindow:
+    """
+    Die letzten Nachrichten und Präferenzen einer Session im Prozess.
+
+    Wird von store_message fortgeschrieben statt neu geladen; `version`
+    ändert sich bei jeder Änderung, so dass abgeleitete Prompts darauf
+    cachen können. Nach dem TTL wird aus Redis neu geladen, damit
+    Nachrichten anderer Prozesse sichtbar werden.
+    """
+
+    messages: Deque[Dict[str, Any]]
+    preferences: Dict[str, Any] = field(default_factory=dict)
+    version: int = field(default_factory=lambda: next(_window_versions))
+    expires_at: float = 0.0
+
+    def touch(self) -> None:
+        self.version = next(_window_versions)
+
 
 class AXEMemoryBridge:
     """
@@ -45,6 +76,8 @@ class AXEMemoryBridge:
         self._redis: Optional[redis.Redis] = None
         self._qdrant_client: Optional[QdrantClient] = None
         self._memory_service = None
+        self._windows: "OrderedDict[str, SessionContextWindow]" = OrderedDict()
+        self._stores = 0  # store_message/_store_preferences calls, detects writes during a window load
 
     async def _get_redis(self) -> redis.Redis:
         if self._redis is None:
@@ -143,7 +176,13 @@ class AXEMemoryBridge:
         
         await redis.rpush(redis_key, json.dumps(message_data))
         await redis.expire(redis_key, REDIS_SESSION_TTL)
-        
+
+        self._stores += 1
+        window = self._windows.get(session_id)
+        if window is not None:
+            window.messages.append(message_data)
+            window.touch()
+
         # 2. Store in MemoryService (long-term)
         memory_service = await self._get_memory_service()
         if memory_service:
@@ -220,6 +259,12 @@ class AXEMemoryBridge:
         Returns:
             Liste von Nachrichten
         """
+        if max_turns <= SESSION_WINDOW_TURNS:
+            window = await self.get_session_window(session_id)
+            return list(window.messages)[-max_turns:]
+        return await self._load_session_messages(session_id, max_turns)
+
+    async def _load_session_messages(self, session_id: str, max_turns: int) -> List[Dict[str, Any]]:
         redis = await self._get_redis()
         redis_key = f"{REDIS_SESSION_PREFIX}:{session_id}:messages"
         
@@ -234,6 +279,41 @@ class AXEMemoryBridge:
         
         return result[-max_turns:]
 
+    async def get_session_window(self, session_id: str) -> SessionContextWindow:
+        """
+        Session-Fenster (letzte SESSION_WINDOW_TURNS Nachrichten + Präferenzen).
+
+        Wird nur bei fehlendem oder abgelaufenem Fenster aus Redis geladen.
+        """
+        window = self._windows.get(session_id)
+        if window is not None and window.expires_at > time.monotonic():
+            self._windows.move_to_end(session_id)
+            return window
+
+        stores = self._stores
+        messages = await self._load_session_messages(session_id, SESSION_WINDOW_TURNS)
+        preferences = await self._load_preferences(session_id)
+        # A write during the load may be missing from it: reload on next access
+        expires_at = time.monotonic() + SESSION_WINDOW_TTL_SECONDS if stores == self._stores else 0.0
+
+        window = self._windows.get(session_id)
+        if window is not None and list(window.messages) == messages and window.preferences == preferences:
+            # Unchanged: keep the version, so prompts built from it stay valid
+            window.expires_at = expires_at
+            self._windows.move_to_end(session_id)
+            return window
+
+        window = SessionContextWindow(
+            messages=deque(messages, maxlen=SESSION_WINDOW_TURNS),
+            preferences=preferences,
+            expires_at=expires_at,
+        )
+        self._windows[session_id] = window
+        self._windows.move_to_end(session_id)
+        while len(self._windows) > SESSION_WINDOW_MAX_SESSIONS:
+            self._windows.popitem(last=False)
+        return window
+
     async def get_session_context_full(
         self,
         session_id: str,
@@ -349,7 +429,13 @@ Example: {{"name": "AXE", "tone": "casual", "topics": ["tech", "coding"]}}
             json.dumps(preferences),
             ex=REDIS_SESSION_TTL
         )
-        
+
+        self._stores += 1
+        window = self._windows.get(session_id)
+        if window is not None:
+            window.preferences = preferences
+            window.touch()
+
         # Also store in Qdrant for semantic search
         qdrant = await self._get_qdrant_client()
         if qdrant and preferences.get("name"):
@@ -375,6 +461,10 @@ Example: {{"name": "AXE", "tone": "casual", "topics": ["tech", "coding"]}}
 
     async def get_preferences(self, session_id: str) -> Dict[str, Any]:
         """Lädt gespeicherte Präferenzen für eine Session."""
+        window = await self.get_session_window(session_id)
+        return dict(window.preferences)
+
+    async def _load_preferences(self, session_id: str) -> Dict[str, Any]:
         redis = await self._get_redis()
         redis_key = f"{REDIS_SESSION_PREFIX}:{session_id}:preferences"
         
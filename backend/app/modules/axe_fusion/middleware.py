@@ -3,15 +3,24 @@ AXE Fusion Middleware
 
 Injects AXE identity system prompt into chat requests.
 Includes session context and preference injection for memory.
+
+Assembled system prompts are cached per (identity prompt, session, session
+window version); the active identity and the session windows are cached by
+AXEIdentityService and AXEMemoryBridge, so a turn without changes does no
+DB or Redis round trip.
 """
 
-from typing import List, Dict, Optional
+from collections import OrderedDict
+from typing import List, Dict, Optional, Tuple
 from app.modules.axe_identity.service import AXEIdentityService
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
 logger = logging.getLogger(__name__)
 
+PROMPT_CACHE_MAX_ENTRIES = 1024
+_prompt_cache: "OrderedDict[Tuple[str, str, int], str]" = OrderedDict()
+
 
 class SystemPromptMiddleware:
     """Injects AXE identity system prompt into chat requests with context"""
@@ -54,10 +63,7 @@ class SystemPromptMiddleware:
             if session_id:
                 context_info = await self._build_session_context(session_id, tenant_id)
                 if context_info:
-                    system_content = self._inject_context_into_prompt(
-                        system_content,
-                        context_info
-                    )
+                    system_content = self._cached_prompt(system_content, context_info)
 
             # TODO: Add knowledge documents when TASK-003 is complete
             # if include_knowledge and knowledge_service_available:
@@ -97,26 +103,40 @@ class SystemPromptMiddleware:
             from .memory_bridge import get_axe_memory_bridge
             
             bridge = get_axe_memory_bridge(self.db)
-            
-            # Get conversation history (last 5 turns)
-            context_messages = await bridge.get_session_context(session_id, max_turns=5)
-            
-            # Get preferences
-            preferences = await bridge.get_preferences(session_id)
-            
+            window = await bridge.get_session_window(session_id)
+
+            # Conversation history (last 5 turns) and preferences
+            context_messages = list(window.messages)[-5:]
+            preferences = window.preferences
+
             if not context_messages and not preferences:
                 return None
-            
+
             return {
                 "messages": context_messages,
                 "preferences": preferences,
-                "session_id": session_id
+                "session_id": session_id,
+                "version": window.version,
             }
             
         except Exception as e:
             logger.debug(f"Failed to build session context: {e}")
             return None
 
+    def _cached_prompt(self, base_prompt: str, context_info: Dict) -> str:
+        """Prompt with session context, reused while identity and window are unchanged."""
+        key = (base_prompt, context_info["session_id"], context_info["version"])
+        prompt = _prompt_cache.get(key)
+        if prompt is not None:
+            _prompt_cache.move_to_end(key)
+            return prompt
+
+        prompt = self._inject_context_into_prompt(base_prompt, context_info)
+        _prompt_cache[key] = prompt
+        while len(_prompt_cache) > PROMPT_CACHE_MAX_ENTRIES:
+            _prompt_cache.popitem(last=False)
+        return prompt
+
     def _inject_context_into_prompt(
         self,
         base_prompt: str,
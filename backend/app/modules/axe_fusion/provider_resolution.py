@@ -0,0 +1,184 @@
+"""Cached provider resolution and circuit breakers for AXE Fusion.
+
+Resolving the active provider probes provider endpoints over HTTP and looks
+up the governed ProviderBinding. The outcome (config or error) is cached per
+resolution key (selector state, binding revision) with a TTL, so chat
+requests only do a dict lookup; a background prober refreshes it ahead of
+expiry. Failed resolutions are cached for a shorter TTL, so a down provider
+is not re-probed by every request. Concurrent misses share one resolution.
+
+Each provider has an integrations CircuitBreaker fed by probes and chat
+calls: OPEN after `failure_threshold` consecutive failures (no probes are
+sent), then HALF_OPEN after `recovery_seconds`, where the next probe
+decides.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, Type
+
+from app.modules.integrations.circuit_breaker import CircuitBreaker
+from app.modules.integrations.schemas import CircuitBreakerConfig
+
+from .provider_selector import ProviderConfig
+
+logger = logging.getLogger(__name__)
+
+
+def record_unreachable(breaker: CircuitBreaker) -> bool:
+    """Count an unreachable provider on its breaker; True if this opened the circuit."""
+    was_open = breaker.is_open
+    breaker.record_failure(is_timeout=True)
+    return breaker.is_open and not was_open
+
+
+@dataclass(frozen=True)
+class ProviderResolution:
+    """Cached outcome of one provider resolution."""
+
+    config: Optional[ProviderConfig]
+    error: Optional[str]
+    version: int
+    expires_at: float
+
+
+class ProviderResolutionCache:
+    """TTL cache of provider resolutions plus per-provider circuit breakers."""
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[float] = None,
+        failure_ttl_seconds: Optional[float] = None,
+        failure_threshold: Optional[int] = None,
+        recovery_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(
+            os.getenv("AXE_PROVIDER_CACHE_TTL_SECONDS", "30")
+        )
+        self.failure_ttl_seconds = failure_ttl_seconds if failure_ttl_seconds is not None else float(
+            os.getenv("AXE_PROVIDER_FAILURE_TTL_SECONDS", "5")
+        )
+        self.failure_threshold = failure_threshold if failure_threshold is not None else int(
+            os.getenv("AXE_PROVIDER_BREAKER_THRESHOLD", "3")
+        )
+        self.recovery_seconds = recovery_seconds if recovery_seconds is not None else float(
+            os.getenv("AXE_PROVIDER_BREAKER_RECOVERY_SECONDS", "30")
+        )
+        self._clock = clock
+        self._entries: Dict[Hashable, ProviderResolution] = {}
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.breaker_config = CircuitBreakerConfig(
+            failure_threshold=self.failure_threshold,
+            recovery_timeout=self.recovery_seconds,
+            success_threshold=1,
+        )
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        # Bumped whenever the cached decision changes or is invalidated
+        self.version = 0
+        self._generation = 0  # invalidations only
+        self.hits = 0
+        self.misses = 0
+
+    def breaker(self, provider: str) -> CircuitBreaker:
+        breaker = self._breakers.get(provider)
+        if breaker is None:
+            breaker = CircuitBreaker(self.breaker_config, name=f"axe_fusion:{provider}")
+            self._breakers[provider] = breaker
+        return breaker
+
+    def get(self, key: Hashable) -> Optional[ProviderResolution]:
+        """Fresh cached resolution for `key`, or None."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at > self._clock():
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def keys(self) -> Tuple[Hashable, ...]:
+        return tuple(self._entries)
+
+    async def resolve(
+        self,
+        key: Hashable,
+        resolver: Callable[[], Awaitable[ProviderConfig]],
+        cacheable_errors: Tuple[Type[BaseException], ...] = (),
+    ) -> ProviderResolution:
+        """Run `resolver` (once for concurrent callers) and cache its outcome.
+
+        Exceptions in `cacheable_errors` are cached as error resolutions;
+        anything else propagates uncached.
+        """
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self._generation
+        try:
+            try:
+                config, error, ttl = await resolver(), None, self.ttl_seconds
+            except cacheable_errors as exc:
+                config, error, ttl = None, str(exc), self.failure_ttl_seconds
+            entry = self._store(key, config, error, ttl, stale=generation != self._generation)
+            future.set_result(entry)
+            return entry
+        except Exception as exc:
+            future.set_exception(exc)
+            # Nobody else may be waiting; don't log "exception never retrieved"
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def _store(
+        self,
+        key: Hashable,
+        config: Optional[ProviderConfig],
+        error: Optional[str],
+        ttl: float,
+        stale: bool,
+    ) -> ProviderResolution:
+        previous = self._entries.get(key)
+        if previous is None or (previous.config, previous.error) != (config, error):
+            self.version += 1
+            if previous is not None:
+                logger.info(
+                    "AXE provider resolution changed: %s -> %s",
+                    previous.config.provider.value if previous.config else previous.error,
+                    config.provider.value if config else error,
+                )
+        entry = ProviderResolution(config, error, self.version, self._clock() + ttl)
+        # Resolved against state invalidated meanwhile: answer callers, don't cache
+        if not stale:
+            self._entries[key] = entry
+        return entry
+
+    def invalidate(self) -> None:
+        self._entries.clear()
+        self._generation += 1
+        self.version += 1
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "version": self.version,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate_percent": round(self.hits / lookups * 100, 2) if lookups else 0,
+            "breakers": {
+                provider: {"state": breaker.current_state.value, "consecutive_failures": breaker.state.failure_count}
+                for provider, breaker in self._breakers.items()
+            },
+        }
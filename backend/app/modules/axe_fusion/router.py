@@ -11,6 +11,7 @@ SECURITY:
 - Error Sanitization
 """
 
+import asyncio
 import logging
 import os
 import hashlib
@@ -18,10 +19,11 @@ import hmac
 import json
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, List, Optional, Literal
+from typing import Any, AsyncIterator, List, Optional, Literal
 from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, File, Header, HTTPException, Query, Request, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, field_validator
 from sqlalchemy.ext.asyncio import AsyncSession
 from slowapi import Limiter
@@ -648,6 +650,91 @@ async def _emit_token_complete(run_id: UUID, text: str) -> None:
         logger.warning("Failed to emit TOKEN_COMPLETE event: %s", exc)
 
 
+def _sse_event(event: str, payload: dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(payload, default=str)}\n\n"
+
+
+async def _stream_direct_chat(
+    *,
+    service: Any,
+    db: AsyncSession,
+    chat_request: ChatRequest,
+    messages: list[dict[str, Any]],
+    context_telemetry: dict[str, Any],
+    request_id: str,
+    user_id: Optional[str],
+    tenant_id: Optional[str],
+    run_id: UUID,
+) -> AsyncIterator[str]:
+    """
+    SSE Events für direkten Streaming-Chat.
+
+    `token` Events tragen Deltas sobald der Provider sie liefert, danach
+    folgt genau ein `done` (vollständiger, de-anonymisierter Text) oder
+    `error` Event.
+    """
+    deltas: asyncio.Queue[Optional[str]] = asyncio.Queue()
+
+    async def on_token(delta: str, finish_reason: Optional[str]) -> None:
+        if delta:
+            await deltas.put(delta)
+
+    async def run_upstream() -> dict[str, Any]:
+        try:
+            return await service.stream_chat(
+                model=chat_request.model,
+                messages=messages,
+                temperature=chat_request.temperature or 0.7,
+                request_id=request_id,
+                principal_id=user_id,
+                run_id=str(run_id),
+                on_token=on_token,
+            )
+        finally:
+            await deltas.put(None)
+
+    upstream = asyncio.create_task(run_upstream())
+    try:
+        while (delta := await deltas.get()) is not None:
+            yield _sse_event("token", {"delta": delta})
+        result = await upstream
+    except Exception as exc:
+        error_message = sanitize_error_for_user(exc)
+        await _emit_state_changed(run_id, "running", "failed", error_message)
+        await _emit_run_failed(run_id, "AXE_CHAT_FAILED", error_message)
+        yield _sse_event("error", {"code": "AXE_CHAT_FAILED", "message": error_message})
+        return
+    finally:
+        if not upstream.done():
+            upstream.cancel()  # client went away
+
+    await _emit_run_succeeded(run_id, {"text": result["text"]})
+    if chat_request.session_id:
+        memory_bridge = get_axe_memory_bridge(db)
+        for msg in chat_request.messages:
+            await memory_bridge.store_message(
+                session_id=chat_request.session_id,
+                role=msg.role,
+                content=msg.content,
+                tenant_id=tenant_id
+            )
+        await memory_bridge.store_message(
+            session_id=chat_request.session_id,
+            role="assistant",
+            content=result["text"],
+            tenant_id=tenant_id
+        )
+
+    yield _sse_event(
+        "done",
+        {
+            "text": result["text"],
+            "run_id": str(run_id),
+            "raw": {**result["raw"], "execution_path": "direct", "streamed": True, "context": context_telemetry},
+        },
+    )
+
+
 async def _try_skillrun_bridge(
     *,
     db: AsyncSession,
@@ -1189,6 +1276,8 @@ async def axe_chat(
     
     **Features:**
     - Automatische AXE Identity System Prompt Injection
+    - `stream: true` mit `Accept: text/event-stream` liefert Server-Sent Events
+      (`token` Deltas, dann `done` oder `error`)
     
     **Fehlercodes:**
     - 503: AXEllm nicht erreichbar
@@ -1372,6 +1461,28 @@ async def axe_chat(
         await _emit_run_created(run_id, "axe.chat.direct")
         await _emit_state_changed(run_id, None, "running", "Starting direct AXE chat execution")
         
+        if chat_request.stream and "text/event-stream" in request.headers.get("accept", ""):
+            return StreamingResponse(
+                _stream_direct_chat(
+                    service=service,
+                    db=db,
+                    chat_request=chat_request,
+                    messages=envelope_messages,
+                    context_telemetry=context_telemetry,
+                    request_id=request_id,
+                    user_id=user_id,
+                    tenant_id=tenant_id,
+                    run_id=run_id,
+                ),
+                media_type="text/event-stream",
+                headers={
+                    "Cache-Control": "no-cache",
+                    "X-Accel-Buffering": "no",
+                    "x-axe-request-id": request_id,
+                    "x-axe-run-id": str(run_id),
+                },
+            )
+
         try:
             if chat_request.stream:
                 result = await service.stream_chat(
@@ -12,6 +12,7 @@ import httpx
 
 from .data_sanitizer import DataSanitizer
 from .mapping_repository import AXEMappingRepository
+from .provider_resolution import ProviderResolutionCache, record_unreachable
 from .provider_selector import (
     LLMProvider,
     ProviderConfig,
@@ -382,6 +383,7 @@ class AXEFusionService:
         self.sanitizer = DataSanitizer()
         self.provider_binding_service = get_provider_binding_service()
         self.mapping_repo = AXEMappingRepository()
+        self.provider_cache = ProviderResolutionCache()
         self._clients: Dict[Tuple[str, str, str], AXEllmClient] = {}
 
     def _get_or_create_client(self, config: ProviderConfig) -> AXEllmClient:
@@ -466,6 +468,7 @@ class AXEFusionService:
     ) -> Dict[str, Any]:
         self.selector.set_runtime_mode(provider)
         self.selector.set_force_sanitization_level(force_sanitization_level)
+        self.provider_cache.invalidate()
         return self.get_provider_runtime()
 
     async def get_deanonymization_outcomes(
@@ -572,13 +575,13 @@ class AXEFusionService:
             middleware = SystemPromptMiddleware(self.db)
             messages = await middleware.inject_system_prompt(messages)
 
-        provider_config = await self._resolve_runtime_config(require_chat=True)
+        provider_config = await self._get_runtime_config(require_chat=True)
         client = self._get_or_create_client(provider_config)
         effective_model = self._resolve_model(model, provider_config)
 
         sanitization_level = self.selector.get_sanitization_level(provider_config.provider)
         if sanitization_level != SanitizationLevel.NONE:
-            outbound_messages, mapping = self.sanitizer.sanitize_messages(messages, sanitization_level)
+            outbound_messages, mapping = await self.sanitizer.sanitize_messages_async(messages, sanitization_level)
         else:
             outbound_messages, mapping = messages, None
 
@@ -610,7 +613,9 @@ class AXEFusionService:
 
         try:
             result = await client.chat(effective_model, outbound_messages, temperature)
-        except Exception:
+            self._record_provider_outcome(provider_config)
+        except Exception as exc:
+            self._record_provider_outcome(provider_config, exc)
             if self.db and mapping_set_id and request_id:
                 try:
                     attempt_no = await self.mapping_repo.get_next_attempt_no(
@@ -641,12 +646,12 @@ class AXEFusionService:
         if mapping and result.get("text"):
             raw_text = result["text"]
             restored_count = sum(1 for p in mapping.replacements if p in raw_text)
-            result["text"] = self.sanitizer.deanonymize_text(result["text"], mapping)
+            result["text"] = await self.sanitizer.deanonymize_text_async(result["text"], mapping)
             try:
                 choices = result["raw"].get("choices", [])
                 if choices and "message" in choices[0]:
                     original_content = choices[0]["message"].get("content", "")
-                    choices[0]["message"]["content"] = self.sanitizer.deanonymize_text(
+                    choices[0]["message"]["content"] = await self.sanitizer.deanonymize_text_async(
                         original_content,
                         mapping,
                     )
@@ -729,13 +734,13 @@ class AXEFusionService:
             middleware = SystemPromptMiddleware(self.db)
             messages = await middleware.inject_system_prompt(messages)
 
-        provider_config = await self._resolve_runtime_config(require_chat=True)
+        provider_config = await self._get_runtime_config(require_chat=True)
         client = self._get_or_create_client(provider_config)
         effective_model = self._resolve_model(model, provider_config)
 
         sanitization_level = self.selector.get_sanitization_level(provider_config.provider)
         if sanitization_level != SanitizationLevel.NONE:
-            outbound_messages, mapping = self.sanitizer.sanitize_messages(messages, sanitization_level)
+            outbound_messages, mapping = await self.sanitizer.sanitize_messages_async(messages, sanitization_level)
         else:
             outbound_messages, mapping = messages, None
 
@@ -772,7 +777,9 @@ class AXEFusionService:
                 temperature,
                 on_token=emit_token_event,
             )
-        except Exception:
+            self._record_provider_outcome(provider_config)
+        except Exception as exc:
+            self._record_provider_outcome(provider_config, exc)
             if self.db and mapping_set_id and request_id:
                 try:
                     attempt_no = await self.mapping_repo.get_next_attempt_no(
@@ -803,7 +810,7 @@ class AXEFusionService:
         if mapping and result.get("text"):
             raw_text = result["text"]
             restored_count = sum(1 for p in mapping.replacements if p in raw_text)
-            result["text"] = self.sanitizer.deanonymize_text(result["text"], mapping)
+            result["text"] = await self.sanitizer.deanonymize_text_async(result["text"], mapping)
 
         if self.db and mapping_set_id and request_id:
             try:
@@ -844,7 +851,7 @@ class AXEFusionService:
             Dict mit Status
         """
         try:
-            provider_config = await self._resolve_runtime_config(require_chat=False)
+            provider_config = await self._get_runtime_config(require_chat=False)
             return {
                 "status": "healthy",
                 "llm_provider": provider_config.provider.value,
@@ -854,7 +861,60 @@ class AXEFusionService:
             logger.warning(f"LLM Provider Health Check fehlgeschlagen: {e}")
             return {"status": "unavailable", "llm_provider": "unknown", "error": str(e)}
 
-    async def _resolve_runtime_config(self, *, require_chat: bool) -> ProviderConfig:
+    def _resolution_key(self, require_chat: bool) -> Tuple[Any, ...]:
+        """Everything a provider resolution depends on besides provider health"""
+        provider = self.selector.get_active_provider()
+        if provider == LLMProvider.AUTO:
+            candidates = tuple(self.selector.get_auto_candidates())
+        else:
+            candidates = (self.selector.get_active_config(),)
+        return (
+            require_chat,
+            provider,
+            candidates,
+            os.getenv("AXE_ENFORCE_PROVIDER_BINDINGS", "true").strip().lower(),
+            os.getenv("AXE_ALLOW_MOCK_FALLBACK", "").strip().lower(),
+            os.getenv("AXE_PROVIDER_CAPABILITY_KEY", "text.generate"),
+            os.getenv("AXE_PROVIDER_CAPABILITY_VERSION", "1"),
+            self.db is not None,
+            self.provider_binding_service.revision,
+        )
+
+    async def _get_runtime_config(self, *, require_chat: bool) -> ProviderConfig:
+        """Active provider from the resolution cache; resolves on a miss"""
+        key = self._resolution_key(require_chat)
+        resolution = self.provider_cache.get(key)
+        if resolution is None:
+            resolution = await self.provider_cache.resolve(
+                key,
+                lambda: self._resolve_runtime_config(require_chat=require_chat),
+                cacheable_errors=(AXEllmUnavailableError,),
+            )
+        if resolution.error is not None:
+            raise AXEllmUnavailableError(resolution.error)
+        return resolution.config
+
+    async def refresh_provider_resolution(self, db=None) -> Dict[str, Any]:
+        """
+        Re-resolve the active provider ahead of cache expiry (background prober).
+
+        Args:
+            db: Session for binding lookups, instead of the service's own
+        """
+        for require_chat in (True, False):
+            key = self._resolution_key(require_chat)
+            # Health-check resolutions only once somebody asked for them
+            if require_chat or key in self.provider_cache.keys():
+                await self.provider_cache.resolve(
+                    key,
+                    lambda: self._resolve_runtime_config(require_chat=require_chat, db=db),
+                    cacheable_errors=(AXEllmUnavailableError,),
+                )
+        return self.provider_cache.stats()
+
+    async def _resolve_runtime_config(self, *, require_chat: bool, db=None) -> ProviderConfig:
+        """Uncached resolution: probes providers and checks governed bindings"""
+        db = db if db is not None and self.db is not None else self.db
         provider = self.selector.get_active_provider()
         enforce_bindings = os.getenv("AXE_ENFORCE_PROVIDER_BINDINGS", "true").strip().lower() in {
             "1",
@@ -869,10 +929,10 @@ class AXEFusionService:
                 "yes",
             }
             for candidate in self.selector.get_auto_candidates():
-                if await self._probe_provider(candidate, require_chat=require_chat):
-                    if enforce_bindings and self.db:
+                if await self._probe_with_breaker(candidate, require_chat=require_chat):
+                    if enforce_bindings and db:
                         binding = await self.provider_binding_service.find_binding_by_provider(
-                            self.db,
+                            db,
                             capability_key=os.getenv("AXE_PROVIDER_CAPABILITY_KEY", "text.generate"),
                             capability_version=int(os.getenv("AXE_PROVIDER_CAPABILITY_VERSION", "1")),
                             provider_key=candidate.provider.value,
@@ -896,13 +956,13 @@ class AXEFusionService:
         if provider == LLMProvider.MOCK and not os.getenv("AXE_ALLOW_MOCK_FALLBACK", "").strip():
             raise AXEllmUnavailableError("Mock provider is disabled for this environment")
 
-        if provider != LLMProvider.MOCK and not await self._probe_provider(config, require_chat=require_chat):
+        if provider != LLMProvider.MOCK and not await self._probe_with_breaker(config, require_chat=require_chat):
             raise AXEllmUnavailableError(
                 f"Configured provider '{provider.value}' is not reachable"
             )
-        if enforce_bindings and self.db and provider != LLMProvider.MOCK:
+        if enforce_bindings and db and provider != LLMProvider.MOCK:
             binding = await self.provider_binding_service.find_binding_by_provider(
-                self.db,
+                db,
                 capability_key=os.getenv("AXE_PROVIDER_CAPABILITY_KEY", "text.generate"),
                 capability_version=int(os.getenv("AXE_PROVIDER_CAPABILITY_VERSION", "1")),
                 provider_key=provider.value,
@@ -914,6 +974,31 @@ class AXEFusionService:
                 )
         return config
 
+    async def _probe_with_breaker(self, config: ProviderConfig, *, require_chat: bool) -> bool:
+        """Probe unless the provider's circuit is open; feeds the breaker"""
+        breaker = self.provider_cache.breaker(config.provider.value)
+        if not breaker.allow_request():
+            return False
+        healthy = await self._probe_provider(config, require_chat=require_chat)
+        if config.provider != LLMProvider.MOCK:
+            if healthy:
+                breaker.record_success()
+            elif record_unreachable(breaker):
+                logger.warning("AXE provider %s circuit opened after failed probes", config.provider.value)
+        return healthy
+
+    def _record_provider_outcome(self, config: ProviderConfig, error: Optional[Exception] = None) -> None:
+        """Feed a chat outcome into the provider's breaker"""
+        if config.provider == LLMProvider.MOCK:
+            return
+        breaker = self.provider_cache.breaker(config.provider.value)
+        if error is None:
+            breaker.record_success()
+        elif isinstance(error, AXEllmUnavailableError) and record_unreachable(breaker):
+            logger.warning("AXE provider %s circuit opened after failed chat calls", config.provider.value)
+            # Next request re-resolves (auto mode moves on to the next candidate)
+            self.provider_cache.invalidate()
+
     async def _probe_provider(self, config: ProviderConfig, *, require_chat: bool) -> bool:
         if config.provider == LLMProvider.MOCK:
             return False
@@ -4,8 +4,10 @@ AXE Identity Service Layer
 Business logic for managing AXE identities.
 """
 
-from typing import List, Optional
+from typing import ClassVar, List, Optional
 import logging
+import os
+import time
 from datetime import datetime, timezone
 
 from sqlalchemy import select, update
@@ -21,9 +23,23 @@ logger = logging.getLogger(__name__)
 class AXEIdentityService:
     """Service for AXE Identity management"""
 
+    # Active identity, shared by all instances of this process. Bumping the
+    # revision invalidates it; the TTL bounds staleness after changes made by
+    # other processes.
+    revision: ClassVar[int] = 0
+    _active_cache: ClassVar[Optional[AXEIdentityResponse]] = None
+    _active_cache_revision: ClassVar[Optional[int]] = None
+    _active_cache_expires_at: ClassVar[float] = 0.0
+    ACTIVE_CACHE_TTL_SECONDS: ClassVar[float] = float(os.getenv("AXE_IDENTITY_CACHE_TTL_SECONDS", "30"))
+
     def __init__(self, db: AsyncSession):
         self.db = db
-        self._active_cache: Optional[AXEIdentityResponse] = None
+
+    @classmethod
+    def invalidate_active_cache(cls) -> None:
+        cls.revision += 1
+        cls._active_cache = None
+        cls._active_cache_revision = None
 
     async def _rollback_optional_identity_error(self, exc: Exception) -> None:
         if not isinstance(exc, (ProgrammingError, DBAPIError, SQLAlchemyError)):
@@ -75,10 +91,12 @@ class AXEIdentityService:
         Returns:
             Active identity or None if no identity is active
         """
-        # Return cached if available
-        if self._active_cache:
-            return self._active_cache
+        cls = type(self)
+        # Return cached if available ("no active identity" is cached as well)
+        if cls._active_cache_revision == cls.revision and cls._active_cache_expires_at > time.monotonic():
+            return cls._active_cache
 
+        revision = cls.revision
         try:
             result = await self.db.execute(
                 select(AXEIdentityORM).where(AXEIdentityORM.is_active == True)
@@ -88,13 +106,18 @@ class AXEIdentityService:
             await self._rollback_optional_identity_error(exc)
             return None
 
-        if identity:
-            self._active_cache = self._to_response(identity)
+        active = self._to_response(identity) if identity else None
+        if active:
             logger.debug(f"Active identity: {identity.name}")
         else:
             logger.warning("No active identity found")
 
-        return self._active_cache
+        # Not if an identity changed while querying
+        if revision == cls.revision:
+            cls._active_cache = active
+            cls._active_cache_revision = revision
+            cls._active_cache_expires_at = time.monotonic() + cls.ACTIVE_CACHE_TTL_SECONDS
+        return active
 
     async def get_default(self) -> AXEIdentityResponse:
         """
@@ -190,7 +213,7 @@ class AXEIdentityService:
 
         # Invalidate cache if this was active
         if identity.is_active:
-            self._active_cache = None
+            self.invalidate_active_cache()
 
         logger.info(f"Updated AXE identity: {identity.name} (v{identity.version})")
         return self._to_response(identity)
@@ -228,7 +251,7 @@ class AXEIdentityService:
         await self.db.refresh(identity)
 
         # Invalidate cache
-        self._active_cache = None
+        self.invalidate_active_cache()
 
         logger.info(f"✅ Activated AXE identity: {identity.name}")
         return self._to_response(identity)
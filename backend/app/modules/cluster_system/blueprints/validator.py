@@ -107,6 +107,10 @@ class BlueprintValidator:
             scaling = cluster["scaling"]
             if "metric" in scaling and scaling["metric"] not in ["task_queue_length", "cpu_usage", "load_percentage"]:
                 raise ValueError(f"Invalid scaling metric: {scaling['metric']}")
+            if "policy" in scaling and scaling["policy"] not in ["predictive", "threshold"]:
+                raise ValueError(f"Invalid scaling policy: {scaling['policy']}")
+            if "target_utilization" in scaling and not 0 < scaling["target_utilization"] <= 1:
+                raise ValueError("Scaling target_utilization must be in (0, 1]")
 
         logger.debug(f"Cluster config validation passed: {cluster['type']}, {min_workers}-{max_workers} workers")
         return True
@@ -217,7 +217,8 @@ class ClusterMetrics(Base):
     memory_usage = Column(Float, default=0.0)  # 0.0 - 100.0
 
     # Performance Metrics
-    tasks_per_minute = Column(Float, default=0.0)
+    tasks_per_minute = Column(Float, default=0.0)   # finished (completed + failed)
+    arrival_rate = Column(Float, nullable=True)     # enqueued per minute
     avg_response_time = Column(Float, default=0.0)  # milliseconds
     error_rate = Column(Float, default=0.0)         # 0.0 - 100.0
 
@@ -229,7 +230,8 @@ class ClusterMetrics(Base):
 
     # Queue Metrics (for scaling decisions)
     queue_length = Column(Integer, default=0)
-    queue_wait_time = Column(Float, default=0.0)  # seconds
+    queue_wait_time = Column(Float, default=0.0)  # seconds, age of the oldest queued task
+    tasks_in_flight = Column(Integer, default=0)
 
     # Relationships
     cluster = relationship("Cluster", back_populates="metrics")
@@ -0,0 +1,163 @@
+"""
+Cluster Scaling Policy - Worker targets from recent cluster metrics
+
+Predictive (default):
+- Arrival rate forecast: Holt smoothing (EWMA level + EWMA trend) over the
+  recent `arrival_rate` samples, projected `forecast_minutes` ahead
+- Service rate per worker from the measured average task latency
+- Target = workers needed to serve the forecast plus drain the backlog
+  within `backlog_drain_minutes` at `target_utilization`
+- Scale-up jumps straight to the target; scale-down is damped to 20% per
+  step and never below the tasks in flight
+
+Threshold (`policy: threshold`, or no latency/arrival data yet):
+- Queue length / CPU against scale_up_threshold / scale_down_threshold,
+  +20% / -20% per step
+"""
+
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Sequence
+
+SCALING_COOLDOWN = timedelta(minutes=5)
+
+DEFAULT_SCALING_CONFIG: Dict[str, Any] = {
+    "policy": "predictive",
+    "metric": "task_queue_length",
+    "scale_up_threshold": 10,
+    "scale_down_threshold": 2,
+    "target_utilization": 0.75,
+    "worker_concurrency": 1,
+    "backlog_drain_minutes": 5.0,
+    "forecast_minutes": 5.0,
+    "smoothing": 0.5,
+}
+
+SCALE_UP_FACTOR = 1.2
+SCALE_DOWN_FACTOR = 0.8
+
+
+@dataclass
+class ScalingDecision:
+    target_workers: int
+    reason: str
+
+
+def in_cooldown(cluster, now: Optional[datetime] = None) -> bool:
+    """Clusters are not rescaled within SCALING_COOLDOWN of their last activity"""
+    if not cluster.last_active:
+        return False
+    return (now or datetime.utcnow()) - cluster.last_active < SCALING_COOLDOWN
+
+
+def forecast_arrival_rate(
+    metrics: Sequence[Any],
+    smoothing: float = 0.5,
+    horizon_minutes: float = 5.0
+) -> Optional[float]:
+    """
+    Forecast of tasks arriving per minute, `horizon_minutes` ahead.
+
+    Args:
+        metrics: ClusterMetrics rows, newest first
+
+    Returns:
+        float: Forecast (>= 0), or None without arrival samples
+    """
+    samples = [(m.timestamp, m.arrival_rate) for m in reversed(metrics) if m.arrival_rate is not None]
+    if not samples:
+        return None
+
+    previous_at, level = samples[0]
+    trend = 0.0  # tasks/min per minute
+    for timestamp, rate in samples[1:]:
+        minutes = (timestamp - previous_at).total_seconds() / 60
+        if minutes <= 0:
+            continue
+        previous_level = level
+        level = smoothing * rate + (1 - smoothing) * (level + trend * minutes)
+        trend = smoothing * (level - previous_level) / minutes + (1 - smoothing) * trend
+        previous_at = timestamp
+
+    return max(level + trend * horizon_minutes, 0.0)
+
+
+def plan_scaling(
+    cluster,
+    metrics: Sequence[Any],
+    scaling_config: Optional[Dict[str, Any]] = None
+) -> Optional[ScalingDecision]:
+    """
+    Decide a new worker target for a cluster.
+
+    Args:
+        cluster: Cluster (current_workers, min_workers, max_workers)
+        metrics: Recent ClusterMetrics rows, newest first
+        scaling_config: Blueprint `cluster.scaling` section
+
+    Returns:
+        ScalingDecision if the target should change, None otherwise
+    """
+    if not metrics:
+        return None
+
+    config = {**DEFAULT_SCALING_CONFIG, **(scaling_config or {})}
+    if config["policy"] != "threshold":
+        service_ms = next((m.avg_response_time for m in metrics if m.avg_response_time), None)
+        arrival = forecast_arrival_rate(metrics, config["smoothing"], config["forecast_minutes"])
+        if service_ms is not None and arrival is not None:
+            return _plan_predictive(cluster, metrics[0], arrival, service_ms, config)
+    return _plan_threshold(cluster, metrics[0], config)
+
+
+def _plan_predictive(
+    cluster,
+    latest,
+    arrival: float,
+    service_ms: float,
+    config: Dict[str, Any]
+) -> Optional[ScalingDecision]:
+    concurrency = max(int(config["worker_concurrency"]), 1)
+    # Tasks per minute one worker handles at the target utilization
+    capacity = 60_000 / service_ms * concurrency * config["target_utilization"]
+    demand = arrival + (latest.queue_length or 0) / config["backlog_drain_minutes"]
+    required = max(math.ceil(demand / capacity), math.ceil((latest.tasks_in_flight or 0) / concurrency))
+    required = min(max(required, cluster.min_workers), cluster.max_workers)
+
+    current = cluster.current_workers
+    reason = (
+        f"predictive: {arrival:.1f} tasks/min forecast, {latest.queue_length or 0} queued, "
+        f"{service_ms:.0f} ms/task -> {required} workers"
+    )
+    if required > current:
+        return ScalingDecision(required, reason)
+    if required < current:
+        target = max(required, int(current * SCALE_DOWN_FACTOR))
+        if target < current:
+            return ScalingDecision(target, reason)
+    return None
+
+
+def _plan_threshold(cluster, latest, config: Dict[str, Any]) -> Optional[ScalingDecision]:
+    metric_type = config["metric"]
+    if metric_type == "task_queue_length":
+        value, label = latest.queue_length or 0, "queue"
+    elif metric_type == "cpu_usage":
+        value, label = latest.cpu_usage or 0, "CPU"
+    else:
+        return None
+
+    current = cluster.current_workers
+    if value > config["scale_up_threshold"] and current < cluster.max_workers:
+        # Scale up by 20%, min +1
+        target = min(int(current * SCALE_UP_FACTOR) + 1, cluster.max_workers)
+        return ScalingDecision(target, f"threshold: {label} {value} > {config['scale_up_threshold']}")
+
+    if value < config["scale_down_threshold"] and current > cluster.min_workers:
+        # Scale down by 20%, min -1
+        target = max(int(current * SCALE_DOWN_FACTOR), cluster.min_workers)
+        if target < current:
+            return ScalingDecision(target, f"threshold: {label} {value} < {config['scale_down_threshold']}")
+
+    return None
@@ -220,6 +220,7 @@ class ClusterMetricsResponse(BaseModel):
 
     # Performance
     tasks_per_minute: float
+    arrival_rate: Optional[float] = None
     avg_response_time: float
     error_rate: float
 
@@ -232,6 +233,7 @@ class ClusterMetricsResponse(BaseModel):
     # Queue
     queue_length: int
     queue_wait_time: float
+    tasks_in_flight: int = 0
 
     model_config = {"from_attributes": True}
 
@@ -11,8 +11,9 @@ Handles:
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, or_, func
+from sqlalchemy.orm import aliased
 from typing import Optional, List, Dict, Any
-from datetime import datetime, timedelta
+from datetime import datetime
 from loguru import logger
 import uuid
 
@@ -37,6 +38,7 @@ from .schemas import (
 from .blueprints.loader import BlueprintLoader
 from .blueprints.validator import BlueprintValidator
 from .creator.spawner import ClusterSpawner
+from .scaling import DEFAULT_SCALING_CONFIG, in_cooldown, plan_scaling
 
 
 class ClusterService:
@@ -544,11 +546,77 @@ class ClusterService:
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
+    async def record_metrics_batch(self, metrics_by_cluster: Dict[str, Dict[str, Any]]) -> int:
+        """Record one metrics snapshot per cluster in a single commit"""
+        self.db.add_all(
+            ClusterMetrics(id=str(uuid.uuid4()), cluster_id=cluster_id, **metrics_data)
+            for cluster_id, metrics_data in metrics_by_cluster.items()
+        )
+        await self.db.commit()
+        return len(metrics_by_cluster)
+
+    async def get_recent_metrics(
+        self,
+        cluster_ids: List[str],
+        limit: int = 10
+    ) -> Dict[str, List[ClusterMetrics]]:
+        """Latest `limit` metrics per cluster (newest first), one query for all clusters"""
+        if not cluster_ids:
+            return {}
+
+        ranked = select(
+            ClusterMetrics,
+            func.row_number().over(
+                partition_by=ClusterMetrics.cluster_id,
+                order_by=ClusterMetrics.timestamp.desc()
+            ).label("position")
+        ).where(ClusterMetrics.cluster_id.in_(cluster_ids)).subquery()
+        metrics = aliased(ClusterMetrics, ranked)
+
+        result = await self.db.execute(
+            select(metrics)
+            .where(ranked.c.position <= limit)
+            .order_by(ranked.c.cluster_id, ranked.c.position)
+        )
+
+        recent: Dict[str, List[ClusterMetrics]] = {cluster_id: [] for cluster_id in cluster_ids}
+        for row in result.scalars():
+            recent[row.cluster_id].append(row)
+        return recent
+
+    async def count_agents_by_status(self, cluster_ids: List[str]) -> Dict[str, Dict[str, int]]:
+        """Agent counts per cluster and status, one query for all clusters"""
+        if not cluster_ids:
+            return {}
+
+        result = await self.db.execute(
+            select(
+                ClusterAgent.cluster_id,
+                ClusterAgent.status,
+                func.count(ClusterAgent.id).label("count")
+            ).where(
+                ClusterAgent.cluster_id.in_(cluster_ids)
+            ).group_by(ClusterAgent.cluster_id, ClusterAgent.status)
+        )
+
+        counts: Dict[str, Dict[str, int]] = {cluster_id: {} for cluster_id in cluster_ids}
+        for row in result:
+            counts[row.cluster_id][row.status] = row.count
+        return counts
+
     # ===== AUTO-SCALING LOGIC =====
 
+    def get_scaling_config(self, blueprint_id: str) -> Dict[str, Any]:
+        """Scaling section of a blueprint (defaults if it can't be loaded)"""
+        try:
+            blueprint = self.blueprint_loader.load_from_file(f"{blueprint_id}.yaml")
+            return blueprint.get("cluster", {}).get("scaling", {})
+        except Exception:
+            return dict(DEFAULT_SCALING_CONFIG)
+
     async def check_scaling_needed(self, cluster_id: str) -> Optional[int]:
         """
-        Check if cluster needs scaling based on metrics.
+        Check if cluster needs scaling based on metrics (see scaling.plan_scaling).
 
         Returns:
             int: New target_workers if scaling needed, None otherwise
@@ -559,11 +627,9 @@ class ClusterService:
             return None
 
         # 2. Check cooldown period (last scaling + 5 minutes)
-        if cluster.last_active:
-            cooldown = datetime.utcnow() - cluster.last_active
-            if cooldown < timedelta(minutes=5):
-                logger.debug(f"Cluster {cluster_id}: Cooldown period active ({cooldown.seconds}s)")
-                return None
+        if in_cooldown(cluster):
+            logger.debug(f"Cluster {cluster_id}: Cooldown period active")
+            return None
 
         # 3. Get latest metrics
         metrics = await self.get_metrics(cluster_id, limit=10)
@@ -571,56 +637,13 @@ class ClusterService:
             logger.debug(f"Cluster {cluster_id}: No metrics available")
             return None
 
-        latest = metrics[0]
-        current_workers = cluster.current_workers
-
-        # 4. Load blueprint scaling config
-        try:
-            blueprint = self.blueprint_loader.load_from_file(f"{cluster.blueprint_id}.yaml")
-            scaling_config = blueprint.get("cluster", {}).get("scaling", {})
-        except Exception:
-            # Default scaling config
-            scaling_config = {
-                "metric": "task_queue_length",
-                "scale_up_threshold": 10,
-                "scale_down_threshold": 2
-            }
+        # 4. Decide from blueprint scaling config
+        decision = plan_scaling(cluster, metrics, self.get_scaling_config(cluster.blueprint_id))
+        if decision is None:
+            return None  # No scaling needed
 
-        metric_type = scaling_config.get("metric", "task_queue_length")
-        scale_up_threshold = scaling_config.get("scale_up_threshold", 10)
-        scale_down_threshold = scaling_config.get("scale_down_threshold", 2)
-
-        # 5. Calculate scaling decision
-        if metric_type == "task_queue_length":
-            queue_length = latest.queue_length or 0
-
-            if queue_length > scale_up_threshold and current_workers < cluster.max_workers:
-                # Scale up by 20%, min +1
-                new_target = min(int(current_workers * 1.2) + 1, cluster.max_workers)
-                logger.info(f"Scale UP: {current_workers} -> {new_target} (queue: {queue_length})")
-                return new_target
-
-            elif queue_length < scale_down_threshold and current_workers > cluster.min_workers:
-                # Scale down by 20%, min -1
-                new_target = max(int(current_workers * 0.8), cluster.min_workers)
-                if new_target < current_workers:
-                    logger.info(f"Scale DOWN: {current_workers} -> {new_target} (queue: {queue_length})")
-                    return new_target
-
-        elif metric_type == "cpu_usage":
-            cpu = latest.cpu_usage or 0
-            # Similar logic for CPU
-            if cpu > scale_up_threshold and current_workers < cluster.max_workers:
-                new_target = min(int(current_workers * 1.2) + 1, cluster.max_workers)
-                logger.info(f"Scale UP: {current_workers} -> {new_target} (CPU: {cpu}%)")
-                return new_target
-            elif cpu < scale_down_threshold and current_workers > cluster.min_workers:
-                new_target = max(int(current_workers * 0.8), cluster.min_workers)
-                if new_target < current_workers:
-                    logger.info(f"Scale DOWN: {current_workers} -> {new_target} (CPU: {cpu}%)")
-                    return new_target
-
-        return None  # No scaling needed
+        logger.info(f"Scale {cluster.current_workers} -> {decision.target_workers} ({decision.reason})")
+        return decision.target_workers
 
     # ===== BLUEPRINT MANAGEMENT =====
 
@@ -14,6 +14,7 @@ Exports:
 - EventType: Enum of all event types in the system
 - EventJournal: Append-only event storage with crash-safety
 - get_event_journal: Singleton journal instance
+- IdempotencyIndex: Bounded-memory duplicate detection (LRU + Bloom filter)
 - EventBus: Pub/sub for event distribution
 - get_event_bus: Singleton event bus instance
 - Projections: In-memory read models (balance, ledger, approvals, synergie)
@@ -48,6 +49,11 @@ from app.modules.credits.event_sourcing.event_journal import (
     EventJournalPermissionError,
     EventJournalCorruptionError,
 )
+from app.modules.credits.event_sourcing.idempotency_index import (
+    IdempotencyIndex,
+    IdempotencyCheck,
+    BloomFilter,
+)
 from app.modules.credits.event_sourcing.event_bus import (
     EventBus,
     get_event_bus,
@@ -64,6 +70,7 @@ from app.modules.credits.event_sourcing.projections import (
     LedgerEntry,
     ApprovalRequest,
     CollaborationRecord,
+    InvalidCursorError,
 )
 from app.modules.credits.event_sourcing.replay import (
     ReplayEngine,
@@ -83,6 +90,10 @@ __all__ = [
     "EventJournalError",
     "EventJournalPermissionError",
     "EventJournalCorruptionError",
+    # Idempotency Index
+    "IdempotencyIndex",
+    "IdempotencyCheck",
+    "BloomFilter",
     # Event Bus
     "EventBus",
     "get_event_bus",
@@ -98,6 +109,7 @@ __all__ = [
     "LedgerEntry",
     "ApprovalRequest",
     "CollaborationRecord",
+    "InvalidCursorError",
     # Replay Engine
     "ReplayEngine",
     "get_replay_engine",
@@ -8,14 +8,15 @@ Defines the contract for Event Journal implementations:
 All implementations must support:
 - Append-only operations
 - Idempotency (duplicate prevention)
-- Async iteration for replay
+- Async iteration for replay (optionally from a sequence number)
 - Metrics tracking
 """
 
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import AsyncIterator, Dict
+from concurrent.futures import Executor
+from typing import AsyncIterator, Dict, List, Optional
 
 from app.modules.credits.event_sourcing.events import EventEnvelope
 
@@ -27,8 +28,10 @@ class BaseEventJournal(ABC):
     Contract:
     1. initialize() — Setup (create tables, files, etc.)
     2. append_event(event) — Append with idempotency
-    3. read_events() — Async generator for replay
-    4. get_metrics() — Stats for monitoring
+    3. read_events(from_sequence) — Async generator for (delta) replay
+       read_event_batches(...) — Batched variant for the replay pipeline
+    4. get_last_sequence() — Position replay resumes after
+    5. get_metrics() — Stats for monitoring
     """
 
     @abstractmethod
@@ -62,12 +65,16 @@ class BaseEventJournal(ABC):
     async def read_events(
         self,
         skip_corrupted: bool = True,
+        from_sequence: int = 0,
     ) -> AsyncIterator[EventEnvelope]:
         """
-        Read all events from journal (async generator).
+        Read events from journal (async generator).
 
         Args:
             skip_corrupted: If True, skip corrupted events and log warning
+            from_sequence: Only yield events with sequence > from_sequence
+                           (0 = all events). Sequence is the journal position
+                           for file journals and credit_events.id for Postgres.
 
         Yields:
             EventEnvelope instances in order
@@ -77,6 +84,54 @@ class BaseEventJournal(ABC):
         """
         pass
 
+    async def read_event_batches(
+        self,
+        from_sequence: int = 0,
+        batch_size: int = 1000,
+        executor: Optional[Executor] = None,
+        skip_corrupted: bool = True,
+    ) -> AsyncIterator[List[EventEnvelope]]:
+        """
+        Read events in ordered batches (replay pipeline input).
+
+        Default implementation groups read_events(); journals that can
+        decode in parallel (file journal) override it and use executor.
+
+        Args:
+            from_sequence: Only yield events with sequence > from_sequence
+            batch_size: Events per batch
+            executor: Optional executor for the decode stage
+            skip_corrupted: If True, skip corrupted events and log warning
+
+        Yields:
+            Lists of EventEnvelope in journal order
+        """
+        batch: List[EventEnvelope] = []
+        async for event in self.read_events(
+            skip_corrupted=skip_corrupted,
+            from_sequence=from_sequence,
+        ):
+            batch.append(event)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    @abstractmethod
+    async def get_last_sequence(self) -> int:
+        """
+        Get sequence of the last event in the journal.
+
+        This is what snapshots store: read_events(from_sequence=...) with
+        it yields exactly the events appended afterwards. It equals the
+        event count for file journals only; Postgres ids have gaps.
+
+        Returns:
+            Last sequence number (0 if journal is empty)
+        """
+        pass
+
     @abstractmethod
     def get_metrics(self) -> Dict:
         """
@@ -4,8 +4,10 @@ Event Journal - Append-Only Event Storage.
 Implements crash-safe event persistence with:
 - JSONL format (one event per line)
 - Atomic append with fsync
-- Idempotency checking (duplicate prevention)
+- Idempotency checking (duplicate prevention, bounded memory)
 - Corruption detection and recovery
+- Optional group commit (batched write + single fsync per batch)
+- Sparse sequence index (sidecar file) for O(delta) replay
 - Zero dependencies (pure Python file I/O)
 
 Design Principles:
@@ -20,6 +22,28 @@ File Format (JSONL):
 {"event_id": "...", "event_type": "...", ...}
 ...
 
+Group Commit:
+- A background writer keeps the file handle open
+- Concurrent append_event() calls are collected for a short window
+  (or until max batch size), written in one write() and fsynced once
+- Each caller's future resolves only after its batch is fsynced,
+  so durability guarantees are identical to the per-event path
+
+Sequence Index:
+- Every valid event has a 1-based sequence number (position in journal)
+- Every index_interval-th event's byte offset is appended to a sidecar
+  file (<journal>.idx, lines "<sequence> <offset>")
+- read_events(from_sequence=N) seeks to the nearest indexed offset at or
+  before N+1 and parses at most index_interval-1 events it doesn't yield
+- The sidecar is a hint: it is validated and rebuilt on initialize()
+
+Idempotency Index:
+- Recent keys are held exactly in a windowed LRU, all keys in a scalable
+  Bloom filter (see idempotency_index.py); Bloom positives outside the
+  window are confirmed by scanning the journal in a worker thread
+- The Bloom filter is checkpointed to <journal>.bloom together with the
+  sequence/offset it covers, so startup only scans the journal tail
+
 Recovery Strategy:
 - On corruption: Log warning, skip line, continue replay
 - On missing file: Create empty journal
@@ -28,14 +52,22 @@ Recovery Strategy:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
+from collections import deque
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import AsyncIterator, Optional, Set
+from typing import AsyncIterator, BinaryIO, Dict, Iterator, List, Optional, Tuple
 
 from loguru import logger
 
+from app.modules.credits.event_sourcing.base_journal import BaseEventJournal
 from app.modules.credits.event_sourcing.events import EventEnvelope
+from app.modules.credits.event_sourcing.idempotency_index import (
+    IdempotencyCheck,
+    IdempotencyIndex,
+)
 
 
 class EventJournalError(Exception):
@@ -53,20 +85,50 @@ class EventJournalCorruptionError(EventJournalError):
     pass
 
 
-class EventJournal:
+def _decode_lines(
+    lines: List[bytes],
+    first_line_number: int,
+) -> Tuple[List[EventEnvelope], List[str]]:
+    """
+    Decode raw JSONL lines into events (replay decode stage).
+
+    Module-level so it can run in a ProcessPoolExecutor.
+
+    Returns:
+        (events in order, error messages for corrupted lines)
+    """
+    events: List[EventEnvelope] = []
+    errors: List[str] = []
+
+    for i, raw_line in enumerate(lines):
+        if not raw_line.strip():
+            continue
+        try:
+            # Parse + validate in one pass (pydantic-core JSON parser)
+            events.append(EventEnvelope.model_validate_json(raw_line))
+        except Exception as e:
+            errors.append(f"Invalid event data at line {first_line_number + i}: {e}")
+
+    return events, errors
+
+
+class EventJournal(BaseEventJournal):
     """
     Append-only event journal with crash-safety guarantees.
 
     Features:
     - JSONL persistence (one event per line)
     - Atomic append with fsync
-    - Idempotency checking via in-memory set
+    - Idempotency checking via bounded LRU + Bloom filter index
     - Graceful corruption recovery
     - Metrics tracking (total events, file size)
+    - Optional group commit mode (group_commit=True)
+    - Sparse sequence → byte offset index for seekable replay
 
     Thread-Safety:
     - NOT thread-safe (use asyncio locks if needed)
     - Single-writer pattern recommended
+    - Group commit mode is safe for concurrent asyncio callers
 
     Example:
         >>> journal = EventJournal(file_path="storage/events/credits.jsonl")
@@ -75,12 +137,19 @@ class EventJournal:
         >>> success = await journal.append_event(event)
         >>> async for event in journal.read_events():
         ...     print(event.event_id)
+        >>> async for event in journal.read_events(from_sequence=1000):
+        ...     print(event.event_id)  # events 1001, 1002, ...
     """
 
     def __init__(
         self,
         file_path: str | Path = "storage/events/credits.jsonl",
         enable_fsync: bool = True,
+        group_commit: bool = False,
+        group_commit_max_batch: int = 256,
+        group_commit_max_delay_ms: float = 2.0,
+        index_interval: int = 1000,
+        idempotency_index: Optional[IdempotencyIndex] = None,
     ):
         """
         Initialize EventJournal.
@@ -88,16 +157,53 @@ class EventJournal:
         Args:
             file_path: Path to JSONL event file
             enable_fsync: Enable fsync for crash-safety (disable for testing)
+            group_commit: Batch concurrent appends into one write + fsync
+            group_commit_max_batch: Max events per group commit batch
+            group_commit_max_delay_ms: Max time to wait for more events
+                                       before committing a batch
+            index_interval: Record every N-th event's byte offset in the
+                            sidecar sequence index
+            idempotency_index: Idempotency index (default: IdempotencyIndex())
         """
         self.file_path = Path(file_path)
         self.enable_fsync = enable_fsync
 
-        # Idempotency tracking (in-memory)
-        self._seen_idempotency_keys: Set[str] = set()
+        # Group commit configuration
+        self.group_commit = group_commit
+        self.group_commit_max_batch = max(1, group_commit_max_batch)
+        self.group_commit_max_delay_ms = max(0.0, group_commit_max_delay_ms)
+
+        # Sparse sequence index: (sequence, byte_offset), ascending
+        self.index_interval = max(1, index_interval)
+        self.index_path = self.file_path.with_name(self.file_path.name + ".idx")
+        self._sparse_index: List[Tuple[int, int]] = []
+
+        # Idempotency tracking (bounded memory, Bloom checkpoint sidecar)
+        self._idempotency = idempotency_index or IdempotencyIndex()
+        self.idempotency_checkpoint_path = self.file_path.with_name(
+            self.file_path.name + ".bloom"
+        )
+
+        # Group commit state (writer task, queue, open file handle)
+        self._commit_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._writer_file: Optional[BinaryIO] = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        # Set by close(): later appends fail instead of queueing behind the
+        # writer's shutdown sentinel
+        self._closed = False
+
+        # Per-event appends: keeps duplicate check + write atomic while the
+        # check awaits a journal scan
+        self._append_lock = asyncio.Lock()
 
         # Metrics
         self._total_events = 0
         self._idempotency_violations = 0
+        self._group_commit_batches = 0
+        self._group_commit_events = 0
+        self._group_commit_fsyncs = 0
 
     async def initialize(self) -> None:
         """
@@ -113,6 +219,7 @@ class EventJournal:
             # Create empty file if needed
             if not self.file_path.exists():
                 self.file_path.touch()
+                self._write_index_file()
                 logger.info(
                     f"EventJournal initialized (new file)",
                     file_path=str(self.file_path),
@@ -126,6 +233,9 @@ class EventJournal:
                     total_events=self._total_events,
                 )
 
+            if self.group_commit:
+                self._start_group_commit_writer()
+
         except PermissionError as e:
             raise EventJournalPermissionError(
                 f"Cannot initialize journal at {self.file_path}: {e}"
@@ -135,18 +245,156 @@ class EventJournal:
         """
         Load idempotency keys from existing journal.
 
-        This prevents duplicate events on restart.
+        This prevents duplicate events on restart. If a valid Bloom
+        checkpoint exists, only events after the checkpoint are scanned;
+        otherwise the whole journal is scanned. The same pass rebuilds the
+        sparse sequence index; the sidecar file is rewritten only if it is
+        missing or disagrees with the journal.
         """
-        async for event in self.read_events():
-            self._seen_idempotency_keys.add(event.idempotency_key)
-            self._total_events += 1
+        start_offset, start_sequence = 0, 0
+        sidecar_index = self._read_index_file()
+        rebuilt_index: List[Tuple[int, int]] = []
+
+        checkpoint = self._idempotency.load_checkpoint(self.idempotency_checkpoint_path)
+        if checkpoint is not None and self._checkpoint_is_valid(checkpoint, sidecar_index):
+            start_sequence, start_offset = checkpoint
+            rebuilt_index = [e for e in sidecar_index if e[0] <= start_sequence]
+        else:
+            self._idempotency.clear()
+            # Size the Bloom filter for the whole journal before loading it
+            self._idempotency.reserve(self._count_lines())
+
+        self._total_events = start_sequence
+
+        for sequence, offset, event in self._scan_events(
+            start_offset, start_sequence, skip_corrupted=True
+        ):
+            self._idempotency.add(event.idempotency_key, sequence)
+            self._total_events = sequence
+            if self._is_index_point(sequence):
+                rebuilt_index.append((sequence, offset))
+
+        self._sparse_index = rebuilt_index
+        if sidecar_index != rebuilt_index:
+            self._write_index_file()
+            logger.info(
+                "EventJournal sequence index rebuilt",
+                index_path=str(self.index_path),
+                entries=len(rebuilt_index),
+            )
+
+        self._save_idempotency_checkpoint()
 
         logger.debug(
             f"Loaded idempotency keys",
-            total_keys=len(self._seen_idempotency_keys),
+            checkpoint_sequence=start_sequence,
+            scanned_events=self._total_events - start_sequence,
             total_events=self._total_events,
         )
 
+    def _count_lines(self) -> int:
+        """Number of lines in the journal (upper bound of its event count)."""
+        lines = 0
+        with open(self.file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                lines += chunk.count(b"\n")
+        return lines
+
+    def _checkpoint_is_valid(
+        self,
+        checkpoint: Tuple[int, int],
+        sidecar_index: List[Tuple[int, int]],
+    ) -> bool:
+        """
+        Check that a Bloom checkpoint still matches the journal file.
+
+        The checkpoint offset must fall on a line boundary within the file,
+        and the sidecar index must contain exactly the expected index points
+        up to the checkpoint sequence (so sequence numbering is consistent).
+        """
+        sequence, offset = checkpoint
+        try:
+            file_size = self.file_path.stat().st_size
+        except OSError:
+            return False
+
+        if sequence < 0 or offset < 0 or offset > file_size:
+            return False
+        if (sequence == 0) != (offset == 0):
+            return False
+
+        if offset > 0:
+            with open(self.file_path, "rb") as f:
+                f.seek(offset - 1)
+                if f.read(1) != b"\n":
+                    return False
+
+        covered = [e for e in sidecar_index if e[0] <= sequence]
+        expected_sequences = list(range(1, sequence + 1, self.index_interval))
+        if [e[0] for e in covered] != expected_sequences:
+            return False
+
+        return all(e[1] < offset for e in covered)
+
+    def _save_idempotency_checkpoint(self) -> None:
+        """Checkpoint the Bloom filter at the current end of the journal."""
+        try:
+            offset = self.file_path.stat().st_size
+        except OSError:
+            return
+        self._idempotency.save_checkpoint(
+            self.idempotency_checkpoint_path,
+            sequence=self._total_events,
+            offset=offset,
+        )
+
+    def _key_exists_on_disk(self, key: str) -> bool:
+        """
+        Authoritative idempotency check: scan the journal for key.
+
+        Only used for Bloom filter positives outside the recent window
+        (true old duplicates or false positives).
+        """
+        needle = json.dumps(key).encode("utf-8")
+        try:
+            with open(self.file_path, "rb") as f:
+                for raw_line in f:
+                    if needle not in raw_line:
+                        continue
+                    try:
+                        if json.loads(raw_line).get("idempotency_key") == key:
+                            return True
+                    except (json.JSONDecodeError, AttributeError):
+                        continue
+        except FileNotFoundError:
+            return False
+        except PermissionError as e:
+            raise EventJournalPermissionError(
+                f"Cannot read journal at {self.file_path}: {e}"
+            ) from e
+        return False
+
+    async def _is_duplicate(self, key: str) -> bool:
+        """
+        Check whether key was already appended.
+
+        Returns:
+            True if key exists in the journal
+        """
+        result = self._idempotency.check(key)
+        if result == IdempotencyCheck.RECENT:
+            return True
+        if result == IdempotencyCheck.ABSENT:
+            return False
+
+        # Full journal scan: keep it off the event loop. Per-event appends
+        # hold _append_lock across check and write, group commit tracks
+        # in-flight keys, so callers can't interleave on the same key.
+        exists = await asyncio.to_thread(self._key_exists_on_disk, key)
+
+        self._idempotency.record_fallback(exists)
+        return exists
+
     async def append_event(self, event: EventEnvelope) -> bool:
         """
         Append event to journal (idempotent, crash-safe).
@@ -159,6 +407,7 @@ class EventJournal:
 
         Raises:
             EventJournalPermissionError: If cannot write to file
+            EventJournalError: If the journal has been closed
 
         Implementation:
         1. Check idempotency key
@@ -166,9 +415,42 @@ class EventJournal:
         3. Append to file with newline
         4. fsync (if enabled)
         5. Update idempotency set
+
+        In group commit mode, steps 3-4 are performed by the background
+        writer for a whole batch; this call returns only after the batch
+        containing the event has been fsynced. Otherwise appends are
+        serialised by an asyncio lock.
         """
+        if self._closed:
+            raise EventJournalError(f"Event journal {self.file_path} is closed")
+        if self.group_commit:
+            return await self._append_event(event)
+        async with self._append_lock:
+            return await self._append_event(event)
+
+    async def _append_event(self, event: EventEnvelope) -> bool:
+        """append_event() body (caller holds _append_lock unless group commit)."""
         # === Idempotency Check ===
-        if event.idempotency_key in self._seen_idempotency_keys:
+        while True:
+            if self.group_commit:
+                # A concurrent append with the same key may still be in
+                # flight. Wait for its outcome: if it fails, this call may
+                # retry it.
+                pending = self._inflight.get(event.idempotency_key)
+                if pending is not None:
+                    try:
+                        await asyncio.shield(pending)
+                    except Exception:
+                        pass
+
+            is_duplicate = await self._is_duplicate(event.idempotency_key)
+
+            # Re-check if another append with this key started while the
+            # journal fallback scan was running (group commit only).
+            if is_duplicate or event.idempotency_key not in self._inflight:
+                break
+
+        if is_duplicate:
             self._idempotency_violations += 1
             logger.warning(
                 "Idempotency violation: duplicate event ignored",
@@ -192,13 +474,17 @@ class EventJournal:
             )
             raise EventJournalError(f"Cannot serialize event: {e}") from e
 
+        if self.group_commit:
+            return await self._append_group_commit(event, event_json)
+
         # === Append to File (Crash-Safe) ===
         try:
-            # Open file in append mode
-            with open(self.file_path, "a", encoding="utf-8") as f:
+            # Open file in append mode (binary, so tell() is a byte offset)
+            with open(self.file_path, "ab") as f:
+                offset = f.tell()
+
                 # Write event (one line)
-                f.write(event_json)
-                f.write("\n")
+                f.write((event_json + "\n").encode("utf-8"))
 
                 # Flush to OS buffer
                 f.flush()
@@ -219,9 +505,10 @@ class EventJournal:
             )
             raise EventJournalError(f"Cannot append event: {e}") from e
 
-        # === Update Idempotency Set ===
-        self._seen_idempotency_keys.add(event.idempotency_key)
+        # === Update Idempotency Index + Sequence Index ===
         self._total_events += 1
+        self._idempotency.add(event.idempotency_key, self._total_events)
+        self._maybe_index(self._total_events, offset)
 
         logger.debug(
             "Event appended to journal",
@@ -232,45 +519,341 @@ class EventJournal:
 
         return True
 
-    async def read_events(
+    # ========================================================================
+    # Group Commit
+    # ========================================================================
+
+    def _start_group_commit_writer(self) -> None:
+        """Start the background group commit writer (idempotent)."""
+        if self._writer_task is not None and not self._writer_task.done():
+            return
+
+        self._commit_queue = asyncio.Queue()
+        self._writer_task = asyncio.create_task(
+            self._group_commit_loop(),
+            name="credits-event-journal-writer",
+        )
+
+        logger.info(
+            "EventJournal group commit writer started",
+            max_batch=self.group_commit_max_batch,
+            max_delay_ms=self.group_commit_max_delay_ms,
+        )
+
+    async def _append_group_commit(
         self,
-        skip_corrupted: bool = True,
-    ) -> AsyncIterator[EventEnvelope]:
+        event: EventEnvelope,
+        event_json: str,
+    ) -> bool:
         """
-        Read all events from journal (generator for memory efficiency).
+        Enqueue event for the group commit writer and wait until fsynced.
 
         Args:
-            skip_corrupted: If True, skip corrupted lines and log warning
-                           If False, raise exception on corruption
+            event: Event to append
+            event_json: Pre-serialized event JSON
 
-        Yields:
-            EventEnvelope instances
+        Returns:
+            True once the event is durable
+        """
+        # close() may have run while this append awaited its idempotency
+        # check; nothing can be enqueued after the sentinel from here on
+        if self._closed:
+            raise EventJournalError(f"Event journal {self.file_path} is closed")
+        if self._writer_task is None or self._writer_task.done():
+            self._start_group_commit_writer()
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._inflight[event.idempotency_key] = future
+
+        await self._commit_queue.put(
+            (event.idempotency_key, (event_json + "\n").encode("utf-8"), future)
+        )
 
-        Raises:
-            EventJournalCorruptionError: If corrupted and skip_corrupted=False
+        try:
+            await asyncio.shield(future)
+        finally:
+            if self._inflight.get(event.idempotency_key) is future:
+                del self._inflight[event.idempotency_key]
 
-        Notes:
-        - Uses generator to avoid loading entire file into memory
-        - Gracefully handles corrupted lines (crash recovery)
-        - Empty lines are silently skipped
+        logger.debug(
+            "Event appended to journal (group commit)",
+            event_id=event.event_id,
+            event_type=event.event_type,
+            total_events=self._total_events,
+        )
+
+        return True
+
+    async def _group_commit_loop(self) -> None:
         """
-        if not self.file_path.exists():
-            logger.warning(
-                "Event journal file does not exist",
-                file_path=str(self.file_path),
+        Background writer: collect pending appends and commit them in batches.
+
+        A batch is closed when max batch size is reached or the delay window
+        (measured from the first event of the batch) has elapsed.
+        """
+        queue = self._commit_queue
+        max_batch = self.group_commit_max_batch
+        max_delay = self.group_commit_max_delay_ms / 1000.0
+        stopping = False
+
+        while not stopping:
+            item = await queue.get()
+            if item is None:
+                break
+
+            batch: List[Tuple[str, bytes, asyncio.Future]] = [item]
+
+            # Drain whatever is already queued, then give concurrent
+            # producers one delay window to join the batch.
+            stopping = self._drain_queue(queue, batch, max_batch)
+            if not stopping and len(batch) < max_batch and max_delay > 0:
+                await asyncio.sleep(max_delay)
+                stopping = self._drain_queue(queue, batch, max_batch)
+
+            await self._commit_batch(batch)
+
+    @staticmethod
+    def _drain_queue(
+        queue: asyncio.Queue,
+        batch: List[Tuple[str, bytes, asyncio.Future]],
+        max_batch: int,
+    ) -> bool:
+        """
+        Move queued items into batch without waiting.
+
+        Returns:
+            True if the shutdown sentinel was encountered
+        """
+        while len(batch) < max_batch:
+            try:
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return False
+            if item is None:
+                return True
+            batch.append(item)
+        return False
+
+    async def _commit_batch(
+        self,
+        batch: List[Tuple[str, bytes, asyncio.Future]],
+    ) -> None:
+        """
+        Write batch in one write(), fsync once, then resolve callers.
+
+        Args:
+            batch: List of (idempotency_key, encoded line, future)
+        """
+        payload = b"".join(line for _, line, _ in batch)
+
+        try:
+            # Blocking file I/O runs off the event loop so producers can
+            # keep enqueueing the next batch while this one is fsynced.
+            start_offset = await asyncio.to_thread(self._write_and_sync, payload)
+        except Exception as e:
+            logger.error(
+                "Failed to commit event batch to journal",
+                batch_size=len(batch),
+                error=str(e),
             )
+            if isinstance(e, PermissionError):
+                error: EventJournalError = EventJournalPermissionError(
+                    f"Cannot append to journal at {self.file_path}: {e}"
+                )
+            else:
+                error = EventJournalError(f"Cannot append event batch: {e}")
+
+            self._close_writer_file()
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
             return
 
+        self._group_commit_batches += 1
+        self._group_commit_events += len(batch)
+        if self.enable_fsync:
+            self._group_commit_fsyncs += 1
+
+        offset = start_offset
+        for key, line, future in batch:
+            self._total_events += 1
+            self._idempotency.add(key, self._total_events)
+            self._maybe_index(self._total_events, offset)
+            offset += len(line)
+            if not future.done():
+                future.set_result(True)
+
+    def _write_and_sync(self, payload: bytes) -> int:
+        """
+        Append payload to the (kept-open) journal file and fsync.
+
+        Returns:
+            Byte offset at which payload was written
+        """
+        if self._writer_file is None:
+            self._writer_file = open(self.file_path, "ab")
+
+        start_offset = self._writer_file.tell()
+        self._writer_file.write(payload)
+        self._writer_file.flush()
+
+        if self.enable_fsync:
+            os.fsync(self._writer_file.fileno())
+
+        return start_offset
+
+    def _close_writer_file(self) -> None:
+        """Close the group commit file handle (reopened lazily)."""
+        if self._writer_file is not None:
+            try:
+                self._writer_file.close()
+            except Exception:
+                pass
+            self._writer_file = None
+
+    async def close(self) -> None:
+        """
+        Stop the group commit writer after draining pending appends and
+        checkpoint the idempotency index (speeds up the next startup).
+
+        Appends issued after close() raise EventJournalError.
+        """
+        self._closed = True
+        if self._writer_task is not None and not self._writer_task.done():
+            await self._commit_queue.put(None)
+            await self._writer_task
+
+        self._writer_task = None
+        self._commit_queue = None
+        self._close_writer_file()
+
+        if self.file_path.exists():
+            self._save_idempotency_checkpoint()
+
+    # ========================================================================
+    # Sequence Index
+    # ========================================================================
+
+    def _is_index_point(self, sequence: int) -> bool:
+        """Whether sequence is recorded in the sparse index."""
+        return (sequence - 1) % self.index_interval == 0
+
+    def _maybe_index(self, sequence: int, offset: int) -> None:
+        """Record (sequence, offset) in memory and sidecar if it's an index point."""
+        if not self._is_index_point(sequence):
+            return
+
+        self._sparse_index.append((sequence, offset))
+
+        try:
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                f.write(f"{sequence} {offset}\n")
+        except OSError as e:
+            # Index is an optimization; journal stays authoritative
+            logger.warning(
+                "Failed to update journal sequence index",
+                index_path=str(self.index_path),
+                error=str(e),
+            )
+
+    def _read_index_file(self) -> List[Tuple[int, int]]:
+        """Read sidecar index entries (malformed lines are ignored)."""
+        entries: List[Tuple[int, int]] = []
+        if not self.index_path.exists():
+            return entries
+
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) != 2:
+                        continue
+                    try:
+                        entries.append((int(parts[0]), int(parts[1])))
+                    except ValueError:
+                        continue
+        except OSError:
+            return []
+
+        return entries
+
+    def _write_index_file(self) -> None:
+        """Atomically rewrite the sidecar index from memory."""
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for sequence, offset in self._sparse_index:
+                    f.write(f"{sequence} {offset}\n")
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            logger.warning(
+                "Failed to write journal sequence index",
+                index_path=str(self.index_path),
+                error=str(e),
+            )
+
+    def _seek_position(self, from_sequence: int) -> Tuple[int, int]:
+        """
+        Find where to start reading to yield events after from_sequence.
+
+        Returns:
+            (byte_offset, sequence of the event preceding byte_offset)
+        """
+        target = from_sequence + 1
+        best_offset, best_sequence = 0, 0
+
+        # Binary search for the last indexed sequence <= target
+        lo, hi = 0, len(self._sparse_index) - 1
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            sequence, offset = self._sparse_index[mid]
+            if sequence <= target:
+                best_sequence, best_offset = sequence - 1, offset
+                lo = mid + 1
+            else:
+                hi = mid - 1
+
+        return best_offset, best_sequence
+
+    async def get_last_sequence(self) -> int:
+        """
+        Get sequence number (line position) of the last event in the journal.
+
+        Returns:
+            Last sequence number (0 if journal is empty)
+        """
+        return self._total_events
+
+    def _scan_events(
+        self,
+        start_offset: int,
+        start_sequence: int,
+        skip_corrupted: bool,
+    ) -> Iterator[Tuple[int, int, EventEnvelope]]:
+        """
+        Scan journal from a byte offset, yielding (sequence, offset, event).
+
+        Args:
+            start_offset: Byte offset of a line start
+            start_sequence: Sequence number of the event before start_offset
+            skip_corrupted: Skip (and log) corrupted lines instead of raising
+        """
         line_number = 0
         corrupted_lines = 0
+        sequence = start_sequence
+        offset = start_offset
 
         try:
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                for line in f:
+            with open(self.file_path, "rb") as f:
+                f.seek(start_offset)
+                for raw_line in f:
+                    line_offset = offset
+                    offset += len(raw_line)
                     line_number += 1
 
                     # Skip empty lines
-                    line = line.strip()
+                    line = raw_line.decode("utf-8", errors="replace").strip()
                     if not line:
                         continue
 
@@ -296,8 +879,6 @@ class EventJournal:
                     # === Deserialize Event ===
                     try:
                         event = EventEnvelope(**event_data)
-                        yield event
-
                     except Exception as e:
                         corrupted_lines += 1
                         error_msg = (
@@ -314,6 +895,9 @@ class EventJournal:
                         else:
                             raise EventJournalCorruptionError(error_msg) from e
 
+                    sequence += 1
+                    yield sequence, line_offset, event
+
         except PermissionError as e:
             raise EventJournalPermissionError(
                 f"Cannot read journal at {self.file_path}: {e}"
@@ -326,6 +910,159 @@ class EventJournal:
                 corrupted_lines=corrupted_lines,
             )
 
+    async def read_events(
+        self,
+        skip_corrupted: bool = True,
+        from_sequence: int = 0,
+    ) -> AsyncIterator[EventEnvelope]:
+        """
+        Read events from journal (generator for memory efficiency).
+
+        Args:
+            skip_corrupted: If True, skip corrupted lines and log warning
+                           If False, raise exception on corruption
+            from_sequence: Only yield events with sequence > from_sequence
+                           (0 = all events). Uses the sparse index to seek.
+
+        Yields:
+            EventEnvelope instances
+
+        Raises:
+            EventJournalCorruptionError: If corrupted and skip_corrupted=False
+
+        Notes:
+        - Uses generator to avoid loading entire file into memory
+        - Gracefully handles corrupted lines (crash recovery)
+        - Empty lines are silently skipped
+        """
+        if not self.file_path.exists():
+            logger.warning(
+                "Event journal file does not exist",
+                file_path=str(self.file_path),
+            )
+            return
+
+        start_offset, start_sequence = (0, 0)
+        if from_sequence > 0:
+            start_offset, start_sequence = self._seek_position(from_sequence)
+
+        for sequence, _, event in self._scan_events(
+            start_offset, start_sequence, skip_corrupted
+        ):
+            if sequence <= from_sequence:
+                continue
+            yield event
+
+    async def read_event_batches(
+        self,
+        from_sequence: int = 0,
+        batch_size: int = 1000,
+        executor: Optional[Executor] = None,
+        skip_corrupted: bool = True,
+        prefetch: int = 4,
+    ) -> AsyncIterator[List[EventEnvelope]]:
+        """
+        Read events in ordered batches, decoding batches in parallel.
+
+        Raw lines are read sequentially (seeking via the sparse index) and
+        handed to executor for JSON + Pydantic decoding; up to prefetch
+        batches are decoded concurrently and yielded in journal order.
+
+        Args:
+            from_sequence: Only yield events with sequence > from_sequence
+            batch_size: Raw lines per decode batch
+            executor: Executor for decoding (None = decode inline)
+            skip_corrupted: If True, skip corrupted lines and log warning
+            prefetch: Max batches decoded ahead of the consumer
+
+        Yields:
+            Lists of EventEnvelope in journal order
+
+        Raises:
+            EventJournalCorruptionError: If corrupted and skip_corrupted=False
+        """
+        if not self.file_path.exists():
+            return
+
+        start_offset, sequence = (0, 0)
+        if from_sequence > 0:
+            start_offset, sequence = self._seek_position(from_sequence)
+
+        loop = asyncio.get_running_loop()
+        pending: deque = deque()
+        corrupted_lines = 0
+
+        def _raw_batches() -> Iterator[Tuple[List[bytes], int]]:
+            line_number = 0
+            with open(self.file_path, "rb") as f:
+                f.seek(start_offset)
+                lines: List[bytes] = []
+                for raw_line in f:
+                    lines.append(raw_line)
+                    if len(lines) >= batch_size:
+                        yield lines, line_number + 1
+                        line_number += len(lines)
+                        lines = []
+                if lines:
+                    yield lines, line_number + 1
+
+        def _submit(lines: List[bytes], first_line: int) -> asyncio.Future:
+            if executor is None:
+                future = loop.create_future()
+                future.set_result(_decode_lines(lines, first_line))
+                return future
+            return loop.run_in_executor(executor, _decode_lines, lines, first_line)
+
+        try:
+            raw_batches = _raw_batches()
+            exhausted = False
+
+            while True:
+                while not exhausted and len(pending) < max(1, prefetch):
+                    try:
+                        lines, first_line = next(raw_batches)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending.append(_submit(lines, first_line))
+
+                if not pending:
+                    break
+
+                events, errors = await pending.popleft()
+
+                if errors:
+                    corrupted_lines += len(errors)
+                    if not skip_corrupted:
+                        raise EventJournalCorruptionError(errors[0])
+                    for error_msg in errors:
+                        logger.warning(error_msg)
+
+                # Drop events the caller already has (within the first
+                # index interval after the seek point)
+                if sequence < from_sequence:
+                    skip = min(len(events), from_sequence - sequence)
+                    sequence += skip
+                    events = events[skip:]
+                sequence += len(events)
+
+                if events:
+                    yield events
+
+        except PermissionError as e:
+            raise EventJournalPermissionError(
+                f"Cannot read journal at {self.file_path}: {e}"
+            ) from e
+        finally:
+            for future in pending:
+                future.cancel()
+
+        if corrupted_lines > 0:
+            logger.warning(
+                f"Event journal batch read completed with {corrupted_lines} corrupted lines skipped",
+                corrupted_lines=corrupted_lines,
+            )
+
     async def count(self) -> int:
         """
         Count total events in journal.
@@ -348,29 +1085,57 @@ class EventJournal:
             - file_size_mb: File size in megabytes
             - idempotency_violations: Number of duplicate events blocked
             - file_path: Path to journal file
+            - index_entries: Number of sparse sequence index entries
+            - idempotency_index: Idempotency index stats (hits, false positives)
+            - group_commit: Group commit stats (if enabled)
         """
         file_size_bytes = (
             self.file_path.stat().st_size if self.file_path.exists() else 0
         )
         file_size_mb = file_size_bytes / (1024 * 1024)
 
-        return {
+        metrics = {
             "total_events": self._total_events,
             "file_size_mb": round(file_size_mb, 2),
             "idempotency_violations": self._idempotency_violations,
             "file_path": str(self.file_path),
+            "index_entries": len(self._sparse_index),
+            "idempotency_index": self._idempotency.get_metrics(),
         }
 
+        if self.group_commit:
+            batches = self._group_commit_batches
+            metrics["group_commit"] = {
+                "batches": batches,
+                "fsyncs": self._group_commit_fsyncs,
+                "avg_batch_size": (
+                    round(self._group_commit_events / batches, 2)
+                    if batches
+                    else 0.0
+                ),
+                "max_batch": self.group_commit_max_batch,
+                "max_delay_ms": self.group_commit_max_delay_ms,
+            }
+
+        return metrics
+
     async def clear(self) -> None:
         """
         Clear journal (DANGEROUS - only for testing).
 
         Removes journal file and resets in-memory state.
         """
+        self._close_writer_file()
+
         if self.file_path.exists():
             self.file_path.unlink()
+        if self.index_path.exists():
+            self.index_path.unlink()
+        if self.idempotency_checkpoint_path.exists():
+            self.idempotency_checkpoint_path.unlink()
 
-        self._seen_idempotency_keys.clear()
+        self._sparse_index.clear()
+        self._idempotency.clear()
         self._total_events = 0
         self._idempotency_violations = 0
 
@@ -434,8 +1199,6 @@ class EventJournal:
 # Global journal instance (initialized on first use)
 # Note: Changed to use factory for backend selection (Phase 5a)
 
-from app.modules.credits.event_sourcing.base_journal import BaseEventJournal
-
 _journal_instance: Optional[BaseEventJournal] = None
 
 
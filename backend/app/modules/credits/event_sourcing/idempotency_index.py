@@ -0,0 +1,530 @@
+"""
+Idempotency Index - Bounded-Memory Duplicate Detection for Event Journals.
+
+Replaces the unbounded in-memory set of every idempotency key ever written
+with a two-tier structure:
+- Windowed LRU: exact membership for the most recent keys (retries almost
+  always arrive shortly after the original event)
+- Bloom filter: compact probabilistic membership for ALL keys
+  (no false negatives, configurable false-positive rate). It is scalable:
+  when a stage reaches its capacity a larger stage with a tighter error
+  rate is added, so the false-positive rate stays bounded as the journal
+  grows instead of climbing toward 1.
+
+Lookup outcomes:
+- RECENT: key is in the LRU window → definitely a duplicate
+- ABSENT: Bloom filter says no → definitely new
+- MAYBE: Bloom filter says maybe → journal must confirm via its
+  authoritative store (file scan / UNIQUE constraint)
+
+Journals without a Bloom tier (Postgres) treat every LRU miss as MAYBE and
+rely on the database UNIQUE constraint as the fallback.
+
+Persistence:
+- The Bloom filter can be checkpointed to a sidecar file together with the
+  journal position it covers, so file journals only re-scan the tail of the
+  journal on startup instead of every event ever written.
+- Without a checkpoint, journals reserve() capacity for the keys they are
+  about to load, so the first stage is sized from the journal itself.
+
+Usage:
+    index = IdempotencyIndex.from_memory_budget(memory_budget_mb=16)
+    index.add("agent_1:allocation:...", sequence=42)
+    if index.check(key) == IdempotencyCheck.MAYBE:
+        is_duplicate = await confirm_in_journal(key)
+        index.record_fallback(is_duplicate)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+from collections import OrderedDict
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+
+# Approximate per-key cost of an LRU entry (key string + OrderedDict node)
+LRU_BYTES_PER_KEY = 160
+
+BLOOM_CHECKPOINT_VERSION = 2
+
+# Scalable Bloom filter: each new stage holds BLOOM_GROWTH times more keys
+# at BLOOM_TIGHTENING times the previous stage's error rate
+BLOOM_GROWTH = 2
+BLOOM_TIGHTENING = 0.5
+
+
+class IdempotencyCheck(str, Enum):
+    """Outcome of an idempotency index lookup."""
+
+    RECENT = "recent"
+    """Key is in the recent window (definite duplicate)."""
+
+    ABSENT = "absent"
+    """Key was never added (definitely new)."""
+
+    MAYBE = "maybe"
+    """Key may exist; caller must confirm against the journal."""
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over string keys.
+
+    Uses double hashing over a single BLAKE2b digest to derive the
+    num_hashes bit positions.
+    """
+
+    def __init__(self, num_bits: int, num_hashes: int, capacity: Optional[int] = None):
+        self.num_bits = max(8, num_bits)
+        self.num_hashes = max(1, num_hashes)
+        self.capacity = capacity
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+
+    @classmethod
+    def for_capacity(cls, capacity: int, error_rate: float = 0.001) -> "BloomFilter":
+        """
+        Size a filter for expected capacity at the target false-positive rate.
+
+        Args:
+            capacity: Expected number of keys
+            error_rate: Target false-positive rate (0 < p < 1)
+        """
+        capacity = max(1, capacity)
+        num_bits = int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        num_hashes = int(round((num_bits / capacity) * math.log(2)))
+        return cls(num_bits, num_hashes, capacity)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str) -> None:
+        """Add key to the filter."""
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+    def __contains__(self, key: str) -> bool:
+        for position in self._positions(key):
+            if not self._bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    @property
+    def count(self) -> int:
+        """Number of keys added (including duplicates)."""
+        return self._count
+
+    @property
+    def memory_bytes(self) -> int:
+        """Size of the bit array in bytes."""
+        return len(self._bits)
+
+    def estimated_false_positive_rate(self) -> float:
+        """Estimated false-positive rate at the current fill level."""
+        if self._count == 0:
+            return 0.0
+        return (1 - math.exp(-self.num_hashes * self._count / self.num_bits)) ** self.num_hashes
+
+    def clear(self) -> None:
+        """Reset all bits."""
+        self._bits = bytearray(len(self._bits))
+        self._count = 0
+
+    def to_bytes(self) -> bytes:
+        """Serialized bit array."""
+        return bytes(self._bits)
+
+    def load_bytes(self, data: bytes, count: int) -> None:
+        """
+        Load bit array produced by to_bytes().
+
+        Raises:
+            ValueError: If data size does not match this filter
+        """
+        if len(data) != len(self._bits):
+            raise ValueError(
+                f"Bloom filter size mismatch: expected {len(self._bits)} bytes, got {len(data)}"
+            )
+        self._bits = bytearray(data)
+        self._count = count
+
+
+class ScalableBloomFilter:
+    """
+    Bloom filter that grows with the number of keys.
+
+    Keys are added to the newest stage; once it holds its capacity, a stage
+    BLOOM_GROWTH times larger with BLOOM_TIGHTENING times the error rate is
+    added. Stage error rates form a geometric series, so the compound
+    false-positive rate stays below error_rate however many keys are added.
+    """
+
+    def __init__(self, initial_capacity: int, error_rate: float = 0.001):
+        self.initial_capacity = max(1, initial_capacity)
+        self.error_rate = error_rate
+        self._stages: List[BloomFilter] = []
+        self._add_stage()
+
+    def _add_stage(self) -> None:
+        level = len(self._stages)
+        capacity = self.initial_capacity * BLOOM_GROWTH ** level
+        stage_error_rate = self.error_rate * (1 - BLOOM_TIGHTENING) * BLOOM_TIGHTENING ** level
+        self._stages.append(BloomFilter.for_capacity(capacity, stage_error_rate))
+
+    def add(self, key: str) -> None:
+        """Add key to the newest stage (adding a stage if it is full)."""
+        stage = self._stages[-1]
+        if stage.count >= stage.capacity:
+            self._add_stage()
+            stage = self._stages[-1]
+        stage.add(key)
+
+    def __contains__(self, key: str) -> bool:
+        return any(key in stage for stage in self._stages)
+
+    def reserve(self, expected_keys: int) -> None:
+        """
+        Size the first stage for expected_keys (only while still empty).
+
+        Args:
+            expected_keys: Number of keys about to be added
+        """
+        if self.count == 0 and expected_keys > self.initial_capacity:
+            self.initial_capacity = expected_keys
+            self._stages = []
+            self._add_stage()
+
+    @property
+    def count(self) -> int:
+        """Number of keys added (including duplicates)."""
+        return sum(stage.count for stage in self._stages)
+
+    @property
+    def stages(self) -> List[BloomFilter]:
+        return list(self._stages)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Size of all bit arrays in bytes."""
+        return sum(stage.memory_bytes for stage in self._stages)
+
+    def estimated_false_positive_rate(self) -> float:
+        """Estimated compound false-positive rate at the current fill level."""
+        miss = 1.0
+        for stage in self._stages:
+            miss *= 1 - stage.estimated_false_positive_rate()
+        return 1 - miss
+
+    def clear(self) -> None:
+        """Drop all keys (back to a single initial stage)."""
+        self._stages = []
+        self._add_stage()
+
+    def restore_stages(self, stages: List[BloomFilter]) -> None:
+        """Replace the stages (checkpoint loading)."""
+        self._stages = stages
+
+
+class IdempotencyIndex:
+    """
+    Bounded-memory idempotency index (windowed LRU + optional Bloom filter).
+
+    Features:
+    - Exact duplicate detection for the most recent lru_capacity keys
+    - Scalable Bloom filter for all keys (file journals) with journal fallback
+    - Configurable initial memory budget
+    - Hit / false-positive metrics
+
+    Thread-Safety:
+    - NOT thread-safe (owned by a single journal on the event loop)
+    """
+
+    def __init__(
+        self,
+        lru_capacity: int = 100_000,
+        bloom_capacity: int = 1_000_000,
+        bloom_error_rate: float = 0.001,
+        use_bloom: bool = True,
+    ):
+        """
+        Initialize IdempotencyIndex.
+
+        Args:
+            lru_capacity: Max keys held exactly in the recent window
+            bloom_capacity: Keys the first Bloom stage is sized for (the
+                            filter grows beyond it)
+            bloom_error_rate: Target Bloom false-positive rate
+            use_bloom: Disable to rely solely on the journal fallback
+                       (e.g. Postgres UNIQUE constraint)
+        """
+        self.lru_capacity = max(1, lru_capacity)
+        self.bloom_error_rate = bloom_error_rate
+        self._recent: "OrderedDict[str, int]" = OrderedDict()
+        self._bloom: Optional[ScalableBloomFilter] = (
+            ScalableBloomFilter(bloom_capacity, bloom_error_rate) if use_bloom else None
+        )
+
+        # Metrics
+        self._lru_hits = 0
+        self._bloom_negatives = 0
+        self._fallback_checks = 0
+        self._fallback_duplicates = 0
+        self._false_positives = 0
+
+    @classmethod
+    def from_memory_budget(
+        cls,
+        memory_budget_mb: float,
+        bloom_error_rate: float = 0.001,
+        use_bloom: bool = True,
+    ) -> "IdempotencyIndex":
+        """
+        Size the index to fit a memory budget.
+
+        Half of the budget goes to the LRU window and half to the first
+        Bloom stage (all of it to the LRU when use_bloom is False). Later
+        Bloom stages are allocated beyond the budget as keys are added.
+
+        Args:
+            memory_budget_mb: Total memory budget in megabytes
+            bloom_error_rate: Target Bloom false-positive rate
+            use_bloom: Whether to allocate a Bloom filter
+        """
+        budget_bytes = max(1.0, memory_budget_mb) * 1024 * 1024
+        lru_bytes = budget_bytes / 2 if use_bloom else budget_bytes
+        bloom_bits = (budget_bytes - lru_bytes) * 8
+
+        first_stage_error_rate = bloom_error_rate * (1 - BLOOM_TIGHTENING)
+        bloom_capacity = max(
+            1,
+            int(bloom_bits * (math.log(2) ** 2) / -math.log(first_stage_error_rate)),
+        )
+
+        return cls(
+            lru_capacity=int(lru_bytes / LRU_BYTES_PER_KEY),
+            bloom_capacity=bloom_capacity,
+            bloom_error_rate=bloom_error_rate,
+            use_bloom=use_bloom,
+        )
+
+    @property
+    def has_bloom(self) -> bool:
+        """Whether a Bloom filter tier is configured."""
+        return self._bloom is not None
+
+    def reserve(self, expected_keys: int) -> None:
+        """
+        Size the Bloom filter for keys about to be loaded (while empty).
+
+        Args:
+            expected_keys: Number of keys the journal holds
+        """
+        if self._bloom is not None:
+            self._bloom.reserve(expected_keys)
+
+    def add(self, key: str, sequence: int = 0) -> None:
+        """
+        Record key as written.
+
+        Args:
+            key: Idempotency key
+            sequence: Journal sequence of the event (for diagnostics)
+        """
+        self._recent[key] = sequence
+        self._recent.move_to_end(key)
+        if len(self._recent) > self.lru_capacity:
+            self._recent.popitem(last=False)
+
+        if self._bloom is not None:
+            self._bloom.add(key)
+
+    def check(self, key: str) -> IdempotencyCheck:
+        """
+        Look up key.
+
+        Returns:
+            RECENT, ABSENT or MAYBE (see IdempotencyCheck)
+        """
+        if key in self._recent:
+            self._lru_hits += 1
+            self._recent.move_to_end(key)
+            return IdempotencyCheck.RECENT
+
+        if self._bloom is not None and key not in self._bloom:
+            self._bloom_negatives += 1
+            return IdempotencyCheck.ABSENT
+
+        return IdempotencyCheck.MAYBE
+
+    def record_fallback(self, is_duplicate: bool) -> None:
+        """
+        Record the outcome of a journal fallback check for a MAYBE lookup.
+
+        Args:
+            is_duplicate: True if the journal confirmed the key exists
+        """
+        self._fallback_checks += 1
+        if is_duplicate:
+            self._fallback_duplicates += 1
+        elif self._bloom is not None:
+            self._false_positives += 1
+
+    def clear(self) -> None:
+        """Remove all keys (metrics are kept)."""
+        self._recent.clear()
+        if self._bloom is not None:
+            self._bloom.clear()
+
+    # ========================================================================
+    # Checkpointing
+    # ========================================================================
+
+    def save_checkpoint(self, path: Path, sequence: int, offset: int) -> None:
+        """
+        Atomically persist the Bloom filter with the journal position it covers.
+
+        Args:
+            path: Checkpoint file path
+            sequence: Last journal sequence included in the filter
+            offset: Journal byte offset just after that event
+        """
+        if self._bloom is None:
+            return
+
+        stages = self._bloom.stages
+        header = {
+            "version": BLOOM_CHECKPOINT_VERSION,
+            "error_rate": self._bloom.error_rate,
+            "initial_capacity": self._bloom.initial_capacity,
+            "stages": [
+                {
+                    "num_bits": stage.num_bits,
+                    "num_hashes": stage.num_hashes,
+                    "capacity": stage.capacity,
+                    "count": stage.count,
+                }
+                for stage in stages
+            ],
+            "sequence": sequence,
+            "offset": offset,
+        }
+
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(json.dumps(header).encode("utf-8"))
+                f.write(b"\n")
+                for stage in stages:
+                    f.write(stage.to_bytes())
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(
+                "Failed to write idempotency checkpoint",
+                path=str(path),
+                error=str(e),
+            )
+
+    def load_checkpoint(self, path: Path) -> Optional[Tuple[int, int]]:
+        """
+        Load a Bloom filter checkpoint written by save_checkpoint().
+
+        The checkpoint's stages replace the current filter, so a filter
+        that grew past its initial capacity is restored as it was.
+
+        Returns:
+            (sequence, offset) covered by the checkpoint, or None if the
+            checkpoint is missing, corrupt or for a different error rate
+        """
+        if self._bloom is None or not path.exists():
+            return None
+
+        try:
+            with open(path, "rb") as f:
+                header = json.loads(f.readline().decode("utf-8"))
+                data = f.read()
+
+            if (
+                header.get("version") != BLOOM_CHECKPOINT_VERSION
+                or header.get("error_rate") != self._bloom.error_rate
+                or not header.get("stages")
+            ):
+                logger.info(
+                    "Idempotency checkpoint does not match index configuration, ignoring",
+                    path=str(path),
+                )
+                return None
+
+            stages = []
+            position = 0
+            for entry in header["stages"]:
+                stage = BloomFilter(int(entry["num_bits"]), int(entry["num_hashes"]), int(entry["capacity"]))
+                size = stage.memory_bytes
+                stage.load_bytes(data[position:position + size], int(entry["count"]))
+                position += size
+                stages.append(stage)
+            if position != len(data):
+                raise ValueError(f"Bloom checkpoint has {len(data) - position} trailing bytes")
+
+            self._bloom.initial_capacity = int(header["initial_capacity"])
+            self._bloom.restore_stages(stages)
+            return int(header["sequence"]), int(header["offset"])
+
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(
+                "Failed to load idempotency checkpoint, ignoring",
+                path=str(path),
+                error=str(e),
+            )
+            return None
+
+    def get_metrics(self) -> Dict:
+        """
+        Get index metrics.
+
+        Returns:
+            Dict with:
+            - lru_size / lru_capacity: Recent window usage
+            - lru_hits: Duplicates caught by the window
+            - bloom_negatives: Lookups answered "new" by the Bloom filter
+            - fallback_checks: Lookups that needed journal confirmation
+            - fallback_duplicates: Confirmed duplicates outside the window
+            - false_positives: Bloom positives the journal did not confirm
+            - false_positive_rate: false_positives / fallback_checks
+            - bloom_memory_bytes / bloom_estimated_fp_rate / bloom_stages
+            - estimated_memory_bytes: Approximate total footprint
+        """
+        bloom_bytes = self._bloom.memory_bytes if self._bloom is not None else 0
+        return {
+            "lru_size": len(self._recent),
+            "lru_capacity": self.lru_capacity,
+            "lru_hits": self._lru_hits,
+            "bloom_negatives": self._bloom_negatives,
+            "fallback_checks": self._fallback_checks,
+            "fallback_duplicates": self._fallback_duplicates,
+            "false_positives": self._false_positives,
+            "false_positive_rate": (
+                round(self._false_positives / self._fallback_checks, 4)
+                if self._fallback_checks
+                else 0.0
+            ),
+            "bloom_memory_bytes": bloom_bytes,
+            "bloom_stages": len(self._bloom.stages) if self._bloom is not None else 0,
+            "bloom_estimated_fp_rate": (
+                round(self._bloom.estimated_false_positive_rate(), 6)
+                if self._bloom is not None
+                else None
+            ),
+            "estimated_memory_bytes": bloom_bytes + len(self._recent) * LRU_BYTES_PER_KEY,
+        }
@@ -23,6 +23,7 @@ from typing import Literal, Optional
 from loguru import logger
 
 from app.modules.credits.event_sourcing.base_journal import BaseEventJournal
+from app.modules.credits.event_sourcing.idempotency_index import IdempotencyIndex
 
 
 EventJournalBackend = Literal["file", "postgres"]
@@ -39,8 +40,10 @@ async def create_event_journal(
         backend: Backend type ("file" or "postgres")
                 If None, uses EVENT_JOURNAL_BACKEND env var (default: "file")
         **kwargs: Backend-specific parameters:
-                 For file: file_path, enable_fsync
+                 For file: file_path, enable_fsync, group_commit,
+                           group_commit_max_batch, group_commit_max_delay_ms
                  For postgres: database_url, pool_size, max_overflow
+                 For both: idempotency_memory_mb
 
     Returns:
         Initialized Event Journal instance (BaseEventJournal)
@@ -50,6 +53,9 @@ async def create_event_journal(
 
     Environment Variables:
         EVENT_JOURNAL_BACKEND: "file" or "postgres" (default: "file")
+        EVENT_JOURNAL_GROUP_COMMIT: "true" to enable group commit (file backend)
+        EVENT_JOURNAL_IDEMPOTENCY_MEMORY_MB: Memory budget for the idempotency
+                                             index (default: index defaults)
         DATABASE_URL: PostgreSQL connection string (for postgres backend)
 
     Examples:
@@ -75,6 +81,12 @@ async def create_event_journal(
 
     backend = backend.lower()  # type: ignore
 
+    # Idempotency index memory budget (optional)
+    idempotency_memory_mb = kwargs.get(
+        "idempotency_memory_mb",
+        os.getenv("EVENT_JOURNAL_IDEMPOTENCY_MEMORY_MB"),
+    )
+
     # === File Backend ===
     if backend == "file":
         from app.modules.credits.event_sourcing.event_journal import EventJournal
@@ -82,10 +94,22 @@ async def create_event_journal(
         # Extract file-specific kwargs
         file_path = kwargs.get("file_path", "storage/events/credits.jsonl")
         enable_fsync = kwargs.get("enable_fsync", True)
+        group_commit = kwargs.get(
+            "group_commit",
+            os.getenv("EVENT_JOURNAL_GROUP_COMMIT", "false").lower() == "true",
+        )
 
         journal = EventJournal(
             file_path=file_path,
             enable_fsync=enable_fsync,
+            group_commit=group_commit,
+            group_commit_max_batch=kwargs.get("group_commit_max_batch", 256),
+            group_commit_max_delay_ms=kwargs.get("group_commit_max_delay_ms", 2.0),
+            idempotency_index=(
+                IdempotencyIndex.from_memory_budget(float(idempotency_memory_mb))
+                if idempotency_memory_mb
+                else None
+            ),
         )
 
         await journal.initialize()
@@ -94,6 +118,7 @@ async def create_event_journal(
             "Event Journal created (file backend)",
             file_path=file_path,
             enable_fsync=enable_fsync,
+            group_commit=group_commit,
         )
 
         return journal
@@ -111,6 +136,13 @@ async def create_event_journal(
             database_url=database_url,
             pool_size=pool_size,
             max_overflow=max_overflow,
+            idempotency_index=(
+                IdempotencyIndex.from_memory_budget(
+                    float(idempotency_memory_mb), use_bloom=False
+                )
+                if idempotency_memory_mb
+                else None
+            ),
         )
 
         await journal.initialize()
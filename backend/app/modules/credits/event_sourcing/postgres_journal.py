@@ -26,7 +26,7 @@ from __future__ import annotations
 
 import json
 import os
-from typing import AsyncIterator, Dict, Optional, Set
+from typing import AsyncIterator, Dict, Optional
 
 from loguru import logger
 from sqlalchemy import text
@@ -35,6 +35,10 @@ from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from app.modules.credits.event_sourcing.base_journal import BaseEventJournal
 from app.modules.credits.event_sourcing.events import EventEnvelope
+from app.modules.credits.event_sourcing.idempotency_index import (
+    IdempotencyCheck,
+    IdempotencyIndex,
+)
 
 
 class PostgresEventJournalError(Exception):
@@ -67,6 +71,7 @@ class PostgresEventJournal(BaseEventJournal):
         database_url: Optional[str] = None,
         pool_size: int = 10,
         max_overflow: int = 20,
+        idempotency_index: Optional[IdempotencyIndex] = None,
     ):
         """
         Initialize PostgresEventJournal.
@@ -76,6 +81,8 @@ class PostgresEventJournal(BaseEventJournal):
                          If None, uses DATABASE_URL from env
             pool_size: Connection pool size
             max_overflow: Max overflow connections
+            idempotency_index: Recent-key cache (default: LRU window only,
+                               UNIQUE constraint is the fallback)
         """
         # Get database URL
         if database_url is None:
@@ -97,9 +104,9 @@ class PostgresEventJournal(BaseEventJournal):
         self._pool_size = pool_size
         self._max_overflow = max_overflow
 
-        # Idempotency tracking (in-memory cache for performance)
-        # Note: DB has UNIQUE constraint as source of truth
-        self._seen_idempotency_keys: Set[str] = set()
+        # Idempotency tracking (bounded recent-key window for performance)
+        # Note: DB has UNIQUE constraint as source of truth, so no Bloom tier
+        self._idempotency = idempotency_index or IdempotencyIndex(use_bloom=False)
 
         # Metrics
         self._total_events = 0
@@ -110,7 +117,7 @@ class PostgresEventJournal(BaseEventJournal):
         Initialize Postgres connection and load idempotency keys.
 
         Creates async engine and verifies table exists.
-        Loads existing idempotency keys into memory cache.
+        Loads the most recent idempotency keys into the memory window.
 
         Raises:
             PostgresEventJournalError: If connection fails
@@ -166,9 +173,11 @@ class PostgresEventJournal(BaseEventJournal):
 
     async def _load_idempotency_keys(self) -> None:
         """
-        Load idempotency keys from database into memory cache.
+        Load the most recent idempotency keys into the memory window.
 
-        This prevents duplicate events on restart without hitting DB every time.
+        Only the last lru_capacity keys are fetched (retries are recent),
+        so startup cost and memory no longer grow with journal size. Older
+        duplicates are still rejected by the UNIQUE constraint.
         """
         if not self._engine:
             return
@@ -176,17 +185,28 @@ class PostgresEventJournal(BaseEventJournal):
         try:
             async with self._engine.begin() as conn:
                 result = await conn.execute(
-                    text("SELECT idempotency_key FROM credit_events")
+                    text("SELECT COUNT(*) FROM credit_events")
                 )
-                keys = result.fetchall()
+                self._total_events = result.scalar() or 0
 
-                for (key,) in keys:
-                    self._seen_idempotency_keys.add(key)
-                    self._total_events += 1
+                result = await conn.execute(
+                    text("""
+                        SELECT idempotency_key, id
+                        FROM credit_events
+                        ORDER BY id DESC
+                        LIMIT :window
+                    """),
+                    {"window": self._idempotency.lru_capacity},
+                )
+                rows = result.fetchall()
+
+                # Oldest first so the newest keys end up most recently used
+                for key, sequence_id in reversed(rows):
+                    self._idempotency.add(key, sequence_id)
 
             logger.debug(
-                "Loaded idempotency keys from Postgres",
-                total_keys=len(self._seen_idempotency_keys),
+                "Loaded recent idempotency keys from Postgres",
+                loaded_keys=len(rows),
                 total_events=self._total_events,
             )
 
@@ -209,15 +229,16 @@ class PostgresEventJournal(BaseEventJournal):
             PostgresEventJournalError: If database write fails
 
         Implementation:
-        1. Check in-memory cache (fast path)
+        1. Check recent-key window (fast path)
         2. INSERT with ON CONFLICT DO NOTHING (DB-level idempotency)
-        3. Update cache if inserted
+        3. Update window if inserted
         """
         if not self._engine or not self._session_factory:
             raise PostgresEventJournalError("Journal not initialized")
 
-        # === Fast Path: In-Memory Cache ===
-        if event.idempotency_key in self._seen_idempotency_keys:
+        # === Fast Path: Recent-Key Window ===
+        check = self._idempotency.check(event.idempotency_key)
+        if check == IdempotencyCheck.RECENT:
             self._idempotency_violations += 1
             logger.warning(
                 "Idempotency violation (cached): duplicate event ignored",
@@ -275,9 +296,13 @@ class PostgresEventJournal(BaseEventJournal):
                 # Check if inserted (ON CONFLICT returns no rows if duplicate)
                 inserted = result.fetchone()
 
+                if check == IdempotencyCheck.MAYBE:
+                    # UNIQUE constraint acted as the fallback check
+                    self._idempotency.record_fallback(is_duplicate=not inserted)
+
                 if inserted:
-                    # Update cache
-                    self._seen_idempotency_keys.add(event.idempotency_key)
+                    # Update window
+                    self._idempotency.add(event.idempotency_key, inserted[0])
                     self._total_events += 1
 
                     logger.debug(
@@ -296,8 +321,8 @@ class PostgresEventJournal(BaseEventJournal):
                         event_type=event.event_type,
                         idempotency_key=event.idempotency_key,
                     )
-                    # Add to cache to speed up future checks
-                    self._seen_idempotency_keys.add(event.idempotency_key)
+                    # Add to window to speed up future checks
+                    self._idempotency.add(event.idempotency_key)
                     return False
 
         except Exception as e:
@@ -311,12 +336,15 @@ class PostgresEventJournal(BaseEventJournal):
     async def read_events(
         self,
         skip_corrupted: bool = True,
+        from_sequence: int = 0,
     ) -> AsyncIterator[EventEnvelope]:
         """
-        Read all events from Postgres (ordered by sequence).
+        Read events from Postgres (ordered by sequence).
 
         Args:
             skip_corrupted: If True, skip corrupted events and log warning
+            from_sequence: Only yield events with id > from_sequence
+                           (0 = all events; uses the primary key index)
 
         Yields:
             EventEnvelope instances in insertion order
@@ -347,8 +375,10 @@ class PostgresEventJournal(BaseEventJournal):
                             causation_id,
                             payload
                         FROM credit_events
+                        WHERE id > :from_sequence
                         ORDER BY id ASC
-                    """)
+                    """),
+                    {"from_sequence": from_sequence},
                 )
 
                 corrupted_count = 0
@@ -391,6 +421,24 @@ class PostgresEventJournal(BaseEventJournal):
             logger.error(f"Failed to read events from Postgres: {e}")
             raise PostgresEventJournalError(f"Cannot read events: {e}") from e
 
+    async def get_last_sequence(self) -> int:
+        """
+        Get sequence (credit_events.id) of the last event in the journal.
+
+        Ids have gaps (rolled-back inserts and ON CONFLICT DO NOTHING consume
+        them), so this is not an event count; it is what snapshots must store
+        for read_events(from_sequence=...) to resume after them.
+
+        Returns:
+            MAX(id) (0 if journal is empty)
+        """
+        if not self._engine:
+            raise PostgresEventJournalError("Journal not initialized")
+
+        async with self._engine.connect() as conn:
+            result = await conn.execute(text("SELECT COALESCE(MAX(id), 0) FROM credit_events"))
+            return int(result.scalar_one())
+
     def get_metrics(self) -> Dict:
         """
         Get journal metrics for monitoring.
@@ -399,12 +447,15 @@ class PostgresEventJournal(BaseEventJournal):
             Dict with:
             - total_events: Total events in journal
             - idempotency_violations: Duplicate attempts
-            - cache_size: In-memory cache size
+            - cache_size: Recent-key window size
+            - idempotency_index: Idempotency index stats
         """
+        index_metrics = self._idempotency.get_metrics()
         return {
             "total_events": self._total_events,
             "idempotency_violations": self._idempotency_violations,
-            "cache_size": len(self._seen_idempotency_keys),
+            "cache_size": index_metrics["lru_size"],
+            "idempotency_index": index_metrics,
             "backend": "postgres",
         }
 
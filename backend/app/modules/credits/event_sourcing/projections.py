@@ -12,19 +12,28 @@ Design:
 - Rebuild from events on startup (replay)
 - In-memory for low-latency reads
 - Eventually consistent with event log
+- apply_event() is the synchronous state transition; handle_event() wraps
+  it for the EventBus (with per-event logging), apply_batch() is used by
+  the replay pipeline (no per-event await or debug logging)
+- Projections track the keys they changed; take_dirty() hands them to the
+  SnapshotManager for incremental (delta) snapshots
 
 Invariants:
 - Balance = Sum(all credit deltas)
 - No NaN, Inf, or None balances
-- Transaction history ordered by timestamp
+- Transaction history ordered by (timestamp, event_id)
 """
 
 from __future__ import annotations
 
-from collections import defaultdict
+import base64
+import heapq
+from bisect import bisect_left, insort
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
+from itertools import islice
+from typing import Deque, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
 
 from loguru import logger
 
@@ -34,7 +43,40 @@ from app.modules.credits.event_sourcing.events import (
 )
 
 
-@dataclass
+CREDIT_EVENT_TYPES: FrozenSet[EventType] = frozenset({
+    EventType.CREDIT_ALLOCATED,
+    EventType.CREDIT_CONSUMED,
+    EventType.CREDIT_REFUNDED,
+    EventType.CREDIT_WITHDRAWN,
+    EventType.CREDIT_REGENERATED,
+})
+
+
+def _apply_batch(projection, events: Iterable[EventEnvelope]) -> int:
+    """
+    Apply events to a projection synchronously (replay fast path).
+
+    Events that fail are logged and skipped, mirroring the replay loop.
+
+    Returns:
+        Number of events applied successfully
+    """
+    applied = 0
+    for event in events:
+        try:
+            projection.apply_event(event)
+            applied += 1
+        except Exception as e:
+            logger.error(
+                f"Failed to apply event to {type(projection).__name__}",
+                event_id=event.event_id,
+                event_type=event.event_type,
+                error=str(e),
+            )
+    return applied
+
+
+@dataclass(slots=True)
 class LedgerEntry:
     """Single ledger entry (transaction)."""
 
@@ -48,6 +90,15 @@ class LedgerEntry:
     mission_id: Optional[str] = None
 
 
+class InvalidCursorError(ValueError):
+    """Raised when a ledger pagination cursor cannot be decoded."""
+
+
+def _ledger_sort_key(entry: LedgerEntry) -> Tuple[datetime, str]:
+    """Total order of ledger entries: timestamp, then event_id as tie-breaker."""
+    return entry.timestamp, entry.event_id
+
+
 @dataclass
 class ApprovalRequest:
     """Approval request state."""
@@ -99,8 +150,11 @@ class BalanceProjection:
     - get_all_balances() → Dict[str, float]
     """
 
+    HANDLED_EVENT_TYPES: FrozenSet[EventType] = CREDIT_EVENT_TYPES
+
     def __init__(self):
         self._balances: Dict[str, float] = defaultdict(float)
+        self._dirty: Set[str] = set()
 
     async def handle_event(self, event: EventEnvelope) -> None:
         """
@@ -109,15 +163,27 @@ class BalanceProjection:
         Args:
             event: Credit event (allocated, consumed, refunded, withdrawn, regenerated)
         """
-        if event.event_type not in [
-            EventType.CREDIT_ALLOCATED,
-            EventType.CREDIT_CONSUMED,
-            EventType.CREDIT_REFUNDED,
-            EventType.CREDIT_WITHDRAWN,
-            EventType.CREDIT_REGENERATED,
-        ]:
+        balance_after = self.apply_event(event)
+        if balance_after is None:
             return
 
+        logger.debug(
+            f"Balance updated: {event.payload['entity_id']} → {balance_after}",
+            entity_id=event.payload["entity_id"],
+            balance=balance_after,
+            event_type=event.event_type,
+        )
+
+    def apply_event(self, event: EventEnvelope) -> Optional[float]:
+        """
+        Apply credit event to balances (synchronous, no debug logging).
+
+        Returns:
+            New balance, or None if the event was ignored
+        """
+        if event.event_type not in CREDIT_EVENT_TYPES:
+            return None
+
         entity_id = event.payload.get("entity_id")
         balance_after = event.payload.get("balance_after")
 
@@ -128,17 +194,16 @@ class BalanceProjection:
                 event_type=event.event_type,
                 payload=event.payload,
             )
-            return
+            return None
 
         # Update balance (use balance_after from event for consistency)
         self._balances[entity_id] = balance_after
+        self._dirty.add(entity_id)
+        return balance_after
 
-        logger.debug(
-            f"Balance updated: {entity_id} → {balance_after}",
-            entity_id=entity_id,
-            balance=balance_after,
-            event_type=event.event_type,
-        )
+    def apply_batch(self, events: Iterable[EventEnvelope]) -> int:
+        """Apply events in order (replay fast path)."""
+        return _apply_batch(self, events)
 
     def get_balance(self, entity_id: str) -> float:
         """
@@ -161,9 +226,15 @@ class BalanceProjection:
         """
         return dict(self._balances)
 
+    def take_dirty(self) -> Set[str]:
+        """Return and reset entity IDs changed since the last call."""
+        dirty, self._dirty = self._dirty, set()
+        return dirty
+
     def clear(self) -> None:
         """Clear all balances (for testing)."""
         self._balances.clear()
+        self._dirty.clear()
 
 
 # ============================================================================
@@ -183,22 +254,36 @@ class LedgerProjection:
     - CREDIT_REGENERATED
 
     State:
-    - entity_id → List[LedgerEntry]
+    - entity_id → Deque[LedgerEntry] (fixed-capacity ring buffer)
+
+    Each ring is kept ordered by (timestamp, event_id), oldest first:
+    - In-order events (the normal case) are a plain append; when the ring
+      is full the oldest entry is evicted in O(1)
+    - Late events are inserted at their sorted position
+    - Queries iterate the rings in reverse, so no per-query sort is needed;
+      get_all_entries() k-way merges the per-entity rings
 
     Query Methods:
-    - get_history(entity_id, limit) → List[LedgerEntry]
-    - get_all_entries() → List[LedgerEntry]
+    - get_history(entity_id, limit, before) → List[LedgerEntry]
+    - get_all_entries(limit, before) → List[LedgerEntry]
+    - get_page(entity_id, limit, cursor) → (List[LedgerEntry], next_cursor)
     """
 
+    HANDLED_EVENT_TYPES: FrozenSet[EventType] = CREDIT_EVENT_TYPES
+
     def __init__(self, max_entries_per_entity: int = 1000):
         """
         Initialize LedgerProjection.
 
         Args:
-            max_entries_per_entity: Max entries to keep per entity (FIFO)
+            max_entries_per_entity: Ring capacity per entity (oldest
+                                    entries are evicted first)
         """
-        self._history: Dict[str, List[LedgerEntry]] = defaultdict(list)
-        self._max_entries_per_entity = max_entries_per_entity
+        self._max_entries_per_entity = max(1, max_entries_per_entity)
+        self._history: Dict[str, Deque[LedgerEntry]] = defaultdict(
+            lambda: deque(maxlen=self._max_entries_per_entity)
+        )
+        self._dirty: Set[str] = set()
 
     async def handle_event(self, event: EventEnvelope) -> None:
         """
@@ -207,15 +292,28 @@ class LedgerProjection:
         Args:
             event: Credit event
         """
-        if event.event_type not in [
-            EventType.CREDIT_ALLOCATED,
-            EventType.CREDIT_CONSUMED,
-            EventType.CREDIT_REFUNDED,
-            EventType.CREDIT_WITHDRAWN,
-            EventType.CREDIT_REGENERATED,
-        ]:
+        entry = self.apply_event(event)
+        if entry is None:
             return
 
+        logger.debug(
+            f"Ledger entry added: {entry.entity_id}",
+            entity_id=entry.entity_id,
+            event_type=event.event_type,
+            amount=entry.amount,
+            total_entries=len(self._history[entry.entity_id]),
+        )
+
+    def apply_event(self, event: EventEnvelope) -> Optional[LedgerEntry]:
+        """
+        Add ledger entry from credit event (synchronous, no debug logging).
+
+        Returns:
+            The new LedgerEntry, or None if the event was ignored
+        """
+        if event.event_type not in CREDIT_EVENT_TYPES:
+            return None
+
         payload = event.payload
         entity_id = payload.get("entity_id")
 
@@ -225,7 +323,7 @@ class LedgerProjection:
                 event_id=event.event_id,
                 event_type=event.event_type,
             )
-            return
+            return None
 
         # Determine amount sign based on event type
         amount = payload.get("amount", 0.0)
@@ -245,25 +343,44 @@ class LedgerProjection:
             mission_id=payload.get("mission_id"),
         )
 
-        # Add entry to history
-        self._history[entity_id].append(entry)
+        self._insert(self._history[entity_id], entry)
+        self._dirty.add(entity_id)
+        return entry
 
-        # Enforce max entries (FIFO)
-        if len(self._history[entity_id]) > self._max_entries_per_entity:
-            self._history[entity_id].pop(0)
+    def apply_batch(self, events: Iterable[EventEnvelope]) -> int:
+        """Apply events in order (replay fast path)."""
+        return _apply_batch(self, events)
 
-        logger.debug(
-            f"Ledger entry added: {entity_id}",
-            entity_id=entity_id,
-            event_type=event.event_type,
-            amount=amount,
-            total_entries=len(self._history[entity_id]),
-        )
+    @staticmethod
+    def _insert(ring: Deque[LedgerEntry], entry: LedgerEntry) -> None:
+        """Insert entry into ring, keeping (timestamp, event_id) order."""
+        if not ring or _ledger_sort_key(ring[-1]) <= _ledger_sort_key(entry):
+            ring.append(entry)  # Fast path; maxlen evicts the oldest entry
+            return
+
+        # Late event: sorted insert (deque.insert() refuses to grow a full ring)
+        if len(ring) == ring.maxlen:
+            if _ledger_sort_key(entry) < _ledger_sort_key(ring[0]):
+                return  # Older than everything retained; would be evicted at once
+            ring.popleft()
+        insort(ring, entry, key=_ledger_sort_key)
+
+    @staticmethod
+    def _iter_newest_first(
+        ring: Deque[LedgerEntry],
+        before: Optional[Tuple[datetime, str]] = None,
+    ) -> Iterator[LedgerEntry]:
+        """Iterate ring newest first, starting strictly before the given key."""
+        if before is None:
+            return reversed(ring)
+        position = bisect_left(ring, before, key=_ledger_sort_key)
+        return islice(reversed(ring), len(ring) - position, None)
 
     def get_history(
         self,
         entity_id: str,
         limit: Optional[int] = None,
+        before: Optional[Tuple[datetime, str]] = None,
     ) -> List[LedgerEntry]:
         """
         Get transaction history for entity.
@@ -271,36 +388,109 @@ class LedgerProjection:
         Args:
             entity_id: Entity ID
             limit: Max number of entries (most recent first)
+            before: Only return entries strictly older than this
+                    (timestamp, event_id) key
 
         Returns:
             List of LedgerEntry (ordered by timestamp, newest first)
         """
-        entries = self._history.get(entity_id, [])
+        ring = self._history.get(entity_id)
+        if not ring:
+            return []
 
-        # Sort by timestamp (newest first)
-        sorted_entries = sorted(entries, key=lambda e: e.timestamp, reverse=True)
+        return list(islice(self._iter_newest_first(ring, before), limit or None))
 
-        if limit:
-            return sorted_entries[:limit]
-
-        return sorted_entries
-
-    def get_all_entries(self) -> List[LedgerEntry]:
+    def get_all_entries(
+        self,
+        limit: Optional[int] = None,
+        before: Optional[Tuple[datetime, str]] = None,
+    ) -> List[LedgerEntry]:
         """
         Get all ledger entries across all entities.
 
+        Merges the already-ordered per-entity rings lazily, so a limited
+        query only touches about limit + number_of_entities entries.
+
+        Args:
+            limit: Max number of entries (most recent first)
+            before: Only return entries strictly older than this
+                    (timestamp, event_id) key
+
         Returns:
             List of all LedgerEntry (ordered by timestamp, newest first)
         """
-        all_entries = []
-        for entries in self._history.values():
-            all_entries.extend(entries)
+        merged = heapq.merge(
+            *(self._iter_newest_first(ring, before) for ring in self._history.values()),
+            key=_ledger_sort_key,
+            reverse=True,
+        )
+        return list(islice(merged, limit or None))
+
+    def get_page(
+        self,
+        entity_id: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[LedgerEntry], Optional[str]]:
+        """
+        Get one page of history (newest first) with a continuation cursor.
+
+        Args:
+            entity_id: Entity ID, or None for entries across all entities
+            limit: Page size
+            cursor: next_cursor returned by the previous page
+
+        Returns:
+            (entries, next_cursor); next_cursor is None on the last page
+
+        Raises:
+            InvalidCursorError: If cursor is malformed
+        """
+        limit = max(1, limit)
+        before = self.decode_cursor(cursor) if cursor else None
+
+        # Fetch one extra entry to detect whether another page exists
+        if entity_id is None:
+            entries = self.get_all_entries(limit=limit + 1, before=before)
+        else:
+            entries = self.get_history(entity_id, limit=limit + 1, before=before)
+
+        if len(entries) <= limit:
+            return entries, None
+
+        entries = entries[:limit]
+        return entries, self.encode_cursor(entries[-1])
+
+    @staticmethod
+    def encode_cursor(entry: LedgerEntry) -> str:
+        """Encode an opaque, URL-safe cursor pointing just past entry."""
+        raw = f"{entry.timestamp.isoformat()}|{entry.event_id}"
+        return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+        """
+        Decode a cursor produced by encode_cursor().
 
-        return sorted(all_entries, key=lambda e: e.timestamp, reverse=True)
+        Raises:
+            InvalidCursorError: If cursor is malformed
+        """
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+            timestamp, event_id = raw.split("|", 1)
+            return datetime.fromisoformat(timestamp), event_id
+        except (ValueError, UnicodeError) as e:
+            raise InvalidCursorError(f"Invalid ledger cursor: {cursor!r}") from e
+
+    def take_dirty(self) -> Set[str]:
+        """Return and reset entity IDs changed since the last call."""
+        dirty, self._dirty = self._dirty, set()
+        return dirty
 
     def clear(self) -> None:
         """Clear all ledger entries (for testing)."""
         self._history.clear()
+        self._dirty.clear()
 
 
 # ============================================================================
@@ -327,8 +517,16 @@ class ApprovalProjection:
     - get_resolved_approvals() → List[ApprovalRequest]
     """
 
+    HANDLED_EVENT_TYPES: FrozenSet[EventType] = frozenset({
+        EventType.APPROVAL_REQUESTED,
+        EventType.APPROVAL_APPROVED,
+        EventType.APPROVAL_REJECTED,
+        EventType.APPROVAL_EXPIRED,
+    })
+
     def __init__(self):
         self._requests: Dict[str, ApprovalRequest] = {}
+        self._dirty: Set[str] = set()
 
     async def handle_event(self, event: EventEnvelope) -> None:
         """
@@ -337,6 +535,10 @@ class ApprovalProjection:
         Args:
             event: Approval event
         """
+        self.apply_event(event)
+
+    def apply_event(self, event: EventEnvelope) -> None:
+        """Update approval state from event (synchronous)."""
         if event.event_type == EventType.APPROVAL_REQUESTED:
             request_id = event.payload.get("request_id")
             if not request_id:
@@ -351,6 +553,7 @@ class ApprovalProjection:
                 requested_at=event.timestamp,
                 action_context=event.payload.get("action_context", {}),
             )
+            self._dirty.add(request_id)
 
         elif event.event_type in [
             EventType.APPROVAL_APPROVED,
@@ -380,6 +583,11 @@ class ApprovalProjection:
             request.resolved_at = event.timestamp
             request.resolved_by = event.payload.get("approver_id", event.actor_id)
             request.justification = event.payload.get("justification", "")
+            self._dirty.add(request_id)
+
+    def apply_batch(self, events: Iterable[EventEnvelope]) -> int:
+        """Apply events in order (replay fast path)."""
+        return _apply_batch(self, events)
 
     def get_request(self, request_id: str) -> Optional[ApprovalRequest]:
         """
@@ -431,9 +639,15 @@ class ApprovalProjection:
             reverse=True,
         )
 
+    def take_dirty(self) -> Set[str]:
+        """Return and reset request IDs changed since the last call."""
+        dirty, self._dirty = self._dirty, set()
+        return dirty
+
     def clear(self) -> None:
         """Clear all approval requests (for testing)."""
         self._requests.clear()
+        self._dirty.clear()
 
 
 # ============================================================================
@@ -458,9 +672,15 @@ class SynergieProjection:
     - get_reuse_stats(agent_id) → Dict
     """
 
+    HANDLED_EVENT_TYPES: FrozenSet[EventType] = frozenset({
+        EventType.COLLABORATION_RECORDED,
+        EventType.REUSE_DETECTED,
+    })
+
     def __init__(self):
         self._collaborations: List[CollaborationRecord] = []
         self._reuse_stats: Dict[str, int] = defaultdict(int)
+        self._dirty: Set[str] = set()
 
     async def handle_event(self, event: EventEnvelope) -> None:
         """
@@ -469,6 +689,10 @@ class SynergieProjection:
         Args:
             event: Synergie event
         """
+        self.apply_event(event)
+
+    def apply_event(self, event: EventEnvelope) -> None:
+        """Update synergie data from event (synchronous)."""
         if event.event_type == EventType.COLLABORATION_RECORDED:
             collab = CollaborationRecord(
                 collaboration_id=event.payload.get("collaboration_id", ""),
@@ -483,6 +707,11 @@ class SynergieProjection:
             source_agent_id = event.payload.get("source_agent_id")
             if source_agent_id:
                 self._reuse_stats[source_agent_id] += 1
+                self._dirty.add(source_agent_id)
+
+    def apply_batch(self, events: Iterable[EventEnvelope]) -> int:
+        """Apply events in order (replay fast path)."""
+        return _apply_batch(self, events)
 
     def get_collaboration_history(
         self,
@@ -521,10 +750,20 @@ class SynergieProjection:
 
         return dict(self._reuse_stats)
 
+    def take_dirty(self) -> Set[str]:
+        """
+        Return and reset source agent IDs whose reuse stats changed.
+
+        Collaborations are append-only; snapshots track them by count.
+        """
+        dirty, self._dirty = self._dirty, set()
+        return dirty
+
     def clear(self) -> None:
         """Clear all synergie data (for testing)."""
         self._collaborations.clear()
         self._reuse_stats.clear()
+        self._dirty.clear()
 
 
 # ============================================================================
@@ -594,6 +833,21 @@ class ProjectionManager:
 
         logger.info("All projections subscribed to EventBus")
 
+    def projections(self) -> Dict[str, object]:
+        """
+        Get projections by name (replay pipeline partitions).
+
+        Returns:
+            Dict of name → projection (each has HANDLED_EVENT_TYPES,
+            apply_batch)
+        """
+        return {
+            "balance": self.balance,
+            "ledger": self.ledger,
+            "approval": self.approval,
+            "synergie": self.synergie,
+        }
+
     def clear_all(self) -> None:
         """Clear all projections (for testing)."""
         self.balance.clear()
@@ -0,0 +1,456 @@
+"""
+Snapshot Codec - Binary Columnar Encoding for Projection Snapshots (v2).
+
+Encodes projection state as struct-packed columns instead of JSON dicts:
+- Balances: entity_id column + float64 column
+- Ledger: per-entity entry counts + one column per LedgerEntry field
+  (timestamps as int64 epoch microseconds)
+- Approvals / collaborations: compact JSON sections (small, irregular)
+
+The column stream is fed through a streaming compressor (zlib by default,
+zstd when the optional `zstandard` package is installed), so the
+uncompressed payload is never materialized as one buffer.
+
+The same SnapshotState type is used for full snapshots and for deltas;
+a delta only carries entities changed since its parent snapshot and is
+folded onto its base with SnapshotState.merge().
+
+Payload layout (before compression):
+    MAGIC | version:u8 | section* (tag:u8, columns...)
+
+Usage:
+    payload, raw_bytes = encode_state(state, compression="zlib")
+    state = decode_state(payload, compression="zlib")
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import sys
+import zlib
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.modules.credits.event_sourcing.projections import (
+    CollaborationRecord,
+    LedgerEntry,
+)
+
+# Optional zstd support
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+SNAPSHOT_FORMAT_VERSION = 2
+MAGIC = b"BRSNAP"
+
+COMPRESSION_NONE = "none"
+COMPRESSION_ZLIB = "zlib"
+COMPRESSION_ZSTD = "zstd"
+
+_SECTION_BALANCE = 1
+_SECTION_LEDGER = 2
+_SECTION_APPROVAL = 3
+_SECTION_SYNERGIE = 4
+_SECTION_END = 0
+
+_NULL_LENGTH = 0xFFFFFFFF
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_U32 = struct.Struct("<I")
+
+
+class SnapshotCodecError(Exception):
+    """Raised when a snapshot payload cannot be decoded."""
+
+
+def available_compressions() -> List[str]:
+    """Compression codecs usable in this environment."""
+    codecs = [COMPRESSION_NONE, COMPRESSION_ZLIB]
+    if zstandard is not None:
+        codecs.append(COMPRESSION_ZSTD)
+    return codecs
+
+
+# ============================================================================
+# Snapshot State
+# ============================================================================
+
+
+@dataclass
+class SnapshotState:
+    """
+    Decoded projection state (full snapshot or delta).
+
+    Approval requests are kept as plain dicts (see approval_to_dict) so a
+    captured state is detached from the live, mutable projection objects.
+    """
+
+    balances: Dict[str, float] = field(default_factory=dict)
+    ledger: Dict[str, List[LedgerEntry]] = field(default_factory=dict)
+    approvals: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    collaborations: List[CollaborationRecord] = field(default_factory=list)
+    reuse_stats: Dict[str, int] = field(default_factory=dict)
+
+    def merge(self, delta: "SnapshotState") -> None:
+        """
+        Fold a delta onto this state (in place).
+
+        Entities in the delta replace the stored ones; collaborations are
+        append-only and are extended.
+        """
+        self.balances.update(delta.balances)
+        self.ledger.update(delta.ledger)
+        self.approvals.update(delta.approvals)
+        self.collaborations.extend(delta.collaborations)
+        self.reuse_stats.update(delta.reuse_stats)
+
+    def entity_count(self) -> int:
+        """Number of entities/records carried by this state."""
+        return (
+            len(self.balances)
+            + len(self.ledger)
+            + len(self.approvals)
+            + len(self.collaborations)
+            + len(self.reuse_stats)
+        )
+
+    def to_state_data(self) -> Dict[str, Dict[str, Any]]:
+        """State in the per-projection shape expected by the restore_* methods."""
+        return {
+            "balance": {"balances": self.balances},
+            "ledger": {"entries": self.ledger},
+            "approval": {"requests": self.approvals},
+            "synergie": {
+                "collaborations": self.collaborations,
+                "reuse_stats": self.reuse_stats,
+            },
+        }
+
+
+def approval_to_dict(request) -> Dict[str, Any]:
+    """Convert ApprovalRequest to a JSON-serializable dict."""
+    return {
+        "request_id": request.request_id,
+        "action_type": request.action_type,
+        "requester_id": request.requester_id,
+        "risk_level": request.risk_level,
+        "status": request.status,
+        "requested_at": request.requested_at.isoformat(),
+        "resolved_at": request.resolved_at.isoformat() if request.resolved_at else None,
+        "resolved_by": request.resolved_by,
+        "justification": request.justification,
+        "action_context": request.action_context,
+    }
+
+
+# ============================================================================
+# Compression
+# ============================================================================
+
+
+def _compressor(compression: str, level: Optional[int]):
+    if compression == COMPRESSION_ZLIB:
+        return zlib.compressobj(6 if level is None else level)
+    if compression == COMPRESSION_ZSTD:
+        if zstandard is None:
+            raise SnapshotCodecError("zstd compression requires the 'zstandard' package")
+        return zstandard.ZstdCompressor(level=3 if level is None else level).compressobj()
+    if compression == COMPRESSION_NONE:
+        return None
+    raise SnapshotCodecError(f"Unknown snapshot compression: {compression}")
+
+
+def _decompress(payload: bytes, compression: str) -> bytes:
+    try:
+        if compression == COMPRESSION_ZLIB:
+            return zlib.decompress(payload)
+        if compression == COMPRESSION_ZSTD:
+            if zstandard is None:
+                raise SnapshotCodecError("zstd compression requires the 'zstandard' package")
+            return zstandard.ZstdDecompressor().decompressobj().decompress(payload)
+        if compression == COMPRESSION_NONE:
+            return payload
+    except zlib.error as e:
+        raise SnapshotCodecError(f"Corrupt snapshot payload: {e}") from e
+    raise SnapshotCodecError(f"Unknown snapshot compression: {compression}")
+
+
+# ============================================================================
+# Column Writer / Reader
+# ============================================================================
+
+
+def _packed(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+class _ColumnWriter:
+    """Streams little-endian columns through a compressor."""
+
+    def __init__(self, compression: str, level: Optional[int]):
+        self._compressor = _compressor(compression, level)
+        self._chunks: List[bytes] = []
+        self.raw_bytes = 0
+
+    def write(self, data: bytes) -> None:
+        self.raw_bytes += len(data)
+        if self._compressor is None:
+            self._chunks.append(data)
+        else:
+            chunk = self._compressor.compress(data)
+            if chunk:
+                self._chunks.append(chunk)
+
+    def u8(self, value: int) -> None:
+        self.write(bytes((value,)))
+
+    def u32(self, value: int) -> None:
+        self.write(_U32.pack(value))
+
+    def ints(self, values: Sequence[int]) -> None:
+        self.u32(len(values))
+        self.write(_packed(array("q", values)))
+
+    def floats(self, values: Sequence[float]) -> None:
+        self.u32(len(values))
+        self.write(_packed(array("d", values)))
+
+    def strings(self, values: Sequence[Optional[str]]) -> None:
+        """Length-prefixed UTF-8 strings; None is encoded as a sentinel length."""
+        encoded = [None if v is None else v.encode("utf-8") for v in values]
+        lengths = array("I", (_NULL_LENGTH if v is None else len(v) for v in encoded))
+        self.u32(len(values))
+        self.write(_packed(lengths))
+        self.write(b"".join(v for v in encoded if v))
+
+    def json(self, value: Any) -> None:
+        data = json.dumps(value, separators=(",", ":")).encode("utf-8")
+        self.u32(len(data))
+        self.write(data)
+
+    def finish(self) -> bytes:
+        if self._compressor is not None:
+            self._chunks.append(self._compressor.flush())
+        return b"".join(self._chunks)
+
+
+class _ColumnReader:
+    """Reads columns written by _ColumnWriter from an uncompressed payload."""
+
+    def __init__(self, data: bytes):
+        self._view = memoryview(data)
+        self._pos = 0
+
+    def _take(self, size: int) -> memoryview:
+        end = self._pos + size
+        if end > len(self._view):
+            raise SnapshotCodecError("Truncated snapshot payload")
+        chunk = self._view[self._pos:end]
+        self._pos = end
+        return chunk
+
+    def raw(self, size: int) -> bytes:
+        return bytes(self._take(size))
+
+    def u8(self) -> int:
+        return self._take(1)[0]
+
+    def u32(self) -> int:
+        return _U32.unpack(self._take(4))[0]
+
+    def _array(self, typecode: str) -> array:
+        count = self.u32()
+        values = array(typecode)
+        values.frombytes(self._take(count * values.itemsize))
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values
+
+    def ints(self) -> array:
+        return self._array("q")
+
+    def floats(self) -> array:
+        return self._array("d")
+
+    def strings(self) -> List[Optional[str]]:
+        lengths = self._array("I")
+        total = sum(length for length in lengths if length != _NULL_LENGTH)
+        blob = bytes(self._take(total))
+        values: List[Optional[str]] = []
+        pos = 0
+        for length in lengths:
+            if length == _NULL_LENGTH:
+                values.append(None)
+            else:
+                values.append(blob[pos:pos + length].decode("utf-8"))
+                pos += length
+        return values
+
+    def json(self) -> Any:
+        return json.loads(bytes(self._take(self.u32())))
+
+
+# ============================================================================
+# Encode / Decode
+# ============================================================================
+
+
+def _to_micros(timestamp: datetime) -> int:
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return (timestamp - _EPOCH) // timedelta(microseconds=1)
+
+
+def _from_micros(micros: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=micros)
+
+
+def encode_state(
+    state: SnapshotState,
+    compression: str = COMPRESSION_ZLIB,
+    level: Optional[int] = None,
+) -> Tuple[bytes, int]:
+    """
+    Encode state into a compressed binary payload.
+
+    Args:
+        state: Full or delta state
+        compression: "zlib", "zstd" or "none"
+        level: Compression level (codec default if None)
+
+    Returns:
+        (payload, raw_bytes) - compressed payload and uncompressed size
+
+    Raises:
+        SnapshotCodecError: If the compression codec is unavailable
+    """
+    writer = _ColumnWriter(compression, level)
+    writer.write(MAGIC)
+    writer.u8(SNAPSHOT_FORMAT_VERSION)
+
+    # Balances
+    writer.u8(_SECTION_BALANCE)
+    writer.strings(list(state.balances.keys()))
+    writer.floats(list(state.balances.values()))
+
+    # Ledger (entries flattened in entity order, counts delimit entities)
+    entity_ids = list(state.ledger.keys())
+    rings = [state.ledger[entity_id] for entity_id in entity_ids]
+    entries = [entry for ring in rings for entry in ring]
+
+    writer.u8(_SECTION_LEDGER)
+    writer.strings(entity_ids)
+    writer.ints([len(ring) for ring in rings])
+    writer.strings([e.event_id for e in entries])
+    writer.ints([_to_micros(e.timestamp) for e in entries])
+    writer.strings([e.entity_type for e in entries])
+    writer.floats([e.amount for e in entries])
+    writer.floats([e.balance_after for e in entries])
+    writer.strings([e.reason for e in entries])
+    writer.strings([e.mission_id for e in entries])
+
+    # Approvals
+    writer.u8(_SECTION_APPROVAL)
+    writer.json(list(state.approvals.values()))
+
+    # Synergie
+    writer.u8(_SECTION_SYNERGIE)
+    writer.json({
+        "collaborations": [
+            {
+                "collaboration_id": c.collaboration_id,
+                "agent_ids": c.agent_ids,
+                "mission_id": c.mission_id,
+                "contribution_scores": c.contribution_scores,
+                "timestamp": _to_micros(c.timestamp),
+            }
+            for c in state.collaborations
+        ],
+        "reuse_stats": state.reuse_stats,
+    })
+
+    writer.u8(_SECTION_END)
+    return writer.finish(), writer.raw_bytes
+
+
+def decode_state(payload: bytes, compression: str = COMPRESSION_ZLIB) -> SnapshotState:
+    """
+    Decode a payload produced by encode_state().
+
+    Raises:
+        SnapshotCodecError: If the payload is corrupt or of another version
+    """
+    reader = _ColumnReader(_decompress(payload, compression))
+
+    if reader.raw(len(MAGIC)) != MAGIC:
+        raise SnapshotCodecError("Not a snapshot payload (bad magic)")
+    version = reader.u8()
+    if version != SNAPSHOT_FORMAT_VERSION:
+        raise SnapshotCodecError(f"Unsupported snapshot format version: {version}")
+
+    state = SnapshotState()
+
+    while True:
+        section = reader.u8()
+
+        if section == _SECTION_END:
+            return state
+
+        if section == _SECTION_BALANCE:
+            keys = reader.strings()
+            state.balances = dict(zip(keys, reader.floats()))
+
+        elif section == _SECTION_LEDGER:
+            entity_ids = reader.strings()
+            counts = reader.ints()
+            event_ids = reader.strings()
+            timestamps = reader.ints()
+            entity_types = reader.strings()
+            amounts = reader.floats()
+            balances_after = reader.floats()
+            reasons = reader.strings()
+            mission_ids = reader.strings()
+
+            pos = 0
+            for entity_id, count in zip(entity_ids, counts):
+                state.ledger[entity_id] = [
+                    LedgerEntry(
+                        event_id=event_ids[i],
+                        timestamp=_from_micros(timestamps[i]),
+                        entity_id=entity_id,
+                        entity_type=entity_types[i],
+                        amount=amounts[i],
+                        balance_after=balances_after[i],
+                        reason=reasons[i],
+                        mission_id=mission_ids[i],
+                    )
+                    for i in range(pos, pos + count)
+                ]
+                pos += count
+
+        elif section == _SECTION_APPROVAL:
+            state.approvals = {item["request_id"]: item for item in reader.json()}
+
+        elif section == _SECTION_SYNERGIE:
+            data = reader.json()
+            state.collaborations = [
+                CollaborationRecord(
+                    collaboration_id=c["collaboration_id"],
+                    agent_ids=c["agent_ids"],
+                    mission_id=c["mission_id"],
+                    contribution_scores=c["contribution_scores"],
+                    timestamp=_from_micros(c["timestamp"]),
+                )
+                for c in data["collaborations"]
+            ]
+            state.reuse_stats = data["reuse_stats"]
+
+        else:
+            raise SnapshotCodecError(f"Unknown snapshot section: {section}")
@@ -9,9 +9,22 @@ Implements periodic snapshots of projection states for faster replay:
 Design:
 - Snapshots stored in Postgres (credit_snapshots table)
 - One snapshot per projection type (balance, ledger, approval, synergie)
-- Retention policy: Keep last N snapshots
+- Retention policy: Keep last N snapshots (whole chains, see below)
 - Automatic snapshot on every M events
 
+Snapshot format v2:
+- Binary columnar payload (snapshot_codec), stream-compressed with zlib
+  or zstd, stored in `payload` (BYTEA) with a SHA256 `checksum`
+- Incremental snapshots: a delta only carries entities changed since its
+  parent (projections track dirty keys) and points at its parent and the
+  full base snapshot of its chain
+- After `max_delta_chain` deltas the next snapshot is full again
+- Legacy v1 rows (JSONB `state_data`) can still be loaded
+
+The v2 columns (format_version, compression, payload, raw_size_bytes,
+base_snapshot_id, parent_snapshot_id, chain_length, checksum) and the
+nullable state_data come with migration 051_add_credit_snapshots_v2_columns.
+
 Usage:
     snapshot_mgr = SnapshotManager(database_url="...")
     await snapshot_mgr.initialize()
@@ -25,8 +38,8 @@ Usage:
     # Load latest snapshot
     snapshot = await snapshot_mgr.load_latest_snapshot("balance")
 
-    # Replay from snapshot
-    await replay_engine.replay_from_snapshot(snapshot)
+    # Restore projections (and continue the delta chain from it)
+    snapshot_mgr.restore_snapshot(projection_manager, snapshot)
 """
 
 from __future__ import annotations
@@ -35,15 +48,49 @@ import gzip
 import hashlib
 import json
 import os
+import time
+from collections import defaultdict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 from loguru import logger
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, AsyncSession
 from sqlalchemy.ext.asyncio import async_sessionmaker
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from app.modules.credits.event_sourcing.projections import ApprovalRequest
+from app.modules.credits.event_sourcing.snapshot_codec import (
+    COMPRESSION_NONE,
+    COMPRESSION_ZLIB,
+    SNAPSHOT_FORMAT_VERSION,
+    SnapshotCodecError,
+    SnapshotState,
+    approval_to_dict,
+    available_compressions,
+    decode_state,
+    encode_state,
+)
+
+
+_SNAPSHOT_COLUMNS = """
+    snapshot_id,
+    snapshot_type,
+    sequence_number,
+    event_count,
+    state_data,
+    created_at,
+    size_bytes,
+    format_version,
+    compression,
+    payload,
+    raw_size_bytes,
+    base_snapshot_id,
+    parent_snapshot_id,
+    chain_length,
+    checksum
+"""
 
 
 class ProjectionSnapshot(BaseModel):
@@ -57,9 +104,21 @@ class ProjectionSnapshot(BaseModel):
     snapshot_type: str  # "balance", "ledger", "approval", "synergie", "all"
     sequence_number: int  # Last processed event id
     event_count: int  # Total events processed
-    state_data: Dict[str, Any]  # Serialized projection state
+    state_data: Dict[str, Any] = Field(default_factory=dict)  # Projection state (merged chain on load)
     created_at: datetime
-    size_bytes: Optional[int] = None
+    size_bytes: Optional[int] = None  # Stored (compressed) size
+    format_version: int = 1
+    compression: Optional[str] = None
+    raw_size_bytes: Optional[int] = None  # Uncompressed payload size
+    base_snapshot_id: Optional[str] = None  # Full snapshot the chain starts from (deltas only)
+    parent_snapshot_id: Optional[str] = None  # Previous snapshot in the chain (deltas only)
+    chain_length: int = 0  # Deltas since base (0 = full snapshot)
+    checksum: Optional[str] = None  # SHA256 of payload
+
+    @property
+    def is_delta(self) -> bool:
+        """True if this snapshot only holds changes since its parent."""
+        return self.parent_snapshot_id is not None
 
 
 class SnapshotManager:
@@ -67,8 +126,8 @@ class SnapshotManager:
     Manages projection snapshots for fast replay.
 
     Features:
-    - Create snapshots at sequence number N
-    - Load latest snapshot for projection type
+    - Create snapshots at sequence number N (full or delta)
+    - Load latest snapshot for projection type (resolving delta chains)
     - Automatic cleanup (retention policy)
     - Postgres-backed storage
     """
@@ -77,6 +136,9 @@ class SnapshotManager:
         self,
         database_url: Optional[str] = None,
         retention_count: int = 10,
+        compression: Optional[str] = None,
+        incremental: bool = True,
+        max_delta_chain: Optional[int] = None,
     ):
         """
         Initialize SnapshotManager.
@@ -85,6 +147,14 @@ class SnapshotManager:
             database_url: PostgreSQL connection string (async)
                          If None, uses DATABASE_URL from env
             retention_count: Number of snapshots to keep per type (default: 10)
+            compression: "zlib", "zstd" or "none"
+                         If None, uses SNAPSHOT_COMPRESSION from env (default: zlib)
+            incremental: Write delta snapshots between full ones
+            max_delta_chain: Deltas before the next full snapshot
+                             If None, uses SNAPSHOT_MAX_DELTA_CHAIN from env (default: 10)
+
+        Raises:
+            ValueError: If the compression codec is unknown or unavailable
         """
         # Get database URL
         if database_url is None:
@@ -99,6 +169,33 @@ class SnapshotManager:
         self.database_url = database_url
         self.retention_count = retention_count
 
+        if compression is None:
+            compression = os.getenv("SNAPSHOT_COMPRESSION", COMPRESSION_ZLIB)
+        if compression not in available_compressions():
+            raise ValueError(
+                f"Snapshot compression {compression!r} not available "
+                f"(available: {available_compressions()})"
+            )
+        if max_delta_chain is None:
+            max_delta_chain = int(os.getenv("SNAPSHOT_MAX_DELTA_CHAIN", "10"))
+
+        self.compression = compression
+        self.incremental = incremental
+        self.max_delta_chain = max(0, max_delta_chain)
+
+        # Delta chain state (snapshot deltas are taken against)
+        self._chain_head: Optional[ProjectionSnapshot] = None
+        self._chain_collaboration_count = 0
+
+        # Metrics (sizes and timings, see get_metrics())
+        self._metrics: Dict[str, Any] = {
+            "full_snapshots": 0,
+            "delta_snapshots": 0,
+            "last_snapshot": None,
+            "last_load_duration_seconds": None,
+            "last_restore": None,
+        }
+
         # SQLAlchemy async engine
         self._engine: Optional[AsyncEngine] = None
         self._session_factory: Optional[async_sessionmaker] = None
@@ -142,6 +239,21 @@ class SnapshotManager:
                         "credit_snapshots table does not exist. "
                         "Run: alembic upgrade head"
                     )
+                else:
+                    result = await conn.execute(
+                        text("""
+                            SELECT EXISTS (
+                                SELECT FROM information_schema.columns
+                                WHERE table_name = 'credit_snapshots'
+                                AND column_name = 'payload'
+                            )
+                        """)
+                    )
+                    if not result.scalar():
+                        logger.warning(
+                            "credit_snapshots lacks the v2 snapshot columns, snapshot writes will fail. "
+                            "Run: alembic upgrade head"
+                        )
 
             logger.info(
                 "SnapshotManager initialized",
@@ -158,6 +270,7 @@ class SnapshotManager:
         projection_manager,
         sequence_number: int,
         event_count: int = 0,
+        full: bool = False,
     ) -> ProjectionSnapshot:
         """
         Create snapshot of all projections at sequence number.
@@ -166,84 +279,145 @@ class SnapshotManager:
             projection_manager: ProjectionManager instance
             sequence_number: Last processed event id (from credit_events.id)
             event_count: Total events processed
+            full: Force a full snapshot even if a delta is possible
 
         Returns:
-            ProjectionSnapshot
+            ProjectionSnapshot (state_data is not populated)
 
         Implementation:
-        1. Serialize projection states to JSON
-        2. Insert into credit_snapshots table
-        3. Cleanup old snapshots (retention policy)
+        1. Capture full state, or only entities changed since the chain head
+        2. Encode as binary columns + stream-compress (snapshot_codec)
+        3. Insert into credit_snapshots table
+        4. Cleanup old snapshots (retention policy, chain-aware)
         """
         if not self._engine or not self._session_factory:
             raise RuntimeError("SnapshotManager not initialized")
 
+        start = time.perf_counter()
         snapshot_id = str(uuid4())
         snapshot_type = "all"  # Could be per-projection for granularity
 
-        # Serialize projection states
-        state_data = {
-            "balance": self._serialize_balance_projection(projection_manager.balance),
-            "ledger": self._serialize_ledger_projection(projection_manager.ledger),
-            "approval": self._serialize_approval_projection(projection_manager.approval),
-            "synergie": self._serialize_synergie_projection(projection_manager.synergie),
-        }
+        parent = self._chain_head
+        is_delta = (
+            self.incremental
+            and not full
+            and parent is not None
+            and parent.chain_length < self.max_delta_chain
+        )
 
-        # Calculate size
-        state_json = json.dumps(state_data)
-        size_bytes = len(state_json.encode('utf-8'))
+        try:
+            state = self.capture_state(projection_manager, delta=is_delta)
+            payload, raw_size_bytes = encode_state(state, self.compression)
+        except Exception:
+            # Dirty sets may be consumed already; the next snapshot must be full
+            self._chain_head = None
+            raise
+        checksum = hashlib.sha256(payload).hexdigest()
+
+        snapshot = ProjectionSnapshot(
+            snapshot_id=snapshot_id,
+            snapshot_type=snapshot_type,
+            sequence_number=sequence_number,
+            event_count=event_count,
+            created_at=datetime.utcnow(),
+            size_bytes=len(payload),
+            format_version=SNAPSHOT_FORMAT_VERSION,
+            compression=self.compression,
+            raw_size_bytes=raw_size_bytes,
+            base_snapshot_id=(parent.base_snapshot_id or parent.snapshot_id) if is_delta else None,
+            parent_snapshot_id=parent.snapshot_id if is_delta else None,
+            chain_length=parent.chain_length + 1 if is_delta else 0,
+            checksum=checksum,
+        )
 
         # Insert snapshot
-        async with self._session_factory() as session:
-            await session.execute(
-                text("""
-                    INSERT INTO credit_snapshots (
-                        snapshot_id,
-                        snapshot_type,
-                        sequence_number,
-                        event_count,
-                        state_data,
-                        size_bytes
-                    ) VALUES (
-                        :snapshot_id,
-                        :snapshot_type,
-                        :sequence_number,
-                        :event_count,
-                        :state_data::jsonb,
-                        :size_bytes
-                    )
-                """),
-                {
-                    "snapshot_id": snapshot_id,
-                    "snapshot_type": snapshot_type,
-                    "sequence_number": sequence_number,
-                    "event_count": event_count,
-                    "state_data": state_json,
-                    "size_bytes": size_bytes,
-                }
-            )
-            await session.commit()
+        try:
+            async with self._session_factory() as session:
+                await session.execute(
+                    text("""
+                        INSERT INTO credit_snapshots (
+                            snapshot_id,
+                            snapshot_type,
+                            sequence_number,
+                            event_count,
+                            size_bytes,
+                            format_version,
+                            compression,
+                            payload,
+                            raw_size_bytes,
+                            base_snapshot_id,
+                            parent_snapshot_id,
+                            chain_length,
+                            checksum
+                        ) VALUES (
+                            :snapshot_id,
+                            :snapshot_type,
+                            :sequence_number,
+                            :event_count,
+                            :size_bytes,
+                            :format_version,
+                            :compression,
+                            :payload,
+                            :raw_size_bytes,
+                            :base_snapshot_id,
+                            :parent_snapshot_id,
+                            :chain_length,
+                            :checksum
+                        )
+                    """),
+                    {
+                        "snapshot_id": snapshot.snapshot_id,
+                        "snapshot_type": snapshot.snapshot_type,
+                        "sequence_number": snapshot.sequence_number,
+                        "event_count": snapshot.event_count,
+                        "size_bytes": snapshot.size_bytes,
+                        "format_version": snapshot.format_version,
+                        "compression": snapshot.compression,
+                        "payload": payload,
+                        "raw_size_bytes": snapshot.raw_size_bytes,
+                        "base_snapshot_id": snapshot.base_snapshot_id,
+                        "parent_snapshot_id": snapshot.parent_snapshot_id,
+                        "chain_length": snapshot.chain_length,
+                        "checksum": snapshot.checksum,
+                    }
+                )
+                await session.commit()
+        except Exception:
+            # Dirty sets were consumed; the next snapshot must be full
+            self._chain_head = None
+            raise
+
+        self._chain_head = snapshot
+        self._chain_collaboration_count = len(projection_manager.synergie._collaborations)
+
+        duration = time.perf_counter() - start
+        self._metrics["last_snapshot"] = {
+            "snapshot_id": snapshot.snapshot_id,
+            "kind": "delta" if is_delta else "full",
+            "sequence_number": snapshot.sequence_number,
+            "entities": state.entity_count(),
+            "size_bytes": snapshot.size_bytes,
+            "raw_size_bytes": snapshot.raw_size_bytes,
+            "compression": snapshot.compression,
+            "chain_length": snapshot.chain_length,
+            "duration_seconds": duration,
+        }
+        self._metrics["full_snapshots" if not is_delta else "delta_snapshots"] += 1
 
         logger.info(
             "Snapshot created",
             snapshot_id=snapshot_id,
+            kind="delta" if is_delta else "full",
             sequence_number=sequence_number,
             event_count=event_count,
-            size_kb=size_bytes / 1024,
+            size_kb=snapshot.size_bytes / 1024,
+            raw_size_kb=raw_size_bytes / 1024,
         )
 
         # Cleanup old snapshots
         await self._cleanup_old_snapshots(snapshot_type)
 
-        return ProjectionSnapshot(
-            snapshot_id=snapshot_id,
-            snapshot_type=snapshot_type,
-            sequence_number=sequence_number,
-            event_count=event_count,
-            state_data=state_data,
-            created_at=datetime.utcnow(),
-            size_bytes=size_bytes,
-        )
+        return snapshot
 
     async def load_latest_snapshot(
         self,
@@ -252,26 +426,27 @@ class SnapshotManager:
         """
         Load latest snapshot for projection type.
 
+        Delta snapshots are resolved by loading their chain back to the
+        base and folding each delta onto it.
+
         Args:
             snapshot_type: Projection type ("balance", "ledger", "all", etc.)
 
         Returns:
-            ProjectionSnapshot or None if no snapshots exist
+            ProjectionSnapshot (with merged state_data) or None if no snapshots exist
+
+        Raises:
+            SnapshotCodecError: If a payload is corrupt or the chain is broken
         """
         if not self._engine:
             raise RuntimeError("SnapshotManager not initialized")
 
+        start = time.perf_counter()
+
         async with self._engine.begin() as conn:
             result = await conn.execute(
-                text("""
-                    SELECT
-                        snapshot_id,
-                        snapshot_type,
-                        sequence_number,
-                        event_count,
-                        state_data,
-                        created_at,
-                        size_bytes
+                text(f"""
+                    SELECT {_SNAPSHOT_COLUMNS}
                     FROM credit_snapshots
                     WHERE snapshot_type = :snapshot_type
                     ORDER BY sequence_number DESC
@@ -286,29 +461,111 @@ class SnapshotManager:
                 logger.debug(f"No snapshots found for type: {snapshot_type}")
                 return None
 
-            snapshot = ProjectionSnapshot(
-                snapshot_id=row[0],
-                snapshot_type=row[1],
-                sequence_number=row[2],
-                event_count=row[3],
-                state_data=row[4],  # Already deserialized from JSONB
-                created_at=row[5],
-                size_bytes=row[6],
-            )
+            snapshot, payload, state_data = self._row_to_snapshot(row)
+
+            if snapshot.format_version < SNAPSHOT_FORMAT_VERSION:
+                # Legacy v1 snapshot: JSONB state, no chain
+                snapshot.state_data = state_data or {}
+            else:
+                payloads = {snapshot.snapshot_id: (snapshot, payload)}
+
+                if snapshot.base_snapshot_id:
+                    chain_result = await conn.execute(
+                        text(f"""
+                            SELECT {_SNAPSHOT_COLUMNS}
+                            FROM credit_snapshots
+                            WHERE (snapshot_id = :base_id OR base_snapshot_id = :base_id)
+                            AND sequence_number <= :sequence_number
+                        """),
+                        {
+                            "base_id": snapshot.base_snapshot_id,
+                            "sequence_number": snapshot.sequence_number,
+                        }
+                    )
+                    for chain_row in chain_result.fetchall():
+                        member, member_payload, _ = self._row_to_snapshot(chain_row)
+                        payloads[member.snapshot_id] = (member, member_payload)
 
-            logger.info(
-                "Snapshot loaded",
-                snapshot_id=snapshot.snapshot_id,
-                sequence_number=snapshot.sequence_number,
-                event_count=snapshot.event_count,
-            )
+                state = self._resolve_chain(snapshot, payloads)
+                snapshot.state_data = state.to_state_data()
 
-            return snapshot
+        self._metrics["last_load_duration_seconds"] = time.perf_counter() - start
+
+        logger.info(
+            "Snapshot loaded",
+            snapshot_id=snapshot.snapshot_id,
+            sequence_number=snapshot.sequence_number,
+            event_count=snapshot.event_count,
+            chain_length=snapshot.chain_length,
+        )
+
+        return snapshot
+
+    def _row_to_snapshot(self, row) -> Tuple[ProjectionSnapshot, Optional[bytes], Optional[Dict]]:
+        """Map a credit_snapshots row to (snapshot, payload, legacy state_data)."""
+        snapshot = ProjectionSnapshot(
+            snapshot_id=row[0],
+            snapshot_type=row[1],
+            sequence_number=row[2],
+            event_count=row[3],
+            created_at=row[5],
+            size_bytes=row[6],
+            format_version=row[7] or 1,
+            compression=row[8],
+            raw_size_bytes=row[10],
+            base_snapshot_id=row[11],
+            parent_snapshot_id=row[12],
+            chain_length=row[13] or 0,
+            checksum=row[14],
+        )
+        payload = bytes(row[9]) if row[9] is not None else None
+        return snapshot, payload, row[4]  # state_data already deserialized from JSONB
+
+    def _resolve_chain(
+        self,
+        head: ProjectionSnapshot,
+        payloads: Dict[str, Tuple[ProjectionSnapshot, Optional[bytes]]],
+    ) -> SnapshotState:
+        """
+        Decode a snapshot chain (base + deltas) into one state.
+
+        Walks parent links from head back to the base, then merges
+        base → head. Each payload is verified against its checksum.
+        """
+        chain: List[Tuple[ProjectionSnapshot, Optional[bytes]]] = []
+        current: Optional[str] = head.snapshot_id
+        while current is not None:
+            if current not in payloads:
+                raise SnapshotCodecError(
+                    f"Broken snapshot chain: {current} missing (head {head.snapshot_id})"
+                )
+            member, payload = payloads[current]
+            chain.append((member, payload))
+            current = member.parent_snapshot_id
+
+        state: Optional[SnapshotState] = None
+        for member, payload in reversed(chain):
+            if payload is None:
+                raise SnapshotCodecError(f"Snapshot {member.snapshot_id} has no payload")
+            if member.checksum and hashlib.sha256(payload).hexdigest() != member.checksum:
+                raise SnapshotCodecError(f"Checksum mismatch for snapshot {member.snapshot_id}")
+
+            decoded = decode_state(payload, member.compression or COMPRESSION_NONE)
+            if state is None:
+                state = decoded
+            else:
+                state.merge(decoded)
+
+        return state
 
     async def _cleanup_old_snapshots(self, snapshot_type: str) -> int:
         """
         Delete old snapshots beyond retention count.
 
+        A delta is only usable together with its chain, so whole chains are
+        kept: a row survives if its chain (base_snapshot_id, or its own id
+        for full snapshots) is referenced by one of the last N snapshots.
+
         Args:
             snapshot_type: Projection type
 
@@ -319,17 +576,21 @@ class SnapshotManager:
             return 0
 
         async with self._session_factory() as session:
-            # Delete all but last N snapshots
+            # Delete all chains not referenced by the last N snapshots
             result = await session.execute(
                 text("""
-                    DELETE FROM credit_snapshots
-                    WHERE snapshot_type = :snapshot_type
-                    AND id NOT IN (
-                        SELECT id FROM credit_snapshots
+                    WITH kept AS (
+                        SELECT COALESCE(base_snapshot_id, snapshot_id) AS chain_id
+                        FROM credit_snapshots
                         WHERE snapshot_type = :snapshot_type
                         ORDER BY sequence_number DESC
                         LIMIT :retention_count
                     )
+                    DELETE FROM credit_snapshots
+                    WHERE snapshot_type = :snapshot_type
+                    AND COALESCE(base_snapshot_id, snapshot_id) NOT IN (
+                        SELECT chain_id FROM kept
+                    )
                 """),
                 {
                     "snapshot_type": snapshot_type,
@@ -348,58 +609,205 @@ class SnapshotManager:
 
             return deleted
 
-    # ========================================================================
-    # Projection Serialization
-    # ========================================================================
+    async def list_snapshots(
+        self,
+        snapshot_type: str = "all",
+        limit: int = 100,
+    ) -> List[ProjectionSnapshot]:
+        """
+        List snapshot metadata (newest first, state_data not loaded).
 
-    def _serialize_balance_projection(self, balance_projection) -> Dict:
-        """Serialize BalanceProjection state."""
-        return {
-            "balances": dict(balance_projection._balances),
-        }
+        Args:
+            snapshot_type: Projection type
+            limit: Maximum number of snapshots
 
-    def _serialize_ledger_projection(self, ledger_projection) -> Dict:
-        """Serialize LedgerProjection state."""
-        return {
-            "ledger": [
-                {
-                    "entity_id": entry.entity_id,
-                    "event_type": entry.event_type,
-                    "amount": entry.amount,
-                    "balance_after": entry.balance_after,
-                    "reason": entry.reason,
-                    "timestamp": entry.timestamp.isoformat(),
-                    "actor_id": entry.actor_id,
-                }
-                for entry in ledger_projection._ledger
-            ],
-        }
+        Returns:
+            List of ProjectionSnapshot
+        """
+        if not self._engine:
+            raise RuntimeError("SnapshotManager not initialized")
 
-    def _serialize_approval_projection(self, approval_projection) -> Dict:
-        """Serialize ApprovalProjection state."""
-        return {
-            "pending_approvals": dict(approval_projection._pending_approvals),
-            "approval_history": list(approval_projection._approval_history),
-        }
+        async with self._engine.begin() as conn:
+            result = await conn.execute(
+                text("""
+                    SELECT
+                        snapshot_id,
+                        snapshot_type,
+                        sequence_number,
+                        event_count,
+                        NULL,
+                        created_at,
+                        size_bytes,
+                        format_version,
+                        compression,
+                        NULL,
+                        raw_size_bytes,
+                        base_snapshot_id,
+                        parent_snapshot_id,
+                        chain_length,
+                        checksum
+                    FROM credit_snapshots
+                    WHERE snapshot_type = :snapshot_type
+                    ORDER BY sequence_number DESC
+                    LIMIT :limit
+                """),
+                {"snapshot_type": snapshot_type, "limit": limit}
+            )
+            return [self._row_to_snapshot(row)[0] for row in result.fetchall()]
 
-    def _serialize_synergie_projection(self, synergie_projection) -> Dict:
-        """Serialize SynergieProjection state."""
-        return {
-            "team_rewards": dict(synergie_projection._team_rewards),
-            "collaboration_count": dict(synergie_projection._collaboration_count),
-        }
+    async def delete_snapshot(self, snapshot_id: str) -> int:
+        """
+        Delete a snapshot together with the deltas that depend on it.
+
+        Args:
+            snapshot_id: Snapshot to delete
+
+        Returns:
+            Number of rows deleted (0 if not found)
+        """
+        if not self._session_factory:
+            raise RuntimeError("SnapshotManager not initialized")
+
+        async with self._session_factory() as session:
+            result = await session.execute(
+                text("""
+                    WITH target AS (
+                        SELECT
+                            snapshot_id,
+                            COALESCE(base_snapshot_id, snapshot_id) AS chain_id,
+                            sequence_number
+                        FROM credit_snapshots
+                        WHERE snapshot_id = :snapshot_id
+                    )
+                    DELETE FROM credit_snapshots s
+                    USING target t
+                    WHERE s.snapshot_id = t.snapshot_id
+                    OR (
+                        s.base_snapshot_id = t.chain_id
+                        AND s.sequence_number > t.sequence_number
+                    )
+                """),
+                {"snapshot_id": snapshot_id}
+            )
+            await session.commit()
+
+        if self._chain_head is not None and self._chain_head.snapshot_id == snapshot_id:
+            self._chain_head = None
+        elif result.rowcount > 1:
+            # Dependent deltas may include our chain head
+            self._chain_head = None
+
+        return result.rowcount
 
     # ========================================================================
-    # Projection Deserialization
+    # Projection Capture / Restore
     # ========================================================================
 
+    def capture_state(self, projection_manager, delta: bool = False) -> SnapshotState:
+        """
+        Capture projection state for a snapshot.
+
+        Always consumes the projections' dirty sets, so a later delta only
+        carries changes made after this capture.
+
+        Args:
+            projection_manager: ProjectionManager instance
+            delta: Only include entities changed since the chain head
+
+        Returns:
+            SnapshotState (detached copy of the projection state)
+        """
+        balance = projection_manager.balance
+        ledger = projection_manager.ledger
+        approval = projection_manager.approval
+        synergie = projection_manager.synergie
+
+        dirty_balances = balance.take_dirty()
+        dirty_ledger = ledger.take_dirty()
+        dirty_approvals = approval.take_dirty()
+        dirty_reuse = synergie.take_dirty()
+
+        if not delta:
+            return SnapshotState(
+                balances=dict(balance._balances),
+                ledger={
+                    entity_id: list(ring)
+                    for entity_id, ring in ledger._history.items()
+                },
+                approvals={
+                    request_id: approval_to_dict(request)
+                    for request_id, request in approval._requests.items()
+                },
+                collaborations=list(synergie._collaborations),
+                reuse_stats=dict(synergie._reuse_stats),
+            )
+
+        return SnapshotState(
+            balances={
+                entity_id: balance._balances[entity_id]
+                for entity_id in dirty_balances
+                if entity_id in balance._balances
+            },
+            ledger={
+                entity_id: list(ledger._history[entity_id])
+                for entity_id in dirty_ledger
+                if entity_id in ledger._history
+            },
+            approvals={
+                request_id: approval_to_dict(approval._requests[request_id])
+                for request_id in dirty_approvals
+                if request_id in approval._requests
+            },
+            collaborations=synergie._collaborations[self._chain_collaboration_count:],
+            reuse_stats={
+                agent_id: synergie._reuse_stats[agent_id]
+                for agent_id in dirty_reuse
+                if agent_id in synergie._reuse_stats
+            },
+        )
+
+    def restore_snapshot(self, projection_manager, snapshot: ProjectionSnapshot) -> None:
+        """
+        Restore all projections from a loaded snapshot.
+
+        Resets the projections' dirty sets and makes the snapshot the chain
+        head, so the next create_snapshot() can write a delta against it.
+        """
+        start = time.perf_counter()
+
+        self.restore_balance_projection(projection_manager.balance, snapshot.state_data["balance"])
+        self.restore_ledger_projection(projection_manager.ledger, snapshot.state_data["ledger"])
+        self.restore_approval_projection(projection_manager.approval, snapshot.state_data["approval"])
+        self.restore_synergie_projection(projection_manager.synergie, snapshot.state_data["synergie"])
+
+        for projection in (
+            projection_manager.balance,
+            projection_manager.ledger,
+            projection_manager.approval,
+            projection_manager.synergie,
+        ):
+            projection.take_dirty()
+
+        if snapshot.format_version >= SNAPSHOT_FORMAT_VERSION:
+            self._chain_head = snapshot
+            self._chain_collaboration_count = len(projection_manager.synergie._collaborations)
+        else:
+            self._chain_head = None  # Deltas are never chained onto v1 snapshots
+
+        self._metrics["last_restore"] = {
+            "snapshot_id": snapshot.snapshot_id,
+            "chain_length": snapshot.chain_length,
+            "load_duration_seconds": self._metrics["last_load_duration_seconds"],
+            "apply_duration_seconds": time.perf_counter() - start,
+        }
+
     def restore_balance_projection(
         self,
         balance_projection,
         state_data: Dict,
     ) -> None:
         """Restore BalanceProjection from snapshot."""
-        balance_projection._balances = dict(state_data.get("balances", {}))
+        balance_projection._balances = defaultdict(float, state_data.get("balances", {}))
         logger.debug(f"Restored {len(balance_projection._balances)} balances")
 
     def restore_ledger_projection(
@@ -407,23 +815,11 @@ class SnapshotManager:
         ledger_projection,
         state_data: Dict,
     ) -> None:
-        """Restore LedgerProjection from snapshot."""
-        from app.modules.credits.event_sourcing.projections import LedgerEntry
-        from datetime import datetime
-
-        ledger_projection._ledger = [
-            LedgerEntry(
-                entity_id=entry["entity_id"],
-                event_type=entry["event_type"],
-                amount=entry["amount"],
-                balance_after=entry["balance_after"],
-                reason=entry["reason"],
-                timestamp=datetime.fromisoformat(entry["timestamp"]),
-                actor_id=entry["actor_id"],
-            )
-            for entry in state_data.get("ledger", [])
-        ]
-        logger.debug(f"Restored {len(ledger_projection._ledger)} ledger entries")
+        """Restore LedgerProjection from snapshot (rings keep their capacity)."""
+        ledger_projection._history.clear()
+        for entity_id, entries in state_data.get("entries", {}).items():
+            ledger_projection._history[entity_id].extend(entries)
+        logger.debug(f"Restored ledger for {len(ledger_projection._history)} entities")
 
     def restore_approval_projection(
         self,
@@ -431,11 +827,26 @@ class SnapshotManager:
         state_data: Dict,
     ) -> None:
         """Restore ApprovalProjection from snapshot."""
-        approval_projection._pending_approvals = dict(state_data.get("pending_approvals", {}))
-        approval_projection._approval_history = list(state_data.get("approval_history", []))
-        logger.debug(
-            f"Restored {len(approval_projection._pending_approvals)} pending approvals"
-        )
+        approval_projection._requests = {
+            request_id: ApprovalRequest(
+                request_id=item["request_id"],
+                action_type=item["action_type"],
+                requester_id=item["requester_id"],
+                risk_level=item["risk_level"],
+                status=item["status"],
+                requested_at=datetime.fromisoformat(item["requested_at"]),
+                resolved_at=(
+                    datetime.fromisoformat(item["resolved_at"])
+                    if item.get("resolved_at")
+                    else None
+                ),
+                resolved_by=item.get("resolved_by"),
+                justification=item.get("justification"),
+                action_context=item.get("action_context", {}),
+            )
+            for request_id, item in state_data.get("requests", {}).items()
+        }
+        logger.debug(f"Restored {len(approval_projection._requests)} approval requests")
 
     def restore_synergie_projection(
         self,
@@ -443,12 +854,33 @@ class SnapshotManager:
         state_data: Dict,
     ) -> None:
         """Restore SynergieProjection from snapshot."""
-        synergie_projection._team_rewards = dict(state_data.get("team_rewards", {}))
-        synergie_projection._collaboration_count = dict(state_data.get("collaboration_count", {}))
+        synergie_projection._collaborations = list(state_data.get("collaborations", []))
+        synergie_projection._reuse_stats = defaultdict(int, state_data.get("reuse_stats", {}))
         logger.debug(
-            f"Restored synergie data for {len(synergie_projection._team_rewards)} teams"
+            f"Restored {len(synergie_projection._collaborations)} collaborations"
         )
 
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get snapshot metrics.
+
+        Returns:
+            Dict with:
+            - compression / incremental / max_delta_chain: Configuration
+            - chain_head: Snapshot ID deltas are currently chained onto
+            - full_snapshots / delta_snapshots: Snapshots created by this process
+            - last_snapshot: Kind, size (compressed/raw) and duration of the last snapshot
+            - last_restore: Chain length and load/apply durations of the last restore
+        """
+        return {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "compression": self.compression,
+            "incremental": self.incremental,
+            "max_delta_chain": self.max_delta_chain,
+            "chain_head": self._chain_head.snapshot_id if self._chain_head else None,
+            **self._metrics,
+        }
+
     # ========================================================================
     # Phase 6b: Snapshot Enhancements
     # ========================================================================
@@ -532,6 +964,7 @@ class SnapshotManager:
         Keeps:
         - Last N snapshots (keep_recent)
         - All milestone snapshots (1000, 10000, 100000, ...)
+        - The chain (base + earlier deltas) of every kept delta snapshot
 
         Deletes all other snapshots.
 
@@ -569,7 +1002,27 @@ class SnapshotManager:
             if self.is_milestone_sequence(snapshot.sequence_number):
                 to_keep.add(snapshot.snapshot_id)
 
-        # Determine deletions
+        # Keep the chains (base + earlier deltas) kept snapshots depend on
+        kept_chains = {
+            s.base_snapshot_id or s.snapshot_id
+            for s in snapshots
+            if s.snapshot_id in to_keep
+        }
+        max_kept_sequence: Dict[str, int] = {}
+        for snapshot in snapshots:
+            if snapshot.snapshot_id in to_keep and snapshot.base_snapshot_id:
+                chain_id = snapshot.base_snapshot_id
+                max_kept_sequence[chain_id] = max(
+                    max_kept_sequence.get(chain_id, 0), snapshot.sequence_number
+                )
+        for snapshot in snapshots:
+            chain_id = snapshot.base_snapshot_id or snapshot.snapshot_id
+            if snapshot.snapshot_id == chain_id and chain_id in kept_chains:
+                to_keep.add(snapshot.snapshot_id)
+            elif snapshot.sequence_number <= max_kept_sequence.get(chain_id, -1):
+                to_keep.add(snapshot.snapshot_id)
+
+        # Determine deletions (deleting a snapshot also drops its later deltas)
         for snapshot in snapshots:
             if snapshot.snapshot_id not in to_keep:
                 to_delete.append(snapshot.snapshot_id)
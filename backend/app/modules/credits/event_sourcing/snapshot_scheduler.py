@@ -125,6 +125,8 @@ class SnapshotScheduler:
         self._last_snapshot_time: Optional[datetime] = None
         self._last_snapshot_event_count: int = 0
         self._current_event_count: int = 0
+        # Journal position the next snapshot covers (what replay skips)
+        self._current_sequence: int = 0
 
         # Metrics
         self._total_snapshots_created = 0
@@ -253,12 +255,14 @@ class SnapshotScheduler:
         Returns:
             (should_create, reason) tuple
         """
-        # Count events in journal
-        event_count = 0
-        async for _ in self.journal.read_events():
-            event_count += 1
+        # The file journal's sequence is the event count; the Postgres
+        # journal's is MAX(credit_events.id), which has gaps, so there it is
+        # only an upper bound of the count — but the position replay needs.
+        sequence = await self.journal.get_last_sequence()
+        event_count = sequence
 
         self._current_event_count = event_count
+        self._current_sequence = sequence
 
         # Check time-based trigger
         time_trigger = False
@@ -301,7 +305,7 @@ class SnapshotScheduler:
             # Create snapshot
             snapshot = await self.snapshot_manager.create_snapshot(
                 projection_manager=self.projection_manager,
-                sequence_number=self._current_event_count,
+                sequence_number=self._current_sequence,
                 event_count=self._current_event_count,
             )
 
@@ -314,6 +318,7 @@ class SnapshotScheduler:
                 f"Automatic snapshot created successfully",
                 snapshot_id=snapshot.snapshot_id,
                 sequence_number=snapshot.sequence_number,
+                kind="delta" if snapshot.is_delta else "full",
                 size_mb=snapshot.size_bytes / 1024 / 1024 if snapshot.size_bytes else 0,
             )
 
@@ -333,7 +338,8 @@ class SnapshotScheduler:
         """
         Delete old snapshots to enforce retention policy.
 
-        Keeps only the N most recent snapshots (configured via retention_count).
+        Keeps the N most recent snapshots (configured via retention_count)
+        plus the delta chains they depend on.
         """
         try:
             # Get all snapshots
@@ -350,8 +356,15 @@ class SnapshotScheduler:
                 reverse=True,
             )
 
-            # Delete snapshots beyond retention count
-            snapshots_to_delete = sorted_snapshots[self.config.retention_count :]
+            # Delete snapshots beyond retention count, except the chains
+            # (base + earlier deltas) that retained delta snapshots need
+            retained = sorted_snapshots[: self.config.retention_count]
+            retained_chains = {s.base_snapshot_id or s.snapshot_id for s in retained}
+            snapshots_to_delete = [
+                s
+                for s in sorted_snapshots[self.config.retention_count :]
+                if (s.base_snapshot_id or s.snapshot_id) not in retained_chains
+            ]
 
             for snapshot in snapshots_to_delete:
                 try:
@@ -386,6 +399,8 @@ class SnapshotScheduler:
             - total_snapshots_created: Total snapshots created
             - total_snapshots_failed: Total snapshot failures
             - last_error: Last error message (if any)
+            - snapshots: SnapshotManager metrics (last snapshot kind and
+              compressed/raw size, last restore time), None before start()
         """
         return {
             "running": self._running,
@@ -406,6 +421,11 @@ class SnapshotScheduler:
             "total_snapshots_created": self._total_snapshots_created,
             "total_snapshots_failed": self._total_snapshots_failed,
             "last_error": self._last_error,
+            "snapshots": (
+                self.snapshot_manager.get_metrics()
+                if self.snapshot_manager
+                else None
+            ),
         }
 
 
@@ -27,7 +27,7 @@ Usage Example:
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from loguru import logger
 
@@ -375,6 +375,29 @@ class CreditSystemDemo:
         self._check_initialized()
         return self.projections.ledger.get_history(agent_id, limit=limit)
 
+    async def get_history_page(
+        self,
+        agent_id: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[LedgerEntry], Optional[str]]:
+        """
+        Get one page of transaction history.
+
+        Args:
+            agent_id: Agent ID, or None for all agents
+            limit: Page size (most recent first)
+            cursor: next_cursor from the previous page
+
+        Returns:
+            (entries, next_cursor); next_cursor is None on the last page
+
+        Raises:
+            InvalidCursorError: If cursor is malformed
+        """
+        self._check_initialized()
+        return self.projections.ledger.get_page(agent_id, limit=limit, cursor=cursor)
+
     async def get_metrics(self) -> Dict:
         """
         Get system metrics.
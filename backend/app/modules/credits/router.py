@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, List
 from app.core.auth_deps import Principal, get_current_principal, require_auth, require_role, SystemRole
 from . import service
+from .event_sourcing.projections import InvalidCursorError
 from .schemas import CreditsHealth, CreditsInfo
 
 router = APIRouter(
@@ -262,7 +263,8 @@ async def get_all_balances(
 @router.get("/history/{agent_id}", response_model=Dict)
 async def get_history(
     agent_id: str,
-    limit: int = 10,
+    limit: int = Query(10, ge=1, le=1000),
+    cursor: Optional[str] = None,
     principal: Principal = Depends(require_auth),
 ):
     """
@@ -271,14 +273,46 @@ async def get_history(
     Args:
         - agent_id: Agent ID
         - limit: Max number of entries (default: 10)
+        - cursor: next_cursor from the previous page
 
     Returns:
         - agent_id
         - history: List[LedgerEntry]
         - total_entries: Number of entries returned
+        - next_cursor: Cursor for the next page (None on the last page)
     """
     try:
-        return await service.get_agent_history(agent_id, limit=limit)
+        return await service.get_agent_history(agent_id, limit=limit, cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+
+
+@router.get("/ledger", response_model=Dict)
+async def get_ledger(
+    limit: int = Query(50, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    principal: Principal = Depends(require_auth),
+):
+    """
+    Get ledger entries across all agents, newest first (Event Sourcing).
+
+    Args:
+        - limit: Page size (default: 50)
+        - cursor: next_cursor from the previous page
+
+    Returns:
+        - entries: List[LedgerEntry]
+        - total_entries: Number of entries returned
+        - next_cursor: Cursor for the next page (None on the last page)
+    """
+    try:
+        return await service.get_ledger_entries(limit=limit, cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
@@ -396,48 +396,93 @@ async def get_all_agent_balances() -> Dict:
     }
 
 
+def _ledger_entry_to_dict(entry) -> Dict:
+    """Convert LedgerEntry to JSON-serializable dict."""
+    return {
+        "event_id": entry.event_id,
+        "timestamp": entry.timestamp.isoformat(),
+        "entity_id": entry.entity_id,
+        "entity_type": entry.entity_type,
+        "amount": entry.amount,
+        "balance_after": entry.balance_after,
+        "reason": entry.reason,
+        "mission_id": entry.mission_id,
+    }
+
+
 async def get_agent_history(
     agent_id: str,
     limit: Optional[int] = 10,
+    cursor: Optional[str] = None,
 ) -> Dict:
     """
     Get transaction history for agent (Event Sourcing).
 
     Args:
         agent_id: Agent ID
-        limit: Max number of entries (most recent first)
+        limit: Max number of entries (most recent first), None for all
+        cursor: next_cursor from a previous call (continues pagination)
 
     Returns:
-        Dict with agent_id, history (list of transactions)
+        Dict with agent_id, history (list of transactions), next_cursor
 
     Raises:
         ValueError: If Event Sourcing not available
+        InvalidCursorError: If cursor is malformed
     """
     credit_system = await get_credit_system()
     if credit_system is None:
         raise ValueError("Event Sourcing not available")
 
-    history = await credit_system.get_history(agent_id, limit=limit)
-
-    # Convert LedgerEntry to dict
-    history_dicts = [
-        {
-            "event_id": entry.event_id,
-            "timestamp": entry.timestamp.isoformat(),
-            "entity_id": entry.entity_id,
-            "entity_type": entry.entity_type,
-            "amount": entry.amount,
-            "balance_after": entry.balance_after,
-            "reason": entry.reason,
-            "mission_id": entry.mission_id,
-        }
-        for entry in history
-    ]
+    if limit is None and cursor is None:
+        history = await credit_system.get_history(agent_id)
+        next_cursor = None
+    else:
+        history, next_cursor = await credit_system.get_history_page(
+            agent_id, limit=limit or 10, cursor=cursor
+        )
+
+    history_dicts = [_ledger_entry_to_dict(entry) for entry in history]
 
     return {
         "agent_id": agent_id,
         "history": history_dicts,
         "total_entries": len(history_dicts),
+        "next_cursor": next_cursor,
+    }
+
+
+async def get_ledger_entries(
+    limit: int = 50,
+    cursor: Optional[str] = None,
+) -> Dict:
+    """
+    Get ledger entries across all agents, newest first (Event Sourcing).
+
+    Args:
+        limit: Page size
+        cursor: next_cursor from a previous call (continues pagination)
+
+    Returns:
+        Dict with entries (list of transactions), total_entries, next_cursor
+
+    Raises:
+        ValueError: If Event Sourcing not available
+        InvalidCursorError: If cursor is malformed
+    """
+    credit_system = await get_credit_system()
+    if credit_system is None:
+        raise ValueError("Event Sourcing not available")
+
+    entries, next_cursor = await credit_system.get_history_page(
+        None, limit=limit, cursor=cursor
+    )
+    entry_dicts = [_ledger_entry_to_dict(entry) for entry in entries]
+
+    return {
+        "entries": entry_dicts,
+        "total_entries": len(entry_dicts),
+        "next_cursor": next_cursor,
     }
 
 
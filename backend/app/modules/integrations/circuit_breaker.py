@@ -87,6 +87,15 @@ class CircuitBreaker:
 
         return False
 
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may pass, for callers that record the
+        outcome themselves instead of using call().
+
+        Moves an OPEN circuit to HALF_OPEN once the recovery timeout elapsed.
+        """
+        return self._can_execute()
+
     def _transition_to_half_open(self) -> None:
         """Transition from OPEN to HALF_OPEN state."""
         self.state.state = CircuitState.HALF_OPEN
@@ -3,12 +3,19 @@ from __future__ import annotations
 import hashlib
 import math
 import re
-from typing import Iterable
+from functools import lru_cache
+from typing import Sequence
 
 import httpx
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 EMBEDDING_DIM = 256
+TOKEN_CACHE_SIZE = 65_536
 
 
 def extract_text_from_input(raw_text: str | None, url: str | None, code: str | None, document_text: str | None) -> str:
@@ -53,10 +60,20 @@ def chunk_content(content: str, max_chars: int = 900, overlap: int = 120) -> lis
     return chunks
 
 
-def _tokenize(text: str) -> Iterable[str]:
+def _tokenize(text: str) -> list[str]:
     return re.findall(r"[a-zA-Z0-9_\-]{2,}", text.lower())
 
 
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def _token_feature(token: str, dim: int) -> tuple[int, float]:
+    """Hashed (index, signed weight) of a token; cached since vocabularies repeat."""
+    digest = hashlib.sha256(token.encode("utf-8")).digest()
+    idx = int.from_bytes(digest[:4], "big") % dim
+    sign = 1.0 if digest[4] % 2 == 0 else -1.0
+    weight = 1.0 + (digest[5] / 255.0)
+    return idx, sign * weight
+
+
 def generate_embeddings(text: str, dim: int = EMBEDDING_DIM) -> list[float]:
     vec = [0.0] * dim
     tokens = list(_tokenize(text))
@@ -64,11 +81,8 @@ def generate_embeddings(text: str, dim: int = EMBEDDING_DIM) -> list[float]:
         return vec
 
     for token in tokens:
-        digest = hashlib.sha256(token.encode("utf-8")).digest()
-        idx = int.from_bytes(digest[:4], "big") % dim
-        sign = 1.0 if digest[4] % 2 == 0 else -1.0
-        weight = 1.0 + (digest[5] / 255.0)
-        vec[idx] += sign * weight
+        idx, value = _token_feature(token, dim)
+        vec[idx] += value
 
     norm = math.sqrt(sum(v * v for v in vec))
     if norm > 0:
@@ -76,5 +90,39 @@ def generate_embeddings(text: str, dim: int = EMBEDDING_DIM) -> list[float]:
     return vec
 
 
+def generate_embeddings_batch(texts: Sequence[str], dim: int = EMBEDDING_DIM) -> list[list[float]]:
+    """
+    Embed many texts at once (same vectors as generate_embeddings).
+
+    Distinct tokens are hashed once, all occurrences are summed into one
+    matrix with a single bincount and rows are normalised together; falls
+    back to per-text embedding without numpy.
+    """
+    if np is None:
+        return [generate_embeddings(text, dim) for text in texts]
+    if not texts:
+        return []
+
+    tokens_per_text = [_tokenize(text) for text in texts]
+    all_tokens = [token for tokens in tokens_per_text for token in tokens]
+    matrix = np.zeros((len(texts), dim), dtype=np.float64)
+    if all_tokens:
+        # Hash each distinct token once, then scatter all occurrences in one pass
+        unique_tokens, inverse = np.unique(np.asarray(all_tokens), return_inverse=True)
+        features = [_token_feature(str(token), dim) for token in unique_tokens]
+        feature_index = np.fromiter((idx for idx, _ in features), dtype=np.int64, count=len(features))
+        feature_value = np.fromiter((value for _, value in features), dtype=np.float64, count=len(features))
+        rows = np.repeat(np.arange(len(texts)), [len(tokens) for tokens in tokens_per_text])
+        matrix = np.bincount(
+            rows * dim + feature_index[inverse],
+            weights=feature_value[inverse],
+            minlength=len(texts) * dim,
+        ).reshape(len(texts), dim)
+
+    norms = np.sqrt(np.einsum("ij,ij->i", matrix, matrix))[:, None]
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix.tolist()
+
+
 def vector_to_pgvector_literal(vector: list[float]) -> str:
     return "[" + ",".join(f"{v:.6f}" for v in vector) + "]"
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import json
+import time
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth_deps import Principal, SystemRole, get_current_principal, require_auth, require_role
@@ -12,6 +15,7 @@ from .schemas import (
     CapabilityLinkRequest,
     CapabilitySearchRequest,
     CapabilityStoreRequest,
+    KnowledgeBulkIngestRequest,
     KnowledgeIngestRequest,
     KnowledgeIngestResponse,
     KnowledgeItemCreate,
@@ -173,6 +177,43 @@ async def ingest_knowledge(
     return KnowledgeIngestResponse(item=_to_item_response(item), chunk_count=chunk_count)
 
 
+@router.post("/ingest/bulk")
+async def ingest_knowledge_bulk(
+    payload: KnowledgeBulkIngestRequest,
+    db: AsyncSession = Depends(get_db),
+    principal: Principal = Depends(require_role(SystemRole.OPERATOR, SystemRole.ADMIN, SystemRole.SYSTEM_ADMIN)),
+):
+    """Ingest many documents, streaming per-document progress via SSE."""
+    service = get_knowledge_engine_service()
+    total = len(payload.documents)
+
+    async def event_generator():
+        started = time.perf_counter()
+        ingested = failed = 0
+        async for event in service.ingest_many(db, principal, payload.documents, batch_size=payload.batch_size):
+            if event["status"] == "ingested":
+                ingested += 1
+            else:
+                failed += 1
+            yield f"data: {json.dumps({**event, 'processed': ingested + failed, 'total': total})}\n\n"
+
+        elapsed = time.perf_counter() - started
+        summary = {
+            "status": "done",
+            "total": total,
+            "ingested": ingested,
+            "failed": failed,
+            "documents_per_second": round(ingested / elapsed, 2) if elapsed > 0 else None,
+        }
+        yield f"data: {json.dumps(summary)}\n\n"
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/help", response_model=HelpDocListResponse)
 async def list_help_docs(
     surface: str | None = Query(default=None),
@@ -105,6 +105,11 @@ class KnowledgeIngestResponse(BaseModel):
     chunk_count: int
 
 
+class KnowledgeBulkIngestRequest(BaseModel):
+    documents: list[KnowledgeIngestRequest] = Field(..., min_length=1, max_length=1000)
+    batch_size: int = Field(default=32, ge=1, le=256)
+
+
 class RelatedKnowledgeResponse(BaseModel):
     item_id: UUID
     related: list[KnowledgeItemResponse] = Field(default_factory=list)
@@ -3,9 +3,11 @@ from __future__ import annotations
 import json
 import math
 import os
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Any
-from uuid import UUID
+from typing import Any, AsyncIterator
+from uuid import UUID, uuid4
 
 from loguru import logger
 from sqlalchemy import text
@@ -13,25 +15,47 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth_deps import Principal
 
-from .ingest_service import chunk_content, extract_text_from_input, generate_embeddings
+from .ingest_service import chunk_content, extract_text_from_input, generate_embeddings, generate_embeddings_batch
 from .schemas import KnowledgeIngestRequest, KnowledgeItemCreate, KnowledgeItemUpdate
 
 try:
     from qdrant_client import QdrantClient
-    from qdrant_client.models import Distance, PointStruct, VectorParams
+    from qdrant_client.models import (
+        Distance,
+        FieldCondition,
+        Filter,
+        FilterSelector,
+        MatchValue,
+        PointStruct,
+        VectorParams,
+    )
 
     QDRANT_AVAILABLE = True
 except ImportError:
     QDRANT_AVAILABLE = False
 
+try:
+    from .vector_index import VectorIndex, VectorIndexStore
+
+    VECTOR_INDEX_AVAILABLE = True
+except ImportError:
+    VECTOR_INDEX_AVAILABLE = False
+
 
 QDRANT_COLLECTION = "brain_knowledge_chunks"
 QDRANT_VECTOR_SIZE = 256
+QDRANT_UPSERT_BATCH_SIZE = 256
+INGEST_BATCH_SIZE = 32
 
 
 class KnowledgeEngineService:
     def __init__(self) -> None:
         self._qdrant_client: QdrantClient | None = None
+        self._vector_indexes: VectorIndexStore | None = VectorIndexStore.from_env() if VECTOR_INDEX_AVAILABLE else None
+        self._item_cache = _ItemCache(
+            max_items=int(os.getenv("KNOWLEDGE_ITEM_CACHE_SIZE", "4096")),
+            ttl_seconds=float(os.getenv("KNOWLEDGE_ITEM_CACHE_TTL_SECONDS", "60")),
+        )
 
     async def _get_qdrant_client(self) -> QdrantClient | None:
         if not QDRANT_AVAILABLE:
@@ -157,7 +181,23 @@ class KnowledgeEngineService:
             },
         )
         row = result.mappings().one_or_none()
+
+        # Changed content gets fresh chunks so search reflects the new text
+        rechunk = row is not None and updated["content"] != current["content"]
+        chunks: list[dict[str, Any]] = []
+        latest_chunk_at: Any = None
+        if rechunk:
+            await db.execute(text("DELETE FROM knowledge_chunks WHERE item_id = :item_id"), {"item_id": str(item_id)})
+            chunks, latest_chunk_at = await self._insert_chunks(db, [(str(item_id), updated["content"])])
+
         await db.commit()
+        self._item_cache.invalidate(str(item_id))
+        if rechunk:
+            await self._delete_qdrant_points(str(item_id))
+            await self._upsert_qdrant_chunks(row["tenant_id"], chunks)
+            for index in self._loaded_vector_indexes(row["tenant_id"]):
+                index.replace_item(item_id, [chunk["embedding"] for chunk in chunks], latest_chunk_at)
+                index.flush()
         return dict(row) if row else None
 
     async def get_item(self, db: AsyncSession, principal: Principal, item_id: UUID) -> dict[str, Any] | None:
@@ -175,20 +215,35 @@ class KnowledgeEngineService:
         row = result.mappings().one_or_none()
         return dict(row) if row else None
 
-    async def _get_item_by_id(self, db: AsyncSession, tenant_id: str | None, item_id: str) -> dict[str, Any] | None:
+    async def _get_items_by_ids(self, db: AsyncSession, tenant_id: str | None, item_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Hydrate items with one query, serving repeats from the item cache."""
+        items: dict[str, dict[str, Any]] = {}
+        missing: list[str] = []
+        for item_id in item_ids:
+            cached = self._item_cache.get(item_id)
+            if cached is None:
+                missing.append(item_id)
+            elif tenant_id is None or cached.get("tenant_id") == tenant_id:
+                items[item_id] = cached
+        if not missing:
+            return items
+
         result = await db.execute(
             text(
                 """
                 SELECT id, tenant_id, title, content, type, tags, visibility, metadata, created_at, updated_at
                 FROM knowledge_items
-                WHERE id = CAST(:item_id AS uuid)
+                WHERE id = ANY(CAST(:item_ids AS uuid[]))
                   AND (CAST(:tenant_id AS text) IS NULL OR tenant_id = :tenant_id)
                 """
             ),
-            {"item_id": item_id, "tenant_id": tenant_id},
+            {"item_ids": missing, "tenant_id": tenant_id},
         )
-        row = result.mappings().one_or_none()
-        return dict(row) if row else None
+        for row in result.mappings().all():
+            item = dict(row)
+            items[str(item["id"])] = item
+            self._item_cache.put(str(item["id"]), item)
+        return items
 
     async def list_items(
         self,
@@ -304,63 +359,191 @@ class KnowledgeEngineService:
 
     async def ingest(self, db: AsyncSession, principal: Principal, payload: KnowledgeIngestRequest) -> tuple[dict[str, Any], int]:
         content = extract_text_from_input(payload.raw_text, payload.url, payload.code, payload.document_text)
-        title = payload.title or content[:80]
+        [(item, chunk_count)] = await self._ingest_documents(db, principal, [(payload, content)])
+        return item, chunk_count
 
-        item = await self.create_knowledge_item(
-            db,
-            principal,
-            KnowledgeItemCreate(
-                title=title,
-                content=content,
-                type=payload.type,
-                tags=payload.tags,
-                visibility=payload.visibility,
-                metadata=payload.metadata,
+    async def ingest_many(
+        self,
+        db: AsyncSession,
+        principal: Principal,
+        payloads: list[KnowledgeIngestRequest],
+        batch_size: int = INGEST_BATCH_SIZE,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Ingest many documents, one transaction per batch.
+
+        Yields one progress event per document (in completion order):
+        {"index", "status": "ingested", "item_id", "title", "chunk_count"}
+        or {"index", "status": "failed", "error"}.
+        """
+        for start in range(0, len(payloads), batch_size):
+            batch: list[tuple[int, KnowledgeIngestRequest, str]] = []
+            for index, payload in enumerate(payloads[start : start + batch_size], start):
+                try:
+                    content = extract_text_from_input(payload.raw_text, payload.url, payload.code, payload.document_text)
+                except Exception as exc:
+                    yield {"index": index, "status": "failed", "error": str(exc)}
+                    continue
+                batch.append((index, payload, content))
+            if not batch:
+                continue
+
+            try:
+                results = await self._ingest_documents(db, principal, [(payload, content) for _, payload, content in batch])
+            except Exception as exc:
+                logger.warning("KnowledgeEngine bulk ingest batch at {} failed: {}", start, exc)
+                await db.rollback()
+                for index, _, _ in batch:
+                    yield {"index": index, "status": "failed", "error": str(exc)}
+                continue
+
+            for (index, _, _), (item, chunk_count) in zip(batch, results):
+                yield {
+                    "index": index,
+                    "status": "ingested",
+                    "item_id": str(item["id"]),
+                    "title": item["title"],
+                    "chunk_count": chunk_count,
+                }
+
+    async def _ingest_documents(
+        self,
+        db: AsyncSession,
+        principal: Principal,
+        documents: list[tuple[KnowledgeIngestRequest, str]],
+    ) -> list[tuple[dict[str, Any], int]]:
+        """Store extracted documents with their chunks in one transaction (constant round trips)."""
+        item_ids = [str(uuid4()) for _ in documents]
+        result = await db.execute(
+            text(
+                """
+                INSERT INTO knowledge_items (id, tenant_id, title, content, type, tags, visibility, metadata)
+                SELECT d.id, :tenant_id, d.title, d.content, d.type, CAST(d.tags AS jsonb), d.visibility, CAST(d.metadata AS jsonb)
+                FROM unnest(
+                    CAST(:ids AS uuid[]), CAST(:titles AS text[]), CAST(:contents AS text[]), CAST(:types AS text[]),
+                    CAST(:tags AS text[]), CAST(:visibilities AS text[]), CAST(:metadata AS text[])
+                ) AS d(id, title, content, type, tags, visibility, metadata)
+                RETURNING id, tenant_id, title, content, type, tags, visibility, metadata, created_at, updated_at
+                """
+            ),
+            {
+                "tenant_id": principal.tenant_id,
+                "ids": item_ids,
+                "titles": [payload.title or content[:80] for payload, content in documents],
+                "contents": [content for _, content in documents],
+                "types": [payload.type for payload, _ in documents],
+                "tags": [json.dumps(payload.tags) for payload, _ in documents],
+                "visibilities": [payload.visibility for payload, _ in documents],
+                "metadata": [json.dumps(payload.metadata) for payload, _ in documents],
+            },
+        )
+        items = {str(row["id"]): dict(row) for row in result.mappings().all()}
+        await db.execute(
+            text(
+                """
+                INSERT INTO knowledge_scores (item_id, usage_count, relevance_score, last_used)
+                SELECT item_id, 0, 0.0, NULL FROM unnest(CAST(:item_ids AS uuid[])) AS item_id
+                ON CONFLICT (item_id) DO NOTHING
+                """
+            ),
+            {"item_ids": item_ids},
+        )
+
+        chunks, latest_chunk_at = await self._insert_chunks(
+            db, [(item_id, content) for item_id, (_, content) in zip(item_ids, documents)]
+        )
+        await db.commit()
+
+        await self._upsert_qdrant_chunks(principal.tenant_id, chunks)
+        for index in self._loaded_vector_indexes(principal.tenant_id):
+            index.add_many([chunk["item_id"] for chunk in chunks], [chunk["embedding"] for chunk in chunks], latest_chunk_at)
+            index.flush()
+
+        chunk_counts: dict[str, int] = {}
+        for chunk in chunks:
+            chunk_counts[chunk["item_id"]] = chunk_counts.get(chunk["item_id"], 0) + 1
+        return [(items[item_id], chunk_counts.get(item_id, 0)) for item_id in item_ids]
+
+    async def _insert_chunks(self, db: AsyncSession, documents: list[tuple[str, str]]) -> tuple[list[dict[str, Any]], Any]:
+        """
+        Chunk, embed and insert (item_id, content) pairs with one statement.
+
+        Returns:
+            Chunk dicts (id, item_id, chunk_index, embedding) and the newest created_at
+        """
+        chunks: list[dict[str, Any]] = []
+        for item_id, content in documents:
+            for idx, chunk in enumerate(chunk_content(content)):
+                chunks.append({"id": str(uuid4()), "item_id": item_id, "chunk_index": idx, "content": chunk})
+        if not chunks:
+            return [], None
+
+        for chunk, embedding in zip(chunks, generate_embeddings_batch([chunk["content"] for chunk in chunks])):
+            chunk["embedding"] = embedding
+
+        result = await db.execute(
+            text(
+                """
+                INSERT INTO knowledge_chunks (id, item_id, content, embedding_json, chunk_index)
+                SELECT c.id, c.item_id, c.content, CAST(c.embedding_json AS jsonb), c.chunk_index
+                FROM unnest(
+                    CAST(:ids AS uuid[]), CAST(:item_ids AS uuid[]), CAST(:contents AS text[]),
+                    CAST(:embeddings AS text[]), CAST(:chunk_indexes AS integer[])
+                ) AS c(id, item_id, content, embedding_json, chunk_index)
+                RETURNING created_at
+                """
             ),
+            {
+                "ids": [chunk["id"] for chunk in chunks],
+                "item_ids": [chunk["item_id"] for chunk in chunks],
+                "contents": [chunk["content"] for chunk in chunks],
+                "embeddings": [json.dumps(chunk["embedding"]) for chunk in chunks],
+                "chunk_indexes": [chunk["chunk_index"] for chunk in chunks],
+            },
         )
+        created = [row["created_at"] for row in result.mappings().all() if row.get("created_at") is not None]
+        return chunks, max(created) if created else None
 
+    async def _upsert_qdrant_chunks(self, tenant_id: str | None, chunks: list[dict[str, Any]]) -> None:
+        if not chunks:
+            return
         qdrant = await self._get_qdrant_client()
-        chunks = chunk_content(content)
-        for idx, chunk in enumerate(chunks):
-            embedding = generate_embeddings(chunk)
-            chunk_result = await db.execute(
-                text(
-                    """
-                    INSERT INTO knowledge_chunks (item_id, content, embedding_json, chunk_index)
-                    VALUES (:item_id, :content, CAST(:embedding_json AS jsonb), :chunk_index)
-                    RETURNING id
-                    """
+        if qdrant is None:
+            return
+        for start in range(0, len(chunks), QDRANT_UPSERT_BATCH_SIZE):
+            batch = chunks[start : start + QDRANT_UPSERT_BATCH_SIZE]
+            try:
+                qdrant.upsert(
+                    collection_name=QDRANT_COLLECTION,
+                    points=[
+                        PointStruct(
+                            id=chunk["id"],
+                            vector=chunk["embedding"],
+                            payload={
+                                "item_id": chunk["item_id"],
+                                "tenant_id": tenant_id,
+                                "chunk_index": chunk["chunk_index"],
+                            },
+                        )
+                        for chunk in batch
+                    ],
+                )
+            except Exception as exc:
+                logger.warning("KnowledgeEngine Qdrant upsert failed for {} chunks: {}", len(batch), exc)
+
+    async def _delete_qdrant_points(self, item_id: str) -> None:
+        qdrant = await self._get_qdrant_client()
+        if qdrant is None:
+            return
+        try:
+            qdrant.delete(
+                collection_name=QDRANT_COLLECTION,
+                points_selector=FilterSelector(
+                    filter=Filter(must=[FieldCondition(key="item_id", match=MatchValue(value=item_id))])
                 ),
-                {
-                    "item_id": str(item["id"]),
-                    "content": chunk,
-                    "embedding_json": json.dumps(embedding),
-                    "chunk_index": idx,
-                },
             )
-            chunk_row = chunk_result.mappings().one()
-
-            if qdrant is not None:
-                try:
-                    qdrant.upsert(
-                        collection_name=QDRANT_COLLECTION,
-                        points=[
-                            PointStruct(
-                                id=str(chunk_row["id"]),
-                                vector=embedding,
-                                payload={
-                                    "item_id": str(item["id"]),
-                                    "tenant_id": principal.tenant_id,
-                                    "chunk_index": idx,
-                                },
-                            )
-                        ],
-                    )
-                except Exception as exc:
-                    logger.warning("KnowledgeEngine Qdrant upsert failed for chunk {}: {}", chunk_row["id"], exc)
-
-        await db.commit()
-        return item, len(chunks)
+        except Exception as exc:
+            logger.warning("KnowledgeEngine Qdrant delete failed for item {}: {}", item_id, exc)
 
     async def semantic_search(self, db: AsyncSession, principal: Principal, query: str, limit: int = 20) -> list[dict[str, Any]]:
         query_vec = generate_embeddings(query)
@@ -399,32 +582,23 @@ class KnowledgeEngineService:
             logger.warning("KnowledgeEngine Qdrant search failed, falling back to JSON embeddings: {}", exc)
             return []
 
-        seen_item_ids: set[str] = set()
-        ordered: list[tuple[float, dict[str, Any]]] = []
-
+        # Best score per item, in Qdrant's order
+        candidates: dict[str, float] = {}
         for point in points:
             payload = point.payload or {}
             item_id = payload.get("item_id")
-            if not isinstance(item_id, str):
-                continue
-            if item_id in seen_item_ids:
+            if not isinstance(item_id, str) or item_id in candidates:
                 continue
 
             tenant_id = payload.get("tenant_id")
             if principal.tenant_id and tenant_id not in {principal.tenant_id, None, ""}:
                 continue
 
-            item = await self._get_item_by_id(db, principal.tenant_id, item_id)
-            if item is None:
-                continue
+            candidates[item_id] = float(getattr(point, "score", 0.0) or 0.0)
 
-            score = float(getattr(point, "score", 0.0) or 0.0)
-            ordered.append((score, item))
-            seen_item_ids.add(item_id)
-            if len(ordered) >= limit:
-                break
-
-        return ordered
+        items = await self._get_items_by_ids(db, principal.tenant_id, list(candidates))
+        ordered = [(score, items[item_id]) for item_id, score in candidates.items() if item_id in items]
+        return ordered[:limit]
 
     async def _semantic_search_fallback(
         self,
@@ -432,6 +606,89 @@ class KnowledgeEngineService:
         principal: Principal,
         query_vec: list[float],
         limit: int,
+    ) -> list[tuple[float, dict[str, Any]]]:
+        index = await self._get_vector_index(db, principal.tenant_id)
+        if index is None:
+            return await self._semantic_search_scan(db, principal, query_vec, limit)
+
+        hits = index.search(query_vec, limit)
+        items = await self._get_items_by_ids(db, principal.tenant_id, [item_id for item_id, _ in hits])
+        return [(score, items[item_id]) for item_id, score in hits if item_id in items]
+
+    async def _get_vector_index(self, db: AsyncSession, tenant_id: str | None) -> VectorIndex | None:
+        """Local vector index for a tenant, rebuilt from Postgres when its fingerprint is stale."""
+        if self._vector_indexes is None:
+            return None
+
+        index = self._vector_indexes.get(tenant_id)
+        if index is not None and self._vector_indexes.is_fresh(index):
+            return index
+
+        result = await db.execute(
+            text(
+                """
+                SELECT COUNT(*) AS chunk_count, MAX(kc.created_at) AS latest_created_at
+                FROM knowledge_chunks kc
+                JOIN knowledge_items ki ON ki.id = kc.item_id
+                WHERE (CAST(:tenant_id AS text) IS NULL OR ki.tenant_id = :tenant_id)
+                """
+            ),
+            {"tenant_id": tenant_id},
+        )
+        row = result.mappings().one()
+        latest = row["latest_created_at"]
+        fingerprint = (int(row["chunk_count"] or 0), str(latest) if latest is not None else None)
+
+        if index is None or index.fingerprint != fingerprint:
+            index = await self._build_vector_index(db, tenant_id, fingerprint[0])
+        index.checked_at = time.monotonic()
+        return index
+
+    async def _build_vector_index(self, db: AsyncSession, tenant_id: str | None, expected_chunks: int) -> VectorIndex:
+        result = await db.execute(
+            text(
+                """
+                SELECT kc.item_id, kc.embedding_json, kc.created_at
+                FROM knowledge_chunks kc
+                JOIN knowledge_items ki ON ki.id = kc.item_id
+                WHERE (CAST(:tenant_id AS text) IS NULL OR ki.tenant_id = :tenant_id)
+                """
+            ),
+            {"tenant_id": tenant_id},
+        )
+        index = self._vector_indexes.create(tenant_id, capacity=max(1024, expected_chunks))
+
+        item_ids: list[Any] = []
+        embeddings: list[list[float]] = []
+        latest_created_at: Any = None
+        for row in result.mappings().all():
+            embedding = row.get("embedding_json")
+            item_ids.append(row["item_id"])
+            embeddings.append(embedding if isinstance(embedding, list) else [])
+            if row.get("created_at") is not None:
+                latest_created_at = max(latest_created_at or row["created_at"], row["created_at"])
+            if len(embeddings) >= 4096:
+                index.add_many(item_ids, embeddings)
+                item_ids, embeddings = [], []
+        index.add_many(item_ids, embeddings)
+        index.latest_created_at = str(latest_created_at) if latest_created_at is not None else None
+        index.flush()
+
+        logger.info("KnowledgeEngine built local vector index for tenant {} ({} chunks)", tenant_id, index.live_count)
+        return index
+
+    def _loaded_vector_indexes(self, tenant_id: str | None) -> list[VectorIndex]:
+        """Local indexes that must see writes to `tenant_id` (its own and the all-tenants one)."""
+        if self._vector_indexes is None:
+            return []
+        return self._vector_indexes.loaded({tenant_id, None})
+
+    async def _semantic_search_scan(
+        self,
+        db: AsyncSession,
+        principal: Principal,
+        query_vec: list[float],
+        limit: int,
     ) -> list[tuple[float, dict[str, Any]]]:
         result = await db.execute(
             text(
@@ -505,27 +762,65 @@ class KnowledgeEngineService:
         return dict(row) if row else None
 
     async def _update_scores(self, db: AsyncSession, scored_items: list[tuple[float, dict[str, Any]]]) -> None:
-        now = datetime.now(timezone.utc)
+        # One row per item (ON CONFLICT cannot touch a row twice per statement)
+        best: dict[str, float] = {}
         for score, item in scored_items:
-            await db.execute(
-                text(
-                    """
-                    INSERT INTO knowledge_scores (item_id, usage_count, relevance_score, last_used)
-                    VALUES (CAST(:item_id AS uuid), 1, :score, :last_used)
-                    ON CONFLICT (item_id)
-                    DO UPDATE SET
-                        usage_count = knowledge_scores.usage_count + 1,
-                        relevance_score = GREATEST(knowledge_scores.relevance_score, EXCLUDED.relevance_score),
-                        last_used = EXCLUDED.last_used,
-                        updated_at = NOW()
-                    """
-                ),
-                {
-                    "item_id": str(item["id"]),
-                    "score": float(score),
-                    "last_used": now,
-                },
-            )
+            item_id = str(item["id"])
+            best[item_id] = max(float(score), best.get(item_id, float("-inf")))
+        if not best:
+            return
+
+        await db.execute(
+            text(
+                """
+                INSERT INTO knowledge_scores (item_id, usage_count, relevance_score, last_used)
+                SELECT s.item_id, 1, s.score, :last_used
+                FROM unnest(CAST(:item_ids AS uuid[]), CAST(:scores AS double precision[])) AS s(item_id, score)
+                ON CONFLICT (item_id)
+                DO UPDATE SET
+                    usage_count = knowledge_scores.usage_count + 1,
+                    relevance_score = GREATEST(knowledge_scores.relevance_score, EXCLUDED.relevance_score),
+                    last_used = EXCLUDED.last_used,
+                    updated_at = NOW()
+                """
+            ),
+            {
+                "item_ids": list(best),
+                "scores": list(best.values()),
+                "last_used": datetime.now(timezone.utc),
+            },
+        )
+
+
+class _ItemCache:
+    """Small LRU + TTL cache of hydrated knowledge item rows."""
+
+    def __init__(self, max_items: int = 4096, ttl_seconds: float = 60.0) -> None:
+        self.max_items = max_items
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def get(self, item_id: str) -> dict[str, Any] | None:
+        entry = self._entries.get(item_id)
+        if entry is None:
+            return None
+        expires_at, item = entry
+        if expires_at < time.monotonic():
+            del self._entries[item_id]
+            return None
+        self._entries.move_to_end(item_id)
+        return item
+
+    def put(self, item_id: str, item: dict[str, Any]) -> None:
+        if self.max_items <= 0:
+            return
+        self._entries[item_id] = (time.monotonic() + self.ttl_seconds, item)
+        self._entries.move_to_end(item_id)
+        while len(self._entries) > self.max_items:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, item_id: str) -> None:
+        self._entries.pop(item_id, None)
 
 
 _service: KnowledgeEngineService | None = None
@@ -0,0 +1,455 @@
+"""
+Knowledge Engine - Local Vector Index
+
+In-process vector search used when Qdrant is unavailable:
+- one contiguous, L2-normalised float32 matrix per tenant
+- exact top-k via a single matrix-vector product
+- IVF (k-means coarse quantiser) approximate mode for large corpora
+- optional memory-mapped persistence (KNOWLEDGE_VECTOR_INDEX_DIR)
+
+Rows are tagged with their knowledge item id; results are deduplicated per
+item (best chunk wins), matching the SQL fallback it replaces.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import time
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+from uuid import UUID
+
+import numpy as np
+from loguru import logger
+
+from .ingest_service import EMBEDDING_DIM
+
+_VECTORS_FILE = "vectors.npy"
+_KEYS_FILE = "keys.npy"
+_LIVE_FILE = "live.npy"
+_META_FILE = "meta.json"
+
+Fingerprint = tuple[int, str | None]  # (live chunk count, latest chunk created_at)
+
+
+def _item_key(item_id: Any) -> bytes:
+    return UUID(str(item_id)).bytes
+
+
+class VectorIndex:
+    """
+    Append-only chunk embedding matrix for one tenant.
+
+    Removed rows are masked out and reclaimed by compaction once they make
+    up half of the matrix. With `directory` set, the matrix, item keys and
+    live mask are numpy memmaps, so a restarted process reopens the index
+    instead of re-reading every embedding from Postgres. A directory must
+    only be used by one process at a time.
+    """
+
+    def __init__(
+        self,
+        dim: int = EMBEDDING_DIM,
+        directory: Path | None = None,
+        ann_min_vectors: int = 50_000,
+        initial_capacity: int = 1024,
+    ) -> None:
+        """
+        Initialize VectorIndex.
+
+        Args:
+            dim: Embedding dimension
+            directory: Memory-map the index into this directory (None = in memory)
+            ann_min_vectors: Switch to IVF search from this many live rows (0 = never)
+            initial_capacity: Rows allocated up front
+        """
+        self.dim = dim
+        self.directory = directory
+        self.ann_min_vectors = ann_min_vectors
+
+        self.count = 0  # used rows, including removed ones
+        self.live_count = 0
+        self.latest_created_at: str | None = None
+        self.checked_at = 0.0  # monotonic time of the last fingerprint check
+
+        self._rows_by_item: dict[bytes, list[int]] = {}
+        self._centroids: np.ndarray | None = None
+        self._assignments: np.ndarray | None = None
+        self._trained_rows = 0
+
+        self._vectors, self._keys, self._live = self._allocate(max(1, initial_capacity))
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    @property
+    def capacity(self) -> int:
+        return int(self._vectors.shape[0])
+
+    @property
+    def fingerprint(self) -> Fingerprint:
+        return self.live_count, self.latest_created_at
+
+    def _allocate(self, capacity: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self.directory is None:
+            return (
+                np.zeros((capacity, self.dim), dtype=np.float32),
+                np.zeros((capacity, 16), dtype=np.uint8),
+                np.zeros(capacity, dtype=np.bool_),
+            )
+
+        # Write new files next to the live ones and swap them in; existing
+        # mappings stay valid until they are dropped.
+        self.directory.mkdir(parents=True, exist_ok=True)
+        arrays = []
+        for name, shape, dtype in (
+            (_VECTORS_FILE, (capacity, self.dim), np.float32),
+            (_KEYS_FILE, (capacity, 16), np.uint8),
+            (_LIVE_FILE, (capacity,), np.bool_),
+        ):
+            tmp = self.directory / f"{name}.tmp"
+            arrays.append((self.directory / name, tmp, np.lib.format.open_memmap(tmp, mode="w+", dtype=dtype, shape=shape)))
+        for final, tmp, array in arrays:
+            array.flush()
+            os.replace(tmp, final)
+        return tuple(array for _, _, array in arrays)  # type: ignore[return-value]
+
+    def _resize(self, capacity: int, rows: np.ndarray | None = None) -> None:
+        """Move `rows` (default: all used rows) into freshly allocated storage."""
+        selector = slice(0, self.count) if rows is None else rows
+        vectors, keys, live = self._allocate(capacity)
+        count = self.count if rows is None else len(rows)
+        vectors[:count] = self._vectors[selector]
+        keys[:count] = self._keys[selector]
+        live[:count] = self._live[selector]
+        self._vectors, self._keys, self._live = vectors, keys, live
+        self.count = count
+
+    def _ensure_capacity(self, extra: int) -> None:
+        needed = self.count + extra
+        if needed > self.capacity:
+            self._resize(max(needed, self.capacity * 2))
+
+    def flush(self) -> None:
+        """Persist the header (memmapped arrays are written through)."""
+        if self.directory is None:
+            return
+        for array in (self._vectors, self._keys, self._live):
+            array.flush()
+        meta = {
+            "dim": self.dim,
+            "count": self.count,
+            "latest_created_at": self.latest_created_at,
+        }
+        tmp = self.directory / f"{_META_FILE}.tmp"
+        tmp.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(tmp, self.directory / _META_FILE)
+
+    @classmethod
+    def load(cls, directory: Path, dim: int = EMBEDDING_DIM, ann_min_vectors: int = 50_000) -> VectorIndex | None:
+        """
+        Reopen a persisted index.
+
+        Returns:
+            The index, or None if the directory holds no usable index
+        """
+        try:
+            meta = json.loads((directory / _META_FILE).read_text(encoding="utf-8"))
+            if int(meta["dim"]) != dim:
+                return None
+            vectors = np.load(directory / _VECTORS_FILE, mmap_mode="r+")
+            keys = np.load(directory / _KEYS_FILE, mmap_mode="r+")
+            live = np.load(directory / _LIVE_FILE, mmap_mode="r+")
+        except (OSError, ValueError, KeyError) as exc:
+            logger.warning("Knowledge vector index at {} unreadable, rebuilding: {}", directory, exc)
+            return None
+
+        count = int(meta["count"])
+        if vectors.shape[1:] != (dim,) or not (len(vectors) == len(keys) == len(live) >= count):
+            return None
+
+        index = cls.__new__(cls)
+        index.dim = dim
+        index.directory = directory
+        index.ann_min_vectors = ann_min_vectors
+        index.count = count
+        index.latest_created_at = meta.get("latest_created_at")
+        index.checked_at = 0.0
+        index._vectors, index._keys, index._live = vectors, keys, live
+        index._centroids = None
+        index._assignments = None
+        index._trained_rows = 0
+        index._rebuild_item_rows()
+        return index
+
+    def _rebuild_item_rows(self) -> None:
+        self._rows_by_item = {}
+        for row in np.flatnonzero(self._live[: self.count]):
+            self._rows_by_item.setdefault(self._keys[row].tobytes(), []).append(int(row))
+        self.live_count = sum(len(rows) for rows in self._rows_by_item.values())
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def _normalise(self, vectors: Sequence[Sequence[float]] | np.ndarray) -> np.ndarray:
+        if isinstance(vectors, np.ndarray) and vectors.ndim == 2 and vectors.shape[1] == self.dim:
+            matrix = vectors.astype(np.float32, copy=True)
+        else:
+            # Ragged input (e.g. legacy embeddings): truncate / zero-pad to dim
+            matrix = np.zeros((len(vectors), self.dim), dtype=np.float32)
+            for i, vector in enumerate(vectors):
+                length = min(len(vector), self.dim)
+                if length:
+                    matrix[i, :length] = np.asarray(vector[:length], dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+
+    def add_many(
+        self,
+        item_ids: Sequence[Any],
+        vectors: Sequence[Sequence[float]] | np.ndarray,
+        latest_created_at: Any = None,
+    ) -> None:
+        """
+        Append chunk embeddings.
+
+        Args:
+            item_ids: Knowledge item id per chunk
+            vectors: Embedding per chunk
+            latest_created_at: Newest created_at of the added chunks
+        """
+        if len(vectors) == 0:
+            return
+        matrix = self._normalise(vectors)
+        self._ensure_capacity(len(matrix))
+
+        start, end = self.count, self.count + len(matrix)
+        self._vectors[start:end] = matrix
+        self._live[start:end] = True
+        keys = [_item_key(item_id) for item_id in item_ids]
+        self._keys[start:end] = np.frombuffer(b"".join(keys), dtype=np.uint8).reshape(-1, 16)
+        for row, key in enumerate(keys, start):
+            self._rows_by_item.setdefault(key, []).append(row)
+        self.count = end
+        self.live_count += len(matrix)
+
+        if latest_created_at is not None:
+            latest = str(latest_created_at)
+            if self.latest_created_at is None or latest > self.latest_created_at:
+                self.latest_created_at = latest
+
+        if self._centroids is not None:
+            self._assign(start, end)
+
+    def remove_item(self, item_id: Any) -> int:
+        """Drop all chunks of an item. Returns the number of rows removed."""
+        rows = self._rows_by_item.pop(_item_key(item_id), [])
+        if rows:
+            self._live[rows] = False
+            self.live_count -= len(rows)
+            if self.count >= 1024 and self.live_count < self.count // 2:
+                self.compact()
+        return len(rows)
+
+    def replace_item(self, item_id: Any, vectors: Sequence[Sequence[float]], latest_created_at: Any = None) -> None:
+        """Swap an item's chunks for a new set."""
+        self.remove_item(item_id)
+        self.add_many([item_id] * len(vectors), vectors, latest_created_at)
+
+    def compact(self) -> None:
+        """Reclaim removed rows."""
+        live_rows = np.flatnonzero(self._live[: self.count])
+        self._resize(self.capacity, live_rows)
+        self._rebuild_item_rows()
+        self._centroids = None
+        self._assignments = None
+        self._trained_rows = 0
+
+    # ------------------------------------------------------------------
+    # IVF
+    # ------------------------------------------------------------------
+
+    def _use_ann(self) -> bool:
+        return bool(self.ann_min_vectors) and self.live_count >= self.ann_min_vectors
+
+    def _train(self) -> None:
+        """Spherical k-means over a sample of live rows, then assign every row."""
+        live_rows = np.flatnonzero(self._live[: self.count])
+        nlist = int(min(1024, max(16, math.sqrt(len(live_rows)))))
+        rng = np.random.default_rng(0)
+        sample_rows = live_rows if len(live_rows) <= nlist * 32 else rng.choice(live_rows, nlist * 32, replace=False)
+        sample = np.asarray(self._vectors[np.sort(sample_rows)])
+
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+        for _ in range(8):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            empty = norms[:, 0] == 0
+            sums[empty] = centroids[empty]  # keep the old centroid for empty clusters
+            norms[empty] = 1.0
+            centroids = (sums / norms).astype(np.float32)
+
+        self._centroids = centroids
+        self._assignments = np.zeros(self.capacity, dtype=np.int32)
+        self._assign(0, self.count)
+        self._trained_rows = len(live_rows)
+
+    def _assign(self, start: int, end: int, block: int = 65_536) -> None:
+        if self._assignments is None or self._centroids is None:
+            return
+        if len(self._assignments) < self.capacity:
+            grown = np.zeros(self.capacity, dtype=np.int32)
+            grown[: len(self._assignments)] = self._assignments
+            self._assignments = grown
+        for lo in range(start, end, block):
+            hi = min(end, lo + block)
+            self._assignments[lo:hi] = np.argmax(self._vectors[lo:hi] @ self._centroids.T, axis=1)
+
+    def _candidate_rows(self, query: np.ndarray, nprobe: int | None) -> np.ndarray | None:
+        """Live rows in the `nprobe` lists closest to the query, or None for a full scan."""
+        if not self._use_ann():
+            return None
+        if self._centroids is None or self.live_count >= 2 * self._trained_rows:
+            self._train()
+        centroids = self._centroids
+        nprobe = min(len(centroids), nprobe or max(1, len(centroids) // 16))
+        selected = np.zeros(len(centroids), dtype=np.bool_)
+        selected[np.argpartition(-(centroids @ query), nprobe - 1)[:nprobe]] = True
+        return np.flatnonzero(selected[self._assignments[: self.count]] & self._live[: self.count])
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def search(self, query: Sequence[float], limit: int, nprobe: int | None = None) -> list[tuple[str, float]]:
+        """
+        Top items by cosine similarity of their best chunk.
+
+        Args:
+            query: Query embedding
+            limit: Maximum number of items
+            nprobe: IVF lists to scan (default: 1/16 of the lists)
+
+        Returns:
+            (item_id, score) pairs, best first
+        """
+        if limit <= 0 or not self.live_count:
+            return []
+        q = self._normalise([query])[0]
+
+        rows = self._candidate_rows(q, nprobe)
+        if rows is None:
+            scores = self._vectors[: self.count] @ q
+            scores[~self._live[: self.count]] = -np.inf
+            rows = np.arange(self.count)
+        else:
+            scores = self._vectors[rows] @ q
+        if not len(scores):
+            return []
+
+        # Take a few chunks per wanted item and widen if duplicates eat the budget
+        k = min(len(scores), limit * 4)
+        while True:
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top], kind="stable")]
+            results: list[tuple[str, float]] = []
+            seen: set[bytes] = set()
+            for position in top:
+                score = float(scores[position])
+                if score == -np.inf:
+                    break
+                key = self._keys[rows[position]].tobytes()
+                if key in seen:
+                    continue
+                seen.add(key)
+                results.append((str(UUID(bytes=key)), score))
+                if len(results) >= limit:
+                    return results
+            if k == len(scores):
+                return results
+            k = min(len(scores), k * 4)
+
+
+class VectorIndexStore:
+    """Per-tenant VectorIndex registry (tenant None = all tenants)."""
+
+    ALL_TENANTS = "__all__"
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        dim: int = EMBEDDING_DIM,
+        ann_min_vectors: int = 50_000,
+        refresh_seconds: float = 60.0,
+    ) -> None:
+        """
+        Initialize VectorIndexStore.
+
+        Args:
+            directory: Root for memory-mapped indexes (None = in memory)
+            dim: Embedding dimension
+            ann_min_vectors: Rows from which searches use IVF (0 = exact only)
+            refresh_seconds: How long an index is trusted before its
+                fingerprint is re-checked against Postgres
+        """
+        self.directory = Path(directory) if directory else None
+        self.dim = dim
+        self.ann_min_vectors = ann_min_vectors
+        self.refresh_seconds = refresh_seconds
+        self._indexes: dict[str, VectorIndex] = {}
+
+    @classmethod
+    def from_env(cls) -> VectorIndexStore:
+        return cls(
+            directory=os.getenv("KNOWLEDGE_VECTOR_INDEX_DIR") or None,
+            ann_min_vectors=int(os.getenv("KNOWLEDGE_VECTOR_INDEX_ANN_MIN_VECTORS", "50000")),
+            refresh_seconds=float(os.getenv("KNOWLEDGE_VECTOR_INDEX_REFRESH_SECONDS", "60")),
+        )
+
+    def _key(self, tenant_id: str | None) -> str:
+        return tenant_id if tenant_id is not None else self.ALL_TENANTS
+
+    def _path(self, key: str) -> Path | None:
+        if self.directory is None:
+            return None
+        return self.directory / hashlib.sha256(key.encode("utf-8")).hexdigest()[:24]
+
+    def get(self, tenant_id: str | None) -> VectorIndex | None:
+        """Loaded or persisted index for a tenant, if any."""
+        key = self._key(tenant_id)
+        index = self._indexes.get(key)
+        if index is None:
+            path = self._path(key)
+            if path is not None and path.exists():
+                index = VectorIndex.load(path, dim=self.dim, ann_min_vectors=self.ann_min_vectors)
+                if index is not None:
+                    self._indexes[key] = index
+        return index
+
+    def create(self, tenant_id: str | None, capacity: int = 1024) -> VectorIndex:
+        """Fresh, empty index for a tenant (replaces any existing one)."""
+        key = self._key(tenant_id)
+        index = VectorIndex(
+            dim=self.dim,
+            directory=self._path(key),
+            ann_min_vectors=self.ann_min_vectors,
+            initial_capacity=capacity,
+        )
+        self._indexes[key] = index
+        return index
+
+    def is_fresh(self, index: VectorIndex) -> bool:
+        return time.monotonic() - index.checked_at < self.refresh_seconds
+
+    def loaded(self, tenant_ids: Iterable[str | None]) -> list[VectorIndex]:
+        """In-memory indexes covering any of the given tenants."""
+        keys = {self._key(tenant_id) for tenant_id in tenant_ids}
+        return [self._indexes[key] for key in keys if key in self._indexes]
@@ -26,6 +26,7 @@ from .schemas import (
     LLMProvider,
     LLMRequest,
     LLMResponse,
+    LLMStreamChunk,
     ChatMessage,
     ProviderConfig,
     OpenRouterConfig,
@@ -38,6 +39,7 @@ __all__ = [
     "LLMProvider",
     "LLMRequest",
     "LLMResponse",
+    "LLMStreamChunk",
     "ChatMessage",
     "ProviderConfig",
     "OpenRouterConfig",
@@ -0,0 +1,175 @@
+"""
+LLM Response Cache - Reuse and coalesce identical LLM requests
+
+Keys are a hash of provider, model, messages and sampling params. Entries
+live in an in-process LRU with TTL and, optionally, a shared Redis tier.
+Concurrent misses for the same key share one upstream call (single-flight).
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from app.core.metrics import record_llm_cache
+
+from .schemas import LLMCacheStats, LLMResponse
+
+REDIS_KEY_PREFIX = "brain:llm_router:cache:"
+
+
+def cache_key(provider: str, model: str, messages: List[Dict[str, str]], params: Dict[str, Any]) -> str:
+    """Stable key for a resolved request"""
+
+    payload = json.dumps(
+        {"provider": provider, "model": model, "messages": messages, "params": params},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """In-memory LRU + TTL cache with optional Redis tier and single-flight"""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 3600.0,
+        redis_getter: Optional[Callable[[], Awaitable[Any]]] = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._redis_getter = redis_getter
+        self._entries: "OrderedDict[str, Tuple[float, LLMResponse]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.latency_saved_ms = 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_call(
+        self,
+        key: str,
+        call: Callable[[], Awaitable[LLMResponse]],
+        store_if: Callable[[LLMResponse], bool] = lambda response: True,
+    ) -> LLMResponse:
+        """
+        Return a cached response, join an identical in-flight call, or run
+        `call` once and cache its result (when `store_if` accepts it)
+        """
+
+        cached = self._get_local(key) or await self._get_remote(key)
+        if cached is not None:
+            return self._served(cached, "hit")
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                # shield: one cancelled waiter must not cancel the shared call
+                response = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # the caller that owned the call was cancelled; make our own
+            else:
+                return self._served(response, "coalesced")
+
+        self.misses += 1
+        record_llm_cache("miss")
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            response = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved when nobody is waiting
+            raise
+        else:
+            future.set_result(response)
+            if store_if(response):
+                self._put_local(key, response)
+                await self._put_remote(key, response)
+            return response
+        finally:
+            self._inflight.pop(key, None)
+
+    def _served(self, response: LLMResponse, result: str) -> LLMResponse:
+        saved_ms = float((response.metadata or {}).get("latency_ms") or 0.0)
+        if result == "hit":
+            self.hits += 1
+        else:
+            self.coalesced += 1
+        self.latency_saved_ms += saved_ms
+        record_llm_cache(result, saved_ms)
+        return response.model_copy(
+            update={"metadata": {**(response.metadata or {}), "cache": result}},
+        )
+
+    def _get_local(self, key: str) -> Optional[LLMResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def _put_local(self, key: str, response: LLMResponse) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _get_remote(self, key: str) -> Optional[LLMResponse]:
+        if self._redis_getter is None:
+            return None
+        try:
+            redis = await self._redis_getter()
+            raw = await redis.get(REDIS_KEY_PREFIX + key)
+        except Exception as e:
+            logger.warning(f"LLM cache Redis read failed: {e}")
+            return None
+        if raw is None:
+            return None
+        response = LLMResponse.model_validate_json(raw)
+        self._put_local(key, response)
+        return response
+
+    async def _put_remote(self, key: str, response: LLMResponse) -> None:
+        if self._redis_getter is None:
+            return
+        try:
+            redis = await self._redis_getter()
+            await redis.set(REDIS_KEY_PREFIX + key, response.model_dump_json(), ex=int(self.ttl_seconds))
+        except Exception as e:
+            logger.warning(f"LLM cache Redis write failed: {e}")
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> LLMCacheStats:
+        lookups = self.hits + self.coalesced + self.misses
+        return LLMCacheStats(
+            entries=len(self._entries),
+            hits=self.hits,
+            coalesced=self.coalesced,
+            misses=self.misses,
+            hit_rate=(self.hits + self.coalesced) / lookups if lookups else 0.0,
+            latency_saved_ms=self.latency_saved_ms,
+        )
@@ -0,0 +1,144 @@
+"""
+Provider Health - Rolling latency/error model per LLM provider
+
+Each provider keeps an EWMA of completion latency and of its error rate and
+a window of recent latencies for p95 (the hedging threshold). Availability
+comes from an integrations CircuitBreaker per provider: OPEN after
+`failure_threshold` consecutive failures, HALF_OPEN after
+`recovery_seconds`, where one success closes it and a failure re-opens it.
+"""
+
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional
+
+from app.modules.integrations.circuit_breaker import CircuitBreaker
+from app.modules.integrations.schemas import CircuitBreakerConfig, CircuitState
+
+from .schemas import LLMProvider, ProviderHealthStatus
+
+# Latency samples kept for percentiles, and needed before p95 is trusted
+LATENCY_WINDOW = 100
+MIN_LATENCY_SAMPLES = 10
+# How much a fully failing provider's latency is inflated when ranking
+ERROR_RATE_PENALTY = 4.0
+# Provider responses that count towards opening the circuit
+FAILURE_STATUS_CODES = [408, 429, 500, 502, 503, 504]
+
+
+class ProviderHealth:
+    """Latency/error EWMA for one provider, gated by its circuit breaker"""
+
+    def __init__(self, alpha: float, breaker: CircuitBreaker):
+        self.alpha = alpha
+        self.breaker = breaker
+        self.latency_ms: Optional[float] = None
+        self.error_rate = 0.0
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    @property
+    def state(self) -> CircuitState:
+        return self.breaker.current_state
+
+    @property
+    def available(self) -> bool:
+        return self.breaker.allow_request()
+
+    @property
+    def consecutive_failures(self) -> int:
+        return self.breaker.state.failure_count
+
+    @property
+    def p95_latency_ms(self) -> Optional[float]:
+        if len(self._latencies) < MIN_LATENCY_SAMPLES:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[int(0.95 * (len(ordered) - 1))]
+
+    def score(self) -> Optional[float]:
+        """Expected latency with an error-rate penalty; None until measured"""
+        if self.latency_ms is None:
+            return None
+        return self.latency_ms * (1.0 + ERROR_RATE_PENALTY * self.error_rate)
+
+    def record_success(self, latency_ms: Optional[float] = None) -> None:
+        if latency_ms is not None:
+            self._latencies.append(latency_ms)
+            self.latency_ms = latency_ms if self.latency_ms is None else (
+                self.alpha * latency_ms + (1.0 - self.alpha) * self.latency_ms
+            )
+        self.error_rate *= 1.0 - self.alpha
+        self.breaker.record_success()
+
+    def record_failure(self, error: Optional[BaseException] = None) -> None:
+        self.error_rate = self.alpha + (1.0 - self.alpha) * self.error_rate
+        status_code = getattr(error, "status_code", None)
+        if status_code is None:
+            status_code = getattr(getattr(error, "response", None), "status_code", None)
+        # No HTTP status means the provider was unreachable, like a timeout
+        is_timeout = status_code is None or "timeout" in type(error).__name__.lower()
+        self.breaker.record_failure(status_code=status_code, is_timeout=is_timeout)
+
+
+class ProviderHealthTracker:
+    """ProviderHealth per provider, plus ranking of candidate providers"""
+
+    def __init__(
+        self,
+        alpha: float = 0.3,
+        failure_threshold: int = 3,
+        recovery_seconds: float = 30.0,
+    ):
+        self.alpha = alpha
+        self.breaker_config = CircuitBreakerConfig(
+            failure_threshold=failure_threshold,
+            recovery_timeout=recovery_seconds,
+            success_threshold=1,
+            failure_status_codes=FAILURE_STATUS_CODES,
+        )
+        self._providers: Dict[LLMProvider, ProviderHealth] = {}
+
+    def get(self, provider: LLMProvider) -> ProviderHealth:
+        health = self._providers.get(provider)
+        if health is None:
+            breaker = CircuitBreaker(self.breaker_config, name=f"llm_router:{provider.value}")
+            health = self._providers[provider] = ProviderHealth(self.alpha, breaker)
+        return health
+
+    def record_success(self, provider: LLMProvider, latency_ms: Optional[float] = None) -> None:
+        self.get(provider).record_success(latency_ms)
+
+    def record_failure(self, provider: LLMProvider, error: Optional[BaseException] = None) -> None:
+        self.get(provider).record_failure(error)
+
+    def healthy(self, providers: Iterable[LLMProvider]) -> List[LLMProvider]:
+        """Providers whose circuit is not open (all of them if every one is)"""
+        providers = list(providers)
+        available = [provider for provider in providers if self.get(provider).available]
+        return available or providers
+
+    def rank(self, providers: Iterable[LLMProvider]) -> List[LLMProvider]:
+        """
+        Healthy providers, fastest first. Unmeasured providers rank ahead so
+        they get measured; ties keep the given (policy) order.
+        """
+        providers = self.healthy(providers)
+        order = {provider: position for position, provider in enumerate(providers)}
+
+        def key(provider: LLMProvider):
+            score = self.get(provider).score()
+            return (0.0 if score is None else score, order[provider])
+
+        return sorted(providers, key=key)
+
+    def snapshot(self) -> List[ProviderHealthStatus]:
+        return [
+            ProviderHealthStatus(
+                provider=provider,
+                state=health.state.value,
+                latency_ms_ewma=health.latency_ms,
+                latency_ms_p95=health.p95_latency_ms,
+                error_rate=health.error_rate,
+                consecutive_failures=health.consecutive_failures,
+            )
+            for provider, health in self._providers.items()
+        ]
@@ -4,19 +4,26 @@ LLM Router API Router
 REST API endpoints for LLM Router functionality
 """
 
-from typing import Optional, List
+import asyncio
+import json
+from typing import AsyncIterator, Optional, List
 from fastapi import APIRouter, HTTPException, Header, Depends
+from fastapi.responses import StreamingResponse
 from loguru import logger
 
 from app.core.auth_deps import require_auth, get_current_principal, Principal
 
 from .service import get_llm_router
 from .schemas import (
+    LLMCacheStats,
     LLMProvider,
     LLMRequest,
     LLMResponse,
+    LLMStreamChunk,
     RouterInfo,
+    ProviderHealthStatus,
     ProviderStatus,
+    ProviderStreamMetrics,
     OpenWebUICompatibility,
     OpenWebUIRequest,
     ChatMessage,
@@ -31,6 +38,23 @@ router = APIRouter(
     dependencies=[Depends(require_auth)]
 )
 
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def _sse_response(events: AsyncIterator[str]) -> StreamingResponse:
+    return StreamingResponse(events, media_type="text/event-stream", headers=SSE_HEADERS)
+
+
+async def _stream_events(chunks: AsyncIterator[LLMStreamChunk]) -> AsyncIterator[str]:
+    """Serialize stream chunks as SSE; failures become a terminal error event"""
+
+    try:
+        async for chunk in chunks:
+            yield f"data: {chunk.model_dump_json()}\n\n"
+    except Exception as e:
+        logger.error(f"Chat stream failed: {e}")
+        yield f"event: error\ndata: {json.dumps({'detail': 'LLM request failed'})}\n\n"
+
 
 @router.get(
     "/info",
@@ -79,7 +103,12 @@ async def chat(
     Provider selection:
     - AXE Agent: Always uses Ollama (local)
     - Other agents: Use requested provider or default
-    - Fallback: Automatic if enabled
+    - Fallback: Automatic if enabled (next healthy candidate)
+    - deadline_ms: overall time budget, 504 when exceeded
+
+    Streaming:
+    - stream=true returns Server-Sent Events, one LLMStreamChunk per event;
+      the final chunk has done=true with usage and timing
 
     Headers:
     - X-Agent-Id: Optional agent identifier for routing
@@ -93,10 +122,19 @@ async def chat(
             detail="LLM Router not initialized",
         )
 
+    if request.stream:
+        return _sse_response(_stream_events(llm_router.chat_stream(request, agent_id=x_agent_id)))
+
     try:
         response = await llm_router.chat(request, agent_id=x_agent_id)
         return response
 
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=504,
+            detail=f"LLM request exceeded deadline of {request.deadline_ms}ms",
+        )
+
     except Exception as e:
         logger.error(f"Chat request failed: {e}", exc_info=True)
         raise HTTPException(
@@ -114,7 +152,7 @@ async def get_provider_status():
     """
     Get health status of all configured providers
 
-    Checks:
+    Checks (cheap model-list probe, cached briefly per provider):
     - Provider availability
     - Latency
     - Last check time
@@ -136,24 +174,90 @@ async def get_provider_status():
         LLMProvider.ANTHROPIC,
     ]
 
+    # Probe providers concurrently; results are cached by the service
+    results = await asyncio.gather(
+        *(llm_router.check_provider_health(provider) for provider in providers),
+        return_exceptions=True,
+    )
+
     statuses = []
-    for provider in providers:
-        try:
-            status = await llm_router.check_provider_health(provider)
-            statuses.append(status)
-        except Exception as e:
-            logger.error(f"Health check failed for {provider.value}: {e}")
-            statuses.append(
-                ProviderStatus(
-                    provider=provider,
-                    available=False,
-                    error=str(e),
-                )
+    for provider, result in zip(providers, results):
+        if isinstance(result, Exception):
+            logger.error(f"Health check failed for {provider.value}: {result}")
+            result = ProviderStatus(
+                provider=provider,
+                available=False,
+                error=str(result),
             )
+        statuses.append(result)
 
     return statuses
 
 
+@router.get(
+    "/metrics/streaming",
+    response_model=List[ProviderStreamMetrics],
+    summary="Streaming latency per provider",
+)
+async def get_stream_metrics():
+    """
+    Time-to-first-token and tokens/s over recent streams per provider
+    """
+
+    llm_router = get_llm_router()
+
+    if not llm_router.initialized:
+        raise HTTPException(
+            status_code=503,
+            detail="LLM Router not initialized",
+        )
+
+    return llm_router.get_stream_metrics()
+
+
+@router.get(
+    "/metrics/cache",
+    response_model=LLMCacheStats,
+    summary="Response cache statistics",
+)
+async def get_cache_stats():
+    """
+    Hits, coalesced requests, misses and upstream latency saved
+    """
+
+    llm_router = get_llm_router()
+
+    if not llm_router.initialized:
+        raise HTTPException(
+            status_code=503,
+            detail="LLM Router not initialized",
+        )
+
+    return llm_router.get_cache_stats()
+
+
+@router.get(
+    "/metrics/routing",
+    response_model=List[ProviderHealthStatus],
+    summary="Provider latency and circuit state",
+)
+async def get_routing_health():
+    """
+    Latency EWMA/p95, error rate and circuit breaker state per provider,
+    as used for adaptive routing and hedging
+    """
+
+    llm_router = get_llm_router()
+
+    if not llm_router.initialized:
+        raise HTTPException(
+            status_code=503,
+            detail="LLM Router not initialized",
+        )
+
+    return llm_router.get_routing_health()
+
+
 @router.get(
     "/providers/{provider}/models",
     response_model=List[str],
@@ -275,6 +379,9 @@ async def openwebui_chat_completions(
             stream=request.stream,
         )
 
+        if request.stream:
+            return _sse_response(_openwebui_stream_events(llm_router.chat_stream(llm_request)))
+
         response = await llm_router.chat(llm_request)
 
         # Return OpenWebUI-compatible format
@@ -304,6 +411,34 @@ async def openwebui_chat_completions(
         )
 
 
+async def _openwebui_stream_events(chunks: AsyncIterator[LLMStreamChunk]) -> AsyncIterator[str]:
+    """Serialize stream chunks as OpenAI chat.completion.chunk events"""
+
+    created = int(time.time())
+    try:
+        async for chunk in chunks:
+            payload = {
+                "id": "chatcmpl-brain",
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": chunk.model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "delta": {} if chunk.done else {"content": chunk.content},
+                        "finish_reason": (chunk.finish_reason or "stop") if chunk.done else None,
+                    }
+                ],
+            }
+            if chunk.done and chunk.usage:
+                payload["usage"] = chunk.usage
+            yield f"data: {json.dumps(payload)}\n\n"
+    except Exception as e:
+        logger.error(f"OpenWebUI chat stream failed: {e}")
+        yield f"data: {json.dumps({'error': {'message': 'Chat request failed'}})}\n\n"
+    yield "data: [DONE]\n\n"
+
+
 @router.get(
     "/openwebui/models",
     summary="OpenWebUI-compatible models endpoint",
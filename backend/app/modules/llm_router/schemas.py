@@ -83,6 +83,12 @@ class LLMRequest(BaseModel):
         description="Available tools/functions",
     )
 
+    deadline_ms: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Overall time budget including fallbacks and hedging (ms)",
+    )
+
     metadata: Optional[Dict[str, Any]] = Field(
         None,
         description="Additional request metadata",
@@ -123,6 +129,45 @@ class LLMResponse(BaseModel):
     )
 
 
+class LLMStreamChunk(BaseModel):
+    """Incremental piece of a streamed LLM response"""
+
+    content: str = Field(
+        "",
+        description="Text delta since the previous chunk",
+    )
+
+    provider: LLMProvider = Field(
+        ...,
+        description="Provider producing the stream",
+    )
+
+    model: str = Field(
+        ...,
+        description="Model producing the stream",
+    )
+
+    done: bool = Field(
+        False,
+        description="True on the final chunk of the stream",
+    )
+
+    finish_reason: Optional[str] = Field(
+        None,
+        description="Reason for completion (final chunk only)",
+    )
+
+    usage: Optional[Dict[str, int]] = Field(
+        None,
+        description="Token usage statistics (final chunk only)",
+    )
+
+    metadata: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Timing metadata (final chunk only)",
+    )
+
+
 class ProviderConfig(BaseModel):
     """Base provider configuration"""
 
@@ -326,6 +371,50 @@ class LLMRouterConfig(BaseModel):
         description="Cache TTL in seconds",
     )
 
+    cache_max_entries: int = Field(
+        1024,
+        description="Responses kept in the in-memory cache (LRU)",
+    )
+
+    cache_redis: bool = Field(
+        False,
+        description="Share cached responses across workers via Redis",
+    )
+
+    health_check_ttl: int = Field(
+        30,
+        description="Seconds a provider health probe result is reused",
+    )
+
+    adaptive_routing: bool = Field(
+        False,
+        description="Route AUTO requests to the fastest healthy candidate provider",
+    )
+
+    enable_hedging: bool = Field(
+        False,
+        description="Start a backup provider once the primary exceeds its p95 latency",
+    )
+
+    latency_ewma_alpha: float = Field(
+        0.3,
+        gt=0.0,
+        le=1.0,
+        description="Weight of the newest sample in latency/error EWMAs",
+    )
+
+    breaker_failure_threshold: int = Field(
+        3,
+        ge=1,
+        description="Consecutive failures that open a provider's circuit",
+    )
+
+    breaker_recovery_seconds: float = Field(
+        30.0,
+        gt=0.0,
+        description="Seconds an open circuit waits before a trial request",
+    )
+
     # Provider configs
     ollama: OllamaConfig = Field(
         default_factory=OllamaConfig,
@@ -358,6 +447,38 @@ class ProviderStatus(BaseModel):
     last_check: Optional[str] = None
 
 
+class ProviderStreamMetrics(BaseModel):
+    """Streaming latency/throughput over a provider's recent streams"""
+
+    provider: LLMProvider
+    streams: int = 0
+    ttft_ms_avg: Optional[float] = None
+    ttft_ms_p95: Optional[float] = None
+    tokens_per_second_avg: Optional[float] = None
+
+
+class ProviderHealthStatus(BaseModel):
+    """Rolling latency/error model and circuit state of a provider"""
+
+    provider: LLMProvider
+    state: str
+    latency_ms_ewma: Optional[float] = None
+    latency_ms_p95: Optional[float] = None
+    error_rate: float = 0.0
+    consecutive_failures: int = 0
+
+
+class LLMCacheStats(BaseModel):
+    """Response cache effectiveness"""
+
+    entries: int = 0
+    hits: int = 0
+    coalesced: int = 0
+    misses: int = 0
+    hit_rate: float = 0.0
+    latency_saved_ms: float = 0.0
+
+
 class RouterInfo(BaseModel):
     """LLM Router system information"""
 
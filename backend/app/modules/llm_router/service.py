@@ -4,36 +4,59 @@ LLM Router Service - Unified LLM access with provider abstraction
 Uses litellm for provider abstraction and routing.
 """
 
+import asyncio
+import math
 import time
-from typing import Optional, Dict, Any, List
+from collections import deque
+from typing import Optional, Dict, Any, List, AsyncIterator, Awaitable, Callable, Deque, Tuple
 from loguru import logger
 import os
 
 try:
     import litellm
     from litellm import completion, acompletion
+    from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler
     LITELLM_AVAILABLE = True
 except ImportError:
     logger.warning("litellm not available - install with: pip install litellm")
     LITELLM_AVAILABLE = False
 
+from .cache import LLMResponseCache, cache_key
+from .health import ProviderHealthTracker
 from .schemas import (
+    LLMCacheStats,
     LLMProvider,
     LLMRequest,
     LLMResponse,
+    LLMStreamChunk,
     LLMRouterConfig,
+    ProviderHealthStatus,
     ProviderStatus,
-    ChatMessage,
-    MessageRole,
+    ProviderStreamMetrics,
     OpenAIConfig,
     OllamaConfig,
     AnthropicConfig,
     OpenWebUIConfig,
     OpenRouterConfig,
 )
+from app.core.metrics import record_llm_hedge, record_llm_stream
 from app.modules.runtime_control.schemas import RuntimeDecisionContext
 from app.modules.runtime_control.service import get_runtime_control_service
 
+# Keep-alive connections per provider, shared by all requests
+LLM_ROUTER_MAX_CONNECTIONS = int(os.getenv("LLM_ROUTER_MAX_CONNECTIONS", "20"))
+DEFAULT_PROVIDER_TIMEOUT = 120.0
+# Recent streams per provider kept for streaming metrics
+STREAM_STATS_WINDOW = 200
+HEALTH_PROBE_TIMEOUT = 5.0
+# Providers that can't be called without an API key
+KEYED_PROVIDERS = {LLMProvider.OPENROUTER, LLMProvider.OPENAI, LLMProvider.ANTHROPIC}
+
+# Providers litellm calls through its own httpx handler, which accepts a
+# shared client. OpenAI-compatible providers (openai/, OpenWebUI) go through
+# the OpenAI SDK client that litellm already caches per api_base/key.
+POOLED_PROVIDERS = {LLMProvider.OLLAMA, LLMProvider.OPENROUTER, LLMProvider.ANTHROPIC}
+
 
 class LLMRouterService:
     """
@@ -48,6 +71,12 @@ class LLMRouterService:
     def __init__(self, config: Optional[LLMRouterConfig] = None):
         """Initialize LLM Router"""
 
+        self._http_clients: Dict[LLMProvider, "AsyncHTTPHandler"] = {}
+        self._stream_samples: Dict[LLMProvider, Deque[Tuple[Optional[float], Optional[float]]]] = {}
+        self._health_cache: Dict[LLMProvider, Tuple[float, ProviderStatus]] = {}
+        self.cache: Optional[LLMResponseCache] = None
+        self.health = ProviderHealthTracker()
+
         if not LITELLM_AVAILABLE:
             logger.error("litellm not installed - LLM Router disabled")
             self.initialized = False
@@ -59,6 +88,19 @@ class LLMRouterService:
         # Configure litellm
         self._configure_litellm()
 
+        if self.config.enable_caching:
+            self.cache = LLMResponseCache(
+                max_entries=self.config.cache_max_entries,
+                ttl_seconds=self.config.cache_ttl,
+                redis_getter=_get_cache_redis if self.config.cache_redis else None,
+            )
+
+        self.health = ProviderHealthTracker(
+            alpha=self.config.latency_ewma_alpha,
+            failure_threshold=self.config.breaker_failure_threshold,
+            recovery_seconds=self.config.breaker_recovery_seconds,
+        )
+
         self.initialized = True
         logger.success("LLM Router initialized successfully")
 
@@ -107,6 +149,12 @@ class LLMRouterService:
 
         return LLMRouterConfig(
             default_provider=default_provider,
+            enable_caching=os.getenv("LLM_ROUTER_CACHE_ENABLED", "true").lower() in ("1", "true", "yes"),
+            cache_ttl=int(os.getenv("LLM_ROUTER_CACHE_TTL", "3600")),
+            cache_max_entries=int(os.getenv("LLM_ROUTER_CACHE_MAX_ENTRIES", "1024")),
+            cache_redis=os.getenv("LLM_ROUTER_CACHE_REDIS", "false").lower() in ("1", "true", "yes"),
+            adaptive_routing=os.getenv("LLM_ROUTER_ADAPTIVE_ROUTING", "false").lower() in ("1", "true", "yes"),
+            enable_hedging=os.getenv("LLM_ROUTER_HEDGING", "false").lower() in ("1", "true", "yes"),
             ollama=ollama_config,
             openrouter=openrouter_config,
             openwebui=openwebui_config,
@@ -213,8 +261,89 @@ class LLMRouterService:
         elif provider == LLMProvider.ANTHROPIC:
             params["api_base"] = self.config.anthropic.base_url
 
+        if provider in POOLED_PROVIDERS:
+            params["client"] = self._get_http_client(provider)
+
         return params
 
+    def _get_http_client(self, provider: LLMProvider) -> "AsyncHTTPHandler":
+        """Pooled HTTP client for a provider, created on first use"""
+
+        client = self._http_clients.get(provider)
+        if client is None:
+            timeout = {
+                LLMProvider.OLLAMA: self.config.ollama.timeout,
+                LLMProvider.OPENWEBUI: self.config.openwebui.timeout,
+            }.get(provider, DEFAULT_PROVIDER_TIMEOUT)
+            client = AsyncHTTPHandler(timeout=timeout, concurrent_limit=LLM_ROUTER_MAX_CONNECTIONS)
+            self._http_clients[provider] = client
+        return client
+
+    async def close(self) -> None:
+        """Close pooled provider connections"""
+
+        clients, self._http_clients = self._http_clients, {}
+        for provider, client in clients.items():
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning(f"Failed to close {provider.value} client: {e}")
+
+    def _route(
+        self,
+        request: LLMRequest,
+        agent_id: Optional[str],
+    ) -> Tuple[List[Tuple[LLMProvider, str]], Optional[str]]:
+        """
+        Ordered (provider, model string) candidates for a request
+
+        The selected provider comes first, then - for AUTO requests - its
+        configured fallback_providers, then Ollama when fallback is enabled.
+        Providers with an open circuit are skipped (unless every candidate
+        is open). With adaptive_routing, AUTO candidates are reordered by
+        measured latency and error rate; Ollama stays the last resort.
+        """
+
+        runtime_provider, runtime_decision_id = self._resolve_runtime_provider(request, agent_id)
+        primary = self._select_provider(request.provider, agent_id, runtime_provider=runtime_provider)
+        flexible = request.provider == LLMProvider.AUTO and runtime_provider is None
+
+        candidates = [primary]
+        if flexible:
+            primary_config = getattr(self.config, primary.value, None)
+            candidates += [
+                provider
+                for provider in getattr(primary_config, "fallback_providers", [])
+                if self._is_routable(provider)
+            ]
+        candidates = list(dict.fromkeys(candidates))
+        if self.config.adaptive_routing and flexible:
+            candidates = self.health.rank(candidates)
+        if self.config.enable_fallback and LLMProvider.OLLAMA not in candidates:
+            candidates.append(LLMProvider.OLLAMA)
+        candidates = self.health.healthy(candidates)
+
+        route = [
+            (provider, self._get_model_string(provider, request.model if provider == primary else None))
+            for provider in candidates
+        ]
+        return route, runtime_decision_id
+
+    def _is_routable(self, provider: LLMProvider) -> bool:
+        """Provider is enabled and has credentials where it needs them"""
+
+        provider_config = getattr(self.config, provider.value, None)
+        if provider_config is None or not provider_config.enabled:
+            return False
+        return provider not in KEYED_PROVIDERS or bool(provider_config.api_key)
+
+    @staticmethod
+    def _messages(request: LLMRequest) -> List[Dict[str, str]]:
+        return [
+            {"role": msg.role.value, "content": msg.content}
+            for msg in request.messages
+        ]
+
     async def chat(
         self,
         request: LLMRequest,
@@ -223,6 +352,10 @@ class LLMRouterService:
         """
         Send chat request to appropriate LLM provider
 
+        Candidates from _route are tried in order; with hedging, a backup
+        starts once the current candidate exceeds its p95 latency.
+        request.deadline_ms bounds the whole call (raises TimeoutError).
+
         Args:
             request: LLM request
             agent_id: Optional agent ID for routing logic
@@ -234,21 +367,153 @@ class LLMRouterService:
         if not self.initialized:
             raise RuntimeError("LLM Router not initialized")
 
-        # Determine provider (runtime-control aware)
-        runtime_provider, runtime_decision_id = self._resolve_runtime_provider(request, agent_id)
-        provider = self._select_provider(request.provider, agent_id, runtime_provider=runtime_provider)
+        if request.stream:
+            return await self._collect_stream(request, agent_id)
 
-        # Get model string
-        model_string = self._get_model_string(provider, request.model)
+        if request.deadline_ms is not None:
+            return await asyncio.wait_for(self._chat(request, agent_id), request.deadline_ms / 1000)
+        return await self._chat(request, agent_id)
 
-        # Get provider params
-        provider_params = self._get_provider_params(provider)
+    async def _chat(self, request: LLMRequest, agent_id: Optional[str]) -> LLMResponse:
+        route, runtime_decision_id = self._route(request, agent_id)
+        messages = self._messages(request)
 
-        # Convert messages
-        messages = [
-            {"role": msg.role.value, "content": msg.content}
-            for msg in request.messages
-        ]
+        def dispatch() -> Awaitable[LLMResponse]:
+            return self._dispatch(request, agent_id, route, messages, runtime_decision_id)
+
+        if self.cache is None or not self._is_cacheable(request):
+            return await dispatch()
+
+        provider, model_string = route[0]
+        key = cache_key(
+            provider.value,
+            model_string,
+            messages,
+            {"temperature": request.temperature, "max_tokens": request.max_tokens, "tools": request.tools},
+        )
+        # A fallback answer from another provider is returned but not cached
+        response = await self.cache.get_or_call(key, dispatch, store_if=lambda r: r.provider == provider)
+        return response.model_copy(
+            update={
+                "metadata": {
+                    **(response.metadata or {}),
+                    "agent_id": agent_id,
+                    "runtime_decision_id": runtime_decision_id,
+                }
+            }
+        )
+
+    def _is_cacheable(self, request: LLMRequest) -> bool:
+        """
+        Deterministic requests (temperature 0) are cached; metadata
+        "cache": true/false overrides this per request
+        """
+
+        override = (request.metadata or {}).get("cache")
+        if override is not None:
+            return bool(override)
+        return request.temperature == 0
+
+    def get_cache_stats(self) -> LLMCacheStats:
+        """Response cache hit rate and latency saved"""
+
+        return self.cache.stats() if self.cache is not None else LLMCacheStats()
+
+    def get_routing_health(self) -> List[ProviderHealthStatus]:
+        """Latency/error model and circuit state per provider"""
+
+        return self.health.snapshot()
+
+    async def _dispatch(
+        self,
+        request: LLMRequest,
+        agent_id: Optional[str],
+        route: List[Tuple[LLMProvider, str]],
+        messages: List[Dict[str, str]],
+        runtime_decision_id: Optional[str],
+    ) -> LLMResponse:
+        """Try route candidates in order, hedging onto the next when enabled"""
+
+        def attempt(index: int) -> Callable[[], Awaitable[LLMResponse]]:
+            provider, model_string = route[index]
+            return lambda: self._complete(request, agent_id, provider, model_string, messages, runtime_decision_id)
+
+        last_error: Optional[Exception] = None
+        index = 0
+        while index < len(route):
+            provider = route[index][0]
+            hedge_after_ms = self._hedge_delay_ms(request, provider)
+            try:
+                if hedge_after_ms is not None and index + 1 < len(route):
+                    return await self._hedged(provider, hedge_after_ms, attempt(index), attempt(index + 1))
+                return await attempt(index)()
+            except Exception as e:
+                last_error = e
+                index += 2 if hedge_after_ms is not None and index + 1 < len(route) else 1
+                if index < len(route):
+                    logger.warning(f"Falling back from {provider.value} to {route[index][0].value}...")
+
+        raise last_error
+
+    def _hedge_delay_ms(self, request: LLMRequest, provider: LLMProvider) -> Optional[float]:
+        """Primary's p95 latency when hedging applies (metadata "hedge" overrides config)"""
+
+        override = (request.metadata or {}).get("hedge")
+        enabled = self.config.enable_hedging if override is None else bool(override)
+        return self.health.get(provider).p95_latency_ms if enabled else None
+
+    async def _hedged(
+        self,
+        provider: LLMProvider,
+        delay_ms: float,
+        primary_call: Callable[[], Awaitable[LLMResponse]],
+        backup_call: Callable[[], Awaitable[LLMResponse]],
+    ) -> LLMResponse:
+        """
+        Run the primary; start the backup once delay_ms elapses (or as soon
+        as the primary fails). The first success wins, the other is cancelled.
+        """
+
+        primary = asyncio.create_task(primary_call())
+        tasks = [primary]
+        try:
+            await asyncio.wait(tasks, timeout=delay_ms / 1000)
+            if primary.done() and primary.exception() is None:
+                return primary.result()
+
+            hedged = not primary.done()
+            backup = asyncio.create_task(backup_call())
+            tasks.append(backup)
+            pending = {task for task in tasks if not task.done()}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        response = task.result()
+                        if hedged:
+                            winner = "primary" if task is primary else "backup"
+                            record_llm_hedge(provider.value, winner)
+                            response.metadata = {**(response.metadata or {}), "hedged": winner}
+                        return response
+
+            if hedged:
+                record_llm_hedge(provider.value, "none")
+            raise backup.exception()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _complete(
+        self,
+        request: LLMRequest,
+        agent_id: Optional[str],
+        provider: LLMProvider,
+        model_string: str,
+        messages: List[Dict[str, str]],
+        runtime_decision_id: Optional[str],
+    ) -> LLMResponse:
+        """Single non-streaming completion, recorded in the provider health model"""
 
         try:
             start_time = time.time()
@@ -259,8 +524,8 @@ class LLMRouterService:
                 messages=messages,
                 temperature=request.temperature,
                 max_tokens=request.max_tokens,
-                stream=request.stream,
-                **provider_params,
+                stream=False,
+                **self._get_provider_params(provider),
             )
 
             latency = (time.time() - start_time) * 1000
@@ -278,35 +543,212 @@ class LLMRouterService:
                     "total_tokens": response.usage.total_tokens,
                 }
 
+        except Exception as e:
+            logger.error(f"LLM request failed ({provider.value}): {e}")
+            self.health.record_failure(provider, e)
+            raise
+
+        self.health.record_success(provider, latency)
+        logger.info(
+            f"LLM request completed: {provider.value} ({model_string}) "
+            f"in {latency:.2f}ms"
+        )
+
+        return LLMResponse(
+            content=content,
+            provider=provider,
+            model=model_string,
+            finish_reason=finish_reason,
+            usage=usage,
+            metadata={
+                "latency_ms": latency,
+                "agent_id": agent_id,
+                "runtime_decision_id": runtime_decision_id,
+            },
+        )
+
+    async def chat_stream(
+        self,
+        request: LLMRequest,
+        agent_id: Optional[str] = None,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Stream chat response from appropriate LLM provider
+
+        Yields content deltas as the provider produces them, then one final
+        chunk (done=True) with finish_reason, usage and timing metadata
+        (ttft_ms, latency_ms, tokens_per_second). The next route candidate
+        is only tried if a provider fails before the first token.
+        request.deadline_ms bounds the whole stream (raises TimeoutError).
+
+        Args:
+            request: LLM request
+            agent_id: Optional agent ID for routing logic
+
+        Yields:
+            LLM stream chunks
+        """
+
+        if not self.initialized:
+            raise RuntimeError("LLM Router not initialized")
+
+        route, runtime_decision_id = self._route(request, agent_id)
+        messages = self._messages(request)
+        deadline = None
+        if request.deadline_ms is not None:
+            deadline = time.perf_counter() + request.deadline_ms / 1000
+
+        for index, (provider, model_string) in enumerate(route):
+            start_time = time.perf_counter()
+            first_token_at: Optional[float] = None
+            content_chunks = 0
+            finish_reason = None
+            usage = None
+
+            try:
+                response = await asyncio.wait_for(
+                    acompletion(
+                        model=model_string,
+                        messages=messages,
+                        temperature=request.temperature,
+                        max_tokens=request.max_tokens,
+                        stream=True,
+                        stream_options={"include_usage": True},
+                        **self._get_provider_params(provider),
+                    ),
+                    _remaining(deadline),
+                )
+
+                chunks = response.__aiter__()
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(chunks.__anext__(), _remaining(deadline))
+                    except StopAsyncIteration:
+                        break
+
+                    if getattr(chunk, "usage", None):
+                        usage = {
+                            "prompt_tokens": chunk.usage.prompt_tokens,
+                            "completion_tokens": chunk.usage.completion_tokens,
+                            "total_tokens": chunk.usage.total_tokens,
+                        }
+                    if not chunk.choices:
+                        continue
+
+                    choice = chunk.choices[0]
+                    if choice.finish_reason:
+                        finish_reason = choice.finish_reason
+                    delta = getattr(choice.delta, "content", None) if choice.delta else None
+                    if not delta:
+                        continue
+
+                    if first_token_at is None:
+                        first_token_at = time.perf_counter()
+                    content_chunks += 1
+                    yield LLMStreamChunk(content=delta, provider=provider, model=model_string)
+
+            except Exception as e:
+                logger.error(f"LLM stream failed ({provider.value}): {e}")
+                ttft_ms = (first_token_at - start_time) * 1000 if first_token_at else None
+                self._record_stream(provider, success=False, ttft_ms=ttft_ms)
+                self.health.record_failure(provider, e)
+
+                # Once tokens were sent the stream can't switch providers
+                deadline_passed = deadline is not None and time.perf_counter() >= deadline
+                if first_token_at is None and not deadline_passed and index + 1 < len(route):
+                    logger.warning(f"Falling back from {provider.value} to {route[index + 1][0].value}...")
+                    continue
+
+                raise
+
+            end_time = time.perf_counter()
+            completion_tokens = (usage or {}).get("completion_tokens") or content_chunks
+            ttft_ms = None
+            tokens_per_second = None
+            if first_token_at is not None:
+                ttft_ms = (first_token_at - start_time) * 1000
+                decode_seconds = end_time - first_token_at
+                if completion_tokens > 1 and decode_seconds > 0:
+                    tokens_per_second = (completion_tokens - 1) / decode_seconds
+
+            self._record_stream(provider, success=True, ttft_ms=ttft_ms, tokens_per_second=tokens_per_second)
+            # Stream durations depend on output length, so only health is recorded
+            self.health.record_success(provider)
+            latency = (end_time - start_time) * 1000
             logger.info(
-                f"LLM request completed: {provider.value} ({model_string}) "
-                f"in {latency:.2f}ms"
+                f"LLM stream completed: {provider.value} ({model_string}) "
+                f"in {latency:.2f}ms (ttft {ttft_ms or 0:.2f}ms)"
             )
 
-            return LLMResponse(
-                content=content,
+            yield LLMStreamChunk(
                 provider=provider,
                 model=model_string,
+                done=True,
                 finish_reason=finish_reason,
                 usage=usage,
                 metadata={
                     "latency_ms": latency,
+                    "ttft_ms": ttft_ms,
+                    "tokens_per_second": tokens_per_second,
                     "agent_id": agent_id,
                     "runtime_decision_id": runtime_decision_id,
                 },
             )
+            return
 
-        except Exception as e:
-            logger.error(f"LLM request failed ({provider.value}): {e}")
+    async def _collect_stream(
+        self,
+        request: LLMRequest,
+        agent_id: Optional[str],
+    ) -> LLMResponse:
+        """Consume chat_stream into a single response"""
 
-            # Try fallback if enabled
-            if self.config.enable_fallback and provider != LLMProvider.OLLAMA:
-                logger.warning(f"Falling back to Ollama...")
-                request.provider = LLMProvider.OLLAMA
-                request.metadata = {**(request.metadata or {}), "runtime_control_disable": True}
-                return await self.chat(request, agent_id)
+        parts: List[str] = []
+        final: Optional[LLMStreamChunk] = None
+        async for chunk in self.chat_stream(request, agent_id):
+            if chunk.done:
+                final = chunk
+            else:
+                parts.append(chunk.content)
+
+        return LLMResponse(
+            content="".join(parts),
+            provider=final.provider,
+            model=final.model,
+            finish_reason=final.finish_reason,
+            usage=final.usage,
+            metadata={**(final.metadata or {}), "streamed": True},
+        )
 
-            raise
+    def _record_stream(
+        self,
+        provider: LLMProvider,
+        success: bool,
+        ttft_ms: Optional[float] = None,
+        tokens_per_second: Optional[float] = None,
+    ) -> None:
+        record_llm_stream(provider.value, success, ttft_ms, tokens_per_second)
+        if success:
+            samples = self._stream_samples.setdefault(provider, deque(maxlen=STREAM_STATS_WINDOW))
+            samples.append((ttft_ms, tokens_per_second))
+
+    def get_stream_metrics(self) -> List[ProviderStreamMetrics]:
+        """Time-to-first-token and throughput over recent streams per provider"""
+
+        metrics = []
+        for provider, samples in self._stream_samples.items():
+            ttfts = sorted(ttft for ttft, _ in samples if ttft is not None)
+            rates = [rate for _, rate in samples if rate is not None]
+            metrics.append(
+                ProviderStreamMetrics(
+                    provider=provider,
+                    streams=len(samples),
+                    ttft_ms_avg=sum(ttfts) / len(ttfts) if ttfts else None,
+                    ttft_ms_p95=ttfts[max(0, math.ceil(0.95 * len(ttfts)) - 1)] if ttfts else None,
+                    tokens_per_second_avg=sum(rates) / len(rates) if rates else None,
+                )
+            )
+        return metrics
 
     @staticmethod
     def _provider_from_value(raw: str | None) -> LLMProvider | None:
@@ -394,6 +836,10 @@ class LLMRouterService:
         """
         Check provider health status
 
+        Probes a cheap metadata endpoint (model list) over the pooled client
+        instead of running a completion. Results are reused for
+        config.health_check_ttl seconds.
+
         Args:
             provider: Provider to check
 
@@ -401,21 +847,23 @@ class LLMRouterService:
             Provider status
         """
 
-        try:
-            start_time = time.time()
-
-            # Simple test request
-            test_request = LLMRequest(
-                messages=[
-                    ChatMessage(role=MessageRole.USER, content="ping")
-                ],
-                provider=provider,
-                max_tokens=5,
-            )
+        cached = self._health_cache.get(provider)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
 
-            response = await self.chat(test_request)
+        status = await self._probe_provider(provider)
+        self._health_cache[provider] = (time.monotonic() + self.config.health_check_ttl, status)
+        return status
 
+    async def _probe_provider(self, provider: LLMProvider) -> ProviderStatus:
+        try:
+            url, headers = self._health_probe_request(provider)
+            start_time = time.time()
+            client = self._get_http_client(provider).client
+            response = await client.get(url, headers=headers, timeout=HEALTH_PROBE_TIMEOUT)
             latency = (time.time() - start_time) * 1000
+            if response.status_code >= 400:
+                raise RuntimeError(f"{url} returned HTTP {response.status_code}")
 
             return ProviderStatus(
                 provider=provider,
@@ -434,6 +882,34 @@ class LLMRouterService:
                 last_check=time.strftime("%Y-%m-%d %H:%M:%S"),
             )
 
+    def _health_probe_request(self, provider: LLMProvider) -> Tuple[str, Dict[str, str]]:
+        """URL and headers of the cheapest authenticated call for a provider"""
+
+        if provider == LLMProvider.OLLAMA:
+            return f"{self.config.ollama.host}/api/tags", {}
+
+        if provider == LLMProvider.OPENWEBUI:
+            headers = {}
+            if self.config.openwebui.api_key:
+                headers["Authorization"] = f"Bearer {self.config.openwebui.api_key}"
+            return f"{self.config.openwebui.host}/api/models", headers
+
+        if provider == LLMProvider.OPENROUTER:
+            api_key, base_url = self.config.openrouter.api_key, self.config.openrouter.base_url
+            headers = {"Authorization": f"Bearer {api_key}"}
+        elif provider == LLMProvider.OPENAI:
+            api_key, base_url = self.config.openai.api_key, self.config.openai.base_url
+            headers = {"Authorization": f"Bearer {api_key}"}
+        elif provider == LLMProvider.ANTHROPIC:
+            api_key, base_url = self.config.anthropic.api_key, self.config.anthropic.base_url
+            headers = {"x-api-key": api_key or "", "anthropic-version": self.config.anthropic.version}
+        else:
+            raise ValueError(f"No health probe for provider {provider.value}")
+
+        if not api_key:
+            raise ValueError(f"{provider.value} API key not configured")
+        return f"{base_url.rstrip('/')}/models", headers
+
     async def list_available_models(
         self,
         provider: LLMProvider,
@@ -451,14 +927,10 @@ class LLMRouterService:
         if provider == LLMProvider.OLLAMA:
             # Query Ollama API for models
             try:
-                import httpx
-
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(
-                        f"{self.config.ollama.host}/api/tags"
-                    )
-                    data = response.json()
-                    return [model["name"] for model in data.get("models", [])]
+                client = self._get_http_client(LLMProvider.OLLAMA).client
+                response = await client.get(f"{self.config.ollama.host}/api/tags")
+                data = response.json()
+                return [model["name"] for model in data.get("models", [])]
 
             except Exception as e:
                 logger.error(f"Failed to list Ollama models: {e}")
@@ -516,3 +988,24 @@ def get_llm_router(
         _llm_router = LLMRouterService(config)
 
     return _llm_router
+
+
+def _remaining(deadline: Optional[float]) -> Optional[float]:
+    """Seconds left until a perf_counter deadline (None = unbounded)"""
+
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.perf_counter())
+
+
+async def _get_cache_redis():
+    from app.core.redis_client import get_redis
+
+    return await get_redis()
+
+
+async def shutdown_llm_router() -> None:
+    """Close pooled provider connections on application shutdown"""
+
+    if _llm_router is not None:
+        await _llm_router.close()
@@ -12,12 +12,27 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
 from loguru import logger
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import (
+    DateTime,
+    Float,
+    Integer,
+    String,
+    bindparam,
+    cast,
+    column,
+    delete,
+    func,
+    literal,
+    or_,
+    select,
+    update,
+    values,
+)
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from .models import Base, ConversationTurnORM, MemoryEntryORM, SessionContextORM
+from .models import Base, ConversationTurnORM, MemoryEntryORM, SessionContextORM, memory_search_document
 from .schemas import (
     CompressionStatus,
     ConversationTurn,
@@ -26,6 +41,7 @@ from .schemas import (
     MemoryType,
     SessionContext,
 )
+from .text_index import SCOPE_FIELDS, MemoryTextIndex, tokenize
 
 
 # Get database URL from environment or default
@@ -48,6 +64,7 @@ class DatabaseAdapter:
         self.async_session = None
         self._initialized = False
         self._dialect_name: Optional[str] = None
+        self._text_index: Optional[MemoryTextIndex] = None  # non-PostgreSQL keyword search
     
     async def initialize(self) -> None:
         """Initialize the database engine and session factory."""
@@ -155,8 +172,9 @@ class DatabaseAdapter:
                 # Insert new
                 orm_entry = MemoryEntryORM(**orm_data)
                 session.add(orm_entry)
-            
-            return entry
+
+        self._index_text(entry)
+        return entry
     
     async def get_memory(self, memory_id: str) -> Optional[MemoryEntry]:
         """Retrieve a memory by ID and update access stats."""
@@ -186,7 +204,10 @@ class DatabaseAdapter:
             if tenant_id is not None:
                 query = query.where(MemoryEntryORM.tenant_id == tenant_id)
             result = await session.execute(query)
-            return result.rowcount > 0
+            deleted = result.rowcount > 0
+        if deleted and self._text_index is not None:
+            self._text_index.remove(memory_id)
+        return deleted
     
     async def query_memories(
         self,
@@ -202,33 +223,26 @@ class DatabaseAdapter:
         min_karma: Optional[float] = None,
         include_compressed: bool = True,
         limit: int = 50,
+        memory_ids: Optional[List[str]] = None,
     ) -> List[MemoryEntry]:
         """Query memories with filters."""
         async with self.session() as session:
             query = select(MemoryEntryORM)
             
-            # Apply filters
-            if tenant_id is not None:
-                query = query.where(MemoryEntryORM.tenant_id == tenant_id)
-            if agent_id:
-                query = query.where(MemoryEntryORM.agent_id == agent_id)
-            if session_id:
-                query = query.where(MemoryEntryORM.session_id == session_id)
-            if mission_id:
-                query = query.where(MemoryEntryORM.mission_id == mission_id)
-            if skill_run_id:
-                query = query.where(MemoryEntryORM.skill_run_id == skill_run_id)
-            if layer:
-                query = query.where(MemoryEntryORM.layer == layer.value)
-            if memory_type:
-                query = query.where(MemoryEntryORM.memory_type == memory_type.value)
-            apply_tag_post_filter = bool(tags)
-            if min_importance is not None:
-                query = query.where(MemoryEntryORM.importance >= min_importance)
-            if min_karma is not None:
-                query = query.where(MemoryEntryORM.karma_score >= min_karma)
-            if not include_compressed:
-                query = query.where(MemoryEntryORM.compression == CompressionStatus.RAW.value)
+            query = self._apply_filters(
+                query,
+                memory_ids=memory_ids,
+                tenant_id=tenant_id,
+                agent_id=agent_id,
+                session_id=session_id,
+                mission_id=mission_id,
+                skill_run_id=skill_run_id,
+                layer=layer,
+                memory_type=memory_type,
+                min_importance=min_importance,
+                min_karma=min_karma,
+                include_compressed=include_compressed,
+            )
             
             # Sort by importance descending, then recency
             query = query.order_by(
@@ -240,55 +254,212 @@ class DatabaseAdapter:
             result = await session.execute(query)
             orm_entries = result.scalars().all()
 
-            if apply_tag_post_filter and tags:
-                filter_tags = set(tags)
-                orm_entries = [
-                    e for e in orm_entries
-                    if filter_tags.intersection(set(e.tags or []))
-                ]
-            
-            return [self._orm_to_memory_entry(e) for e in orm_entries]
+            return [self._orm_to_memory_entry(e) for e in self._filter_tags(orm_entries, tags)]
     
     async def keyword_search(
         self, 
         query: str, 
         limit: int = 10,
+        match_all: bool = False,
         **filters
     ) -> List[MemoryEntry]:
-        """Simple keyword search across memory content."""
+        """
+        Ranked full-text search across memory content and summary.
+
+        Query tokens match as prefixes and are OR-ed (AND-ed with match_all).
+        PostgreSQL uses the idx_memory_entries_search GIN index; other
+        databases use an in-process inverted index. ``filters`` accepts the
+        query_memories filters.
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+        tags = filters.pop("tags", None)
+        if self._dialect_name != "postgresql":
+            return await self._keyword_search_local(query, limit, match_all, tags, filters)
+
+        operator = " & " if match_all else " | "
+        ts_query = func.to_tsquery("simple", operator.join(f"{token}:*" for token in tokens))
+        document = memory_search_document(MemoryEntryORM.content, MemoryEntryORM.summary)
         async with self.session() as session:
-            # Use ILIKE for case-insensitive search
-            search_pattern = f"%{query.lower()}%"
-            
-            db_query = select(MemoryEntryORM).where(
-                (MemoryEntryORM.content.ilike(search_pattern)) |
-                (MemoryEntryORM.summary.ilike(search_pattern))
+            db_query = self._apply_filters(
+                select(MemoryEntryORM).where(document.op("@@")(ts_query)),
+                **filters,
             )
-            
-            # Apply additional filters
-            if filters.get("tenant_id"):
-                db_query = db_query.where(MemoryEntryORM.tenant_id == filters["tenant_id"])
-            if filters.get("agent_id"):
-                db_query = db_query.where(MemoryEntryORM.agent_id == filters["agent_id"])
-            if filters.get("session_id"):
-                db_query = db_query.where(MemoryEntryORM.session_id == filters["session_id"])
-            if filters.get("mission_id"):
-                db_query = db_query.where(MemoryEntryORM.mission_id == filters["mission_id"])
-            if filters.get("skill_run_id"):
-                db_query = db_query.where(MemoryEntryORM.skill_run_id == filters["skill_run_id"])
-            if filters.get("layer"):
-                db_query = db_query.where(MemoryEntryORM.layer == filters["layer"].value)
-            
-            db_query = db_query.limit(limit)
+            db_query = db_query.order_by(
+                func.ts_rank_cd(document, ts_query).desc(),
+                MemoryEntryORM.created_at.desc(),
+            ).limit(limit)
             
             result = await session.execute(db_query)
             orm_entries = result.scalars().all()
             
-            return [self._orm_to_memory_entry(e) for e in orm_entries]
+            return [self._orm_to_memory_entry(e) for e in self._filter_tags(orm_entries, tags)]
+
+    async def _keyword_search_local(
+        self,
+        query: str,
+        limit: int,
+        match_all: bool,
+        tags: Optional[List[str]],
+        filters: Dict[str, Any],
+    ) -> List[MemoryEntry]:
+        """Rank with the in-process index, then hydrate pages applying the remaining filters."""
+        index = await self._get_text_index()
+        scope = {
+            field: value.value if isinstance(value, (MemoryLayer, MemoryType)) else value
+            for field, value in filters.items()
+            if field in SCOPE_FIELDS and value
+        }
+        page = max(limit * 4, 50)
+        ranked = index.search(query, limit=page, match_all=match_all, **scope)
+        exhausted = len(ranked) < page
+        results: List[MemoryEntry] = []
+        offset = 0
+        while len(results) < limit:
+            if offset >= len(ranked):
+                if exhausted:
+                    break
+                # The best page was filtered out; rank everything and continue
+                ranked = index.search(query, match_all=match_all, **scope)
+                exhausted = True
+                continue
+            ids = [memory_id for memory_id, _ in ranked[offset:offset + page]]
+            entries = await self.query_memories(memory_ids=ids, tags=tags, limit=len(ids), **filters)
+            by_id = {entry.memory_id: entry for entry in entries}
+            results.extend(by_id[memory_id] for memory_id in ids if memory_id in by_id)
+            offset += page
+        return results[:limit]
+
+    async def _get_text_index(self) -> MemoryTextIndex:
+        """Build the in-process text index from the table on first use."""
+        if self._text_index is None:
+            columns = [MemoryEntryORM.memory_id, MemoryEntryORM.content, MemoryEntryORM.summary]
+            columns += [getattr(MemoryEntryORM, field) for field in SCOPE_FIELDS]
+            async with self.session() as session:
+                result = await session.execute(select(*columns))
+                self._text_index = MemoryTextIndex.build(dict(row._mapping) for row in result.all())
+            logger.info("🔎 Built in-process memory text index (%d memories)", len(self._text_index))
+        return self._text_index
+
+    def _index_text(self, entry: MemoryEntry) -> None:
+        if self._text_index is not None:
+            self._text_index.add(
+                entry.memory_id,
+                f"{entry.content} {entry.summary or ''}",
+                tenant_id=entry.tenant_id,
+                agent_id=entry.agent_id,
+                session_id=entry.session_id,
+                mission_id=entry.mission_id,
+                skill_run_id=entry.skill_run_id,
+                layer=entry.layer.value,
+                memory_type=entry.memory_type.value,
+            )
+
+    @staticmethod
+    def _apply_filters(
+        query,
+        memory_ids: Optional[List[str]] = None,
+        tenant_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        mission_id: Optional[str] = None,
+        skill_run_id: Optional[str] = None,
+        layer: Optional[MemoryLayer] = None,
+        memory_type: Optional[MemoryType] = None,
+        min_importance: Optional[float] = None,
+        min_karma: Optional[float] = None,
+        include_compressed: bool = True,
+    ):
+        """Apply the common memory filters to a select()."""
+        if memory_ids is not None:
+            query = query.where(MemoryEntryORM.memory_id.in_(memory_ids))
+        if tenant_id is not None:
+            query = query.where(MemoryEntryORM.tenant_id == tenant_id)
+        if agent_id:
+            query = query.where(MemoryEntryORM.agent_id == agent_id)
+        if session_id:
+            query = query.where(MemoryEntryORM.session_id == session_id)
+        if mission_id:
+            query = query.where(MemoryEntryORM.mission_id == mission_id)
+        if skill_run_id:
+            query = query.where(MemoryEntryORM.skill_run_id == skill_run_id)
+        if layer:
+            query = query.where(MemoryEntryORM.layer == layer.value)
+        if memory_type:
+            query = query.where(MemoryEntryORM.memory_type == memory_type.value)
+        if min_importance is not None:
+            query = query.where(MemoryEntryORM.importance >= min_importance)
+        if min_karma is not None:
+            query = query.where(MemoryEntryORM.karma_score >= min_karma)
+        if not include_compressed:
+            query = query.where(MemoryEntryORM.compression == CompressionStatus.RAW.value)
+        return query
+
+    @staticmethod
+    def _filter_tags(orm_entries, tags: Optional[List[str]]):
+        """Keep entries sharing at least one tag (tags are filtered after the query)."""
+        if not tags:
+            return orm_entries
+        filter_tags = set(tags)
+        return [e for e in orm_entries if filter_tags.intersection(set(e.tags or []))]
     
     async def get_memories_by_layer(self, layer: MemoryLayer) -> List[MemoryEntry]:
         """Get all memories for a specific layer."""
         return await self.query_memories(layer=layer, limit=10000)
+
+    async def load_embeddings(
+        self,
+        tenant_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> List[tuple]:
+        """Return (memory_id, embedding) for every embedded memory in scope."""
+        async with self.session() as session:
+            query = select(MemoryEntryORM.memory_id, MemoryEntryORM.embedding).where(
+                MemoryEntryORM.embedding.is_not(None)
+            )
+            if tenant_id is not None:
+                query = query.where(MemoryEntryORM.tenant_id == tenant_id)
+            if agent_id:
+                query = query.where(MemoryEntryORM.agent_id == agent_id)
+            result = await session.execute(query)
+            return [(row[0], row[1]) for row in result.all() if row[1]]
+
+    async def load_unembedded(
+        self,
+        tenant_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: int = 500,
+    ) -> List[tuple]:
+        """Return (memory_id, content) for up to ``limit`` memories in scope without an embedding."""
+        async with self.session() as session:
+            # A None embedding is stored as SQL NULL or as JSON null
+            query = select(MemoryEntryORM.memory_id, MemoryEntryORM.content).where(
+                or_(
+                    MemoryEntryORM.embedding.is_(None),
+                    cast(MemoryEntryORM.embedding, String) == "null",
+                )
+            )
+            if tenant_id is not None:
+                query = query.where(MemoryEntryORM.tenant_id == tenant_id)
+            if agent_id:
+                query = query.where(MemoryEntryORM.agent_id == agent_id)
+            result = await session.execute(query.limit(limit))
+            return [(row[0], row[1]) for row in result.all()]
+
+    async def bulk_update_embeddings(self, embeddings: Dict[str, List[float]]) -> int:
+        """Store many embeddings with one executemany UPDATE."""
+        if not embeddings:
+            return 0
+        table = MemoryEntryORM.__table__
+        async with self.session() as session:
+            result = await session.execute(
+                update(table)
+                .where(table.c.memory_id == bindparam("b_memory_id"))
+                .values(embedding=bindparam("b_embedding")),
+                [{"b_memory_id": memory_id, "b_embedding": embedding} for memory_id, embedding in embeddings.items()],
+            )
+            return result.rowcount
     
     async def evict_expired(self) -> int:
         """Remove expired memories. Returns count of evicted entries."""
@@ -298,7 +469,10 @@ class DatabaseAdapter:
                     MemoryEntryORM.expires_at <= datetime.utcnow()
                 )
             )
-            return result.rowcount
+            evicted = result.rowcount
+        if evicted:
+            self._text_index = None  # rebuilt on the next keyword search
+        return evicted
 
     async def evict_stale_sessions(self, ttl_hours: float, tenant_id: Optional[str] = None) -> int:
         """Delete sessions inactive longer than ttl_hours."""
@@ -318,7 +492,95 @@ class DatabaseAdapter:
                 .where(MemoryEntryORM.memory_id == memory_id)
                 .values(**updates)
             )
-            return result.rowcount > 0
+            updated = result.rowcount > 0
+            reindex = None
+            if updated and self._text_index is not None and {"content", "summary", *SCOPE_FIELDS} & set(updates):
+                row = await session.execute(select(MemoryEntryORM).where(MemoryEntryORM.memory_id == memory_id))
+                reindex = self._orm_to_memory_entry(row.scalar_one())
+        if reindex is not None:
+            self._index_text(reindex)
+        return updated
+    
+    async def bulk_update_access(self, updates: List[Dict[str, Any]]) -> int:
+        """
+        Apply many (memory_id, access_count, last_accessed_at, importance)
+        updates with one UPDATE ... FROM (VALUES ...) statement.
+
+        SQLite has no column aliases for VALUES subqueries, so the fallback
+        database gets a single executemany instead.
+        """
+        if not updates:
+            return 0
+        async with self.session() as session:
+            if self._dialect_name == "sqlite":
+                table = MemoryEntryORM.__table__
+                result = await session.execute(
+                    update(table)
+                    .where(table.c.memory_id == bindparam("b_memory_id"))
+                    .values(
+                        access_count=bindparam("b_access_count"),
+                        last_accessed_at=bindparam("b_last_accessed_at"),
+                        importance=bindparam("b_importance"),
+                    ),
+                    [{f"b_{key}": value for key, value in u.items()} for u in updates],
+                )
+                return result.rowcount
+
+            rows = values(
+                column("memory_id", String),
+                column("access_count", Integer),
+                column("last_accessed_at", DateTime),
+                column("importance", Float),
+                name="access_updates",
+            ).data([
+                (u["memory_id"], u["access_count"], u["last_accessed_at"], u["importance"])
+                for u in updates
+            ])
+            result = await session.execute(
+                update(MemoryEntryORM)
+                .where(MemoryEntryORM.memory_id == rows.c.memory_id)
+                .values(
+                    access_count=rows.c.access_count,
+                    last_accessed_at=rows.c.last_accessed_at,
+                    importance=rows.c.importance,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            return result.rowcount
+
+    async def apply_decay(
+        self,
+        decay_per_day: float,
+        agent_id: Optional[str] = None,
+        now: Optional[datetime] = None,
+    ) -> List[tuple]:
+        """
+        Decay importance of every memory idle for more than a day, in one
+        statement. Returns (memory_id, new_importance) for decayed rows.
+        """
+        now = now or datetime.utcnow()
+        last_active = func.coalesce(MemoryEntryORM.last_accessed_at, MemoryEntryORM.created_at)
+        if self._dialect_name == "sqlite":
+            idle_days = func.julianday(literal(now, DateTime())) - func.julianday(last_active)
+            decayed = func.max(0.0, MemoryEntryORM.importance - decay_per_day * idle_days)
+        else:
+            idle_days = func.extract("epoch", literal(now, DateTime()) - last_active) / 86400.0
+            decayed = func.greatest(0.0, MemoryEntryORM.importance - decay_per_day * idle_days)
+
+        query = (
+            update(MemoryEntryORM)
+            .where(last_active < now - timedelta(days=1))
+            .where(MemoryEntryORM.importance > 0)
+            .values(importance=decayed)
+            .returning(MemoryEntryORM.memory_id, MemoryEntryORM.importance)
+            .execution_options(synchronize_session=False)
+        )
+        if agent_id:
+            query = query.where(MemoryEntryORM.agent_id == agent_id)
+
+        async with self.session() as session:
+            result = await session.execute(query)
+            return [(row[0], row[1]) for row in result.all()]
     
     # ------------------------------------------------------------------
     # Session Context Operations
@@ -21,6 +21,7 @@ from sqlalchemy import (
     String,
     Text,
     func,
+    literal_column,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import declarative_base, relationship
@@ -29,6 +30,20 @@ Base = declarative_base()
 JSON_TYPE = JSON().with_variant(JSONB, "postgresql")
 
 
+def memory_search_document(content, summary):
+    """
+    tsvector over content + summary for full-text search.
+
+    Built from literals only, so queries using it match the expression of
+    idx_memory_entries_search and can use the index.
+    """
+    empty = literal_column("''")
+    return func.to_tsvector(
+        literal_column("'simple'::regconfig"),
+        func.coalesce(content, empty).op("||")(literal_column("' '")).op("||")(func.coalesce(summary, empty)),
+    )
+
+
 class MemoryEntryORM(Base):
     """
     SQLAlchemy ORM model for memory entries.
@@ -91,6 +106,12 @@ class MemoryEntryORM(Base):
         # GIN index for tags array and metadata JSONB
         Index("idx_memory_entries_tags", "tags", postgresql_using="gin"),
         Index("idx_memory_entries_metadata", "metadata", postgresql_using="gin"),
+        # Full-text search (PostgreSQL only; other databases use an in-process index)
+        Index(
+            "idx_memory_entries_search",
+            memory_search_document(content, summary),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
     )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -2,10 +2,14 @@
 Selective Recall - KARMA-scored memory retrieval.
 
 Retrieval strategies:
-    - Keyword:   Simple text match (fast, always available)
+    - Hybrid:    Nearest neighbours and full-text matches merged into one
+                 ranking; relevance fuses vector similarity with query term
+                 coverage and is blended with the importance/KARMA/recency/
+                 access composite
+    - Semantic:  As hybrid, for queries given only as an embedding
+    - Keyword:   Ranked full-text match (no vector index for the scope)
     - Importance: Filter by importance + KARMA score
     - Recency:   Bias toward recent memories
-    - Hybrid:    Combine keyword, importance, and recency
 
 KARMA integration:
     - Memories with higher KARMA scores rank higher
@@ -18,7 +22,7 @@ from __future__ import annotations
 import math
 import time
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 from loguru import logger
 
@@ -30,6 +34,8 @@ from .schemas import (
     MemoryType,
 )
 from .store import MemoryStore
+from .text_index import tokenize
+from .vector_index import MemoryVectorIndex, embed_text
 
 
 # Decay: importance drops 1 point per day of inactivity
@@ -38,6 +44,15 @@ IMPORTANCE_DECAY_PER_DAY = 1.0
 RECALL_BOOST = 0.5
 # Max importance (cap to prevent runaway)
 MAX_IMPORTANCE = 100.0
+# Hybrid recall: share of the final score taken by query relevance
+RELEVANCE_WEIGHT = 0.75
+# Hybrid recall: share of relevance taken by vector similarity (the rest
+# is the fraction of query terms found in the memory)
+SEMANTIC_SHARE = 0.5
+# Hybrid recall: nearest neighbours fetched per requested memory
+SEMANTIC_OVERFETCH = 10
+# Hybrid recall: neighbours below this cosine similarity are not candidates
+MIN_SIMILARITY = 0.2
 
 
 class SelectiveRecall:
@@ -56,33 +71,34 @@ class SelectiveRecall:
         """
         Execute a memory recall using the best available strategy.
 
-        Falls back from semantic → keyword → importance-based.
+        Falls back from hybrid/semantic → keyword → importance-based.
         """
         start = time.monotonic()
 
-        # Get base candidates
-        candidates = await self.store.query(
-            tenant_id=query.tenant_id,
-            agent_id=query.agent_id,
-            session_id=query.session_id,
-            mission_id=query.mission_id,
-            layer=query.layer,
-            memory_type=query.memory_type,
-            tags=query.tags,
-            min_importance=query.min_importance,
-            min_karma=query.min_karma,
-            include_compressed=query.include_compressed,
-            limit=query.limit * 5,  # Over-fetch for re-ranking
-        )
-
-        # Apply keyword filter if query text provided
-        strategy = "importance"
-        if query.query:
-            candidates = self._keyword_filter(candidates, query.query)
+        index, vector = await self._query_vector(query) if query.query or query.embedding else (None, None)
+        if index is not None:
+            similarities = dict(
+                index.search(vector, query.limit * SEMANTIC_OVERFETCH, min_similarity=MIN_SIMILARITY)
+            )
+            # Full-text matches join the nearest neighbours, so memories that
+            # are not (yet) embedded or rank low by similarity still compete
+            candidates = await self._keyword_candidates(query) if query.query else []
+            seen = {mem.memory_id for mem in candidates}
+            missing = [memory_id for memory_id in similarities if memory_id not in seen]
+            if missing:
+                # Hydrate the nearest neighbours, applying the remaining filters
+                candidates += await self._query_candidates(query, memory_ids=missing)
+            strategy = "hybrid" if query.query else "semantic"
+            scored = self._score_hybrid(query, candidates, index, vector, similarities)
+        elif query.query:
+            # Full-text search (indexed) when query text is provided
+            candidates = await self._keyword_candidates(query)
             strategy = "keyword"
-
-        # Score and rank
-        scored = self._score_memories(candidates)
+            scored = self._score_memories(candidates)
+        else:
+            candidates = await self._query_candidates(query)
+            strategy = "importance"
+            scored = self._score_memories(candidates)
 
         # Take top N
         scored.sort(key=lambda x: x[1], reverse=True)
@@ -101,39 +117,73 @@ class SelectiveRecall:
             recall_strategy=strategy,
         )
 
+    async def _query_candidates(
+        self,
+        query: MemoryQuery,
+        memory_ids: Optional[List[str]] = None,
+    ) -> List[MemoryEntry]:
+        """Fetch candidates matching the query filters."""
+        return await self.store.query(
+            tenant_id=query.tenant_id,
+            agent_id=query.agent_id,
+            session_id=query.session_id,
+            mission_id=query.mission_id,
+            layer=query.layer,
+            memory_type=query.memory_type,
+            tags=query.tags,
+            min_importance=query.min_importance,
+            min_karma=query.min_karma,
+            include_compressed=query.include_compressed,
+            limit=len(memory_ids) if memory_ids is not None else query.limit * 5,  # Over-fetch for re-ranking
+            memory_ids=memory_ids,
+        )
+
+    async def _keyword_candidates(self, query: MemoryQuery) -> List[MemoryEntry]:
+        """Best full-text matches for the query text, with the query filters applied."""
+        return await self.store.keyword_search(
+            query.query,
+            limit=query.limit * 5,  # Over-fetch for re-ranking
+            tenant_id=query.tenant_id,
+            agent_id=query.agent_id,
+            session_id=query.session_id,
+            mission_id=query.mission_id,
+            layer=query.layer,
+            memory_type=query.memory_type,
+            tags=query.tags,
+            min_importance=query.min_importance,
+            min_karma=query.min_karma,
+            include_compressed=query.include_compressed,
+        )
+
+    async def _query_vector(
+        self,
+        query: MemoryQuery,
+    ) -> Tuple[Optional[MemoryVectorIndex], Optional[List[float]]]:
+        """
+        The scope's vector index and the query vector.
+
+        (None, None) when the scope has no index (no numpy, no embeddings) or
+        the query vector doesn't match the indexed dimension.
+        """
+        index = await self.store.vector_index(tenant_id=query.tenant_id, agent_id=query.agent_id)
+        if index is None:
+            return None, None
+        vector = query.embedding or embed_text(query.query)
+        if len(vector) != index.dim:
+            return None, None
+        return index, vector
+
     async def apply_decay(self, agent_id: Optional[str] = None) -> int:
         """
         Apply importance decay to old memories.
 
         Memories that haven't been accessed decay in importance.
-        Called periodically (e.g., once per day).
+        Called periodically (e.g., once per day). Runs as one set-based
+        UPDATE over all idle memories.
 
         Returns count of memories that decayed.
         """
-        now = datetime.utcnow()
-        memories = await self.store.query(
-            agent_id=agent_id,
-            limit=1000,
-        )
-
-        decayed = 0
-        db = await self.store._get_db()
-        
-        for mem in memories:
-            last_access = mem.last_accessed_at or mem.created_at
-            days_idle = (now - last_access).total_seconds() / 86400
-
-            if days_idle > 1:
-                decay = IMPORTANCE_DECAY_PER_DAY * days_idle
-                new_importance = max(0.0, mem.importance - decay)
-                if new_importance != mem.importance:
-                    mem.importance = new_importance
-                    # Persist decay to database
-                    await db.update_memory(
-                        mem.memory_id,
-                        importance=new_importance,
-                    )
-                    decayed += 1
+        decayed = await self.store.apply_decay(IMPORTANCE_DECAY_PER_DAY, agent_id=agent_id)
 
         if decayed:
             logger.info("📉 Applied decay to %d memories", decayed)
@@ -174,24 +224,43 @@ class SelectiveRecall:
 
         return scored
 
-    # ------------------------------------------------------------------
-    # Keyword filtering
-    # ------------------------------------------------------------------
-
-    @staticmethod
-    def _keyword_filter(memories: List[MemoryEntry], query: str) -> List[MemoryEntry]:
-        """Filter memories by keyword match in content/summary."""
-        q = query.lower()
-        tokens = q.split()
+    def _score_hybrid(
+        self,
+        query: MemoryQuery,
+        memories: List[MemoryEntry],
+        index: MemoryVectorIndex,
+        vector: List[float],
+        similarities: Dict[str, float],
+    ) -> List[tuple]:
+        """
+        Score memories by query relevance blended with the composite score.
 
-        results = []
-        for mem in memories:
-            text = f"{mem.content} {mem.summary or ''}".lower()
-            # Match if any token appears
-            if any(t in text for t in tokens):
-                results.append(mem)
+        Relevance = similarity * SEMANTIC_SHARE + term coverage * (1 - SEMANTIC_SHARE),
+        or the similarity alone for embedding-only queries.
+        Score = relevance * 100 * RELEVANCE_WEIGHT + composite * (1 - RELEVANCE_WEIGHT)
+        """
+        terms = set(tokenize(query.query))
+        scored = []
+        for mem, score in self._score_memories(memories):
+            similarity = similarities.get(mem.memory_id)
+            if similarity is None:
+                embedding = mem.embedding
+                if embedding is None and query.embedding is None:
+                    # Not backfilled yet; embed like the query was
+                    embedding = embed_text(mem.content)
+                similarity = max(0.0, index.similarity(vector, embedding)) if embedding else 0.0
+            relevance = similarity
+            if terms:
+                relevance = SEMANTIC_SHARE * similarity + (1 - SEMANTIC_SHARE) * self._term_coverage(terms, mem)
+            scored.append((mem, RELEVANCE_WEIGHT * relevance * 100.0 + (1 - RELEVANCE_WEIGHT) * score))
+        return scored
 
-        return results
+    @staticmethod
+    def _term_coverage(terms: Set[str], memory: MemoryEntry) -> float:
+        """Fraction of query terms matching a word of the memory as a prefix, like the full-text search."""
+        words = set(tokenize(f"{memory.content} {memory.summary or ''}"))
+        matched = sum(1 for term in terms if any(word.startswith(term) for word in words))
+        return matched / len(terms)
 
     # ------------------------------------------------------------------
     # Reinforcement
@@ -203,12 +272,6 @@ class SelectiveRecall:
         memory.last_accessed_at = datetime.utcnow()
         new_importance = min(MAX_IMPORTANCE, memory.importance + RECALL_BOOST)
         memory.importance = new_importance
-        
-        # Persist reinforcement to database
-        db = await self.store._get_db()
-        await db.update_memory(
-            memory.memory_id,
-            access_count=memory.access_count,
-            last_accessed_at=memory.last_accessed_at,
-            importance=new_importance,
-        )
+
+        # Persisted in bulk by the store's write-behind buffer
+        self.store.record_access(memory)
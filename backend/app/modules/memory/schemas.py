@@ -172,6 +172,9 @@ class MemoryQuery(BaseModel):
     min_karma: Optional[float] = None
     limit: int = Field(10, ge=1, le=100)
     include_compressed: bool = Field(True, description="Include summarized memories")
+    embedding: Optional[List[float]] = Field(
+        None, description="Query vector; embedded from `query` when omitted"
+    )
 
 
 class MemoryRecallResult(BaseModel):
@@ -227,6 +230,9 @@ class MemoryStoreRequest(BaseModel):
     importance: float = Field(50.0, ge=0.0, le=100.0)
     tags: List[str] = Field(default_factory=list)
     metadata: Dict[str, Any] = Field(default_factory=dict)
+    embedding: Optional[List[float]] = Field(
+        None, description="Vector embedding; computed from content when omitted"
+    )
 
 
 class SkillRunMemoryIngestResponse(BaseModel):
@@ -263,6 +269,7 @@ class MemorySystemInfo(BaseModel):
         "cross_session_persistence",
         "context_compression",
         "selective_recall",
+        "semantic_recall",
         "karma_scoring",
         "importance_decay",
     ])
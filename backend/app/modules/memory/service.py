@@ -28,6 +28,7 @@ from .schemas import (
     SessionContext,
 )
 from .store import MemoryStore
+from .vector_index import embed_text
 
 MODULE_VERSION = "1.0.0"
 
@@ -69,6 +70,7 @@ class MemoryService:
             importance=request.importance,
             tags=request.tags,
             metadata=getattr(request, "metadata", {}),
+            embedding=request.embedding or embed_text(request.content),
         )
         return await self.store.store(entry)
 
@@ -199,6 +201,10 @@ class MemoryService:
     async def get_info(self) -> MemorySystemInfo:
         return MemorySystemInfo()
 
+    async def shutdown(self) -> None:
+        """Flush buffered memory writes before the process exits."""
+        await self.store.close()
+
 
 # ============================================================================
 # Singleton
@@ -212,3 +218,9 @@ def get_memory_service(event_stream: Optional["EventStream"] = None) -> MemorySe
     if _service is None:
         _service = MemoryService(event_stream=event_stream)
     return _service
+
+
+async def shutdown_memory_service() -> None:
+    """Flush the singleton's write-behind buffer, if it was ever created."""
+    if _service is not None:
+        await _service.shutdown()
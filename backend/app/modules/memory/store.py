@@ -11,6 +11,7 @@ Uses SQLAlchemy async ORM for all database operations.
 
 from __future__ import annotations
 
+import os
 import time
 from datetime import datetime
 from typing import Dict, List, Optional
@@ -26,6 +27,13 @@ from .schemas import (
     MemoryType,
     SessionContext,
 )
+from .vector_index import VECTOR_INDEX_AVAILABLE, MemoryVectorIndex, Scope, embed_text
+from .write_buffer import MemoryWriteBuffer
+
+# Rebuild per-scope vector indexes after this long to pick up other writers
+VECTOR_INDEX_REFRESH_SECONDS = float(os.getenv("MEMORY_VECTOR_INDEX_REFRESH_SECONDS", "300"))
+# Memories stored without an embedding that get one per index build
+EMBEDDING_BACKFILL_BATCH = int(os.getenv("MEMORY_EMBEDDING_BACKFILL_BATCH", "500"))
 
 # EventStream integration
 try:
@@ -52,6 +60,9 @@ class MemoryStore:
         self._db: Optional[DatabaseAdapter] = None
         self._live_entries: Dict[str, MemoryEntry] = {}
         self._total_compressions = 0
+        self._vector_indexes: Dict[Scope, MemoryVectorIndex] = {}
+        self._unindexed_scopes: Dict[Scope, float] = {}  # scope -> checked_at
+        self.write_buffer = MemoryWriteBuffer(self._flush_access_updates)
         
         # Metrics (still tracked in memory for performance)
         self._total_stores = 0
@@ -75,6 +86,7 @@ class MemoryStore:
         db = await self._get_db()
         await db.store_memory(entry)
         self._live_entries[entry.memory_id] = entry
+        self._index_entry(entry)
         self._total_stores += 1
 
         await self._emit("memory.stored", memory_id=entry.memory_id, layer=entry.layer.value)
@@ -88,6 +100,8 @@ class MemoryStore:
     async def get_for_tenant(self, memory_id: str, tenant_id: Optional[str]) -> Optional[MemoryEntry]:
         """Retrieve a memory by ID with optional tenant boundary."""
         db = await self._get_db()
+        if memory_id in self.write_buffer:
+            await self.write_buffer.flush()
         entry = await db.get_memory_for_tenant(memory_id, tenant_id)
         if entry:
             live = self._live_entries.get(memory_id)
@@ -105,6 +119,9 @@ class MemoryStore:
         
         if deleted:
             self._live_entries.pop(memory_id, None)
+            self.write_buffer.discard(memory_id)
+            for index in self._vector_indexes.values():
+                index.remove(memory_id)
             await self._emit("memory.deleted", memory_id=memory_id)
         
         return deleted
@@ -127,6 +144,7 @@ class MemoryStore:
         min_karma: Optional[float] = None,
         include_compressed: bool = True,
         limit: int = 50,
+        memory_ids: Optional[List[str]] = None,
     ) -> List[MemoryEntry]:
         """
         Query memories with filters. Returns sorted by importance (desc).
@@ -145,9 +163,16 @@ class MemoryStore:
             min_karma=min_karma,
             include_compressed=include_compressed,
             limit=limit,
+            memory_ids=memory_ids,
         )
         result: List[MemoryEntry] = []
         for entry in entries:
+            pending = self.write_buffer.pending(entry.memory_id)
+            if pending is not None:
+                # Buffered access stats are newer than the database row
+                entry.access_count = pending["access_count"]
+                entry.last_accessed_at = pending["last_accessed_at"]
+                entry.importance = pending["importance"]
             live = self._live_entries.get(entry.memory_id)
             if live is None:
                 self._live_entries[entry.memory_id] = entry
@@ -170,7 +195,7 @@ class MemoryStore:
         return result
 
     async def keyword_search(self, query: str, limit: int = 10, **filters) -> List[MemoryEntry]:
-        """Simple keyword search across memory content."""
+        """Ranked full-text search across memory content and summary."""
         db = await self._get_db()
         matches = await db.keyword_search(query, limit=limit, **filters)
         normalized: List[MemoryEntry] = []
@@ -226,8 +251,138 @@ class MemoryStore:
         evicted = await db.evict_expired()
         if evicted:
             logger.info("🗑️ Evicted %d expired memories", evicted)
+            self._vector_indexes.clear()
+            self._unindexed_scopes.clear()
         return evicted
 
+    # ------------------------------------------------------------------
+    # Write-behind access stats
+    # ------------------------------------------------------------------
+
+    def record_access(self, entry: MemoryEntry) -> None:
+        """Buffer an entry's access_count/last_accessed_at/importance for a bulk write."""
+        self.write_buffer.add(
+            entry.memory_id,
+            access_count=entry.access_count,
+            last_accessed_at=entry.last_accessed_at,
+            importance=entry.importance,
+        )
+
+    async def flush(self) -> int:
+        """Write buffered access stats now. Returns the number of memories written."""
+        return await self.write_buffer.flush()
+
+    async def close(self) -> int:
+        """Flush buffered writes on shutdown."""
+        flushed = await self.write_buffer.close()
+        if flushed:
+            logger.info("💾 Flushed %d buffered memory updates on shutdown", flushed)
+        return flushed
+
+    async def apply_decay(self, decay_per_day: float, agent_id: Optional[str] = None) -> int:
+        """Decay idle memories in the database and mirror the result on live entries."""
+        await self.write_buffer.flush()
+        db = await self._get_db()
+        decayed = await db.apply_decay(decay_per_day, agent_id=agent_id)
+        for memory_id, importance in decayed:
+            live = self._live_entries.get(memory_id)
+            if live is not None:
+                live.importance = importance
+        return len(decayed)
+
+    async def _flush_access_updates(self, updates: List[Dict]) -> int:
+        db = await self._get_db()
+        return await db.bulk_update_access(updates)
+
+    # ------------------------------------------------------------------
+    # Vector indexes
+    # ------------------------------------------------------------------
+
+    async def vector_index(
+        self,
+        tenant_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> Optional[MemoryVectorIndex]:
+        """
+        Get the similarity index for a tenant/agent scope.
+
+        Built from stored embeddings on first use and rebuilt after
+        VECTOR_INDEX_REFRESH_SECONDS; writes through this store keep it
+        current in between. Each build first backfills a batch of memories
+        stored without an embedding. Returns None without numpy or embeddings.
+        """
+        if not VECTOR_INDEX_AVAILABLE:
+            return None
+        scope: Scope = (tenant_id, agent_id or None)
+        now = time.monotonic()
+        index = self._vector_indexes.get(scope)
+        if index is not None and now - index.built_at < VECTOR_INDEX_REFRESH_SECONDS:
+            return index
+        if now - self._unindexed_scopes.get(scope, -VECTOR_INDEX_REFRESH_SECONDS) < VECTOR_INDEX_REFRESH_SECONDS:
+            return None
+
+        await self.backfill_embeddings(tenant_id=tenant_id, agent_id=agent_id)
+        db = await self._get_db()
+        rows = await db.load_embeddings(tenant_id=tenant_id, agent_id=agent_id)
+        if not rows:
+            self._vector_indexes.pop(scope, None)
+            self._unindexed_scopes[scope] = now
+            return None
+
+        # Scopes may mix embedders; index the dominant dimension
+        dims: Dict[int, int] = {}
+        for _, embedding in rows:
+            dims[len(embedding)] = dims.get(len(embedding), 0) + 1
+        dim = max(dims, key=dims.get)
+        index = MemoryVectorIndex(dim, capacity=dims[dim])
+        for memory_id, embedding in rows:
+            index.upsert(memory_id, embedding)
+        self._vector_indexes[scope] = index
+        self._unindexed_scopes.pop(scope, None)
+        logger.debug("Built memory vector index for %s (%d vectors)", scope, len(index))
+        return index
+
+    async def backfill_embeddings(
+        self,
+        tenant_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: int = EMBEDDING_BACKFILL_BATCH,
+    ) -> int:
+        """
+        Embed up to ``limit`` memories in scope that were stored without an
+        embedding (e.g. before semantic recall existed). Returns the count.
+        """
+        db = await self._get_db()
+        rows = await db.load_unembedded(tenant_id=tenant_id, agent_id=agent_id, limit=limit)
+        if not rows:
+            return 0
+        embeddings = {memory_id: embed_text(content) for memory_id, content in rows}
+        await db.bulk_update_embeddings(embeddings)
+        for memory_id, embedding in embeddings.items():
+            live = self._live_entries.get(memory_id)
+            if live is not None:
+                live.embedding = embedding
+        logger.debug("Backfilled %d memory embeddings for %s", len(embeddings), (tenant_id, agent_id))
+        return len(embeddings)
+
+    def _index_entry(self, entry: MemoryEntry) -> None:
+        """Apply a stored entry to every loaded index whose scope covers it."""
+        for (tenant_id, agent_id), index in self._vector_indexes.items():
+            if self._in_scope(entry, tenant_id, agent_id):
+                if entry.embedding:
+                    index.upsert(entry.memory_id, entry.embedding)
+                else:
+                    index.remove(entry.memory_id)
+        if entry.embedding:
+            for scope in [s for s in self._unindexed_scopes if self._in_scope(entry, *s)]:
+                del self._unindexed_scopes[scope]
+
+    @staticmethod
+    def _in_scope(entry: MemoryEntry, tenant_id: Optional[str], agent_id: Optional[str]) -> bool:
+        if tenant_id is not None and entry.tenant_id != tenant_id:
+            return False
+        return agent_id is None or entry.agent_id == agent_id
+
     # ------------------------------------------------------------------
     # Stats
     # ------------------------------------------------------------------
@@ -28,6 +28,7 @@ from app.modules.memory.schemas import (
 )
 from app.modules.memory.store import MemoryStore
 from app.modules.memory.context import ContextManager
+from app.modules.memory.vector_index import VECTOR_INDEX_AVAILABLE
 from app.modules.memory.compressor import MemoryCompressor
 from app.modules.memory.recall import SelectiveRecall
 from app.modules.memory.service import MemoryService
@@ -382,7 +383,7 @@ class TestSelectiveRecall:
 
         result = await recall.recall(MemoryQuery(query="deployment"))
         assert result.total_found >= 1
-        assert result.recall_strategy == "keyword"
+        assert result.recall_strategy == ("hybrid" if VECTOR_INDEX_AVAILABLE else "keyword")
         assert result.memories[0].content == "The deployment was successful"
 
     @pytest.mark.asyncio
@@ -0,0 +1,122 @@
+"""
+Tests for full-text keyword search over memories.
+
+Covers: MemoryTextIndex ranking/prefixes/scoping, DatabaseAdapter keyword
+search on the in-process path, the PostgreSQL tsvector query and keyword
+recall. In-process search timings are in
+scripts/benchmark_memory_text_search.py.
+"""
+
+import os
+import sys
+
+import pytest
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.schema import CreateIndex
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from app.modules.memory.models import MemoryEntryORM, memory_search_document
+from app.modules.memory.recall import SelectiveRecall
+from app.modules.memory.schemas import MemoryEntry, MemoryLayer, MemoryQuery, MemoryType
+from app.modules.memory.store import MemoryStore
+from app.modules.memory.text_index import MemoryTextIndex
+from app.modules.memory.vector_index import VECTOR_INDEX_AVAILABLE
+
+
+def _entry(content: str, agent_id: str = "agent_1", **kwargs) -> MemoryEntry:
+    return MemoryEntry(
+        layer=kwargs.pop("layer", MemoryLayer.EPISODIC),
+        memory_type=MemoryType.OBSERVATION,
+        content=content,
+        agent_id=agent_id,
+        **kwargs,
+    )
+
+
+def test_text_index_ranks_prefix_matches_and_filters_scope() -> None:
+    index = MemoryTextIndex()
+    index.add("a", "Deployment of the canary release for the web frontend", agent_id="agent_1", layer="episodic")
+    index.add("b", "canary canary rollout, deploy step", agent_id="agent_1", layer="episodic")
+    index.add("c", "postgres vacuum", agent_id="agent_1", layer="episodic")
+    index.add("d", "deploy canary", agent_id="agent_2", layer="episodic")
+
+    assert [memory_id for memory_id, _ in index.search("deploy canary", agent_id="agent_1")] == ["b", "a"]
+    assert [memory_id for memory_id, _ in index.search("rollout vacuum")] == ["c", "b"]  # shorter doc first
+    assert [memory_id for memory_id, _ in index.search("canary rollout", match_all=True)] == ["b"]
+    assert [memory_id for memory_id, _ in index.search("deploy", limit=1)] == ["d"]
+    assert index.search("!!") == []
+
+    index.remove("c")
+    assert index.search("vacuum") == []
+    assert "vacuum" not in index._vocabulary
+
+
+@pytest.mark.asyncio
+async def test_keyword_search_ranks_multi_token_matches() -> None:
+    store = MemoryStore()
+    await store.store(_entry("The mission was completed successfully"))
+    both = await store.store(_entry("Mission deployment rolled back"))
+    await store.store(_entry("Agent started processing"))
+
+    results = await store.keyword_search("mission deploy")
+
+    assert [m.memory_id for m in results][0] == both.memory_id
+    assert len(results) == 2
+
+
+@pytest.mark.asyncio
+async def test_text_index_follows_writes_without_rebuilding() -> None:
+    store = MemoryStore()
+    first = await store.store(_entry("redis cluster failover"))
+    assert [m.memory_id for m in await store.keyword_search("failover")] == [first.memory_id]
+    db = await store._get_db()
+    index = db._text_index
+
+    second = await store.store(_entry("unrelated note"))
+    await db.update_memory(second.memory_id, summary="failover rehearsal notes")
+    assert {m.memory_id for m in await store.keyword_search("failover")} == {first.memory_id, second.memory_id}
+
+    await store.delete(first.memory_id)
+    assert [m.memory_id for m in await store.keyword_search("failover")] == [second.memory_id]
+    assert db._text_index is index
+
+
+@pytest.mark.asyncio
+async def test_keyword_search_pages_past_filtered_candidates() -> None:
+    store = MemoryStore()
+    for i in range(60):
+        await store.store(_entry(f"incident incident incident {i}", importance=10.0))
+    keeper = await store.store(_entry("incident review", importance=90.0))
+
+    results = await store.keyword_search("incident", limit=5, min_importance=50.0)
+
+    assert [m.memory_id for m in results] == [keeper.memory_id]
+
+
+@pytest.mark.asyncio
+async def test_keyword_recall_is_not_limited_to_the_overfetch_window() -> None:
+    store = MemoryStore()
+    recall = SelectiveRecall(store)
+    for i in range(40):
+        await store.store(_entry(f"routine heartbeat {i}", importance=95.0))
+    target = await store.store(_entry("grafana alert fired on ingest lag", importance=5.0))
+
+    result = await recall.recall(MemoryQuery(query="grafana ingest", agent_id="agent_1", limit=2))
+
+    # Memories stored without embeddings are backfilled when numpy is available
+    assert result.recall_strategy == ("hybrid" if VECTOR_INDEX_AVAILABLE else "keyword")
+    assert [m.memory_id for m in result.memories] == [target.memory_id]
+
+
+@pytest.mark.asyncio
+async def test_postgres_query_uses_the_indexed_expression() -> None:
+    dialect = asyncpg.dialect()
+    index = next(ix for ix in MemoryEntryORM.__table__.indexes if ix.name == "idx_memory_entries_search")
+    indexed = str(CreateIndex(index).compile(dialect=dialect)).split("USING gin (", 1)[1][:-1]
+    document = memory_search_document(MemoryEntryORM.content, MemoryEntryORM.summary)
+    queried = str(document.compile(dialect=dialect)).replace("memory_entries.", "")
+
+    assert queried == indexed
@@ -0,0 +1,173 @@
+"""
+Tests for write-behind reinforcement and set-based decay.
+
+Covers: MemoryWriteBuffer coalescing/flush/retry, bulk access updates from
+SelectiveRecall, single-statement decay and flush-on-shutdown.
+"""
+
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", ".."))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from app.modules.memory.recall import SelectiveRecall
+from app.modules.memory.schemas import MemoryEntry, MemoryLayer, MemoryQuery, MemoryStoreRequest, MemoryType
+from app.modules.memory.service import MemoryService
+from app.modules.memory.store import MemoryStore
+from app.modules.memory.vector_index import embed_text
+from app.modules.memory.write_buffer import MemoryWriteBuffer
+
+
+def _entry(content: str, agent_id: str = "agent_1", **kwargs) -> MemoryEntry:
+    return MemoryEntry(
+        layer=MemoryLayer.EPISODIC,
+        memory_type=MemoryType.OBSERVATION,
+        content=content,
+        agent_id=agent_id,
+        **kwargs,
+    )
+
+
+async def _record_updates(store: MemoryStore) -> list:
+    """Collect every UPDATE sent to the store's database."""
+    db = await store._get_db()
+    statements = []
+
+    @event.listens_for(db.engine.sync_engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("UPDATE"):
+            statements.append(statement)
+
+    return statements
+
+
+async def _stored(store: MemoryStore, memory_id: str) -> MemoryEntry:
+    db = await store._get_db()
+    return (await db.query_memories(memory_ids=[memory_id]))[0]
+
+
+@pytest.mark.asyncio
+async def test_buffer_coalesces_and_flushes_when_full() -> None:
+    flushed = []
+
+    async def _flush(rows):
+        flushed.append(rows)
+        return len(rows)
+
+    buffer = MemoryWriteBuffer(_flush, max_pending=3, flush_seconds=60)
+    now = datetime.utcnow()
+    buffer.add("a", 1, now, 50.5)
+    buffer.add("a", 2, now, 51.0)
+    buffer.add("b", 1, now, 10.5)
+    assert len(buffer) == 2 and not flushed
+
+    buffer.add("c", 1, now, 20.5)
+    await asyncio.sleep(0)
+
+    assert len(flushed) == 1
+    assert {row["memory_id"]: row["access_count"] for row in flushed[0]} == {"a": 2, "b": 1, "c": 1}
+    assert len(buffer) == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_requeues_without_overwriting_newer_updates() -> None:
+    now = datetime.utcnow()
+
+    async def _fail(rows):
+        buffer.add("a", 5, now, 60.0)  # arrives mid-flush
+        raise RuntimeError("db down")
+
+    buffer = MemoryWriteBuffer(_fail, flush_seconds=60)
+    buffer.add("a", 1, now, 50.0)
+    buffer.add("b", 1, now, 50.0)
+
+    with pytest.raises(RuntimeError):
+        await buffer.flush()
+
+    assert buffer.pending("a")["access_count"] == 5
+    assert buffer.pending("b")["access_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_recall_defers_reinforcement_to_one_bulk_update() -> None:
+    store = MemoryStore()
+    recall = SelectiveRecall(store)
+    entries = [
+        await store.store(_entry(f"deploy step {i}", importance=40.0, embedding=embed_text(f"deploy step {i}")))
+        for i in range(5)
+    ]
+    updates = await _record_updates(store)
+
+    for _ in range(3):
+        result = await recall.recall(MemoryQuery(query="deploy", agent_id="agent_1"))
+    assert len(result.memories) == 5
+    assert updates == []
+
+    # Reads see buffered stats before they are flushed
+    queried = await store.query(agent_id="agent_1")
+    assert {m.access_count for m in queried} == {3}
+
+    assert await store.flush() == 5
+    assert len(updates) == 1
+    persisted = await _stored(store, entries[0].memory_id)
+    assert persisted.access_count == 3
+    assert persisted.importance == pytest.approx(41.5)
+    assert persisted.last_accessed_at is not None
+
+
+@pytest.mark.asyncio
+async def test_get_flushes_pending_stats_before_incrementing() -> None:
+    store = MemoryStore()
+    recall = SelectiveRecall(store)
+    entry = await store.store(_entry("cache warmup finished"))
+    await recall.recall(MemoryQuery(query="warmup", agent_id="agent_1"))
+
+    fetched = await store.get(entry.memory_id)
+
+    assert fetched.access_count == 2
+    assert len(store.write_buffer) == 0
+
+
+@pytest.mark.asyncio
+async def test_decay_is_one_statement_over_all_idle_memories() -> None:
+    store = MemoryStore()
+    recall = SelectiveRecall(store)
+    week_ago = datetime.utcnow() - timedelta(days=7)
+    idle = [await store.store(_entry(f"idle {i}", importance=50.0, created_at=week_ago)) for i in range(3)]
+    fresh = await store.store(_entry("fresh", importance=50.0))
+    other_agent = await store.store(_entry("other", agent_id="agent_2", importance=50.0, created_at=week_ago))
+    floor = await store.store(_entry("floor", importance=3.0, created_at=week_ago))
+    updates = await _record_updates(store)
+
+    decayed = await recall.apply_decay(agent_id="agent_1")
+
+    assert decayed == 4
+    assert len(updates) == 1
+    assert (await _stored(store, idle[0].memory_id)).importance == pytest.approx(43.0, abs=0.01)
+    assert idle[0].importance == pytest.approx(43.0, abs=0.01)  # live entry mirrors the database
+    assert (await _stored(store, floor.memory_id)).importance == 0.0
+    assert (await _stored(store, fresh.memory_id)).importance == 50.0
+    assert (await _stored(store, other_agent.memory_id)).importance == 50.0
+
+
+@pytest.mark.asyncio
+async def test_service_shutdown_flushes_buffered_reinforcement() -> None:
+    svc = MemoryService()
+    entry = await svc.store_memory(MemoryStoreRequest(
+        content="rollback plan approved",
+        memory_type=MemoryType.DECISION,
+        agent_id="agent_1",
+    ))
+    await svc.recall_memories(MemoryQuery(query="rollback plan", agent_id="agent_1"))
+    assert entry.memory_id in svc.store.write_buffer
+
+    await svc.shutdown()
+
+    assert (await _stored(svc.store, entry.memory_id)).access_count == 1
@@ -0,0 +1,161 @@
+"""
+Memory Text Index - In-process inverted index for keyword search.
+
+Used by DatabaseAdapter when the database has no full-text search (the
+SQLite dev/test fallback); PostgreSQL uses a GIN tsvector index instead.
+
+Documents are tokenised like PostgreSQL's 'simple' configuration, query
+tokens match as prefixes (``deploy`` finds ``deployment``) and results are
+ranked with BM25. Static scope fields (tenant, agent, layer, ...) are kept
+per document so filtering happens before ranking.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Fields filtered inside the index; everything else is checked on hydration
+SCOPE_FIELDS = ("tenant_id", "agent_id", "session_id", "mission_id", "skill_run_id", "layer", "memory_type")
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+# Vocabulary terms a single prefix may expand to
+MAX_PREFIX_EXPANSIONS = 64
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lower-cased word tokens, split on anything that isn't a letter or digit."""
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+class MemoryTextIndex:
+    """Term → {memory_id: term frequency} postings with BM25 ranking."""
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._vocabulary: List[str] = []  # sorted, for prefix lookups
+        self._lengths: Dict[str, int] = {}
+        self._terms: Dict[str, Tuple[str, ...]] = {}
+        self._scopes: Dict[str, Dict[str, Any]] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._lengths
+
+    def add(self, memory_id: str, text: str, **scope: Any) -> None:
+        """Index (or re-index) a memory's text and scope fields."""
+        self._add(memory_id, text, scope, keep_vocabulary_sorted=True)
+
+    def _add(self, memory_id: str, text: str, scope: Dict[str, Any], keep_vocabulary_sorted: bool) -> None:
+        self.remove(memory_id)
+        tokens = tokenize(text)
+        counts: Dict[str, int] = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        for term, count in counts.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                if keep_vocabulary_sorted:
+                    self._vocabulary.insert(bisect_left(self._vocabulary, term), term)
+            postings[memory_id] = count
+        self._lengths[memory_id] = len(tokens)
+        self._terms[memory_id] = tuple(counts)
+        self._scopes[memory_id] = {field: scope.get(field) for field in SCOPE_FIELDS}
+        self._total_length += len(tokens)
+
+    def remove(self, memory_id: str) -> None:
+        length = self._lengths.pop(memory_id, None)
+        if length is None:
+            return
+        self._total_length -= length
+        self._scopes.pop(memory_id, None)
+        for term in self._terms.pop(memory_id, ()):
+            postings = self._postings[term]
+            postings.pop(memory_id, None)
+            if not postings:
+                del self._postings[term]
+                position = bisect_left(self._vocabulary, term)
+                if position < len(self._vocabulary) and self._vocabulary[position] == term:
+                    del self._vocabulary[position]
+
+    def _expand(self, prefix: str) -> List[str]:
+        start = bisect_left(self._vocabulary, prefix)
+        terms = []
+        for term in self._vocabulary[start:start + MAX_PREFIX_EXPANSIONS]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        match_all: bool = False,
+        **scope: Any,
+    ) -> List[Tuple[str, float]]:
+        """
+        Rank memories matching any (or, with match_all, every) query token.
+
+        ``scope`` takes SCOPE_FIELDS values; None means unfiltered. Returns
+        the best ``limit`` (memory_id, score) pairs, or all when None.
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens or not self._lengths:
+            return []
+        filters = {field: value for field, value in scope.items() if value is not None and field in SCOPE_FIELDS}
+
+        total = len(self._lengths)
+        avg_length = self._total_length / total or 1.0
+        scores: Dict[str, float] = {}
+        matched: Dict[str, int] = {}
+        for token in tokens:
+            token_hits: Dict[str, float] = {}
+            for term in self._expand(token):
+                postings = self._postings[term]
+                idf = math.log(1.0 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+                for memory_id, tf in postings.items():
+                    norm = tf + K1 * (1.0 - B + B * self._lengths[memory_id] / avg_length)
+                    score = idf * tf * (K1 + 1.0) / norm
+                    if score > token_hits.get(memory_id, 0.0):
+                        token_hits[memory_id] = score
+            for memory_id, score in token_hits.items():
+                scores[memory_id] = scores.get(memory_id, 0.0) + score
+                matched[memory_id] = matched.get(memory_id, 0) + 1
+
+        results = []
+        for memory_id, score in scores.items():
+            if match_all and matched[memory_id] < len(tokens):
+                continue
+            if filters and not self._in_scope(memory_id, filters):
+                continue
+            results.append((memory_id, score))
+        if limit is not None and limit < len(results):
+            return heapq.nlargest(limit, results, key=lambda pair: pair[1])
+        results.sort(key=lambda pair: pair[1], reverse=True)
+        return results
+
+    def _in_scope(self, memory_id: str, filters: Dict[str, Any]) -> bool:
+        fields = self._scopes[memory_id]
+        return all(fields.get(field) == value for field, value in filters.items())
+
+    @classmethod
+    def build(cls, rows: Iterable[Dict[str, Any]]) -> MemoryTextIndex:
+        """Build from rows carrying memory_id, content, summary and scope fields."""
+        index = cls()
+        for row in rows:
+            text = f"{row.get('content') or ''} {row.get('summary') or ''}"
+            index._add(row["memory_id"], text, row, keep_vocabulary_sorted=False)
+        index._vocabulary = sorted(index._postings)
+        return index
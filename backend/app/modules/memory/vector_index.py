@@ -0,0 +1,132 @@
+"""
+Memory Vector Index - In-process similarity search over stored embeddings.
+
+One index is kept per (tenant, agent) scope and built from the embeddings
+persisted with each MemoryEntry. Vectors are L2-normalised once on insert so
+a recall is a single matrix-vector product over the scope.
+
+Query texts without a caller-supplied embedding are embedded with the
+Knowledge Engine's hashed token embedder, which is also what MemoryService
+uses for new memories.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.modules.knowledge_engine.ingest_service import generate_embeddings
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+VECTOR_INDEX_AVAILABLE = np is not None
+
+Scope = Tuple[Optional[str], Optional[str]]  # (tenant_id, agent_id)
+
+
+def embed_text(text: str) -> List[float]:
+    """Embed memory or query text with the default hashed embedder."""
+    return generate_embeddings(text)
+
+
+class MemoryVectorIndex:
+    """
+    Dense float32 matrix of normalised embeddings for one scope.
+
+    Rows are addressed by memory_id; removed rows are masked out and
+    reused by the next insert.
+    """
+
+    def __init__(self, dim: int, capacity: int = 256) -> None:
+        self.dim = dim
+        self.built_at = time.monotonic()
+        self._vectors = np.zeros((max(1, capacity), dim), dtype=np.float32)
+        self._live = np.zeros(max(1, capacity), dtype=bool)
+        self._ids: List[Optional[str]] = [None] * max(1, capacity)
+        self._rows: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._rows
+
+    def _grow(self) -> None:
+        capacity = len(self._ids) * 2
+        vectors = np.zeros((capacity, self.dim), dtype=np.float32)
+        vectors[: self._size] = self._vectors[: self._size]
+        live = np.zeros(capacity, dtype=bool)
+        live[: self._size] = self._live[: self._size]
+        self._vectors, self._live = vectors, live
+        self._ids.extend([None] * (capacity - len(self._ids)))
+
+    def upsert(self, memory_id: str, embedding: Sequence[float]) -> bool:
+        """Insert or replace a memory's vector. Returns False on dimension mismatch."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        if vector.shape != (self.dim,):
+            self.remove(memory_id)
+            return False
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            self.remove(memory_id)
+            return False
+
+        row = self._rows.get(memory_id)
+        if row is None:
+            if self._free:
+                row = self._free.pop()
+            else:
+                if self._size == len(self._ids):
+                    self._grow()
+                row = self._size
+                self._size += 1
+            self._rows[memory_id] = row
+            self._ids[row] = memory_id
+            self._live[row] = True
+        self._vectors[row] = vector / norm
+        return True
+
+    def remove(self, memory_id: str) -> None:
+        row = self._rows.pop(memory_id, None)
+        if row is None:
+            return
+        self._live[row] = False
+        self._ids[row] = None
+        self._free.append(row)
+
+    def similarity(self, query: Sequence[float], embedding: Sequence[float]) -> float:
+        """Cosine similarity of two vectors of this index's dimension; 0.0 otherwise."""
+        a = np.asarray(query, dtype=np.float32)
+        b = np.asarray(embedding, dtype=np.float32)
+        if a.shape != (self.dim,) or b.shape != (self.dim,):
+            return 0.0
+        norm = float(np.linalg.norm(a) * np.linalg.norm(b))
+        return float(a @ b) / norm if norm else 0.0
+
+    def search(self, query: Sequence[float], limit: int, min_similarity: float = 0.0) -> List[Tuple[str, float]]:
+        """Return up to ``limit`` (memory_id, cosine similarity) pairs, best first."""
+        vector = np.asarray(query, dtype=np.float32)
+        if vector.shape != (self.dim,) or not self._rows or limit <= 0:
+            return []
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return []
+
+        scores = self._vectors[: self._size] @ (vector / norm)
+        scores[~self._live[: self._size]] = -np.inf
+        limit = min(limit, len(self._rows))
+        if limit < self._size:
+            top = np.argpartition(scores, -limit)[-limit:]
+        else:
+            top = np.arange(self._size)
+        top = top[np.argsort(scores[top])[::-1]]
+        return [
+            (self._ids[row], float(scores[row]))
+            for row in top
+            if self._live[row] and scores[row] >= min_similarity
+        ]
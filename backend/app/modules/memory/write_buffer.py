@@ -0,0 +1,127 @@
+"""
+Write-behind buffer for memory access statistics.
+
+Recall reinforcement (access_count, last_accessed_at, importance) is
+coalesced per memory and written in bulk instead of one UPDATE per
+recalled memory. A flush happens when the buffer fills, FLUSH_SECONDS
+after the first pending update, on demand (reads, decay) and on shutdown.
+A failed flush re-queues its rows without overwriting newer values.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from loguru import logger
+
+MAX_PENDING = int(os.getenv("MEMORY_WRITE_BUFFER_MAX_PENDING", "500"))
+FLUSH_SECONDS = float(os.getenv("MEMORY_WRITE_BUFFER_FLUSH_SECONDS", "2.0"))
+
+FlushFn = Callable[[List[Dict[str, Any]]], Awaitable[int]]
+
+
+class MemoryWriteBuffer:
+    """Coalesces access-stat updates per memory_id and flushes them in bulk."""
+
+    def __init__(
+        self,
+        flush_fn: FlushFn,
+        max_pending: int = MAX_PENDING,
+        flush_seconds: float = FLUSH_SECONDS,
+    ) -> None:
+        self._flush_fn = flush_fn
+        self.max_pending = max_pending
+        self.flush_seconds = flush_seconds
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self.total_flushes = 0
+        self.total_rows_flushed = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._pending
+
+    def add(
+        self,
+        memory_id: str,
+        access_count: int,
+        last_accessed_at: datetime,
+        importance: float,
+    ) -> None:
+        """Record the latest access stats for a memory (last write wins)."""
+        self._pending[memory_id] = {
+            "memory_id": memory_id,
+            "access_count": access_count,
+            "last_accessed_at": last_accessed_at,
+            "importance": importance,
+        }
+        if len(self._pending) >= self.max_pending:
+            self._schedule(0.0)
+        elif self._timer is None:
+            self._schedule(self.flush_seconds)
+
+    def pending(self, memory_id: str) -> Optional[Dict[str, Any]]:
+        return self._pending.get(memory_id)
+
+    def discard(self, memory_id: str) -> None:
+        self._pending.pop(memory_id, None)
+
+    async def flush(self) -> int:
+        """Write all pending updates. Returns the number of rows sent."""
+        async with self._lock:
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, {}
+            try:
+                await self._flush_fn(list(batch.values()))
+            except BaseException as exc:
+                # Keep anything newer that arrived while flushing
+                for memory_id, update in batch.items():
+                    self._pending.setdefault(memory_id, update)
+                if not isinstance(exc, asyncio.CancelledError):
+                    logger.error("[MemoryWriteBuffer] Flush of %d updates failed: %s", len(batch), exc)
+                raise
+            self.total_flushes += 1
+            self.total_rows_flushed += len(batch)
+            return len(batch)
+
+    async def close(self) -> int:
+        """Cancel the flush timer and write everything still pending."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return await self.flush()
+
+    def _schedule(self, delay: float) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # no loop: flushed on the next read, decay or close()
+        if delay <= 0:
+            if self._flush_task is None or self._flush_task.done():
+                self._start_flush()
+            return
+        if self._timer is None:
+            # A timer handle (not a sleeping task) so an idle loop can close cleanly
+            self._timer = loop.call_later(delay, self._start_flush)
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._flush_task = asyncio.get_running_loop().create_task(self._flush_in_background())
+
+    async def _flush_in_background(self) -> None:
+        try:
+            await self.flush()
+        except Exception:
+            pass  # rows were re-queued and logged by flush()
+        if self._pending:
+            self._schedule(self.flush_seconds)
@@ -0,0 +1,277 @@
+"""
+Policy Decision Index - Compiled form of the policy cache for evaluation
+
+Built once per policy cache load:
+- Policies are bucketed by action pattern: exact actions, literal prefixes
+  ("data.*") and a wildcard tier for other globs; resource patterns are
+  precompiled
+- Each bucket keeps its rules pre-sorted by priority, so a lookup merges a
+  few sorted lists lazily instead of sorting every rule
+- Conditions get a precompiled field accessor and regex
+- Decisions are kept in a bounded LRU keyed by action, resource and the
+  context fields the conditions read
+
+Evaluation order matches the uncompiled engine: rules by priority (highest
+first), ties in policy cache order, then rule order.
+"""
+
+import fnmatch
+import heapq
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from loguru import logger
+
+from .schemas import (
+    Policy as PolicySchema,
+    PolicyCondition,
+    PolicyConditionOperator,
+    PolicyEvaluationContext,
+    PolicyRule,
+)
+
+DECISION_CACHE_SIZE = 4096
+
+GLOB_CHARS = "*?["
+
+Accessor = Callable[[PolicyEvaluationContext], Any]
+
+
+def _field_accessor(field_name: str) -> Accessor:
+    """Compile a dot-notation field into a context accessor"""
+    parts = field_name.split(".")
+
+    if len(parts) == 1:
+        return lambda context: getattr(context, field_name, None)
+
+    if len(parts) == 2:
+        root, key = parts
+        if root == "environment":
+            return lambda context: context.environment.get(key)
+        if root == "params":
+            return lambda context: context.params.get(key)
+        if root == "agent":
+            attribute = f"agent_{key}"
+            return lambda context: getattr(context, attribute, None)
+
+    logger.warning(f"Field not found: {field_name}")
+    return lambda context: None
+
+
+def _pattern_matcher(pattern: str) -> Callable[[str], bool]:
+    """fnmatch semantics, compiled once"""
+    if pattern == "*":
+        return lambda value: True
+    if not any(char in pattern for char in GLOB_CHARS):
+        return lambda value: value == pattern
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+class CompiledCondition:
+    """PolicyCondition with its accessor and regex resolved"""
+
+    __slots__ = ("field", "accessor", "operator", "expected", "pattern")
+
+    def __init__(self, condition: PolicyCondition):
+        self.field = condition.field
+        self.accessor = _field_accessor(condition.field)
+        self.operator = condition.operator
+        self.expected = condition.value
+        self.pattern = None
+        if self.operator == PolicyConditionOperator.MATCHES:
+            try:
+                self.pattern = re.compile(self.expected)
+            except (re.error, TypeError) as e:
+                logger.warning(f"Invalid regex in policy condition on '{self.field}': {e}")
+
+    def matches(self, context: PolicyEvaluationContext) -> bool:
+        field_value = self.accessor(context)
+        operator = self.operator
+        expected = self.expected
+
+        if operator == PolicyConditionOperator.EQUALS:
+            return field_value == expected
+        elif operator == PolicyConditionOperator.NOT_EQUALS:
+            return field_value != expected
+        elif operator == PolicyConditionOperator.GREATER_THAN:
+            return field_value > expected
+        elif operator == PolicyConditionOperator.LESS_THAN:
+            return field_value < expected
+        elif operator == PolicyConditionOperator.CONTAINS:
+            return expected in str(field_value) if field_value is not None else False
+        elif operator == PolicyConditionOperator.MATCHES:
+            if field_value is None or self.pattern is None:
+                return False
+            return bool(self.pattern.match(str(field_value)))
+        elif operator == PolicyConditionOperator.IN:
+            return field_value in expected if isinstance(expected, list) else False
+        else:
+            logger.warning(f"Unknown operator: {operator}")
+            return False
+
+
+@dataclass
+class CompiledPolicy:
+    policy: PolicySchema
+    resource_matches: Callable[[str], bool]
+    # Sort key of the policy's default effect: (-first rule priority, cache order)
+    order: Tuple[int, int]
+
+
+@dataclass
+class CompiledRule:
+    compiled_policy: CompiledPolicy
+    rule: PolicyRule
+    conditions: List[CompiledCondition]
+    # (-priority, policy cache order, rule order)
+    order: Tuple[int, int, int]
+
+    def matches(self, context: PolicyEvaluationContext) -> bool:
+        return all(condition.matches(context) for condition in self.conditions)
+
+
+@dataclass
+class _Bucket:
+    policies: List[CompiledPolicy] = field(default_factory=list)
+    rules: List[CompiledRule] = field(default_factory=list)
+
+    def sort(self) -> None:
+        self.policies.sort(key=lambda p: p.order)
+        self.rules.sort(key=lambda r: r.order)
+
+
+@dataclass
+class PolicyDecision:
+    """
+    Outcome of matching a context: the first matching rule, or the
+    default-effect policy when no rule matched (None if no policy applies)
+    """
+
+    policy: Optional[PolicySchema] = None
+    rule: Optional[PolicyRule] = None
+
+
+class PolicyDecisionIndex:
+    """Compiled, bucketed view of the enabled policies"""
+
+    def __init__(self, policies: Iterable[PolicySchema], cache_size: int = DECISION_CACHE_SIZE):
+        self._exact: Dict[str, _Bucket] = {}
+        self._prefixes: Dict[str, _Bucket] = {}
+        self._wildcard: List[Tuple[Callable[[str], bool], _Bucket]] = []
+        self._cache: "OrderedDict[Tuple[Any, ...], PolicyDecision]" = OrderedDict()
+        self._cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        accessors: Dict[str, Accessor] = {}
+        wildcard: Dict[str, _Bucket] = {}
+        for position, policy in enumerate(policies):
+            if not policy.enabled:
+                continue
+            metadata = policy.metadata or {}
+            action_pattern = metadata.get("action_pattern", "*")
+            compiled_policy = CompiledPolicy(
+                policy=policy,
+                resource_matches=_pattern_matcher(metadata.get("resource_pattern", "*")),
+                order=(-(policy.rules[0].priority if policy.rules else 0), position),
+            )
+
+            if not any(char in action_pattern for char in GLOB_CHARS):
+                bucket = self._exact.setdefault(action_pattern, _Bucket())
+            elif action_pattern.endswith("*") and not any(char in action_pattern[:-1] for char in GLOB_CHARS):
+                bucket = self._prefixes.setdefault(action_pattern[:-1], _Bucket())
+            else:
+                bucket = wildcard.setdefault(action_pattern, _Bucket())
+
+            bucket.policies.append(compiled_policy)
+            for rule_position, rule in enumerate(policy.rules):
+                if not rule.enabled:
+                    continue
+                conditions = [CompiledCondition(condition) for condition in rule.conditions]
+                for condition in conditions:
+                    accessors.setdefault(condition.field, condition.accessor)
+                bucket.rules.append(
+                    CompiledRule(compiled_policy, rule, conditions, (-rule.priority, position, rule_position))
+                )
+
+        self._wildcard = [(_pattern_matcher(pattern), bucket) for pattern, bucket in wildcard.items()]
+        self._prefix_lengths = sorted({len(prefix) for prefix in self._prefixes})
+        for bucket in self._buckets():
+            bucket.sort()
+        # Context fields any condition reads; together with action and
+        # resource they determine the decision
+        self._key_accessors = list(accessors.values())
+
+    def _buckets(self) -> Iterator[_Bucket]:
+        yield from self._exact.values()
+        yield from self._prefixes.values()
+        for _, bucket in self._wildcard:
+            yield bucket
+
+    def _candidate_buckets(self, action: str) -> List[_Bucket]:
+        buckets = []
+        exact = self._exact.get(action)
+        if exact is not None:
+            buckets.append(exact)
+        for length in self._prefix_lengths:
+            if length > len(action):
+                break
+            bucket = self._prefixes.get(action[:length])
+            if bucket is not None:
+                buckets.append(bucket)
+        buckets.extend(bucket for matches, bucket in self._wildcard if matches(action))
+        return buckets
+
+    def decide(self, context: PolicyEvaluationContext) -> PolicyDecision:
+        """Decision for a context, served from the LRU when possible"""
+        key = self._cache_key(context)
+        if key is not None:
+            decision = self._cache.get(key)
+            if decision is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return decision
+            self.cache_misses += 1
+
+        decision = self._decide(context)
+
+        if key is not None and self._cache_size > 0:
+            self._cache[key] = decision
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return decision
+
+    def _cache_key(self, context: PolicyEvaluationContext) -> Optional[Tuple[Any, ...]]:
+        key = (context.action, context.resource, *(accessor(context) for accessor in self._key_accessors))
+        try:
+            hash(key)
+        except TypeError:
+            return None  # unhashable field values (dicts, lists) aren't cached
+        return key
+
+    def _decide(self, context: PolicyEvaluationContext) -> PolicyDecision:
+        buckets = self._candidate_buckets(context.action)
+        resource = context.resource or "*"
+
+        rules = heapq.merge(*(bucket.rules for bucket in buckets), key=lambda r: r.order)
+        for compiled_rule in rules:
+            if compiled_rule.compiled_policy.resource_matches(resource) and compiled_rule.matches(context):
+                return PolicyDecision(compiled_rule.compiled_policy.policy, compiled_rule.rule)
+
+        policies = heapq.merge(*(bucket.policies for bucket in buckets), key=lambda p: p.order)
+        for compiled_policy in policies:
+            if compiled_policy.resource_matches(resource):
+                return PolicyDecision(compiled_policy.policy)
+
+        return PolicyDecision()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "decision_cache_entries": len(self._cache),
+            "decision_cache_hits": self.cache_hits,
+            "decision_cache_misses": self.cache_misses,
+            "decision_cache_hit_rate_percent": round(self.cache_hits / lookups * 100, 2) if lookups else 0,
+        }
@@ -4,7 +4,7 @@ Policy Engine Service - Business logic for policy evaluation
 Provides rule-based policy engine with:
 - Policy CRUD operations with database persistence
 - Policy evaluation (check if action is allowed)
-- In-memory caching for performance
+- In-memory caching for performance (compiled decision index + LRU)
 - Integration with Foundation layer (double-check safety)
 - Comprehensive audit logging
 - EventStream integration
@@ -19,8 +19,6 @@ Sprint 3 EventStream Integration:
 - policy.deleted: When policy removed
 """
 
-import fnmatch
-import re
 import time
 import uuid
 from datetime import datetime, timezone
@@ -30,6 +28,7 @@ from loguru import logger
 from sqlalchemy import select, desc
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from .decision_index import PolicyDecisionIndex
 from .schemas import (
     Policy as PolicySchema,
     PolicyRule,
@@ -101,6 +100,8 @@ class PolicyEngine:
         # In-memory cache (policies loaded from DB)
         self._policy_cache: Dict[str, PolicySchema] = {}
         self._cache_loaded = False
+        # Compiled from _policy_cache on first evaluation after a (re)load
+        self._decision_index: Optional[PolicyDecisionIndex] = None
 
         # Permissions (still in-memory for now)
         self.permissions: Dict[str, Permission] = {}
@@ -145,6 +146,7 @@ class PolicyEngine:
             for policy in policies:
                 self._policy_cache[str(policy.id)] = self._db_to_schema(policy)
 
+            self._decision_index = PolicyDecisionIndex(self._policy_cache.values())
             self._cache_loaded = True
             logger.info(f"✅ Loaded {len(self._policy_cache)} policies into cache")
 
@@ -156,8 +158,15 @@ class PolicyEngine:
         """Invalidate the in-memory cache (call after DB changes)"""
         self._cache_loaded = False
         self._policy_cache.clear()
+        self._decision_index = None
         logger.debug("Policy cache invalidated")
 
+    def _get_decision_index(self) -> PolicyDecisionIndex:
+        """Compiled decision index for the current policy cache"""
+        if self._decision_index is None:
+            self._decision_index = PolicyDecisionIndex(self._policy_cache.values())
+        return self._decision_index
+
     def _db_to_schema(self, db_policy: PolicyModel) -> PolicySchema:
         """Convert database Policy model to Pydantic schema"""
         # Convert conditions JSON to PolicyRule objects
@@ -382,13 +391,10 @@ class PolicyEngine:
         # Ensure cache is loaded
         await self._ensure_cache_loaded()
 
-        # Get active policies from cache
-        active_policies = [
-            p for p in self._policy_cache.values() 
-            if p.enabled and self._policy_matches_context(p, context)
-        ]
+        # Resolve matching rule (or default-effect policy) via the compiled index
+        decision = self._get_decision_index().decide(context)
 
-        if not active_policies:
+        if decision.policy is None:
             logger.warning("⚠️ No matching active policies - defaulting to DENY")
             result = PolicyEvaluationResult(
                 allowed=False,
@@ -406,106 +412,94 @@ class PolicyEngine:
             )
             return result
 
-        # Collect and sort all rules by priority
-        all_rules = []
-        for policy in active_policies:
-            for rule in policy.rules:
-                if rule.enabled:
-                    all_rules.append((policy, rule))
-
-        all_rules.sort(key=lambda x: x[1].priority, reverse=True)
-
-        # Find first matching rule
+        # First matching rule (rules are pre-sorted by priority)
         matched_policy_id = None
         matched_rule_id = None
         risk_tier = "low"
 
-        for policy, rule in all_rules:
-            if await self._rule_matches(rule, context):
-                logger.info(
-                    f"✅ Matched rule: {rule.name} (effect={rule.effect.value})"
-                )
-                matched_policy_id = policy.policy_id
-                matched_rule_id = rule.rule_id
-                
-                # Determine risk tier based on effect
-                if rule.effect == PolicyEffect.DENY:
-                    risk_tier = "high"
-                elif rule.effect == PolicyEffect.AUDIT:
-                    risk_tier = "medium"
-
-                result = self._apply_effect(rule.effect, policy, rule, context)
-                self._update_metrics(result)
-
-                # Foundation double-check
-                if FOUNDATION_AVAILABLE and result.allowed:
-                    foundation_check = await self._check_foundation(context)
-                    if not foundation_check:
-                        logger.warning("⚠️ Policy allowed but Foundation blocked - DENY")
-                        result.allowed = False
-                        result.effect = PolicyEffect.DENY
-                        result.reason = f"{result.reason} (overridden by Foundation safety check)"
-                        self.total_denies += 1
-                        risk_tier = "critical"
-
-                # Emit events
-                evaluation_time_ms = (time.time() - start_time) * 1000
+        if decision.rule is not None:
+            policy, rule = decision.policy, decision.rule
+            logger.info(
+                f"✅ Matched rule: {rule.name} (effect={rule.effect.value})"
+            )
+            matched_policy_id = policy.policy_id
+            matched_rule_id = rule.rule_id
+            
+            # Determine risk tier based on effect
+            if rule.effect == PolicyEffect.DENY:
+                risk_tier = "high"
+            elif rule.effect == PolicyEffect.AUDIT:
+                risk_tier = "medium"
+
+            result = self._apply_effect(rule.effect, policy, rule, context)
+            self._update_metrics(result)
+
+            # Foundation double-check
+            if FOUNDATION_AVAILABLE and result.allowed:
+                foundation_check = await self._check_foundation(context)
+                if not foundation_check:
+                    logger.warning("⚠️ Policy allowed but Foundation blocked - DENY")
+                    result.allowed = False
+                    result.effect = PolicyEffect.DENY
+                    result.reason = f"{result.reason} (overridden by Foundation safety check)"
+                    self.total_denies += 1
+                    risk_tier = "critical"
+
+            # Emit events
+            evaluation_time_ms = (time.time() - start_time) * 1000
+            await self._emit_event_safe(
+                event_type="policy.evaluated",
+                policy=policy,
+                rule=rule,
+                context=context,
+                result=result,
+                evaluation_time_ms=evaluation_time_ms,
+            )
+
+            if not result.allowed:
                 await self._emit_event_safe(
-                    event_type="policy.evaluated",
+                    event_type="policy.denied",
                     policy=policy,
                     rule=rule,
                     context=context,
                     result=result,
-                    evaluation_time_ms=evaluation_time_ms,
                 )
 
-                if not result.allowed:
-                    await self._emit_event_safe(
-                        event_type="policy.denied",
-                        policy=policy,
-                        rule=rule,
-                        context=context,
-                        result=result,
-                    )
-
-                if result.effect == PolicyEffect.WARN:
-                    await self._emit_event_safe(
-                        event_type="policy.warning_triggered",
-                        policy=policy,
-                        rule=rule,
-                        context=context,
-                        warnings=result.warnings,
-                    )
-
-                if result.effect == PolicyEffect.AUDIT:
-                    await self._emit_event_safe(
-                        event_type="policy.audit_required",
-                        policy=policy,
-                        rule=rule,
-                        context=context,
-                        result=result,
-                    )
-
-                # Log audit event
-                await self._log_audit_event(
-                    context, result,
-                    policy_matched=matched_policy_id,
-                    rule_matched=matched_rule_id,
-                    risk_tier=risk_tier,
-                    ip_address=ip_address,
-                    request_id=request_id
+            if result.effect == PolicyEffect.WARN:
+                await self._emit_event_safe(
+                    event_type="policy.warning_triggered",
+                    policy=policy,
+                    rule=rule,
+                    context=context,
+                    warnings=result.warnings,
                 )
 
-                return result
+            if result.effect == PolicyEffect.AUDIT:
+                await self._emit_event_safe(
+                    event_type="policy.audit_required",
+                    policy=policy,
+                    rule=rule,
+                    context=context,
+                    result=result,
+                )
+
+            # Log audit event
+            await self._log_audit_event(
+                context, result,
+                policy_matched=matched_policy_id,
+                rule_matched=matched_rule_id,
+                risk_tier=risk_tier,
+                ip_address=ip_address,
+                request_id=request_id
+            )
+
+            return result
 
         # No rules matched - use default effect
         logger.debug("No rules matched - using default effect")
         
-        # Find the highest priority policy's default effect
-        default_effect = PolicyEffect.DENY
-        for policy in sorted(active_policies, key=lambda p: p.rules[0].priority if p.rules else 0, reverse=True):
-            default_effect = policy.default_effect
-            break
+        # Default effect of the highest priority matching policy
+        default_effect = decision.policy.default_effect
 
         result = PolicyEvaluationResult(
             allowed=(default_effect == PolicyEffect.ALLOW),
@@ -545,77 +539,6 @@ class PolicyEngine:
 
         return result
 
-    def _policy_matches_context(self, policy: PolicySchema, context: PolicyEvaluationContext) -> bool:
-        """Check if policy applies to the given context based on resource/action patterns"""
-        metadata = policy.metadata or {}
-        resource_pattern = metadata.get("resource_pattern", "*")
-        action_pattern = metadata.get("action_pattern", "*")
-        
-        resource_match = fnmatch.fnmatch(context.resource or "*", resource_pattern)
-        action_match = fnmatch.fnmatch(context.action, action_pattern)
-        
-        return resource_match and action_match
-
-    async def _rule_matches(
-        self, rule: PolicyRule, context: PolicyEvaluationContext
-    ) -> bool:
-        """Check if all conditions in a rule match the context (AND logic)"""
-        if not rule.conditions:
-            return True
-
-        for condition in rule.conditions:
-            if not await self._condition_matches(condition, context):
-                return False
-
-        return True
-
-    async def _condition_matches(
-        self, condition: PolicyCondition, context: PolicyEvaluationContext
-    ) -> bool:
-        """Check if a single condition matches"""
-        field_value = self._get_field_value(condition.field, context)
-        operator = condition.operator
-        expected = condition.value
-
-        if operator == PolicyConditionOperator.EQUALS:
-            return field_value == expected
-        elif operator == PolicyConditionOperator.NOT_EQUALS:
-            return field_value != expected
-        elif operator == PolicyConditionOperator.GREATER_THAN:
-            return field_value > expected
-        elif operator == PolicyConditionOperator.LESS_THAN:
-            return field_value < expected
-        elif operator == PolicyConditionOperator.CONTAINS:
-            return expected in str(field_value) if field_value is not None else False
-        elif operator == PolicyConditionOperator.MATCHES:
-            if field_value is None:
-                return False
-            return bool(re.match(expected, str(field_value)))
-        elif operator == PolicyConditionOperator.IN:
-            return field_value in expected if isinstance(expected, list) else False
-        else:
-            logger.warning(f"Unknown operator: {operator}")
-            return False
-
-    def _get_field_value(self, field: str, context: PolicyEvaluationContext) -> Any:
-        """Get field value from context using dot notation"""
-        parts = field.split(".")
-
-        if len(parts) == 1:
-            return getattr(context, field, None)
-
-        if len(parts) == 2:
-            root, key = parts
-            if root == "environment":
-                return context.environment.get(key)
-            elif root == "params":
-                return context.params.get(key)
-            elif root == "agent":
-                return getattr(context, f"agent_{key}", None)
-
-        logger.warning(f"Field not found: {field}")
-        return None
-
     def _apply_effect(
         self,
         effect: PolicyEffect,
@@ -995,6 +918,7 @@ class PolicyEngine:
             "cache_hits": self.cache_hits,
             "cache_misses": self.cache_misses,
             "hit_rate_percent": round(hit_rate, 2),
+            **(self._decision_index.stats() if self._decision_index else {}),
         }
 
 
@@ -18,6 +18,8 @@ from .schemas import ProviderBindingCreate, ProviderBindingResponse, ProviderBin
 
 class ProviderBindingService:
     HEALTH_KEY = "brain:provider_bindings:health:{binding_id}"
+    # Bumped on every binding change in this process; caches key on it
+    revision = 0
     TRANSITIONS = {
         ProviderBindingStatus.DRAFT.value: {ProviderBindingStatus.ENABLED.value, ProviderBindingStatus.DISABLED.value},
         ProviderBindingStatus.ENABLED.value: {ProviderBindingStatus.DISABLED.value, ProviderBindingStatus.QUARANTINED.value},
@@ -25,6 +27,11 @@ class ProviderBindingService:
         ProviderBindingStatus.DISABLED.value: {ProviderBindingStatus.ENABLED.value},
     }
 
+    @classmethod
+    def bump_revision(cls) -> None:
+        # Through the class: `self.revision += 1` would shadow it per instance
+        cls.revision += 1
+
     @staticmethod
     def is_transition_allowed(current: str, target: str) -> bool:
         return target in ProviderBindingService.TRANSITIONS.get(current, set())
@@ -94,6 +101,7 @@ class ProviderBindingService:
             audit_message="Provider binding created",
         )
         await db.commit()
+        self.bump_revision()
         await db.refresh(model)
         return model
 
@@ -161,6 +169,7 @@ class ProviderBindingService:
             audit_message=f"Provider binding moved to {target_status.value}",
         )
         await db.commit()
+        self.bump_revision()
         await db.refresh(binding)
         return binding
 
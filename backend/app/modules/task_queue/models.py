@@ -109,6 +109,7 @@ class TaskModel(Base):
     
     # Dependencies
     depends_on = Column(JSONB, nullable=False, default=list)  # List of task_ids
+    remaining_dependencies = Column(Integer, nullable=False, default=0)  # Claimable at 0
     
     # Timestamps
     created_at = Column(DateTime, nullable=False, default=_utc_now_naive)
@@ -149,6 +150,7 @@ class TaskModel(Base):
             "wait_time_ms": self.wait_time_ms,
             "created_by": self.created_by,
             "depends_on": self.depends_on,
+            "remaining_dependencies": self.remaining_dependencies,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
@@ -158,3 +160,4 @@ class TaskModel(Base):
 Index('idx_tasks_status_priority_created', TaskModel.status, TaskModel.priority, TaskModel.created_at)
 Index('idx_tasks_claimed_by', TaskModel.claimed_by)
 Index('idx_tasks_scheduled_at', TaskModel.scheduled_at)
+Index('idx_tasks_depends_on', TaskModel.depends_on, postgresql_using='gin')  # Reverse dependency lookup
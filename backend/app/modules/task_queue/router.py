@@ -23,7 +23,7 @@ from app.modules.module_lifecycle.service import get_module_lifecycle_service
 from .schemas import (
     TaskCreate, TaskUpdate, TaskClaim, TaskComplete, TaskFail,
     TaskResponse, TaskListResponse, TaskStats, QueueStats, TaskStatus,
-    TaskClaimResponse, TaskLeaseCreateResponse
+    TaskClaimResponse, TaskBatchClaimResponse, TaskLeaseCreateResponse
 )
 from .service import get_task_queue_service
 from .models import TaskModel, TaskStatus as TaskModelStatus
@@ -283,6 +283,50 @@ async def claim_task(
     )
 
 
+@router.post("/claim/batch", response_model=TaskBatchClaimResponse)
+@limiter.limit(RateLimits.TASKS_CLAIM)
+async def claim_task_batch(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    principal: Principal = Depends(require_role(UserRole.AGENT, UserRole.SERVICE, UserRole.OPERATOR, UserRole.ADMIN)),
+    task_types: Optional[List[str]] = Query(None, description="Filter by task types"),
+    min_priority: Optional[int] = Query(None, ge=10, le=100, description="Minimum priority"),
+    limit: int = Query(10, ge=1, le=100, description="Maximum tasks to claim"),
+):
+    """
+    Claim up to `limit` available tasks in one request.
+
+    Uses skip-locked row claiming, so concurrent workers never receive
+    the same task and ineligible tasks do not block the queue.
+    """
+    service = get_task_queue_service()
+    body = await request.json()
+    claim_payload = body.get("claim", body)
+    claim = TaskClaim.model_validate(claim_payload)
+
+    if principal.agent_id and principal.agent_id != claim.agent_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Agent identity mismatch")
+
+    tasks = await service.claim_tasks(
+        db=db,
+        agent_id=claim.agent_id,
+        task_types=task_types,
+        min_priority=min_priority,
+        limit=limit,
+    )
+
+    if not tasks:
+        return TaskBatchClaimResponse(
+            success=False,
+            message="No tasks available"
+        )
+
+    return TaskBatchClaimResponse(
+        success=True,
+        tasks=[task_to_response(task) for task in tasks]
+    )
+
+
 @router.post("/{task_id}/start", response_model=TaskResponse)
 async def start_task(
     request: Request,
@@ -120,6 +120,7 @@ class TaskResponse(BaseModel):
     error_message: Optional[str] = Field(default=None)
     execution_time_ms: Optional[float] = Field(default=None)
     wait_time_ms: Optional[float] = Field(default=None)
+    remaining_dependencies: int = Field(default=0, description="Unfinished dependencies (claimable at 0)")
     created_by: Optional[str] = Field(default=None)
     created_at: datetime = Field(...)
     updated_at: datetime = Field(...)
@@ -145,6 +146,9 @@ class TaskStats(BaseModel):
     avg_execution_time_ms: Optional[float] = Field(default=None)
     avg_wait_time_ms: Optional[float] = Field(default=None)
     throughput_per_minute: Optional[float] = Field(default=None)
+    wait_time_percentiles_ms: Dict[str, Optional[float]] = Field(default_factory=dict, description="p50/p95/p99 queue wait")
+    execution_time_percentiles_ms: Dict[str, Optional[float]] = Field(default_factory=dict, description="p50/p95/p99 execution time")
+    window_seconds: Optional[int] = Field(default=None, description="Rolling window of the time-based metrics")
 
 
 # ============================================================================
@@ -158,6 +162,13 @@ class TaskClaimResponse(BaseModel):
     message: Optional[str] = Field(default=None)
 
 
+class TaskBatchClaimResponse(BaseModel):
+    """Response when claiming a batch of tasks"""
+    success: bool = Field(...)
+    tasks: List[TaskResponse] = Field(default_factory=list)
+    message: Optional[str] = Field(default=None)
+
+
 class TaskLeaseCreateResponse(BaseModel):
     skill_run_id: UUID
     task: TaskResponse
@@ -169,6 +180,7 @@ class QueueStats(BaseModel):
     by_priority: Dict[int, int] = Field(default_factory=dict, description="Pending tasks by priority")
     oldest_pending: Optional[datetime] = Field(default=None, description="Oldest pending task timestamp")
     estimated_wait_seconds: Optional[int] = Field(default=None, description="Estimated wait time for new normal priority task")
+    estimated_wait_seconds_by_priority: Dict[int, Optional[int]] = Field(default_factory=dict, description="Estimated wait time for a new task per priority level")
 
 
 # ============================================================================
@@ -6,20 +6,23 @@ Business logic for task queue management with prioritization and EventStream.
 
 from __future__ import annotations
 
+import time
 from datetime import datetime, timezone, timedelta
 from typing import List, Optional, Dict, Any
 from uuid import UUID, uuid4
 
 from loguru import logger
-from sqlalchemy import select, func, and_, or_, desc, asc
+from sqlalchemy import select, update, func, and_, or_, desc, asc, literal
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.core.auth_deps import Principal, PrincipalType
 from app.modules.skill_engine.models import SkillRunModel
 from app.modules.skill_engine.schemas import SkillRunState
-from app.modules.skill_engine.service import get_skill_engine_service
+from app.modules.skill_engine.service import SkillEngineService, get_skill_engine_service
 
 from .models import TaskModel, TaskStatus, TaskPriority
+from .stats import TaskQueueStatsEngine
 from .schemas import (
     TaskCreate, TaskUpdate, TaskClaim, TaskComplete, TaskFail,
     TaskResponse, TaskStats, QueueStats
@@ -40,19 +43,50 @@ class TaskQueueService:
     - Claim/complete/fail workflow
     - Automatic retry with backoff
     - Scheduled/delayed task execution
-    - Dependency management
+    - Dependency management (remaining-dependency counters, cascading cancel)
+    - Batched, skip-locked claiming for concurrent workers
+    - Rolling throughput/latency statistics (in-process, see stats.py)
     """
+
+    # Worker lanes with special matching rules in _agent_matches_required_worker
+    WORKER_LANES = ("miniworker", "openclaw", "opencode")
+
+    # Tasks still waiting in the queue (affected by dependency cascades)
+    WAITING_STATUSES = (TaskStatus.PENDING, TaskStatus.SCHEDULED, TaskStatus.RETRYING)
+
+    # Terminal states that can never satisfy a dependency
+    DEAD_STATUSES = (TaskStatus.FAILED, TaskStatus.CANCELLED, TaskStatus.TIMEOUT)
+
+    # States a task never leaves
+    TERMINAL_STATUSES = (TaskStatus.COMPLETED, *DEAD_STATUSES)
     
-    def __init__(self, event_stream=None):
-        """Initialize task queue service"""
+    def __init__(self, event_stream=None, stats_refresh_seconds: float = 10.0):
+        """
+        Initialize task queue service.
+
+        Args:
+            event_stream: Optional EventStream for task events
+            stats_refresh_seconds: Max age of cached queue/status counts
+        """
         self.event_stream = event_stream
         self.recovery_policy_service = get_recovery_policy_service() if get_recovery_policy_service else None
+        self.stats = TaskQueueStatsEngine()
+        self.stats_refresh_seconds = stats_refresh_seconds
+        self._aggregate_cache: Dict[str, tuple] = {}
         logger.info("📋 Task Queue Service initialized")
 
     @staticmethod
     def _utc_now_naive() -> datetime:
         return datetime.now(timezone.utc).replace(tzinfo=None)
 
+    @staticmethod
+    def _stats_key(task: TaskModel) -> tuple:
+        """(task_type, priority) key for rolling statistics."""
+        return (
+            getattr(task, "task_type", None) or "generic",
+            getattr(task, "priority", None) or TaskPriority.NORMAL.value,
+        )
+
     @staticmethod
     def _principal_for_task(task: TaskModel) -> Principal:
         principal_type_raw = str(task.created_by_type or "service").lower()
@@ -155,14 +189,14 @@ class TaskQueueService:
         task_result = await db.execute(select(TaskModel).where(TaskModel.task_id == task_id))
         queue_task = task_result.scalar_one_or_none()
         if queue_task is not None:
-            queue_task.completed_at = fallback_completed_at
+            task_values: Dict[str, Any] = {"completed_at": fallback_completed_at}
             if success:
-                queue_task.status = TaskStatus.COMPLETED
-                queue_task.result = output_payload or {}
+                task_values["status"] = TaskStatus.COMPLETED
+                task_values["result"] = output_payload or {}
             else:
-                queue_task.status = TaskStatus.FAILED
-                queue_task.error_message = failure_reason_sanitized or failure_code or "External execution failed"
-                queue_task.error_details = {
+                task_values["status"] = TaskStatus.FAILED
+                task_values["error_message"] = failure_reason_sanitized or failure_code or "External execution failed"
+                task_values["error_details"] = {
                     "fallback_finalize": True,
                     "failure_code": failure_code or "EXTERNAL-FAIL",
                 }
@@ -174,15 +208,37 @@ class TaskQueueService:
                     if getattr(started_at, "tzinfo", None) is not None
                     else started_at
                 )
-                queue_task.execution_time_ms = (
+                task_values["execution_time_ms"] = (
                     fallback_completed_at - started_at_naive
                 ).total_seconds() * 1000
 
+            # Only the call that moves the task into a terminal state touches
+            # its dependents; a repeated fallback must not decrement them again
+            finalized = await db.execute(
+                update(TaskModel)
+                .where(
+                    TaskModel.task_id == task_id,
+                    TaskModel.status.notin_(self.TERMINAL_STATUSES),
+                )
+                .values(**task_values)
+                .execution_options(synchronize_session=False)
+            )
+            if finalized.rowcount:
+                # Dependency updates were rolled back with the failed finalize
+                if success:
+                    await self._release_dependents(db, task_id)
+                else:
+                    await self._cascade_to_dependents(db, task_id, "failed")
+
         result = await db.execute(select(SkillRunModel).where(SkillRunModel.id == skill_run_id))
         run = result.scalar_one_or_none()
         if run is None:
             logger.warning("Fallback SkillRun finalize skipped: run not found {}", skill_run_id)
             return
+        if run.state in SkillEngineService.TERMINAL_STATES:
+            await db.commit()
+            logger.info("Fallback SkillRun finalize skipped: run {} already {}", skill_run_id, run.state)
+            return
 
         now = datetime.now(timezone.utc)
         run.state_sequence = (run.state_sequence or 0) + 1
@@ -213,8 +269,6 @@ class TaskQueueService:
                 "error_classification": "execution_error",
             }
 
-        if queue_task is not None:
-            db.add(queue_task)
         db.add(run)
         await db.commit()
         logger.warning(
@@ -239,6 +293,68 @@ class TaskQueueService:
         except Exception as e:
             logger.warning(f"Failed to publish event {event_type}: {e}")
     
+    # ========================================================================
+    # Dependency Tracking
+    # ========================================================================
+
+    async def _release_dependents(self, db: AsyncSession, task_id: str) -> None:
+        """
+        Decrement remaining_dependencies of every task depending on task_id.
+
+        Uses the GIN index on depends_on as reverse dependency index; a
+        dependent becomes claimable when its counter reaches zero. Runs in
+        the caller's transaction.
+        """
+        await db.execute(
+            update(TaskModel)
+            .where(
+                TaskModel.depends_on.has_key(task_id),
+                TaskModel.remaining_dependencies > 0,
+            )
+            .values(remaining_dependencies=TaskModel.remaining_dependencies - 1)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def _cascade_to_dependents(self, db: AsyncSession, task_id: str, reason: str) -> None:
+        """
+        Cancel all waiting tasks that (transitively) depend on task_id.
+
+        A single recursive UPDATE walks the dependency graph; tasks that are
+        already claimed or running are left to finish. Runs in the caller's
+        transaction.
+        """
+        now = self._utc_now_naive()
+        dependent = aliased(TaskModel)
+
+        blocked = (
+            select(TaskModel.task_id)
+            .where(
+                TaskModel.depends_on.has_key(task_id),
+                TaskModel.status.in_(self.WAITING_STATUSES),
+            )
+            .cte("blocked", recursive=True)
+        )
+        blocked = blocked.union(
+            select(dependent.task_id).where(
+                dependent.depends_on.has_key(blocked.c.task_id),
+                dependent.status.in_(self.WAITING_STATUSES),
+            )
+        )
+
+        await db.execute(
+            update(TaskModel)
+            .where(TaskModel.task_id.in_(select(blocked.c.task_id)))
+            .values(
+                status=TaskStatus.CANCELLED,
+                completed_at=now,
+                updated_at=now,
+                error_message=f"Dependency {task_id} {reason}",
+                error_details={"cascade_from": task_id, "reason": f"dependency_{reason}"},
+            )
+            .execution_options(synchronize_session=False)
+        )
+        logger.info(f"⛓️ Cancelled waiting dependents of {task_id} (dependency {reason})")
+
     # ========================================================================
     # Task Creation
     # ========================================================================
@@ -276,6 +392,25 @@ class TaskQueueService:
         initial_status = TaskStatus.PENDING
         if task_data.scheduled_at and task_data.scheduled_at > self._utc_now_naive():
             initial_status = TaskStatus.SCHEDULED
+
+        # Count unfinished dependencies once; completions decrement the counter.
+        # FOR SHARE holds the dependency rows until this task is committed, so
+        # a dependency completing (or failing) concurrently waits for us and
+        # its _release_dependents/_cascade_to_dependents then sees this task.
+        remaining_dependencies = 0
+        dead_dependency = None
+        if task_data.depends_on:
+            deps_result = await db.execute(
+                select(TaskModel.task_id, TaskModel.status)
+                .where(TaskModel.task_id.in_(task_data.depends_on))
+                .order_by(TaskModel.task_id)
+                .with_for_update(read=True)
+            )
+            for dep_id, dep_status in deps_result.all():
+                if dep_status in self.DEAD_STATUSES:
+                    dead_dependency = dep_id
+                elif dep_status != TaskStatus.COMPLETED:
+                    remaining_dependencies += 1
         
         task = TaskModel(
             task_id=task_id,
@@ -297,9 +432,17 @@ class TaskQueueService:
             max_retries=task_data.max_retries,
             retry_delay_seconds=task_data.retry_delay_seconds,
             depends_on=task_data.depends_on,
+            remaining_dependencies=remaining_dependencies,
             created_by=created_by,
             created_by_type=created_by_type,
         )
+
+        if dead_dependency is not None:
+            # A dependency can no longer complete: cancel up front
+            task.status = TaskStatus.CANCELLED
+            task.completed_at = self._utc_now_naive()
+            task.error_message = f"Dependency {dead_dependency} did not complete"
+            task.error_details = {"cascade_from": dead_dependency, "reason": "dependency_failed"}
         
         db.add(task)
         await db.commit()
@@ -403,6 +546,9 @@ class TaskQueueService:
             )
         )
         
+        # Only tasks whose dependencies have all completed
+        query = query.where(TaskModel.remaining_dependencies == 0)
+
         # Filter by task types if specified
         if task_types:
             query = query.where(TaskModel.task_type.in_(task_types))
@@ -421,19 +567,6 @@ class TaskQueueService:
         if not task:
             return None
         
-        # Check dependencies
-        if task.depends_on:
-            # Check if all dependencies are completed
-            deps_result = await db.execute(
-                select(TaskModel.status).where(TaskModel.task_id.in_(task.depends_on))
-            )
-            dep_statuses = {row[0] for row in deps_result.all()}
-            
-            # If any dependency is not completed, skip this task
-            if dep_statuses and dep_statuses != {TaskStatus.COMPLETED}:
-                logger.debug(f"Task {task.task_id} has incomplete dependencies, skipping")
-                return None
-
         required_worker = None
         if isinstance(task.config, dict):
             required_worker = task.config.get("required_worker")
@@ -458,6 +591,8 @@ class TaskQueueService:
         
         await db.commit()
         await db.refresh(task)
+
+        self.stats.record_claim(*self._stats_key(task), task.wait_time_ms)
         
         logger.info(f"🔒 Task {task.task_id} claimed by {agent_id}")
         await self._publish_event("task.claimed", task.task_id, {
@@ -467,6 +602,113 @@ class TaskQueueService:
         
         return task
     
+    @classmethod
+    def _required_worker_filter(cls, agent_id: str):
+        """SQL equivalent of _agent_matches_required_worker over TaskModel.config."""
+        required = func.lower(func.trim(TaskModel.config["required_worker"].astext))
+        normalized_agent = (agent_id or "").strip().lower()
+        eligible_lanes = [
+            lane for lane in cls.WORKER_LANES
+            if cls._agent_matches_required_worker(agent_id, lane)
+        ]
+
+        conditions = [
+            required.is_(None),
+            required == "",
+            # Generic lanes: required worker is a substring of the agent id
+            and_(
+                required.notin_(cls.WORKER_LANES),
+                func.strpos(literal(normalized_agent), required) > 0,
+            ),
+        ]
+        if eligible_lanes:
+            conditions.append(required.in_(eligible_lanes))
+        return or_(*conditions)
+
+    async def claim_tasks(
+        self,
+        db: AsyncSession,
+        agent_id: str,
+        task_types: Optional[List[str]] = None,
+        min_priority: Optional[int] = None,
+        limit: int = 1,
+    ) -> List[TaskModel]:
+        """
+        Atomically claim up to `limit` eligible tasks.
+
+        Dependency readiness (remaining_dependencies == 0) and
+        required-worker eligibility are evaluated in the query, so
+        ineligible tasks never block the ones behind them, and
+        rows are locked with FOR UPDATE SKIP LOCKED so concurrent workers
+        claim disjoint tasks instead of racing on the queue head.
+
+        Args:
+            db: Database session
+            agent_id: ID of agent claiming the tasks
+            task_types: Optional filter for specific task types
+            min_priority: Optional minimum priority threshold
+            limit: Maximum number of tasks to claim
+
+        Returns:
+            Claimed tasks in priority order (empty if none available)
+        """
+        now = self._utc_now_naive()
+
+        query = select(TaskModel).where(
+            or_(
+                and_(
+                    TaskModel.status == TaskStatus.PENDING,
+                    TaskModel.scheduled_at.is_(None)
+                ),
+                and_(
+                    TaskModel.status == TaskStatus.SCHEDULED,
+                    TaskModel.scheduled_at <= now
+                )
+            ),
+            TaskModel.remaining_dependencies == 0,
+            self._required_worker_filter(agent_id),
+        )
+
+        if task_types:
+            query = query.where(TaskModel.task_type.in_(task_types))
+        if min_priority is not None:
+            query = query.where(TaskModel.priority >= min_priority)
+
+        query = (
+            query.order_by(desc(TaskModel.priority), asc(TaskModel.created_at))
+            .limit(max(1, limit))
+            .with_for_update(skip_locked=True, of=TaskModel)
+        )
+
+        result = await db.execute(query)
+        tasks = list(result.scalars().all())
+
+        if not tasks:
+            return []
+
+        for task in tasks:
+            task.status = TaskStatus.CLAIMED
+            task.claimed_by = agent_id
+            task.claimed_at = now
+            task.updated_at = now
+            if task.created_at:
+                task.wait_time_ms = (now - task.created_at).total_seconds() * 1000
+
+        # Single commit releases the row locks for the whole batch
+        await db.commit()
+
+        for task in tasks:
+            self.stats.record_claim(*self._stats_key(task), task.wait_time_ms)
+
+        logger.info(f"🔒 {len(tasks)} task(s) claimed by {agent_id}")
+        for task in tasks:
+            await self._publish_event("task.claimed", task.task_id, {
+                "agent_id": agent_id,
+                "priority": task.priority
+            })
+
+        return tasks
+    
     async def start_task(
         self,
         db: AsyncSession,
@@ -547,6 +789,7 @@ class TaskQueueService:
             raise ValueError(f"Task {task_id} was claimed by {task.claimed_by}, not {agent_id}")
         
         now = self._utc_now_naive()
+        already_completed = task.status == TaskStatus.COMPLETED
         task.status = TaskStatus.COMPLETED
         task.completed_at = now
         task.result = complete_data.result
@@ -555,6 +798,9 @@ class TaskQueueService:
             task.execution_time_ms = complete_data.execution_time_ms
         elif task.started_at:
             task.execution_time_ms = (now - task.started_at).total_seconds() * 1000
+
+        if not already_completed:
+            await self._release_dependents(db, task_id)
         
         if task.skill_run_id:
             await self._finalize_linked_skill_run(
@@ -567,6 +813,9 @@ class TaskQueueService:
             await db.commit()
 
         await db.refresh(task)
+
+        if not already_completed:
+            self.stats.record_completion(*self._stats_key(task), task.execution_time_ms)
         
         logger.info(f"✅ Task {task_id} completed by {agent_id}")
         await self._publish_event("task.completed", task_id, {
@@ -644,6 +893,8 @@ class TaskQueueService:
             
             await db.commit()
             await db.refresh(task)
+
+            self.stats.record_failure(*self._stats_key(task), retrying=True)
             
             logger.warning(f"🔄 Task {task_id} failed, retrying ({task.retry_count}/{task.max_retries})")
             await self._publish_event("task.retrying", task_id, {
@@ -660,6 +911,8 @@ class TaskQueueService:
             
             if task.started_at:
                 task.execution_time_ms = (task.completed_at - task.started_at).total_seconds() * 1000
+
+            await self._cascade_to_dependents(db, task_id, "failed")
             
             if task.skill_run_id:
                 await self._finalize_linked_skill_run(
@@ -673,6 +926,8 @@ class TaskQueueService:
             else:
                 await db.commit()
             await db.refresh(task)
+
+            self.stats.record_failure(*self._stats_key(task), getattr(task, "execution_time_ms", None))
             
             logger.error(f"❌ Task {task_id} failed permanently after {task.retry_count} retries")
             await self._publish_event("task.failed", task_id, {
@@ -713,15 +968,18 @@ class TaskQueueService:
         if task.status not in (TaskStatus.PENDING, TaskStatus.SCHEDULED, TaskStatus.CLAIMED):
             raise ValueError(f"Cannot cancel task in {task.status.value} state")
         
+        previous_status = task.status
         task.status = TaskStatus.CANCELLED
         task.completed_at = self._utc_now_naive()
+
+        await self._cascade_to_dependents(db, task_id, "cancelled")
         
         await db.commit()
         
         logger.info(f"🚫 Task {task_id} cancelled by {cancelled_by}")
         await self._publish_event("task.cancelled", task_id, {
             "cancelled_by": cancelled_by,
-            "previous_status": task.status.value
+            "previous_status": previous_status.value
         })
         
         return True
@@ -788,70 +1046,84 @@ class TaskQueueService:
         await db.commit()
         return True
     
+    async def _cached_aggregate(self, name: str, loader) -> Any:
+        """Return a DB aggregate, re-running loader at most every stats_refresh_seconds."""
+        now = time.monotonic()
+        cached = self._aggregate_cache.get(name)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        value = await loader()
+        self._aggregate_cache[name] = (now + self.stats_refresh_seconds, value)
+        return value
+
+    async def _status_counts(self, db: AsyncSession) -> Dict[str, int]:
+        async def _load() -> Dict[str, int]:
+            result = await db.execute(
+                select(TaskModel.status, func.count(TaskModel.id))
+                .group_by(TaskModel.status)
+            )
+            return {row[0].value: row[1] for row in result.all()}
+
+        return await self._cached_aggregate("status_counts", _load)
+
+    async def _queued_by_priority(self, db: AsyncSession) -> Dict[int, tuple]:
+        """priority -> (queued count, oldest created_at) for pending/scheduled tasks."""
+        async def _load() -> Dict[int, tuple]:
+            result = await db.execute(
+                select(TaskModel.priority, func.count(TaskModel.id), func.min(TaskModel.created_at))
+                .where(TaskModel.status.in_([TaskStatus.PENDING, TaskStatus.SCHEDULED]))
+                .group_by(TaskModel.priority)
+            )
+            return {row[0]: (row[1], row[2]) for row in result.all()}
+
+        return await self._cached_aggregate("queued_by_priority", _load)
+
+    def _estimate_wait(self, queued: Dict[int, tuple], priority: int) -> Optional[int]:
+        """ETA for a new task: tasks at the same or higher priority / claim rate."""
+        tasks_ahead = sum(count for p, (count, _) in queued.items() if p >= priority)
+        eta = self.stats.estimate_wait_seconds(tasks_ahead)
+        return None if eta is None else int(round(eta))
+    
     async def get_stats(self, db: AsyncSession) -> TaskStats:
-        """Get task statistics"""
-        # Count by status
-        result = await db.execute(
-            select(TaskModel.status, func.count(TaskModel.id))
-            .group_by(TaskModel.status)
-        )
-        status_counts = {row[0].value: row[1] for row in result.all()}
-        
-        # Total counts
-        result = await db.execute(select(func.count(TaskModel.id)))
-        total = result.scalar() or 0
-        
-        # Execution times
-        result = await db.execute(
-            select(
-                func.avg(TaskModel.execution_time_ms),
-                func.avg(TaskModel.wait_time_ms)
-            ).where(TaskModel.status == TaskStatus.COMPLETED)
-        )
-        avg_times = result.one()
+        """
+        Get task statistics.
+
+        Status counts come from a cached aggregate (refreshed at most every
+        stats_refresh_seconds); times and throughput come from the rolling
+        in-process window.
+        """
+        status_counts = await self._status_counts(db)
+        rolling = self.stats.get_snapshot()
         
         return TaskStats(
-            total_tasks=total,
+            total_tasks=sum(status_counts.values()),
             pending_count=status_counts.get("pending", 0),
             running_count=status_counts.get("running", 0),
             completed_count=status_counts.get("completed", 0),
             failed_count=status_counts.get("failed", 0),
-            avg_execution_time_ms=avg_times[0],
-            avg_wait_time_ms=avg_times[1],
-            throughput_per_minute=None  # TODO: Calculate from recent completions
+            avg_execution_time_ms=rolling["avg_execution_time_ms"],
+            avg_wait_time_ms=rolling["avg_wait_time_ms"],
+            throughput_per_minute=rolling["throughput_per_minute"],
+            wait_time_percentiles_ms=rolling["wait_time_percentiles_ms"],
+            execution_time_percentiles_ms=rolling["execution_time_percentiles_ms"],
+            window_seconds=rolling["window_seconds"],
         )
     
     async def get_queue_stats(self, db: AsyncSession) -> QueueStats:
-        """Get queue statistics"""
-        # Pending/scheduled count
-        result = await db.execute(
-            select(func.count(TaskModel.id)).where(
-                TaskModel.status.in_([TaskStatus.PENDING, TaskStatus.SCHEDULED])
-            )
-        )
-        queue_length = result.scalar() or 0
-        
-        # By priority
-        result = await db.execute(
-            select(TaskModel.priority, func.count(TaskModel.id))
-            .where(TaskModel.status.in_([TaskStatus.PENDING, TaskStatus.SCHEDULED]))
-            .group_by(TaskModel.priority)
-        )
-        by_priority = {row[0]: row[1] for row in result.all()}
-        
-        # Oldest pending
-        result = await db.execute(
-            select(TaskModel.created_at).where(
-                TaskModel.status.in_([TaskStatus.PENDING, TaskStatus.SCHEDULED])
-            ).order_by(asc(TaskModel.created_at)).limit(1)
-        )
-        oldest = result.scalar_one_or_none()
+        """Get queue statistics with per-priority wait estimates"""
+        queued = await self._queued_by_priority(db)
+        oldest = min((created for _, created in queued.values() if created), default=None)
         
         return QueueStats(
-            queue_length=queue_length,
-            by_priority=by_priority,
+            queue_length=sum(count for count, _ in queued.values()),
+            by_priority={priority: count for priority, (count, _) in queued.items()},
             oldest_pending=oldest,
-            estimated_wait_seconds=None  # TODO: Calculate based on worker throughput
+            estimated_wait_seconds=self._estimate_wait(queued, TaskPriority.NORMAL.value),
+            estimated_wait_seconds_by_priority={
+                level.value: self._estimate_wait(queued, level.value)
+                for level in TaskPriority
+            },
         )
     
     # ========================================================================
@@ -0,0 +1,255 @@
+"""
+Task Queue System - Rolling Statistics
+
+In-process sliding-window statistics fed by claim/complete/fail events:
+- Counters per (task_type, priority) in fixed time buckets
+- Log-bucketed latency histograms for wait and execution times
+- Queue-wait ETA from the observed claim rate
+
+Reads aggregate at most `window_seconds / bucket_seconds` buckets, so their
+cost is independent of the size of the tasks table.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
+
+PERCENTILES: Tuple[Tuple[str, float], ...] = (("p50", 0.50), ("p95", 0.95), ("p99", 0.99))
+
+StatsKey = Tuple[str, int]  # (task_type, priority)
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram.
+
+    Bin i covers (GROWTH^(i-1), GROWTH^i] milliseconds, giving ~10%
+    relative error from 1 ms up to ~1 day with a fixed number of bins.
+    """
+
+    GROWTH = 1.1
+    MAX_MS = 24 * 60 * 60 * 1000.0
+    BINS = int(math.ceil(math.log(MAX_MS) / math.log(GROWTH))) + 1
+
+    __slots__ = ("counts", "count", "total_ms")
+
+    def __init__(self):
+        self.counts: List[int] = [0] * self.BINS
+        self.count = 0
+        self.total_ms = 0.0
+
+    def add(self, value_ms: float) -> None:
+        """Record one latency sample (milliseconds)."""
+        value_ms = max(0.0, float(value_ms))
+        if value_ms <= 1.0:
+            index = 0
+        else:
+            index = min(int(math.ceil(math.log(value_ms) / math.log(self.GROWTH))), self.BINS - 1)
+        self.counts[index] += 1
+        self.count += 1
+        self.total_ms += value_ms
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's samples to this one."""
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.count += other.count
+        self.total_ms += other.total_ms
+
+    def mean(self) -> Optional[float]:
+        return self.total_ms / self.count if self.count else None
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Upper bound of the bin containing the q-quantile (0 < q <= 1)."""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(q * self.count))
+        cumulative = 0
+        for index, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return 1.0 if index == 0 else self.GROWTH ** index
+        return self.MAX_MS
+
+    def percentiles(self) -> Dict[str, Optional[float]]:
+        return {name: self.percentile(q) for name, q in PERCENTILES}
+
+
+@dataclass
+class _Counters:
+    """Per-key counters of one time bucket."""
+
+    claimed: int = 0
+    completed: int = 0
+    failed: int = 0
+    retried: int = 0
+    wait: LatencyHistogram = field(default_factory=LatencyHistogram)
+    execution: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def merge(self, other: "_Counters") -> None:
+        self.claimed += other.claimed
+        self.completed += other.completed
+        self.failed += other.failed
+        self.retried += other.retried
+        self.wait.merge(other.wait)
+        self.execution.merge(other.execution)
+
+
+class TaskQueueStatsEngine:
+    """
+    Sliding-window task queue statistics.
+
+    Events are added to the current time bucket; buckets older than the
+    window are dropped as new ones are opened.
+
+    Example:
+        >>> engine = TaskQueueStatsEngine(window_seconds=600)
+        >>> engine.record_claim("generic", 50, wait_time_ms=120.0)
+        >>> engine.record_completion("generic", 50, execution_time_ms=900.0)
+        >>> engine.throughput_per_minute()
+    """
+
+    def __init__(
+        self,
+        window_seconds: int = 600,
+        bucket_seconds: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize TaskQueueStatsEngine.
+
+        Args:
+            window_seconds: Length of the sliding window
+            bucket_seconds: Granularity of the window
+            clock: Monotonic time source (seconds)
+        """
+        self.bucket_seconds = max(1, bucket_seconds)
+        self.window_seconds = max(self.bucket_seconds, window_seconds)
+        self._max_buckets = self.window_seconds // self.bucket_seconds
+        self._clock = clock
+        self._started = clock()
+        self._buckets: Deque[Tuple[int, Dict[StatsKey, _Counters]]] = deque()
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def _counters(self, task_type: str, priority: int) -> _Counters:
+        bucket_index = int(self._clock() // self.bucket_seconds)
+        if not self._buckets or self._buckets[-1][0] != bucket_index:
+            self._buckets.append((bucket_index, {}))
+            self._evict(bucket_index)
+        bucket = self._buckets[-1][1]
+        key = (task_type, priority)
+        counters = bucket.get(key)
+        if counters is None:
+            counters = bucket[key] = _Counters()
+        return counters
+
+    def record_claim(self, task_type: str, priority: int, wait_time_ms: Optional[float]) -> None:
+        counters = self._counters(task_type, priority)
+        counters.claimed += 1
+        if wait_time_ms is not None:
+            counters.wait.add(wait_time_ms)
+
+    def record_completion(self, task_type: str, priority: int, execution_time_ms: Optional[float]) -> None:
+        counters = self._counters(task_type, priority)
+        counters.completed += 1
+        if execution_time_ms is not None:
+            counters.execution.add(execution_time_ms)
+
+    def record_failure(
+        self,
+        task_type: str,
+        priority: int,
+        execution_time_ms: Optional[float] = None,
+        retrying: bool = False,
+    ) -> None:
+        counters = self._counters(task_type, priority)
+        if retrying:
+            counters.retried += 1
+        else:
+            counters.failed += 1
+        if execution_time_ms is not None:
+            counters.execution.add(execution_time_ms)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _evict(self, current_index: int) -> None:
+        oldest_allowed = current_index - self._max_buckets + 1
+        while self._buckets and self._buckets[0][0] < oldest_allowed:
+            self._buckets.popleft()
+
+    def _window(self) -> Iterable[Dict[StatsKey, _Counters]]:
+        self._evict(int(self._clock() // self.bucket_seconds))
+        return [bucket for _, bucket in self._buckets]
+
+    def _elapsed_seconds(self) -> float:
+        """Observed part of the window (shorter right after startup)."""
+        return max(float(self.bucket_seconds), min(float(self.window_seconds), self._clock() - self._started))
+
+    def aggregate(
+        self,
+        task_type: Optional[str] = None,
+        min_priority: Optional[int] = None,
+    ) -> _Counters:
+        """Sum counters over the window, optionally filtered."""
+        total = _Counters()
+        for bucket in self._window():
+            for (key_type, key_priority), counters in bucket.items():
+                if task_type is not None and key_type != task_type:
+                    continue
+                if min_priority is not None and key_priority < min_priority:
+                    continue
+                total.merge(counters)
+        return total
+
+    def throughput_per_minute(self) -> float:
+        """Completed tasks per minute over the window."""
+        return self.aggregate().completed * 60.0 / self._elapsed_seconds()
+
+    def claim_rate_per_second(self) -> float:
+        """Claimed tasks per second over the window (the queue's drain rate)."""
+        return self.aggregate().claimed / self._elapsed_seconds()
+
+    def estimate_wait_seconds(self, tasks_ahead: int) -> Optional[float]:
+        """
+        Expected queue wait for a task with `tasks_ahead` tasks in front of it.
+
+        Returns:
+            Seconds, 0 for an empty queue, None if no claims were observed
+        """
+        if tasks_ahead <= 0:
+            return 0.0
+        rate = self.claim_rate_per_second()
+        if rate <= 0:
+            return None
+        return tasks_ahead / rate
+
+    def get_snapshot(self) -> Dict[str, object]:
+        """Window totals, throughput and latency percentiles."""
+        total = self.aggregate()
+        return {
+            "window_seconds": self.window_seconds,
+            "claimed": total.claimed,
+            "completed": total.completed,
+            "failed": total.failed,
+            "retried": total.retried,
+            "throughput_per_minute": total.completed * 60.0 / self._elapsed_seconds(),
+            "avg_wait_time_ms": total.wait.mean(),
+            "avg_execution_time_ms": total.execution.mean(),
+            "wait_time_percentiles_ms": total.wait.percentiles(),
+            "execution_time_percentiles_ms": total.execution.percentiles(),
+        }
+
+    def reset(self) -> None:
+        """Drop all recorded samples."""
+        self._buckets.clear()
+        self._started = self._clock()
@@ -3,17 +3,24 @@ Auto-scaling background worker for cluster system.
 
 This worker periodically checks all active clusters for scaling needs
 and triggers scaling operations based on configured metrics.
+
+The recent metrics of all clusters are loaded in one query per tick and
+fed to the scaling policy (app.modules.cluster_system.scaling).
 """
 import asyncio
 import logging
 from datetime import datetime
-from typing import List
+from typing import Any, Dict
 
 from app.modules.cluster_system.service import ClusterService
 from app.modules.cluster_system.models import Cluster, ClusterStatus
-from sqlalchemy.ext.asyncio import AsyncSession
+from app.modules.cluster_system.scaling import in_cooldown, plan_scaling
+from app.modules.cluster_system.schemas import ClusterScale
 from app.core.db import get_session
 
+# Metrics rows per cluster the policy looks at (newest first)
+METRICS_WINDOW = 10
+
 logger = logging.getLogger(__name__)
 
 
@@ -70,20 +77,35 @@ class AutoscalerWorker:
                 
                 if clusters:
                     logger.debug(f"🔍 Checking {len(clusters)} active clusters for scaling needs")
-                
-                for cluster in clusters:
+
+                now = datetime.utcnow()
+                candidates = [cluster for cluster in clusters if not in_cooldown(cluster, now)]
+                recent_metrics = await self.service.get_recent_metrics(
+                    [cluster.id for cluster in candidates], limit=METRICS_WINDOW
+                )
+                scaling_configs: Dict[str, Dict[str, Any]] = {}
+
+                for cluster in candidates:
                     try:
-                        new_target = await self.service.check_scaling_needed(cluster.id)
-                        
-                        if new_target and new_target != cluster.current_workers:
-                            logger.info(f"🚀 Scaling cluster {cluster.id}: {cluster.current_workers} -> {new_target}")
-                            
-                            from app.modules.cluster_system.schemas import ClusterScale
+                        if cluster.blueprint_id not in scaling_configs:
+                            scaling_configs[cluster.blueprint_id] = self.service.get_scaling_config(cluster.blueprint_id)
+                        decision = plan_scaling(
+                            cluster, recent_metrics[cluster.id], scaling_configs[cluster.blueprint_id]
+                        )
+
+                        if decision and decision.target_workers != cluster.current_workers:
+                            logger.info(
+                                f"🚀 Scaling cluster {cluster.id}: {cluster.current_workers} -> "
+                                f"{decision.target_workers} ({decision.reason})"
+                            )
                             await self.service.scale_cluster(
-                                cluster.id, 
-                                ClusterScale(target_workers=new_target, reason="Auto-scaling triggered")
+                                cluster.id,
+                                ClusterScale(
+                                    target_workers=decision.target_workers,
+                                    reason=f"Auto-scaling triggered: {decision.reason}"
+                                )
                             )
-                    
+
                     except Exception as e:
                         logger.error(f"❌ Error scaling cluster {cluster.id}: {e}", exc_info=True)
         except Exception as e:
@@ -0,0 +1,60 @@
+"""Background prober keeping the AXE Fusion provider resolution warm."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from app.core.db import get_session
+from app.modules.axe_fusion.service import get_axe_fusion_service
+
+logger = logging.getLogger(__name__)
+
+
+class AXEProviderProber:
+    """Periodically re-resolves the active AXE provider (health probes + binding lookup)."""
+
+    def __init__(self, interval_seconds: float = 10.0) -> None:
+        self.interval_seconds = interval_seconds
+        self.running = False
+
+    async def start(self) -> None:
+        self.running = True
+        logger.info("AXE provider prober started (interval=%ss)", self.interval_seconds)
+        while self.running:
+            try:
+                await self._run_cycle()
+            except Exception as exc:
+                logger.warning("AXE provider probe cycle failed: %s", exc)
+            await asyncio.sleep(self.interval_seconds)
+
+    async def _run_cycle(self) -> None:
+        service = get_axe_fusion_service()
+        if service.db is None:
+            stats = await service.refresh_provider_resolution()
+        else:
+            # Own session: the service's session belongs to a request
+            async with get_session() as db:
+                stats = await service.refresh_provider_resolution(db=db)
+        logger.debug("AXE provider resolution refreshed: %s", stats)
+
+    def stop(self) -> None:
+        self.running = False
+        logger.info("AXE provider prober stopped")
+
+
+_axe_provider_prober: AXEProviderProber | None = None
+
+
+async def start_axe_provider_prober(interval_seconds: float = 10.0) -> None:
+    global _axe_provider_prober
+    if _axe_provider_prober is None:
+        _axe_provider_prober = AXEProviderProber(interval_seconds=interval_seconds)
+        await _axe_provider_prober.start()
+
+
+def stop_axe_provider_prober() -> None:
+    global _axe_provider_prober
+    if _axe_provider_prober is not None:
+        _axe_provider_prober.stop()
+        _axe_provider_prober = None
@@ -3,18 +3,26 @@ Base Worker Class
 
 Provides common functionality for all worker types:
 - Redis queue connection
-- Task dequeuing
-- Concurrency control
+- Task dequeuing (reliable: BLMOVE into a per-worker processing list)
+- Concurrency control (up to `concurrency` tasks in flight)
+- Orphan recovery for tasks of crashed workers
 - Heartbeat
-- Graceful shutdown
+- Per-cluster task counters and durations (see utils.queue_stats)
+- Graceful shutdown (drains in-flight tasks)
 """
 
 import asyncio
 import redis.asyncio as redis
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Set
 from datetime import datetime
 from loguru import logger
 import json
+import time
+
+from .utils.queue_stats import record_task_finished
+
+HEARTBEAT_KEY = "brain:worker:{worker_id}:heartbeat"
+HEARTBEAT_TTL = 60
 
 
 class BaseWorker:
@@ -23,6 +31,14 @@ class BaseWorker:
 
     Subclasses must implement:
     - process_task(task: dict) -> dict
+
+    Each task runs as its own asyncio task; a new one is popped as soon as
+    a slot is free, so up to `concurrency` tasks are in flight.
+
+    With `reliable=True` a popped task is moved atomically into
+    `{queue_name}:processing:{worker_id}` and removed only after its result
+    is published. Tasks left there by a crashed worker (no heartbeat) are
+    pushed back to the head of the queue.
     """
 
     def __init__(
@@ -30,59 +46,97 @@ class BaseWorker:
         worker_id: str,
         concurrency: int = 2,
         redis_url: str = "redis://localhost:6379/0",
-        queue_name: str = "brain:tasks"
+        queue_name: str = "brain:tasks",
+        reliable: bool = True,
+        drain_timeout: float = 30.0,
+        block_timeout: float = 5.0
     ):
         self.worker_id = worker_id
         self.concurrency = concurrency
         self.redis_url = redis_url
         self.queue_name = queue_name
+        self.reliable = reliable
+        self.drain_timeout = drain_timeout
+        self.block_timeout = block_timeout
+        self.processing_list = f"{queue_name}:processing:{worker_id}"
 
         # State
         self.redis: Optional[redis.Redis] = None
         self.is_running = False
         self.tasks_processed = 0
         self.tasks_failed = 0
+        self.tasks_recovered = 0
 
         # Concurrency control
         self.semaphore = asyncio.Semaphore(concurrency)
+        self._inflight: Set[asyncio.Task] = set()
+        self._loops: Set[asyncio.Task] = set()
 
         logger.info(f"Initialized {self.__class__.__name__}: {worker_id}")
 
+    @property
+    def active_tasks(self) -> int:
+        return len(self._inflight)
+
     # ===== LIFECYCLE =====
 
     async def start(self):
-        """Start worker (blocking)"""
+        """Start worker (blocking until stop())"""
         logger.info(f"Starting worker {self.worker_id}...")
 
         # Connect to Redis
-        self.redis = redis.from_url(self.redis_url, decode_responses=True)
+        if self.redis is None:
+            self.redis = redis.from_url(self.redis_url, decode_responses=True)
         await self.redis.ping()
         logger.info("Redis connection established")
 
         self.is_running = True
 
+        # Announce ourselves before recovering, so peers don't requeue our list
+        await self._send_heartbeat()
+        if self.reliable:
+            await self._requeue_orphans(include_own=True)
+
         # Start background tasks
-        heartbeat_task = asyncio.create_task(self._heartbeat_loop())
-        process_task = asyncio.create_task(self._process_loop())
+        self._loops = {
+            asyncio.create_task(self._heartbeat_loop()),
+            asyncio.create_task(self._process_loop()),
+        }
 
         # Run until stopped
-        await asyncio.gather(heartbeat_task, process_task)
+        await asyncio.gather(*self._loops, return_exceptions=True)
 
     async def stop(self):
-        """Graceful shutdown"""
+        """Graceful shutdown: stop consuming, drain in-flight tasks"""
         logger.info(f"Stopping worker {self.worker_id}...")
         self.is_running = False
 
-        # Wait for current tasks to finish (max 30 seconds)
-        for i in range(30):
-            if self.semaphore._value == self.concurrency:
-                logger.info("All tasks completed")
-                break
-            logger.info(f"Waiting for {self.concurrency - self.semaphore._value} tasks to complete...")
-            await asyncio.sleep(1)
+        # Stop popping; a cancelled BLMOVE leaves its task in the processing list
+        for loop in self._loops:
+            loop.cancel()
+        await asyncio.gather(*self._loops, return_exceptions=True)
+
+        # Wait for current tasks to finish
+        if self._inflight:
+            logger.info(f"Waiting for {len(self._inflight)} tasks to complete...")
+            _, pending = await asyncio.wait(self._inflight, timeout=self.drain_timeout)
+            if pending:
+                logger.warning(
+                    f"{len(pending)} tasks still running after {self.drain_timeout}s - cancelling"
+                    + (" (they stay in the processing list)" if self.reliable else "")
+                )
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+        logger.info("All tasks completed")
 
         # Close Redis connection
         if self.redis:
+            try:
+                # Lets peers recover anything left in our processing list right away
+                await self.redis.delete(HEARTBEAT_KEY.format(worker_id=self.worker_id))
+            except Exception as e:
+                logger.warning(f"Failed to clear heartbeat: {e}")
             await self.redis.close()
 
         logger.info(f"Worker stopped. Processed: {self.tasks_processed}, Failed: {self.tasks_failed}")
@@ -90,25 +144,23 @@ class BaseWorker:
     # ===== TASK PROCESSING =====
 
     async def _process_loop(self):
-        """Main task processing loop"""
+        """Main task consumption loop"""
         logger.info(f"Worker {self.worker_id} ready to process tasks")
 
         while self.is_running:
+            # Only pop when a slot is free, so popped tasks start immediately
+            await self.semaphore.acquire()
+            dispatched = False
             try:
-                # Blocking pop with timeout (BLPOP)
-                result = await self.redis.blpop(self.queue_name, timeout=5)
-
-                if not result:
+                task_json = await self._pop_task()
+                if task_json is None:
                     # Timeout, no tasks in queue
                     continue
 
-                # Parse task
-                _, task_json = result
-                task = json.loads(task_json)
-
-                # Process with concurrency limit
-                async with self.semaphore:
-                    await self._handle_task(task)
+                task = asyncio.create_task(self._run_task(task_json))
+                self._inflight.add(task)
+                task.add_done_callback(self._inflight.discard)
+                dispatched = True
 
             except asyncio.CancelledError:
                 logger.info("Process loop cancelled")
@@ -118,6 +170,78 @@ class BaseWorker:
                 logger.error(f"Process loop error: {e}", exc_info=True)
                 await asyncio.sleep(1)  # Backoff
 
+            finally:
+                if not dispatched:
+                    self.semaphore.release()
+
+    async def _pop_task(self) -> Optional[str]:
+        """Blocking pop of the next raw task (None on timeout)"""
+        if self.reliable:
+            return await self.redis.blmove(
+                self.queue_name, self.processing_list, self.block_timeout, "LEFT", "LEFT"
+            )
+
+        result = await self.redis.blpop(self.queue_name, timeout=self.block_timeout)
+        return result[1] if result else None
+
+    async def _run_task(self, task_json: str):
+        """Process one popped task, then acknowledge it"""
+        try:
+            try:
+                task = json.loads(task_json)
+            except ValueError as e:
+                self.tasks_failed += 1
+                logger.error(f"Dropping malformed task: {e}")
+            else:
+                await self._handle_task(task)
+
+            await self._ack(task_json)
+
+        except Exception as e:
+            # Not acknowledged: a reliable worker re-runs it after a restart
+            logger.error(f"Task run error: {e}", exc_info=True)
+
+        finally:
+            self.semaphore.release()
+
+    async def _ack(self, task_json: str):
+        """Remove a finished task from the processing list"""
+        if not self.reliable:
+            return
+        try:
+            await self.redis.lrem(self.processing_list, 1, task_json)
+        except Exception as e:
+            # Left in the list, the task is re-run after the next restart
+            logger.error(f"Failed to acknowledge task: {e}")
+
+    async def _requeue_orphans(self, include_own: bool = False) -> int:
+        """
+        Push tasks from processing lists of dead workers (no heartbeat)
+        back to the head of the queue, oldest first.
+
+        include_own also recovers this worker's list - only valid at startup,
+        before any task of this incarnation was popped.
+        """
+        prefix = f"{self.queue_name}:processing:"
+        recovered = 0
+
+        async for key in self.redis.scan_iter(match=f"{prefix}*"):
+            owner = key[len(prefix):]
+            if owner == self.worker_id:
+                if not include_own:
+                    continue
+            elif await self.redis.exists(HEARTBEAT_KEY.format(worker_id=owner)):
+                continue
+
+            # Newest first to the head, so the oldest ends up in front
+            while await self.redis.lmove(key, self.queue_name, "LEFT", "LEFT") is not None:
+                recovered += 1
+
+        if recovered:
+            self.tasks_recovered += recovered
+            logger.warning(f"Requeued {recovered} orphaned tasks to {self.queue_name}")
+        return recovered
+
     async def _handle_task(self, task: Dict[str, Any]):
         """Handle single task with error handling"""
         task_id = task.get("id", "unknown")
@@ -125,12 +249,14 @@ class BaseWorker:
 
         logger.info(f"Processing task {task_id} (type: {task_type})")
 
+        started = time.perf_counter()
         try:
             # Call subclass implementation
             result = await self.process_task(task)
 
             self.tasks_processed += 1
             logger.info(f"Task {task_id} completed successfully")
+            await self._record_stats(task, started, success=True)
 
             # Publish success event
             await self._publish_result(task_id, result, success=True)
@@ -138,10 +264,19 @@ class BaseWorker:
         except Exception as e:
             self.tasks_failed += 1
             logger.error(f"Task {task_id} failed: {e}", exc_info=True)
+            await self._record_stats(task, started, success=False)
 
             # Publish failure event
             await self._publish_result(task_id, {"error": str(e)}, success=False)
 
+    async def _record_stats(self, task: Dict[str, Any], started: float, success: bool):
+        """Count the finished task for cluster metrics (best effort)"""
+        duration_ms = (time.perf_counter() - started) * 1000
+        try:
+            await record_task_finished(self.redis, self.queue_name, task, duration_ms, success)
+        except Exception as e:
+            logger.warning(f"Failed to record task stats: {e}")
+
     async def process_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process single task (MUST be implemented by subclass).
@@ -160,10 +295,12 @@ class BaseWorker:
     # ===== HEARTBEAT =====
 
     async def _heartbeat_loop(self):
-        """Send heartbeat to Redis every 30 seconds"""
+        """Send heartbeat to Redis every 30 seconds and recover orphaned tasks"""
         while self.is_running:
             try:
                 await self._send_heartbeat()
+                if self.reliable:
+                    await self._requeue_orphans()
                 await asyncio.sleep(30)
 
             except asyncio.CancelledError:
@@ -181,13 +318,14 @@ class BaseWorker:
             "timestamp": datetime.utcnow().isoformat(),
             "tasks_processed": self.tasks_processed,
             "tasks_failed": self.tasks_failed,
-            "active_tasks": self.concurrency - self.semaphore._value
+            "tasks_recovered": self.tasks_recovered,
+            "active_tasks": self.active_tasks
         }
 
         # Store with 60 second TTL
         await self.redis.setex(
-            f"brain:worker:{self.worker_id}:heartbeat",
-            60,
+            HEARTBEAT_KEY.format(worker_id=self.worker_id),
+            HEARTBEAT_TTL,
             json.dumps(heartbeat_data)
         )
 
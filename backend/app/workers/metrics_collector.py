@@ -3,28 +3,104 @@ Metrics collection background worker for cluster system.
 
 This worker periodically collects metrics for all active clusters
 and stores them in the cluster_metrics table for auto-scaling decisions.
+
+Each tick makes one pass for all clusters:
+- one query for active clusters, one for agent counts by status
+- one Redis snapshot of the cluster task queues (queued tasks and their
+  age, in-flight tasks, enqueued/finished counters and task durations)
+- rates and latencies from the counter deltas since the previous tick
+- one commit for all metrics rows
 """
 import asyncio
 import logging
-from datetime import datetime
-from typing import Dict, Any
+import os
+from typing import Dict, Any, List, Optional
 
 from app.modules.cluster_system.service import ClusterService
-from app.modules.cluster_system.models import Cluster, ClusterStatus, ClusterAgent
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from app.modules.cluster_system.models import Cluster, ClusterStatus
+from app.workers.utils.queue_stats import QueueSnapshot, collect_queue_snapshot
+from sqlalchemy import select
 from app.core.db import get_session
+from app.core.redis_client import get_redis
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_TASK_QUEUES = "brain:cluster_tasks"
+
+
+def derive_cluster_metrics(
+    cluster_id: str,
+    status_counts: Dict[str, int],
+    snapshot: QueueSnapshot,
+    previous: Optional[QueueSnapshot] = None
+) -> Dict[str, Any]:
+    """
+    Metrics row for one cluster from agent counts and queue snapshots.
+
+    Rates, average latency and error rate cover the interval since
+    `previous`; without it (first tick, counters reset) they stay 0 and
+    arrival_rate None.
+    """
+    stats = snapshot.cluster(cluster_id)
+
+    tasks_per_minute = 0.0
+    avg_response_time = 0.0
+    error_rate = 0.0
+    arrival_rate = None
+
+    if previous is not None:
+        before = previous.cluster(cluster_id)
+        elapsed_minutes = (snapshot.collected_at - previous.collected_at).total_seconds() / 60
+        finished = stats.finished_total - before.finished_total
+        enqueued = stats.enqueued_total - before.enqueued_total
+        failed = stats.failed_total - before.failed_total
+
+        if elapsed_minutes > 0 and finished >= 0 and enqueued >= 0:
+            tasks_per_minute = finished / elapsed_minutes
+            arrival_rate = enqueued / elapsed_minutes
+            if finished:
+                avg_response_time = (stats.duration_ms_total - before.duration_ms_total) / finished
+                error_rate = failed / finished * 100
+
+    queue_wait_time = 0.0
+    if stats.oldest_queued_at is not None:
+        queue_wait_time = max((snapshot.collected_at - stats.oldest_queued_at).total_seconds(), 0.0)
+
+    return {
+        "timestamp": snapshot.collected_at,
+        "tasks_per_minute": tasks_per_minute,
+        "arrival_rate": arrival_rate,
+        "avg_response_time": avg_response_time,
+        "error_rate": error_rate,
+        "active_agents": status_counts.get("active", 0),
+        "idle_agents": status_counts.get("idle", 0),
+        "busy_agents": status_counts.get("busy", 0),
+        "failed_agents": status_counts.get("failed", 0) + status_counts.get("spawn_failed", 0),
+        "queue_length": stats.queued,
+        "queue_wait_time": queue_wait_time,
+        "tasks_in_flight": stats.in_flight,
+    }
+
 
 class MetricsCollectorWorker:
     """Background worker that collects metrics for all active clusters."""
 
-    def __init__(self, collection_interval: int = 30):
+    def __init__(
+        self,
+        collection_interval: int = 30,
+        queue_names: Optional[List[str]] = None,
+        redis=None
+    ):
         self.collection_interval = collection_interval  # seconds
+        self.queue_names = queue_names or [
+            name.strip()
+            for name in os.getenv("CLUSTER_TASK_QUEUES", DEFAULT_TASK_QUEUES).split(",")
+            if name.strip()
+        ]
+        self.redis = redis
         self.running = False
         self.service = None
+        self._previous_snapshot: Optional[QueueSnapshot] = None
         self._schema_missing_logged = False
 
     async def start(self):
@@ -68,98 +144,43 @@ class MetricsCollectorWorker:
                         return
                     raise
 
-                if clusters:
-                    logger.debug(f"📊 Collecting metrics for {len(clusters)} active clusters")
+                if not clusters:
+                    return
+                logger.debug(f"📊 Collecting metrics for {len(clusters)} active clusters")
 
-                for cluster in clusters:
-                    try:
-                        metrics = await self._collect_cluster_metrics(db, cluster)
-                        await self.service.record_metrics(cluster.id, metrics)
-                        logger.debug(f"✅ Recorded metrics for cluster {cluster.id}")
-                    except Exception as e:
-                        logger.error(f"❌ Error collecting metrics for cluster {cluster.id}: {e}", exc_info=True)
+                snapshot = await self._queue_snapshot()
+                if snapshot is None:
+                    return
+
+                cluster_ids = [cluster.id for cluster in clusters]
+                agent_counts = await self.service.count_agents_by_status(cluster_ids)
+                metrics = {
+                    cluster_id: derive_cluster_metrics(
+                        cluster_id, agent_counts[cluster_id], snapshot, self._previous_snapshot
+                    )
+                    for cluster_id in cluster_ids
+                }
+                await self.service.record_metrics_batch(metrics)
+                self._previous_snapshot = snapshot
+
+                logger.debug(
+                    f"✅ Recorded metrics for {len(metrics)} clusters "
+                    f"({len(snapshot.live_workers)} live workers, {snapshot.active_tasks} active tasks)"
+                )
 
         except Exception as e:
             logger.error(f"❌ Error in metrics collection loop: {e}", exc_info=True)
 
-    async def _collect_cluster_metrics(self, db: AsyncSession, cluster: Cluster) -> Dict[str, Any]:
-        """
-        Collect current metrics for a cluster.
-
-        Metrics collected:
-        - CPU usage (simulated based on load)
-        - Memory usage (simulated)
-        - Task queue length (simulated)
-        - Agent counts by status
-        - Performance metrics
-        """
-        # Get agent counts by status
-        result = await db.execute(
-            select(
-                ClusterAgent.status,
-                func.count(ClusterAgent.id).label("count")
-            ).where(
-                ClusterAgent.cluster_id == cluster.id
-            ).group_by(ClusterAgent.status)
-        )
-
-        status_counts = {row.status: row.count for row in result}
-
-        active_agents = status_counts.get("active", 0)
-        idle_agents = status_counts.get("idle", 0)
-        busy_agents = status_counts.get("busy", 0)
-        failed_agents = status_counts.get("failed", 0) + status_counts.get("spawn_failed", 0)
-
-        # Calculate derived metrics
-        total_agents = active_agents + idle_agents + busy_agents
-
-        # Simulate load-based metrics (in production, these would come from real monitoring)
-        # For now, use cluster load_percentage if available
-        load = cluster.load_percentage or 0.0
-
-        # CPU usage: correlates with load (0-100%)
-        cpu_usage = min(load * 1.2, 100.0)
-
-        # Memory usage: assume ~70% baseline + load factor
-        memory_usage = min(70.0 + (load * 0.3), 100.0)
-
-        # Task queue length: simulated based on load
-        # High load = more tasks queued
-        if load > 80:
-            queue_length = int((load - 80) * 2)  # 0-40 tasks
-        elif load > 50:
-            queue_length = int((load - 50) / 5)  # 0-6 tasks
-        else:
-            queue_length = 0
-
-        # Queue wait time: increases with queue length
-        queue_wait_time = queue_length * 2.5 if queue_length > 0 else 0.0  # seconds
-
-        # Tasks per minute: estimate based on active agents and load
-        tasks_per_minute = active_agents * (load / 100.0) * 10 if active_agents > 0 else 0.0
-
-        # Average response time: increases with load
-        avg_response_time = 100 + (load * 5)  # 100-600ms
-
-        # Error rate: increases slightly with high load
-        error_rate = min(load / 20, 5.0) if load > 80 else 0.0  # 0-5%
-
-        metrics = {
-            "timestamp": datetime.utcnow(),
-            "cpu_usage": cpu_usage,
-            "memory_usage": memory_usage,
-            "tasks_per_minute": tasks_per_minute,
-            "avg_response_time": avg_response_time,
-            "error_rate": error_rate,
-            "active_agents": active_agents,
-            "idle_agents": idle_agents,
-            "busy_agents": busy_agents,
-            "failed_agents": failed_agents,
-            "queue_length": queue_length,
-            "queue_wait_time": queue_wait_time
-        }
-
-        return metrics
+    async def _queue_snapshot(self) -> Optional[QueueSnapshot]:
+        """Snapshot of the task queues; None (tick skipped) if Redis is unavailable"""
+        try:
+            if self.redis is None:
+                self.redis = await get_redis()
+            return await collect_queue_snapshot(self.redis, self.queue_names)
+        except Exception as e:
+            # Recording zeros would look like an idle cluster to the autoscaler
+            logger.warning(f"⚠️  Task queues unavailable, skipping metrics collection: {e}")
+            return None
 
     def stop(self):
         """Stop the metrics collection loop."""
@@ -4,6 +4,7 @@ Redis Queue Utilities
 Helper functions for task queue operations.
 """
 
+import asyncio
 import redis.asyncio as redis
 import json
 from typing import Dict, Any
@@ -11,6 +12,8 @@ from datetime import datetime
 import uuid
 from loguru import logger
 
+from .queue_stats import record_task_enqueued
+
 
 class TaskQueue:
     """
@@ -65,8 +68,11 @@ class TaskQueue:
             "created_at": datetime.utcnow().isoformat()
         }
 
-        # Push to queue (RPUSH = append to right)
-        await self.redis.rpush(queue_name, json.dumps(task))
+        # Push to queue (RPUSH = append to right), counted for cluster metrics
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.rpush(queue_name, json.dumps(task))
+        record_task_enqueued(pipe, queue_name, task)
+        await pipe.execute()
 
         logger.info(f"Task {task_id} ({task_type}) pushed to {queue_name}")
         return task_id
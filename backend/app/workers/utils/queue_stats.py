@@ -0,0 +1,172 @@
+"""
+Task Queue Statistics
+
+Per-cluster counters kept next to the Redis task queues, and a snapshot of
+queue state for the metrics collector:
+- producers count enqueued tasks, workers count finished tasks and their
+  durations (hash `brain:task_stats:{queue}`, fields `{cluster_id}:{counter}`)
+- queued tasks and their age come from the queue list itself
+- in-flight tasks from the processing lists of live workers, worker
+  liveness and active task counts from heartbeats
+"""
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from loguru import logger
+
+STATS_KEY = "brain:task_stats:{queue_name}"
+HEARTBEAT_PATTERN = "brain:worker:*:heartbeat"
+# Queued tasks inspected per queue and tick (oldest first)
+QUEUE_SCAN_LIMIT = 10_000
+
+
+def task_cluster_id(task: Dict[str, Any]) -> Optional[str]:
+    payload = task.get("payload")
+    return payload.get("cluster_id") if isinstance(payload, dict) else None
+
+
+def record_task_enqueued(pipe, queue_name: str, task: Dict[str, Any]) -> None:
+    """Count an enqueued task (on a pipeline shared with the RPUSH)"""
+    cluster_id = task_cluster_id(task)
+    if cluster_id:
+        pipe.hincrby(STATS_KEY.format(queue_name=queue_name), f"{cluster_id}:enqueued", 1)
+
+
+async def record_task_finished(
+    redis,
+    queue_name: str,
+    task: Dict[str, Any],
+    duration_ms: float,
+    success: bool
+) -> None:
+    """Count a finished task and its processing time"""
+    cluster_id = task_cluster_id(task)
+    if not cluster_id:
+        return
+
+    key = STATS_KEY.format(queue_name=queue_name)
+    pipe = redis.pipeline(transaction=False)
+    pipe.hincrby(key, f"{cluster_id}:{'completed' if success else 'failed'}", 1)
+    pipe.hincrbyfloat(key, f"{cluster_id}:duration_ms", duration_ms)
+    await pipe.execute()
+
+
+@dataclass
+class ClusterQueueStats:
+    """Queue state and cumulative task counters of one cluster"""
+
+    queued: int = 0
+    oldest_queued_at: Optional[datetime] = None
+    in_flight: int = 0
+    enqueued_total: int = 0
+    completed_total: int = 0
+    failed_total: int = 0
+    duration_ms_total: float = 0.0
+
+    @property
+    def finished_total(self) -> int:
+        return self.completed_total + self.failed_total
+
+
+@dataclass
+class QueueSnapshot:
+    collected_at: datetime
+    clusters: Dict[str, ClusterQueueStats] = field(default_factory=dict)
+    live_workers: List[str] = field(default_factory=list)
+    active_tasks: int = 0
+
+    def cluster(self, cluster_id: str) -> ClusterQueueStats:
+        return self.clusters.get(cluster_id) or ClusterQueueStats()
+
+
+def _parse_task(raw: str) -> Optional[Dict[str, Any]]:
+    try:
+        task = json.loads(raw)
+    except ValueError:
+        return None
+    return task if isinstance(task, dict) else None
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    if not isinstance(value, str):
+        return None
+    try:
+        timestamp = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    # Producers write naive UTC (datetime.utcnow())
+    return timestamp.replace(tzinfo=None)
+
+
+async def collect_queue_snapshot(
+    redis,
+    queue_names: Iterable[str],
+    scan_limit: int = QUEUE_SCAN_LIMIT
+) -> QueueSnapshot:
+    """Per-cluster queue depth/age, in-flight tasks and counters for all queues"""
+    queue_names = list(queue_names)
+    snapshot = QueueSnapshot(collected_at=datetime.utcnow())
+
+    # Heartbeats: which workers are alive and how busy they are
+    heartbeat_keys = [key async for key in redis.scan_iter(match=HEARTBEAT_PATTERN)]
+    for raw in (await redis.mget(heartbeat_keys)) if heartbeat_keys else []:
+        if not raw:
+            continue
+        heartbeat = _parse_task(raw) or {}
+        if heartbeat.get("worker_id"):
+            snapshot.live_workers.append(heartbeat["worker_id"])
+            snapshot.active_tasks += int(heartbeat.get("active_tasks") or 0)
+    live = set(snapshot.live_workers)
+
+    processing_lists: List[str] = []
+    for queue_name in queue_names:
+        prefix = f"{queue_name}:processing:"
+        async for key in redis.scan_iter(match=f"{prefix}*"):
+            # Lists of dead workers are requeued by the next heartbeat
+            if key[len(prefix):] in live:
+                processing_lists.append(key)
+
+    # One round trip for queues, counters and processing lists
+    pipe = redis.pipeline(transaction=False)
+    for queue_name in queue_names:
+        pipe.lrange(queue_name, 0, scan_limit - 1)
+        pipe.hgetall(STATS_KEY.format(queue_name=queue_name))
+    for key in processing_lists:
+        pipe.lrange(key, 0, -1)
+    results = await pipe.execute()
+
+    for index in range(len(queue_names)):
+        queued, counters = results[2 * index], results[2 * index + 1]
+
+        for raw in queued:
+            task = _parse_task(raw)
+            cluster_id = task_cluster_id(task) if task else None
+            if not cluster_id:
+                continue
+            stats = snapshot.clusters.setdefault(cluster_id, ClusterQueueStats())
+            stats.queued += 1
+            if stats.oldest_queued_at is None:
+                stats.oldest_queued_at = _parse_timestamp(task.get("created_at"))
+
+        for name, value in (counters or {}).items():
+            cluster_id, _, counter = name.rpartition(":")
+            stats = snapshot.clusters.setdefault(cluster_id, ClusterQueueStats())
+            try:
+                if counter == "duration_ms":
+                    stats.duration_ms_total += float(value)
+                elif counter in ("enqueued", "completed", "failed"):
+                    setattr(stats, f"{counter}_total", getattr(stats, f"{counter}_total") + int(value))
+            except ValueError:
+                logger.warning(f"Ignoring malformed task counter {name}={value!r}")
+
+    for in_flight in results[2 * len(queue_names):]:
+        for raw in in_flight:
+            task = _parse_task(raw)
+            cluster_id = task_cluster_id(task) if task else None
+            if cluster_id:
+                snapshot.clusters.setdefault(cluster_id, ClusterQueueStats()).in_flight += 1
+
+    return snapshot
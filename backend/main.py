@@ -47,6 +47,10 @@ from app.workers.axe_learning_scheduler import (
     start_axe_learning_scheduler,
     stop_axe_learning_scheduler,
 )
+from app.workers.axe_provider_prober import (
+    start_axe_provider_prober,
+    stop_axe_provider_prober,
+)
 
 # Event Stream (ADR-001: REQUIRED core infrastructure)
 try:
@@ -327,6 +331,15 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         )
         logger.info("✅ AXE learning scheduler started (interval: %ss)", interval_seconds)
 
+    # Start AXE provider prober (keeps the cached provider resolution fresh)
+    axe_provider_prober_task = None
+    if _feature_enabled("ENABLE_AXE_PROVIDER_PROBER", "true"):
+        probe_interval = float(os.getenv("AXE_PROVIDER_PROBE_INTERVAL_SECONDS", "10"))
+        axe_provider_prober_task = asyncio.create_task(
+            start_axe_provider_prober(interval_seconds=probe_interval)
+        )
+        logger.info("✅ AXE provider prober started (interval: %ss)", probe_interval)
+
     # Seed built-in skills (optional in local profiles)
     if _feature_enabled("ENABLE_BUILTIN_SKILL_SEED", "true"):
         try:
@@ -388,6 +401,24 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         stop_axe_learning_scheduler()
         logger.info("🛑 AXE learning scheduler stopped")
 
+    if axe_provider_prober_task:
+        stop_axe_provider_prober()
+        logger.info("🛑 AXE provider prober stopped")
+
+    try:
+        from app.modules.memory.service import shutdown_memory_service
+
+        await shutdown_memory_service()
+    except Exception as e:
+        logger.error(f"❌ Memory write buffer flush failed: {e}")
+
+    try:
+        from app.modules.llm_router.service import shutdown_llm_router
+
+        await shutdown_llm_router()
+    except Exception as e:
+        logger.error(f"❌ LLM router connection pool close failed: {e}")
+
     if redis:
         await redis.close()
     logger.info("🛑 BRAiN Core shutdown complete")
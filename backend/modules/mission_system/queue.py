@@ -7,6 +7,7 @@ Implements priority queues with support for delayed execution and agent affinity
 
 Key Features:
 - Priority-based task scheduling
+- Capability-sharded queues with atomic server-side dequeue
 - Agent assignment tracking
 - Dead letter queue for failed missions
 - Mission state persistence
@@ -14,7 +15,8 @@ Key Features:
 
 Architecture:
 - Redis Streams for reliable message delivery
-- Sorted sets for priority queuing
+- Sorted sets for priority queuing (one per required capability set)
+- Lua script for atomic pop + assignment
 - Hash maps for mission state storage
 - Pub/Sub for real-time notifications
 
@@ -65,6 +67,75 @@ except ImportError as e:
 logger = logging.getLogger(__name__)
 
 
+# Queue score = priority band + enqueue time, so equal priorities are FIFO.
+# Scores stay below 2**53 and are therefore exact as Redis doubles.
+PRIORITY_SCORE_SCALE = 10 ** 13
+
+# Pops the best mission across all shards whose required capabilities are a
+# subset of the agent's capabilities and records the assignment atomically.
+#
+# KEYS[1] shard registry (hash: shard key -> comma-joined capabilities)
+# KEYS[2] global pending queue, KEYS[3] mission state, KEYS[4] agent assignments
+# ARGV[1] agent id, ARGV[2..] agent capabilities
+#
+# Shard keys are read from the registry, so this requires a single Redis node
+# (or all keys in one hash slot).
+DEQUEUE_MISSION_LUA = """
+if redis.call('HEXISTS', KEYS[4], ARGV[1]) == 1 then
+  return false
+end
+
+local capabilities = {}
+for i = 2, #ARGV do
+  capabilities[ARGV[i]] = true
+end
+
+local eligible = {}
+local shards = redis.call('HGETALL', KEYS[1])
+for i = 1, #shards, 2 do
+  local qualifies = true
+  for skill in string.gmatch(shards[i + 1], '[^,]+') do
+    if not capabilities[skill] then
+      qualifies = false
+      break
+    end
+  end
+  if qualifies then
+    eligible[#eligible + 1] = shards[i]
+  end
+end
+
+while true do
+  local best_key, best_id, best_score = nil, nil, nil
+  for _, key in ipairs(eligible) do
+    local head = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+    if head[1] then
+      local score = tonumber(head[2])
+      if best_score == nil or score < best_score then
+        best_key, best_id, best_score = key, head[1], score
+      end
+    end
+  end
+  if best_key == nil then
+    return false
+  end
+
+  redis.call('ZREM', best_key, best_id)
+  redis.call('ZREM', KEYS[2], best_id)
+  if redis.call('ZCARD', best_key) == 0 then
+    redis.call('HDEL', KEYS[1], best_key)
+  end
+
+  local state = redis.call('HGET', KEYS[3], best_id)
+  if state then
+    redis.call('HSET', KEYS[4], ARGV[1], best_id)
+    return {best_id, state}
+  end
+  -- Orphaned queue entry without state: dropped above, try the next one
+end
+"""
+
+
 class MissionQueueManager:
     """
     Manages mission queues using Redis as the backend storage.
@@ -99,11 +170,15 @@ class MissionQueueManager:
         self.AGENT_ASSIGNMENTS = "brain:agents:assignments"
         self.DEAD_LETTER_QUEUE = "brain:missions:dlq"
         self.QUEUE_STATS = "brain:missions:stats"
+        self.QUEUE_SHARDS = "brain:missions:queue:shards"
+        self.QUEUE_SHARD_PREFIX = "brain:missions:queue:shard:"
 
         # Configuration
         self.MAX_RETRIES = 3
         self.VISIBILITY_TIMEOUT = 300  # 5 minutes
         self.DLQ_THRESHOLD = 5  # Move to DLQ after 5 failures
+
+        self._dequeue_script = None
         
     async def connect(self) -> None:
         """Establish connection to Redis and EventStream (ADR-001 compliant)"""
@@ -117,6 +192,8 @@ class MissionQueueManager:
             await self.redis_client.ping()
             logger.info("Successfully connected to Redis")
 
+            await self.rebuild_capability_shards(only_if_missing=True)
+
             # EventStream initialization (ADR-001)
             if self.eventstream_mode == "required":
                 # REQUIRED MODE: EventStream MUST initialize
@@ -178,19 +255,11 @@ class MissionQueueManager:
                 estimated_start=datetime.utcnow() + timedelta(seconds=30)
             )
             
-            # Store mission state
-            await self.redis_client.hset(
-                self.MISSION_STATE,
-                mission.id,
-                mission.json()
-            )
-            
-            # Add to priority queue (higher priority = lower score for Redis)
-            priority_score = 10 - mission.priority.value
-            await self.redis_client.zadd(
-                self.MISSION_QUEUE,
-                {mission.id: priority_score}
-            )
+            # Store mission state and add it to its capability shard
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                pipe.hset(self.MISSION_STATE, mission.id, mission.json())
+                self._queue_mission(pipe, mission, self._queue_score(mission))
+                await pipe.execute()
             
             # Publish to EventStream (ADR-001) or legacy MISSION_STREAM (degraded mode only)
             if self.event_stream is not None:
@@ -274,61 +343,57 @@ class MissionQueueManager:
             if not self.redis_client:
                 await self.connect()
             
-            # Get highest priority missions (lowest scores)
-            mission_candidates = await self.redis_client.zrange(
-                self.MISSION_QUEUE, 0, 9, withscores=True
+            if self._dequeue_script is None:
+                self._dequeue_script = self.redis_client.register_script(DEQUEUE_MISSION_LUA)
+
+            # Atomically pop the best qualifying mission and record the assignment
+            popped = await self._dequeue_script(
+                keys=[
+                    self.QUEUE_SHARDS,
+                    self.MISSION_QUEUE,
+                    self.MISSION_STATE,
+                    self.AGENT_ASSIGNMENTS,
+                ],
+                args=[agent_id, *agent_capabilities],
             )
+            if not popped:
+                return None
+
+            mission_id, mission_data = popped
+            try:
+                mission = Mission.parse_raw(mission_data)
+            except Exception as e:
+                logger.error(f"Failed to parse mission {mission_id}: {e}")
+                await self.redis_client.hdel(self.AGENT_ASSIGNMENTS, agent_id)
+                return None
+
+            # Update mission status
+            mission.status = MissionStatus.ASSIGNED
+            mission.assigned_agent_id = agent_id
+            mission.assigned_agents = [agent_id]
+            mission.updated_at = datetime.utcnow()
+
+            # Store updated mission state
+            await self.redis_client.hset(
+                self.MISSION_STATE,
+                mission.id,
+                mission.json()
+            )
+
+            # Update statistics
+            await self._update_queue_stats("assigned", mission.mission_type.value)
+
+            # Log assignment
+            await self._log_mission_event(
+                mission.id,
+                "INFO",
+                f"Mission assigned to agent {agent_id}"
+            )
+
+            logger.info(f"Mission {mission.id} assigned to agent {agent_id}")
+            return mission
             
-            for mission_id, priority_score in mission_candidates:
-                # Get full mission data
-                mission_data = await self.redis_client.hget(self.MISSION_STATE, mission_id)
-                if not mission_data:
-                    # Clean up orphaned queue entry
-                    await self.redis_client.zrem(self.MISSION_QUEUE, mission_id)
-                    continue
-                
-                try:
-                    mission = Mission.parse_raw(mission_data)
-                except Exception as e:
-                    logger.error(f"Failed to parse mission {mission_id}: {e}")
-                    continue
-                
-                # Check if agent meets requirements
-                if self._agent_matches_requirements(agent_capabilities, mission.agent_requirements):
-                    # Try to assign mission atomically
-                    assigned = await self._assign_mission_to_agent(mission.id, agent_id)
-                    if assigned:
-                        # Remove from queue
-                        await self.redis_client.zrem(self.MISSION_QUEUE, mission_id)
-                        
-                        # Update mission status
-                        mission.status = MissionStatus.ASSIGNED
-                        mission.assigned_agent_id = agent_id
-                        mission.assigned_agents = [agent_id]
-                        mission.updated_at = datetime.utcnow()
-                        
-                        # Store updated mission state
-                        await self.redis_client.hset(
-                            self.MISSION_STATE,
-                            mission.id,
-                            mission.json()
-                        )
-                        
-                        # Update statistics
-                        await self._update_queue_stats("assigned", mission.mission_type.value)
-                        
-                        # Log assignment
-                        await self._log_mission_event(
-                            mission.id,
-                            "INFO",
-                            f"Mission assigned to agent {agent_id}"
-                        )
-                        
-                        logger.info(f"Mission {mission.id} assigned to agent {agent_id}")
-                        return mission
-            
-            # No suitable missions found
-            return None
+
             
         except Exception as e:
             logger.error(f"Failed to dequeue mission for agent {agent_id}: {e}")
@@ -469,6 +534,7 @@ class MissionQueueManager:
             # Queue lengths
             pending_count = await self.redis_client.zcard(self.MISSION_QUEUE)
             dlq_count = await self.redis_client.zcard(self.DEAD_LETTER_QUEUE)
+            shard_count = await self.redis_client.hlen(self.QUEUE_SHARDS)
             
             # Active assignments
             active_assignments = await self.redis_client.hlen(self.AGENT_ASSIGNMENTS)
@@ -499,7 +565,8 @@ class MissionQueueManager:
                 "queue_lengths": {
                     "pending": pending_count,
                     "dead_letter": dlq_count,
-                    "stream": stream_length
+                    "stream": stream_length,
+                    "capability_shards": shard_count
                 },
                 "active_assignments": active_assignments,
                 "statistics": stats_data,
@@ -551,58 +618,89 @@ class MissionQueueManager:
             logger.error(f"Failed to get logs for mission {mission_id}: {e}")
             return []
     
-    def _agent_matches_requirements(
-        self, 
-        agent_capabilities: List[str], 
-        requirements: Any
-    ) -> bool:
+    @staticmethod
+    def _required_capabilities(mission: Mission) -> List[str]:
+        """Sorted, de-duplicated skills a mission requires."""
+        skills = getattr(mission.agent_requirements, "skills_required", None) or []
+        return sorted({skill for skill in skills if skill})
+
+    @staticmethod
+    def _queue_score(mission: Mission, ready_at: Optional[datetime] = None) -> float:
         """
-        Check if agent capabilities match mission requirements.
-        
+        Queue score: higher priority first, then earlier ready time.
+
         Args:
-            agent_capabilities: Agent's capabilities
-            requirements: Mission requirements
-            
+            mission: Mission to score
+            ready_at: When the mission becomes eligible (default: now)
+
         Returns:
-            True if agent is suitable
+            Sorted set score (lower is dequeued first)
         """
-        # Simple capability matching - can be enhanced with KARMA scoring
-        required_skills = getattr(requirements, 'skills_required', [])
-        
-        if not required_skills:
-            return True  # No specific requirements
-        
-        # Check if agent has all required skills
-        return all(skill in agent_capabilities for skill in required_skills)
-    
-    async def _assign_mission_to_agent(self, mission_id: str, agent_id: str) -> bool:
+        ready_at = ready_at or datetime.utcnow()
+        band = 10 - mission.priority.value
+        return float(band * PRIORITY_SCORE_SCALE + int(ready_at.timestamp() * 1000))
+
+    def _shard_key(self, capabilities: List[str]) -> str:
+        """Sorted set holding missions that require exactly `capabilities`."""
+        return self.QUEUE_SHARD_PREFIX + (",".join(capabilities) or "*")
+
+    def _queue_mission(self, pipe: Any, mission: Mission, score: float) -> None:
         """
-        Atomically assign mission to agent.
-        
+        Queue a mission in its capability shard and the global pending index.
+
+        Must run in the same MULTI as any other write for the mission, so
+        the shard registry never lags behind the shard itself.
+
         Args:
-            mission_id: Mission to assign
-            agent_id: Agent to assign to
-            
+            pipe: Transactional Redis pipeline
+            mission: Mission to queue
+            score: Queue score (see _queue_score)
+        """
+        capabilities = self._required_capabilities(mission)
+        shard_key = self._shard_key(capabilities)
+        pipe.hset(self.QUEUE_SHARDS, shard_key, ",".join(capabilities))
+        pipe.zadd(shard_key, {mission.id: score})
+        pipe.zadd(self.MISSION_QUEUE, {mission.id: score})
+
+    async def rebuild_capability_shards(self, only_if_missing: bool = False) -> int:
+        """
+        Rebuild capability shards from the global pending queue.
+
+        Used to migrate queues written before sharding.
+
+        Args:
+            only_if_missing: Skip if any shard already exists
+
         Returns:
-            True if successfully assigned
+            Number of missions placed into shards
         """
-        try:
-            # Use Redis transaction to ensure atomicity
-            async with self.redis_client.pipeline(transaction=True) as pipe:
-                # Check if agent is already assigned to another mission
-                current_assignment = await pipe.hget(self.AGENT_ASSIGNMENTS, agent_id)
-                if current_assignment:
-                    return False  # Agent is busy
-                
-                # Assign mission
-                await pipe.hset(self.AGENT_ASSIGNMENTS, agent_id, mission_id)
-                await pipe.execute()
-                
-                return True
-                
-        except Exception as e:
-            logger.error(f"Failed to assign mission {mission_id} to agent {agent_id}: {e}")
-            return False
+        if only_if_missing and await self.redis_client.exists(self.QUEUE_SHARDS):
+            return 0
+
+        pending = await self.redis_client.zrange(self.MISSION_QUEUE, 0, -1, withscores=True)
+        if not pending:
+            return 0
+
+        states = await self.redis_client.hmget(
+            self.MISSION_STATE, [mission_id for mission_id, _ in pending]
+        )
+        rebuilt = 0
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            for (mission_id, score), mission_data in zip(pending, states):
+                if not mission_data:
+                    pipe.zrem(self.MISSION_QUEUE, mission_id)
+                    continue
+                try:
+                    mission = Mission.parse_raw(mission_data)
+                except Exception as e:
+                    logger.error(f"Failed to parse mission {mission_id}: {e}")
+                    continue
+                self._queue_mission(pipe, mission, score)
+                rebuilt += 1
+            await pipe.execute()
+
+        logger.info(f"Rebuilt capability shards for {rebuilt} queued missions")
+        return rebuilt
     
     async def _handle_mission_failure(self, mission: Mission) -> None:
         """
@@ -629,15 +727,17 @@ class MissionQueueManager:
             )
             
         else:
-            # Re-queue for retry after delay
+            # Re-queue for retry after delay (orders behind missions of the
+            # same priority that become ready earlier)
             retry_delay = 60 * (2 ** failure_count)  # Exponential backoff
-            retry_score = datetime.utcnow().timestamp() + retry_delay
-            
-            await self.redis_client.zadd(
-                self.MISSION_QUEUE,
-                {mission.id: retry_score}
+            retry_score = self._queue_score(
+                mission, datetime.utcnow() + timedelta(seconds=retry_delay)
             )
             
+            async with self.redis_client.pipeline(transaction=True) as pipe:
+                self._queue_mission(pipe, mission, retry_score)
+                await pipe.execute()
+            
             await self._log_mission_event(
                 mission.id,
                 "WARNING",
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+AXE Sanitizer Benchmark - Per-Category vs. Single-Pass Sanitisation.
+
+Sanitises a synthetic conversation (emails, IPs, paths, secrets among
+filler text) at STRICT level and reports:
+- sequential: one regex pass per category (previous implementation)
+- single pass: DataSanitizer.sanitize_messages on a cold cache
+- next turn: the same history plus one new message (cached prefix)
+- restore: deanonymize_text over the last 50 sanitised messages
+
+Usage:
+    # Default: 10,000 and 100,000 tokens of history
+    python benchmark_axe_sanitizer.py
+
+    # Custom history sizes
+    python benchmark_axe_sanitizer.py --tokens 50000 500000
+
+Notes:
+    Token counts assume ~4 characters per token.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from app.modules.axe_fusion.data_sanitizer import DataSanitizer
+from app.modules.axe_fusion.provider_selector import SanitizationLevel
+
+CATEGORIES = ("email", "phone", "ip", "card", "path", "secret")
+FILLERS = ["Please review the deployment plan.", "The build failed again.", "Thanks, that works now!"]
+
+
+def conversation(turns: int, seed: int = 7) -> list:
+    """Chat history with sensitive values in every third and fifth turn."""
+    rng = random.Random(seed)
+    messages = []
+    for turn in range(turns):
+        parts = [rng.choice(FILLERS) for _ in range(rng.randint(1, 4))]
+        if turn % 3 == 0:
+            parts.append(f"Reach me at dev{turn}@example.com or on 10.0.{turn % 250}.{rng.randint(1, 250)}.")
+        if turn % 5 == 0:
+            parts.append(f"Logs are in /var/log/app{turn}/run.log, key api-{rng.getrandbits(64):x}.")
+        messages.append({"role": "user" if turn % 2 == 0 else "assistant", "content": " ".join(parts)})
+    return messages
+
+
+def sequential_sanitize(sanitizer: DataSanitizer, messages: list) -> list:
+    """One regex pass per category, as before the combined pattern."""
+    counters = {key: 0 for key in CATEGORIES}
+    sanitized = []
+    for message in messages:
+        content = message["content"]
+        for category in CATEGORIES:
+
+            def _replace(match, category=category):
+                counters[category] += 1
+                return f"[{category.upper()}_{counters[category]}]"
+
+            content = sanitizer._base_patterns[category].sub(_replace, content)
+        sanitized.append({**message, "content": content})
+    return sanitized
+
+
+def run(tokens: int) -> dict:
+    """Time every stage for one history size."""
+    messages = conversation(max(1, tokens * 4 // 80))
+    while sum(len(m["content"]) for m in messages) < tokens * 4:
+        messages = conversation(len(messages) * 2)
+    sanitizer = DataSanitizer()
+
+    started = time.perf_counter()
+    sequential_sanitize(sanitizer, messages)
+    sequential = time.perf_counter() - started
+
+    started = time.perf_counter()
+    sanitized, mapping = sanitizer.sanitize_messages(messages, SanitizationLevel.STRICT)
+    cold = time.perf_counter() - started
+
+    started = time.perf_counter()
+    sanitizer.sanitize_messages(messages + [{"role": "user", "content": "next turn"}], SanitizationLevel.STRICT)
+    warm = time.perf_counter() - started
+
+    response = "\n".join(m["content"] for m in sanitized[-50:])
+    started = time.perf_counter()
+    sanitizer.deanonymize_text(response, mapping)
+    restore = time.perf_counter() - started
+
+    return {
+        "messages": len(messages),
+        "placeholders": len(mapping.replacements),
+        "sequential": sequential,
+        "cold": cold,
+        "warm": warm,
+        "restore": restore,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark AXE data sanitisation")
+    parser.add_argument("--tokens", type=int, nargs="+", default=[10_000, 100_000], help="History sizes in tokens")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    print(
+        f"{'tokens':>10}{'messages':>10}{'placeholders':>14}"
+        f"{'sequential ms':>15}{'single ms':>11}{'next ms':>10}{'restore ms':>12}"
+    )
+    for tokens in args.tokens:
+        r = run(tokens)
+        print(
+            f"{tokens:>10,}{r['messages']:>10,}{r['placeholders']:>14,}"
+            f"{r['sequential'] * 1000:>15.1f}{r['cold'] * 1000:>11.1f}"
+            f"{r['warm'] * 1000:>10.1f}{r['restore'] * 1000:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
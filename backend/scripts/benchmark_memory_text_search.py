@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Memory Text Search Benchmark - In-Process MemoryTextIndex.
+
+Builds the in-process full-text index (used when the memory database is
+not PostgreSQL) over synthetic memories of 20 words from a 50,000 word
+vocabulary, then times two-word keyword searches scoped to one agent.
+
+Usage:
+    # Default: 100,000 memories
+    python benchmark_memory_text_search.py
+
+    # Larger indexes
+    python benchmark_memory_text_search.py --sizes 100000 1000000
+
+Notes:
+    Memories are spread over 100 agents; every search is scoped to one.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.modules.memory.text_index import MemoryTextIndex
+
+VOCABULARY = [f"term{i}" for i in range(50_000)]
+
+
+def run(size: int, queries: int) -> dict:
+    """Index build time and mean search latency for one index size."""
+    rng = random.Random(5)
+    rows = (
+        {
+            "memory_id": f"mem_{i}",
+            "content": " ".join(rng.choice(VOCABULARY) for _ in range(20)),
+            "agent_id": f"agent_{i % 100}",
+        }
+        for i in range(size)
+    )
+    started = time.perf_counter()
+    index = MemoryTextIndex.build(rows)
+    build = time.perf_counter() - started
+
+    samples = [" ".join(rng.sample(VOCABULARY, 2)) for _ in range(queries)]
+    started = time.perf_counter()
+    for query in samples:
+        index.search(query, limit=50, agent_id="agent_7")
+    search = (time.perf_counter() - started) / queries
+
+    return {"build": build, "search": search}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark in-process memory text search")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000], help="Indexed memories")
+    parser.add_argument("--queries", type=int, default=50, help="Searches per size")
+    args = parser.parse_args()
+
+    print(f"{'memories':>10}{'build s':>10}{'search ms':>12}")
+    for size in args.sizes:
+        r = run(size, args.queries)
+        print(f"{size:>10,}{r['build']:>10.1f}{r['search'] * 1000:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
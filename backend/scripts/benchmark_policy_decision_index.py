@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Policy Decision Benchmark - Linear Scan vs. Compiled Decision Index.
+
+Builds synthetic policy sets with namespaced action patterns (as real
+policy sets use) and times one decision per context:
+- linear scan: fnmatch every policy, sort all active rules per decision
+  (previous PolicyEngine evaluation)
+- indexed: PolicyDecisionIndex lookup with the decision LRU bypassed
+
+Usage:
+    # Default: 10, 1,000 and 10,000 policies
+    python benchmark_policy_decision_index.py
+
+    # Custom policy counts
+    python benchmark_policy_decision_index.py --sizes 100 50000
+
+Notes:
+    Conditions are pre-compiled for both strategies so only policy
+    selection and rule ordering are compared.
+"""
+
+import argparse
+import fnmatch
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from app.modules.policy.decision_index import CompiledCondition, PolicyDecisionIndex
+from app.modules.policy.schemas import (
+    Policy,
+    PolicyCondition,
+    PolicyConditionOperator,
+    PolicyEffect,
+    PolicyEvaluationContext,
+    PolicyRule,
+)
+
+ROLES = ["admin", "guest", "fleet_member"]
+
+
+def policies(size: int, rng: random.Random) -> list:
+    """One single-condition rule per policy, spread over 500 services."""
+    return [
+        Policy(
+            policy_id=f"p{i}",
+            name=f"p{i}",
+            rules=[
+                PolicyRule(
+                    rule_id=f"r{i}",
+                    name=f"r{i}",
+                    effect=PolicyEffect.ALLOW,
+                    priority=rng.randint(0, 100),
+                    conditions=[
+                        PolicyCondition(
+                            field="agent.role",
+                            operator=PolicyConditionOperator.EQUALS,
+                            value=rng.choice(ROLES),
+                        )
+                    ],
+                )
+            ],
+            metadata={
+                "action_pattern": f"svc{i % 500}.{rng.choice(['*', 'read', 'write'])}",
+                "resource_pattern": "*",
+            },
+        )
+        for i in range(size)
+    ]
+
+
+def linear_scan(policy_set: list, conditions: dict, context: PolicyEvaluationContext):
+    """First matching rule across all matching policies, highest priority first."""
+    resource = context.resource or "*"
+    active = [
+        p for p in policy_set
+        if fnmatch.fnmatch(resource, p.metadata["resource_pattern"])
+        and fnmatch.fnmatch(context.action, p.metadata["action_pattern"])
+    ]
+    rules = sorted((r for p in active for r in p.rules if r.enabled), key=lambda r: r.priority, reverse=True)
+    for rule in rules:
+        if all(condition.matches(context) for condition in conditions[rule.rule_id]):
+            return rule
+    return None
+
+
+def run(size: int) -> dict:
+    """Time index build and per-decision cost for one policy count."""
+    rng = random.Random(3)
+    policy_set = policies(size, rng)
+    contexts = [
+        PolicyEvaluationContext(agent_id=f"a{i}", agent_role=rng.choice(ROLES), action=f"svc{rng.randrange(500)}.read")
+        for i in range(200)
+    ]
+    conditions = {r.rule_id: [CompiledCondition(c) for c in r.conditions] for p in policy_set for r in p.rules}
+
+    started = time.perf_counter()
+    index = PolicyDecisionIndex(policy_set)
+    build = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for context in contexts:
+        index._decide(context)
+    indexed = (time.perf_counter() - started) / len(contexts)
+
+    started = time.perf_counter()
+    for context in contexts:
+        linear_scan(policy_set, conditions, context)
+    scan = (time.perf_counter() - started) / len(contexts)
+
+    return {"build": build, "indexed": indexed, "scan": scan}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark policy decision evaluation")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 10_000], help="Policy counts")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    print(f"{'policies':>10}{'build ms':>10}{'indexed us':>12}{'scan us':>12}")
+    for size in args.sizes:
+        r = run(size)
+        print(f"{size:>10,}{r['build'] * 1000:>10.1f}{r['indexed'] * 1e6:>12.1f}{r['scan'] * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
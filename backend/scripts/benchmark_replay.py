@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Replay Benchmark - Sequential vs. Pipelined Projection Rebuild.
+
+Generates a synthetic credit journal (JSONL) and rebuilds all projections
+with the ReplayEngine in three configurations:
+- sequential: every event awaited through every projection (legacy path)
+- pipelined: batched decode → partition → per-projection apply queues
+- pipelined+pool: pipelined with a process pool for the decode stage
+
+Reports total events/s and events/s per pipeline stage.
+
+Usage:
+    # Default: 200,000 events over 1,000 entities
+    python benchmark_replay.py
+
+    # Large run, reuse an existing synthetic journal
+    python benchmark_replay.py --events 10000000 --journal /tmp/replay-10m.jsonl
+
+    # Skip the (slow) sequential baseline
+    python benchmark_replay.py --events 1000000 --modes pipelined pipelined+pool
+
+Notes:
+    Integrity verification is disabled so only replay itself is measured.
+    Generating the journal is not part of the measurement.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from uuid import uuid4
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from loguru import logger
+
+from app.modules.credits.event_sourcing.event_journal import EventJournal
+from app.modules.credits.event_sourcing.projections import ProjectionManager
+from app.modules.credits.event_sourcing.replay import ReplayEngine
+
+
+MODES = ["sequential", "pipelined", "pipelined+pool"]
+
+
+def generate_journal(path: Path, events: int, entities: int, seed: int = 42) -> None:
+    """Write a synthetic journal with credit, approval and synergie events."""
+    rng = random.Random(seed)
+    balances = [0.0] * entities
+    base_time = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(events):
+            timestamp = (base_time + timedelta(milliseconds=i)).isoformat()
+            roll = rng.random()
+
+            if roll < 0.05:
+                event_type = "approval.requested"
+                payload = {
+                    "request_id": f"req_{i}",
+                    "action_type": "deploy",
+                    "requester_id": f"agent_{i % entities}",
+                    "risk_level": "high",
+                }
+                correlation_id = f"req_{i}"
+            elif roll < 0.08:
+                event_type = "synergie.collaboration_recorded"
+                payload = {
+                    "collaboration_id": f"collab_{i}",
+                    "agent_ids": [f"agent_{i % entities}", f"agent_{(i + 1) % entities}"],
+                    "mission_id": f"mission_{i}",
+                    "contribution_scores": {},
+                }
+                correlation_id = f"mission_{i}"
+            else:
+                entity = rng.randrange(entities)
+                consumed = balances[entity] >= 5.0 and roll < 0.5
+                amount = 5.0 if consumed else 10.0
+                balances[entity] += -amount if consumed else amount
+                event_type = "credit.consumed" if consumed else "credit.allocated"
+                payload = {
+                    "entity_id": f"agent_{entity}",
+                    "entity_type": "agent",
+                    "amount": amount,
+                    "reason": "benchmark",
+                    "balance_after": balances[entity],
+                }
+                correlation_id = f"agent_{entity}"
+
+            f.write(json.dumps({
+                "event_id": str(uuid4()),
+                "event_type": event_type,
+                "timestamp": timestamp,
+                "actor_id": "benchmark",
+                "correlation_id": correlation_id,
+                "causation_id": None,
+                "payload": payload,
+                "schema_version": 1,
+                "idempotency_key": f"bench:{i}",
+            }))
+            f.write("\n")
+
+
+async def run_mode(mode: str, journal: EventJournal, args) -> dict:
+    """Replay the journal once in the given mode."""
+    engine = ReplayEngine(
+        journal,
+        ProjectionManager(),
+        verify_integrity=False,
+        use_snapshots=False,
+        pipelined=(mode != "sequential"),
+        batch_size=args.batch_size,
+        decode_workers=(args.workers if mode == "pipelined+pool" else 0),
+        pause_gc=True,
+    )
+
+    started = time.perf_counter()
+    metrics = await engine.replay_all()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "mode": mode,
+        "events": metrics["total_events"],
+        "seconds": elapsed,
+        "events_per_second": metrics["total_events"] / elapsed if elapsed > 0 else 0.0,
+        "stages": metrics.get("stages", {}),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark credit projection replay",
+    )
+    parser.add_argument("--events", type=int, default=200_000, help="Events in the synthetic journal")
+    parser.add_argument("--entities", type=int, default=1000, help="Distinct credit entities")
+    parser.add_argument("--batch-size", type=int, default=2000, help="Pipeline batch size")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=max(1, (os.cpu_count() or 2) - 1),
+        help="Decode processes for pipelined+pool",
+    )
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES, help="Modes to run")
+    parser.add_argument("--journal", default=None, help="Journal path (generated if missing)")
+
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    tmpdir = None
+    if args.journal:
+        path = Path(args.journal)
+    else:
+        tmpdir = tempfile.TemporaryDirectory(prefix="replay-bench-")
+        path = Path(tmpdir.name) / "credits.jsonl"
+
+    try:
+        if not path.exists():
+            print(f"Generating {args.events:,} events → {path}")
+            started = time.perf_counter()
+            generate_journal(path, args.events, args.entities)
+            print(f"Generated in {time.perf_counter() - started:.1f}s")
+
+        journal = EventJournal(file_path=path, enable_fsync=False)
+
+        results = [await run_mode(mode, journal, args) for mode in args.modes]
+
+        print()
+        print(f"{'mode':<16}{'events':>12}{'seconds':>10}{'events/s':>12}")
+        for r in results:
+            print(f"{r['mode']:<16}{r['events']:>12,}{r['seconds']:>10.2f}{r['events_per_second']:>12,.0f}")
+
+        for r in results:
+            if not r["stages"]:
+                continue
+            print()
+            print(f"[{r['mode']}] per-stage")
+            print(f"  {'stage':<10}{'events':>12}{'busy s':>10}{'events/s':>12}")
+            for name, stage in r["stages"].items():
+                rate = stage.get("events_per_second") or 0.0
+                print(f"  {name:<10}{stage['events']:>12,}{stage['seconds']:>10.2f}{rate:>12,.0f}")
+
+    finally:
+        if tmpdir is not None:
+            tmpdir.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Worker Benchmark - Task Throughput by Concurrency Level.
+
+Runs a BaseWorker with an I/O-bound stub task (a fixed asyncio.sleep per
+task) against an in-memory fakeredis queue and reports tasks/s for each
+concurrency level, with and without the reliable (processing list) queue.
+
+Usage:
+    # Default: concurrency 1, 8 and 32, 20 ms of I/O per task
+    python benchmark_worker_throughput.py
+
+    # Other concurrency levels, 50 ms of I/O per task
+    python benchmark_worker_throughput.py --concurrency 1 16 64 --delay-ms 50
+
+Notes:
+    Each run processes 50 tasks per concurrency slot. With a pure I/O stub,
+    ideal throughput is concurrency / delay.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import fakeredis
+import fakeredis.aioredis
+from loguru import logger
+
+from app.workers.base_worker import BaseWorker
+
+QUEUE = "brain:benchmark_tasks"
+
+
+class StubWorker(BaseWorker):
+    """process_task that only awaits, tracking peak parallelism."""
+
+    def __init__(self, server: fakeredis.FakeServer, delay: float, **kwargs):
+        super().__init__(queue_name=QUEUE, block_timeout=0.05, **kwargs)
+        self.redis = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+
+    async def process_task(self, task):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return {"ok": True}
+
+
+async def run(concurrency: int, reliable: bool, delay: float) -> dict:
+    """Drain 50 tasks per concurrency slot and time it."""
+    server = fakeredis.FakeServer()
+    tasks = 50 * concurrency
+    redis = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    await redis.rpush(QUEUE, *(json.dumps({"id": f"t{i}", "type": "stub", "payload": {}}) for i in range(tasks)))
+
+    worker = StubWorker(server, delay, worker_id="bench", concurrency=concurrency, reliable=reliable)
+    started = time.perf_counter()
+    runner = asyncio.create_task(worker.start())
+    while worker.tasks_processed < tasks:
+        await asyncio.sleep(0.005)
+    elapsed = time.perf_counter() - started
+    await worker.stop()
+    await runner
+
+    return {
+        "concurrency": concurrency,
+        "reliable": reliable,
+        "tasks_per_second": tasks / elapsed,
+        "max_active": worker.max_active,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark BaseWorker task throughput")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32], help="Concurrency levels")
+    parser.add_argument("--delay-ms", type=float, default=20.0, help="Simulated I/O per task")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    print(f"{'concurrency':>12}{'reliable':>10}{'tasks/s':>12}{'peak':>8}")
+    for concurrency in args.concurrency:
+        for reliable in (False, True):
+            r = await run(concurrency, reliable, args.delay_ms / 1000)
+            print(f"{r['concurrency']:>12}{str(r['reliable']):>10}{r['tasks_per_second']:>12,.0f}{r['max_active']:>8}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
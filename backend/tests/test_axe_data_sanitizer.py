@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import random
+
+import pytest
+
 from app.modules.axe_fusion.data_sanitizer import DataSanitizer
 from app.modules.axe_fusion.provider_selector import SanitizationLevel
 
@@ -36,3 +41,115 @@ def test_moderate_sanitization_keeps_paths() -> None:
 
     assert "/home/user/a.txt" in sanitized_content
     assert "[EMAIL_1]" in sanitized_content
+
+
+def _sequential_sanitize(sanitizer: DataSanitizer, messages, categories):
+    """Reference: one regex pass per category, as before the combined pattern."""
+    counters = {key: 0 for key in categories}
+    replacements = {}
+    sanitized = []
+    for message in messages:
+        content = message["content"]
+        for category in categories:
+
+            def _replace(match, category=category):
+                counters[category] += 1
+                placeholder = f"[{category.upper()}_{counters[category]}]"
+                replacements[placeholder] = match.group(0)
+                return placeholder
+
+            content = sanitizer._base_patterns[category].sub(_replace, content)
+        sanitized.append({**message, "content": content})
+    return sanitized, replacements
+
+
+def _conversation(turns: int, seed: int = 7):
+    rng = random.Random(seed)
+    fillers = ["Please review the deployment plan.", "The build failed again.", "Thanks, that works now!"]
+    messages = []
+    for turn in range(turns):
+        parts = [rng.choice(fillers) for _ in range(rng.randint(1, 4))]
+        if turn % 3 == 0:
+            parts.append(f"Reach me at dev{turn}@example.com or on 10.0.{turn % 250}.{rng.randint(1, 250)}.")
+        if turn % 5 == 0:
+            parts.append(f"Logs are in /var/log/app{turn}/run.log, key api-{rng.getrandbits(64):x}.")
+        messages.append({"role": "user" if turn % 2 == 0 else "assistant", "content": " ".join(parts)})
+    return messages
+
+
+@pytest.mark.parametrize(
+    "level,categories",
+    [
+        (SanitizationLevel.STRICT, ("email", "phone", "ip", "card", "path", "secret")),
+        (SanitizationLevel.MODERATE, ("email", "phone", "ip", "secret")),
+    ],
+)
+def test_single_pass_matches_per_category_passes(level, categories) -> None:
+    sanitizer = DataSanitizer()
+    messages = _conversation(60)
+
+    sanitized, mapping = sanitizer.sanitize_messages(messages, level)
+    expected, replacements = _sequential_sanitize(sanitizer, messages, categories)
+
+    assert sanitized == expected
+    assert mapping.replacements == replacements
+
+
+def test_unchanged_history_is_served_from_cache() -> None:
+    sanitizer = DataSanitizer()
+    history = _conversation(20)
+    first, first_mapping = sanitizer.sanitize_messages(history, SanitizationLevel.STRICT)
+    distinct = len({message["content"] for message in history})
+    assert sanitizer.cache_misses == distinct
+
+    new_turn = {"role": "user", "content": "Also ping ops@example.com"}
+    second, second_mapping = sanitizer.sanitize_messages(history + [new_turn], SanitizationLevel.STRICT)
+
+    assert sanitizer.cache_misses == distinct + 1
+    assert sanitizer.cache_hits == 2 * len(history) - distinct
+    assert second[:-1] == first
+    assert second_mapping.replacements.items() >= first_mapping.replacements.items()
+    email_count = sum(1 for placeholder in first_mapping.replacements if placeholder.startswith("[EMAIL_"))
+    assert second[-1]["content"] == f"Also ping [EMAIL_{email_count + 1}]"
+
+    # Bounded by cached characters, oldest scans evicted first
+    small = DataSanitizer(cache_chars=100)
+    small.sanitize_messages([{"role": "user", "content": "a" * 60}, {"role": "user", "content": "b" * 60}], SanitizationLevel.STRICT)
+    assert small._cached_chars == 60 and len(small._cache) == 1
+
+
+def test_restore_is_a_single_pass_over_placeholders() -> None:
+    sanitizer = DataSanitizer()
+    content = " ".join(f"user{i}@example.com" for i in range(12))
+    _, mapping = sanitizer.sanitize_messages([{"role": "user", "content": content}], SanitizationLevel.STRICT)
+
+    restored = sanitizer.deanonymize_text("[EMAIL_1], [EMAIL_12] and [EMAIL_99]", mapping)
+    assert restored == "user0@example.com, user11@example.com and [EMAIL_99]"
+
+    # Originals that look like placeholders are not substituted again
+    mapping.remember("[EMAIL_13]", "[EMAIL_1]")
+    assert sanitizer.deanonymize_text("[EMAIL_13]", mapping) == "[EMAIL_1]"
+
+
+@pytest.mark.asyncio
+async def test_large_payloads_are_processed_off_the_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    sanitizer = DataSanitizer(offload_chars=50)
+    offloaded = []
+    to_thread = asyncio.to_thread
+
+    async def _to_thread(func, *args):
+        offloaded.append(func.__name__)
+        return await to_thread(func, *args)
+
+    monkeypatch.setattr(asyncio, "to_thread", _to_thread)
+
+    small = [{"role": "user", "content": "mail a@example.com"}]
+    _, mapping = await sanitizer.sanitize_messages_async(small, SanitizationLevel.STRICT)
+    assert offloaded == []
+
+    large = [{"role": "user", "content": "mail a@example.com" + " x" * 30}]
+    sanitized, mapping = await sanitizer.sanitize_messages_async(large, SanitizationLevel.STRICT)
+    restored = await sanitizer.deanonymize_text_async(sanitized[0]["content"], mapping)
+
+    assert offloaded == ["sanitize_messages", "deanonymize_text"]
+    assert restored == large[0]["content"]
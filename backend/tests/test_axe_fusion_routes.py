@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import importlib
 import io
+import json
 import sys
 import types
 import pytest
@@ -163,6 +164,41 @@ def test_axe_fusion_chat_route_allows_dmz(client, monkeypatch: pytest.MonkeyPatc
     assert "x-axe-request-id" in response.headers
 
 
+def test_axe_fusion_chat_streams_tokens_as_sse(client, monkeypatch: pytest.MonkeyPatch):
+    class _StreamingServiceStub(_FusionServiceStub):
+        async def stream_chat(self, model, messages, temperature=0.7, on_token=None, **kwargs):  # noqa: ANN001
+            for delta in ("Hal", "lo"):
+                await on_token(delta, None)
+            await on_token("", "stop")
+            return {"text": "Hallo", "raw": {"streamed": True, "model": model, "finish_reason": "stop"}}
+
+    monkeypatch.setattr(axe_fusion_router_module, "get_axe_trust_validator", lambda: _AllowDmzValidator())
+    monkeypatch.setattr(axe_fusion_router_module, "get_axe_fusion_service", lambda db=None: _StreamingServiceStub())
+    monkeypatch.setattr(axe_fusion_router_module, "AXE_CHAT_EXECUTION_PATH", "direct")
+    monkeypatch.setattr(axe_fusion_router_module, "AXE_CHAT_ALLOW_DIRECT_EXECUTION", True)
+
+    response = client.post(
+        "/api/axe/chat",
+        headers={"Accept": "text/event-stream"},
+        json={
+            "model": "gpt-4o-mini",
+            "messages": [{"role": "user", "content": "hi"}],
+            "stream": True,
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [
+        (block.split("\n")[0][len("event: "):], json.loads(block.split("\n")[1][len("data: "):]))
+        for block in response.text.strip().split("\n\n")
+    ]
+    assert events[:2] == [("token", {"delta": "Hal"}), ("token", {"delta": "lo"})]
+    assert events[-1][0] == "done"
+    assert events[-1][1]["text"] == "Hallo"
+    assert events[-1][1]["raw"]["execution_path"] == "direct"
+
+
 def test_axe_fusion_chat_cors_preflight_allows_axe_ui_dev_origin(client):
     response = client.options(
         "/api/axe/chat",
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+from datetime import datetime, timezone
+
 import pytest
 
+from app.modules.axe_fusion.provider_resolution import ProviderResolutionCache
 from app.modules.axe_fusion.provider_selector import LLMProvider, ProviderConfig
 from app.modules.axe_fusion.service import AXEFusionService, AXEllmClient, AXEllmUnavailableError
+from app.modules.integrations.schemas import CircuitState
+from app.modules.provider_bindings.service import ProviderBindingService
 
 
 class _FakeHttpClient:
@@ -129,3 +135,150 @@ async def test_runtime_config_accepts_provider_when_governed_binding_exists(monk
 
     resolved = await service._resolve_runtime_config(require_chat=True)
     assert resolved.provider == LLMProvider.OPENAI
+
+
+def _openai_config() -> ProviderConfig:
+    return ProviderConfig(
+        provider=LLMProvider.OPENAI,
+        base_url="http://127.0.0.1:8099",
+        api_key="dummy",
+        model="mock-model",
+    )
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _counting_probe(results: dict[LLMProvider, bool]):
+    calls: list[LLMProvider] = []
+
+    async def _probe(config, require_chat):  # noqa: ANN001
+        calls.append(config.provider)
+        await asyncio.sleep(0)
+        return results[config.provider]
+
+    return _probe, calls
+
+
+@pytest.mark.asyncio
+async def test_runtime_config_is_resolved_once_and_served_from_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = AXEFusionService()
+    clock = _Clock()
+    service.provider_cache = ProviderResolutionCache(ttl_seconds=30, clock=clock)
+    monkeypatch.setattr(service.selector, "get_active_provider", lambda: LLMProvider.OPENAI)
+    monkeypatch.setattr(service.selector, "get_active_config", _openai_config)
+    probe, calls = _counting_probe({LLMProvider.OPENAI: True})
+    monkeypatch.setattr(service, "_probe_provider", probe)
+
+    # Concurrent misses share one resolution
+    configs = await asyncio.gather(*(service._get_runtime_config(require_chat=True) for _ in range(5)))
+    await service._get_runtime_config(require_chat=True)
+    assert {config.provider for config in configs} == {LLMProvider.OPENAI}
+    assert calls == [LLMProvider.OPENAI]
+
+    # Expiry, runtime changes and binding changes trigger a new resolution
+    clock.now += 31
+    await service._get_runtime_config(require_chat=True)
+    monkeypatch.setenv("LOCAL_LLM_MODE", "openai")  # restored after set_provider_runtime
+    monkeypatch.delenv("FORCE_SANITIZATION_LEVEL", raising=False)
+    service.set_provider_runtime(LLMProvider.OPENAI, None)
+    await service._get_runtime_config(require_chat=True)
+    monkeypatch.setattr(ProviderBindingService, "revision", ProviderBindingService.revision + 1)
+    await service._get_runtime_config(require_chat=True)
+    assert len(calls) == 4
+    assert service.provider_cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_unreachable_provider_is_cached_briefly_and_circuit_opens(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = AXEFusionService()
+    clock = _Clock()
+    service.provider_cache = ProviderResolutionCache(
+        ttl_seconds=30, failure_ttl_seconds=5, failure_threshold=2, recovery_seconds=60, clock=clock
+    )
+    monkeypatch.setattr(service.selector, "get_active_provider", lambda: LLMProvider.OPENAI)
+    monkeypatch.setattr(service.selector, "get_active_config", _openai_config)
+    results = {LLMProvider.OPENAI: False}
+    probe, calls = _counting_probe(results)
+    monkeypatch.setattr(service, "_probe_provider", probe)
+
+    for _ in range(2):
+        with pytest.raises(AXEllmUnavailableError, match="not reachable"):
+            await service._get_runtime_config(require_chat=True)
+    assert len(calls) == 1  # failure cached
+
+    clock.now += 6
+    with pytest.raises(AXEllmUnavailableError):
+        await service._get_runtime_config(require_chat=True)
+    assert len(calls) == 2
+    assert service.provider_cache.breaker("openai").current_state == CircuitState.OPEN
+
+    # Open circuit: no probes at all until recovery
+    clock.now += 6
+    results[LLMProvider.OPENAI] = True
+    with pytest.raises(AXEllmUnavailableError):
+        await service._get_runtime_config(require_chat=True)
+    assert len(calls) == 2
+
+    clock.now += 60
+    service.provider_cache.breaker("openai").state.next_retry_at = datetime.now(timezone.utc)
+    assert (await service._get_runtime_config(require_chat=True)).provider == LLMProvider.OPENAI
+    assert service.provider_cache.breaker("openai").current_state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_chat_failures_open_circuit_and_auto_mode_moves_on(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = AXEFusionService()
+    service.provider_cache = ProviderResolutionCache(failure_threshold=2, recovery_seconds=60)
+    monkeypatch.setenv("OPENAI_API_KEY", "dummy")
+    monkeypatch.setattr(service.selector, "get_active_provider", lambda: LLMProvider.AUTO)
+    probe, calls = _counting_probe({LLMProvider.OLLAMA: True, LLMProvider.OPENAI: True, LLMProvider.GROQ: True})
+    monkeypatch.setattr(service, "_probe_provider", probe)
+
+    ollama = await service._get_runtime_config(require_chat=True)
+    assert ollama.provider == LLMProvider.OLLAMA
+
+    for _ in range(2):
+        service._record_provider_outcome(ollama, AXEllmUnavailableError("timeout"))
+
+    assert (await service._get_runtime_config(require_chat=True)).provider == LLMProvider.OPENAI
+    assert calls == [LLMProvider.OLLAMA, LLMProvider.OPENAI]  # open circuit isn't probed
+
+
+@pytest.mark.asyncio
+async def test_refresh_provider_resolution_updates_cached_decision(monkeypatch: pytest.MonkeyPatch) -> None:
+    service = AXEFusionService()
+    service.provider_cache = ProviderResolutionCache(ttl_seconds=30, failure_threshold=1)
+    monkeypatch.setattr(service.selector, "get_active_provider", lambda: LLMProvider.OPENAI)
+    monkeypatch.setattr(service.selector, "get_active_config", _openai_config)
+    results = {LLMProvider.OPENAI: True}
+    probe, calls = _counting_probe(results)
+    monkeypatch.setattr(service, "_probe_provider", probe)
+
+    await service._get_runtime_config(require_chat=True)
+    version = service.provider_cache.version
+
+    results[LLMProvider.OPENAI] = False
+    stats = await service.refresh_provider_resolution()
+
+    assert stats["version"] == version + 1
+    assert calls == [LLMProvider.OPENAI, LLMProvider.OPENAI]  # health-check key never requested
+    with pytest.raises(AXEllmUnavailableError):
+        await service._get_runtime_config(require_chat=True)
+    assert len(calls) == 2
+
+
+def test_binding_revision_bump_is_seen_by_every_service_instance() -> None:
+    before = ProviderBindingService.revision
+    writer, reader = ProviderBindingService(), ProviderBindingService()
+    try:
+        writer.bump_revision()
+        assert reader.revision == before + 1
+        assert "revision" not in vars(writer)
+    finally:
+        ProviderBindingService.revision = before
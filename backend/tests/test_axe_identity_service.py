@@ -10,6 +10,13 @@ from sqlalchemy.exc import ProgrammingError
 from app.modules.axe_identity.service import AXEIdentityService
 
 
+@pytest.fixture(autouse=True)
+def _fresh_active_identity_cache():
+    AXEIdentityService.invalidate_active_cache()
+    yield
+    AXEIdentityService.invalidate_active_cache()
+
+
 class _FailingSession:
     def __init__(self) -> None:
         self.rollback_calls = 0
@@ -85,3 +92,46 @@ async def test_axe_identity_get_active_handles_missing_timestamps() -> None:
     assert isinstance(response.created_at, datetime)
     assert isinstance(response.updated_at, datetime)
     assert response.updated_at >= response.created_at.replace(tzinfo=response.updated_at.tzinfo)
+
+
+class _CountingIdentitySession(_IdentitySession):
+    def __init__(self, identity):
+        super().__init__(identity)
+        self.executions = 0
+
+    async def execute(self, *_args, **_kwargs):
+        self.executions += 1
+        return await super().execute()
+
+
+@pytest.mark.asyncio
+async def test_active_identity_is_shared_across_instances_until_invalidated(monkeypatch: pytest.MonkeyPatch) -> None:
+    identity = SimpleNamespace(
+        id=uuid4(),
+        name="AXE Cached",
+        description=None,
+        system_prompt="This is a valid prompt text",
+        personality={},
+        capabilities=[],
+        is_active=True,
+        version=1,
+        created_at=None,
+        updated_at=None,
+        created_by="system",
+    )
+    session = _CountingIdentitySession(identity)
+
+    # One service per request, as SystemPromptMiddleware does
+    for _ in range(3):
+        assert (await AXEIdentityService(session).get_active()).name == "AXE Cached"  # type: ignore[arg-type]
+    assert session.executions == 1
+
+    AXEIdentityService.invalidate_active_cache()  # activate/update
+    await AXEIdentityService(session).get_active()  # type: ignore[arg-type]
+    assert session.executions == 2
+
+    monkeypatch.setattr(AXEIdentityService, "ACTIVE_CACHE_TTL_SECONDS", 0.0)
+    AXEIdentityService.invalidate_active_cache()
+    await AXEIdentityService(session).get_active()  # type: ignore[arg-type]
+    await AXEIdentityService(session).get_active()  # type: ignore[arg-type]
+    assert session.executions == 4
@@ -0,0 +1,99 @@
+"""
+Tests for cached system prompt assembly: session context windows kept up to
+date by AXEMemoryBridge.store_message and prompts reused across turns.
+"""
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+
+import app.modules.axe_fusion.memory_bridge as bridge_module
+from app.modules.axe_fusion.memory_bridge import AXEMemoryBridge
+from app.modules.axe_fusion.middleware import SystemPromptMiddleware
+from app.modules.axe_identity.service import AXEIdentityService
+
+
+class _CountingRedis(fakeredis.aioredis.FakeRedis):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.reads = 0
+
+    async def lrange(self, *args, **kwargs):
+        self.reads += 1
+        return await super().lrange(*args, **kwargs)
+
+    async def get(self, *args, **kwargs):
+        self.reads += 1
+        return await super().get(*args, **kwargs)
+
+
+@pytest.fixture
+def bridge(monkeypatch: pytest.MonkeyPatch) -> AXEMemoryBridge:
+    bridge = AXEMemoryBridge()
+    bridge._redis = _CountingRedis(server=fakeredis.FakeServer(), decode_responses=True)
+
+    async def _no_service():
+        return None
+
+    async def _no_qdrant():
+        return None
+
+    monkeypatch.setattr(bridge, "_get_memory_service", _no_service)
+    monkeypatch.setattr(bridge, "_get_qdrant_client", _no_qdrant)
+    monkeypatch.setattr(bridge_module, "_memory_bridge", bridge)
+    return bridge
+
+
+@pytest.fixture(autouse=True)
+def _no_active_identity(monkeypatch: pytest.MonkeyPatch):
+    async def _get_active(self):
+        return None
+
+    monkeypatch.setattr(AXEIdentityService, "get_active", _get_active)
+
+
+@pytest.mark.asyncio
+async def test_session_window_is_updated_by_store_message(bridge: AXEMemoryBridge) -> None:
+    await bridge.store_message("s1", "user", "first")
+    window = await bridge.get_session_window("s1")
+    reads = bridge._redis.reads
+    version = window.version
+
+    await bridge.store_message("s1", "assistant", "second")
+
+    assert [m["content"] for m in await bridge.get_session_context("s1", max_turns=5)] == ["first", "second"]
+    assert bridge._redis.reads == reads  # appended in place, not reloaded
+    assert window.version != version
+
+    # Writes from another process become visible once the window expires
+    await bridge._redis.rpush(f"{bridge_module.REDIS_SESSION_PREFIX}:s1:messages", '{"role": "user", "content": "third"}')
+    window.expires_at = 0.0
+    assert [m["content"] for m in await bridge.get_session_context("s1")] == ["first", "second", "third"]
+
+    # Older history than the window still comes from Redis
+    await bridge.get_session_context("s1", max_turns=50)
+    assert bridge._redis.reads == reads + 3
+
+
+@pytest.mark.asyncio
+async def test_system_prompt_is_reused_until_the_session_changes(bridge: AXEMemoryBridge) -> None:
+    await bridge.store_message("s1", "user", "Hello AXE")
+    middleware = SystemPromptMiddleware(db=None)  # type: ignore[arg-type]
+    built = []
+    inject = middleware._inject_context_into_prompt
+
+    def _counting_inject(base_prompt, context_info):
+        built.append(context_info["version"])
+        return inject(base_prompt, context_info)
+
+    middleware._inject_context_into_prompt = _counting_inject
+
+    first = await middleware.inject_system_prompt([{"role": "user", "content": "hi"}], session_id="s1")
+    second = await middleware.inject_system_prompt([{"role": "user", "content": "hi"}], session_id="s1")
+    assert first[0] == second[0] and "user: Hello AXE" in first[0]["content"]
+    assert len(built) == 1
+
+    await bridge.store_message("s1", "assistant", "Hi there")
+    third = await middleware.inject_system_prompt([{"role": "user", "content": "hi"}], session_id="s1")
+    assert "assistant: Hi there" in third[0]["content"]
+    assert len(built) == 2
@@ -0,0 +1,246 @@
+"""
+Tests for cluster metrics collection and auto-scaling.
+
+Covers: the Redis queue snapshot (per-cluster depth, age, in-flight and
+counters), metrics derived from counter deltas, the predictive scaling
+policy and its threshold fallback, and one-query-per-tick batching in the
+metrics collector and autoscaler.
+"""
+
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+import app.workers.autoscaler as autoscaler_module
+import app.workers.metrics_collector as collector_module
+from app.modules.cluster_system.models import (
+    AgentRole,
+    Cluster,
+    ClusterAgent,
+    ClusterMetrics,
+    ClusterStatus,
+    ClusterType,
+)
+from app.modules.cluster_system.scaling import forecast_arrival_rate, plan_scaling
+from app.workers.autoscaler import AutoscalerWorker
+from app.workers.metrics_collector import MetricsCollectorWorker, derive_cluster_metrics
+from app.workers.utils.queue import TaskQueue
+from app.workers.utils.queue_stats import (
+    ClusterQueueStats,
+    QueueSnapshot,
+    collect_queue_snapshot,
+    record_task_finished,
+)
+
+QUEUE = "brain:cluster_tasks"
+
+
+def _task(cluster_id: str, created_at: datetime) -> str:
+    return json.dumps(
+        {"id": "t", "type": "stub", "payload": {"cluster_id": cluster_id}, "created_at": created_at.isoformat()}
+    )
+
+
+def _metrics(*arrival_rates, avg_response_time=1000.0, queue_length=0, tasks_in_flight=0, step_minutes=1.0):
+    """ClusterMetrics-like rows, newest first"""
+    now = datetime.utcnow()
+    rows = [
+        SimpleNamespace(
+            timestamp=now - timedelta(minutes=step_minutes * age),
+            arrival_rate=rate,
+            avg_response_time=avg_response_time,
+            queue_length=queue_length,
+            tasks_in_flight=tasks_in_flight,
+            cpu_usage=0.0,
+        )
+        for age, rate in enumerate(reversed(arrival_rates))
+    ]
+    return rows
+
+
+def _cluster(current: int, min_workers: int = 1, max_workers: int = 50) -> SimpleNamespace:
+    return SimpleNamespace(current_workers=current, min_workers=min_workers, max_workers=max_workers)
+
+
+@pytest.mark.asyncio
+async def test_queue_snapshot_groups_queue_state_by_cluster() -> None:
+    server = fakeredis.FakeServer()
+    redis = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+    queue = TaskQueue()
+    queue.redis = redis
+
+    for cluster_id in ("c1", "c1", "c2"):
+        await queue.push_task("stub", {"cluster_id": cluster_id})
+    old = datetime.utcnow() - timedelta(seconds=90)
+    await redis.lpush(QUEUE, _task("c1", old))
+    await redis.rpush(QUEUE, json.dumps({"id": "x", "type": "stub", "payload": {}}))  # no cluster
+
+    await record_task_finished(redis, QUEUE, {"payload": {"cluster_id": "c1"}}, 200.0, success=True)
+    await record_task_finished(redis, QUEUE, {"payload": {"cluster_id": "c1"}}, 400.0, success=False)
+
+    # In flight at a live worker counts, a dead worker's list doesn't
+    await redis.setex("brain:worker:w1:heartbeat", 60, json.dumps({"worker_id": "w1", "active_tasks": 1}))
+    await redis.rpush(f"{QUEUE}:processing:w1", _task("c2", old))
+    await redis.rpush(f"{QUEUE}:processing:dead", _task("c2", old))
+
+    snapshot = await collect_queue_snapshot(redis, [QUEUE])
+
+    c1, c2 = snapshot.cluster("c1"), snapshot.cluster("c2")
+    assert (c1.queued, c1.enqueued_total, c1.completed_total, c1.failed_total) == (3, 2, 1, 1)
+    assert c1.duration_ms_total == 600.0
+    assert 89 <= (snapshot.collected_at - c1.oldest_queued_at).total_seconds() < 95
+    assert (c2.queued, c2.in_flight, c2.enqueued_total) == (1, 1, 1)
+    assert snapshot.live_workers == ["w1"] and snapshot.active_tasks == 1
+
+
+def test_derived_metrics_cover_the_interval_since_the_previous_snapshot() -> None:
+    now = datetime.utcnow()
+    previous = QueueSnapshot(
+        collected_at=now - timedelta(seconds=30),
+        clusters={"c1": ClusterQueueStats(enqueued_total=10, completed_total=8, duration_ms_total=800.0)},
+    )
+    current = QueueSnapshot(
+        collected_at=now,
+        clusters={
+            "c1": ClusterQueueStats(
+                queued=4,
+                oldest_queued_at=now - timedelta(seconds=12),
+                in_flight=2,
+                enqueued_total=25,
+                completed_total=17,
+                failed_total=1,
+                duration_ms_total=2800.0,
+            )
+        },
+    )
+
+    metrics = derive_cluster_metrics("c1", {"active": 3, "spawn_failed": 1}, current, previous)
+
+    assert metrics["arrival_rate"] == 30.0  # 15 enqueued in half a minute
+    assert metrics["tasks_per_minute"] == 20.0
+    assert metrics["avg_response_time"] == 200.0
+    assert metrics["error_rate"] == 10.0
+    assert (metrics["queue_length"], metrics["queue_wait_time"], metrics["tasks_in_flight"]) == (4, 12.0, 2)
+    assert (metrics["active_agents"], metrics["failed_agents"]) == (3, 1)
+
+    # First tick: no rates yet
+    first = derive_cluster_metrics("c1", {}, current)
+    assert first["arrival_rate"] is None and first["tasks_per_minute"] == 0.0
+
+
+def test_predictive_policy_scales_ahead_of_rising_arrivals() -> None:
+    # 1 s per task: one worker serves 60/min, 45/min at 75% utilization
+    rising = _metrics(30, 60, 90, 120)
+    assert forecast_arrival_rate(rising, horizon_minutes=0) < forecast_arrival_rate(rising)
+
+    decision = plan_scaling(_cluster(2), rising)
+    assert decision.target_workers > 4  # beyond what the current rate alone needs
+    assert decision.reason.startswith("predictive")
+
+    # Clamped to max_workers
+    assert plan_scaling(_cluster(2, max_workers=3), rising).target_workers == 3
+
+    # Backlog adds demand even at steady arrivals
+    steady = _metrics(45, 45, 45)
+    assert plan_scaling(_cluster(1), steady) is None
+    assert plan_scaling(_cluster(1), _metrics(45, 45, 45, queue_length=450)).target_workers == 3
+
+
+def test_predictive_scale_down_is_damped_and_keeps_in_flight_work() -> None:
+    idle = _metrics(0, 0, 0)
+    assert plan_scaling(_cluster(10), idle).target_workers == 8
+    assert plan_scaling(_cluster(10), _metrics(0, 0, 0, tasks_in_flight=9)).target_workers == 9
+    assert plan_scaling(_cluster(1), idle) is None
+
+
+def test_threshold_fallback_without_latency_data() -> None:
+    no_latency = _metrics(None, None, avg_response_time=0.0, queue_length=20)
+    decision = plan_scaling(_cluster(5), no_latency)
+    assert decision.target_workers == 7 and decision.reason.startswith("threshold")
+
+    configured = plan_scaling(_cluster(5), _metrics(45, 45, queue_length=20), {"policy": "threshold"})
+    assert configured.target_workers == 7
+
+
+@pytest.fixture
+async def session_factory(monkeypatch: pytest.MonkeyPatch):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        for model in (Cluster, ClusterAgent, ClusterMetrics):
+            await conn.run_sync(model.__table__.create)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def get_session():
+        async with factory() as session:
+            yield session
+
+    monkeypatch.setattr(collector_module, "get_session", get_session)
+    monkeypatch.setattr(autoscaler_module, "get_session", get_session)
+
+    statements = []
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    factory.statements = statements
+    yield factory
+    await engine.dispose()
+
+
+async def _add_clusters(factory, count: int) -> None:
+    async with factory() as db:
+        for i in range(count):
+            db.add(
+                Cluster(
+                    id=f"c{i}",
+                    name=f"c{i}",
+                    type=ClusterType.PROJECT,
+                    status=ClusterStatus.ACTIVE,
+                    blueprint_id="missing",
+                    current_workers=1,
+                    last_active=datetime.utcnow() - timedelta(hours=1),
+                )
+            )
+            db.add(ClusterAgent(id=f"a{i}", cluster_id=f"c{i}", agent_id=f"a{i}", role=AgentRole.WORKER))
+        await db.commit()
+
+
+@pytest.mark.asyncio
+async def test_collector_and_autoscaler_query_once_per_tick(session_factory) -> None:
+    await _add_clusters(session_factory, 5)
+    redis = fakeredis.aioredis.FakeRedis(server=fakeredis.FakeServer(), decode_responses=True)
+    queue = TaskQueue()
+    queue.redis = redis
+    for _ in range(30):
+        await queue.push_task("stub", {"cluster_id": "c0"})
+
+    collector = MetricsCollectorWorker(queue_names=[QUEUE], redis=redis)
+    session_factory.statements.clear()
+    await collector._collect_all_metrics()
+
+    selects = [s for s in session_factory.statements if s.lstrip().upper().startswith("SELECT")]
+    inserts = [s for s in session_factory.statements if s.lstrip().upper().startswith("INSERT")]
+    assert len(selects) == 2  # clusters + agent counts, independent of cluster count
+    assert len(inserts) <= 1  # executemany
+    async with session_factory() as db:
+        rows = {m.cluster_id: m for m in (await db.execute(ClusterMetrics.__table__.select())).all()}
+    assert len(rows) == 5
+    assert rows["c0"].queue_length == 30 and rows["c0"].active_agents == 1
+    assert rows["c1"].queue_length == 0 and rows["c1"].arrival_rate is None
+
+    # Queue of c0 breaches the threshold fallback (no latency data yet)
+    session_factory.statements.clear()
+    await AutoscalerWorker()._check_all_clusters()
+
+    metrics_selects = [s for s in session_factory.statements if "FROM cluster_metrics" in s]
+    assert len(metrics_selects) == 1
+    async with session_factory() as db:
+        cluster = await db.get(Cluster, "c0")
+        idle = await db.get(Cluster, "c1")
+    assert cluster.current_workers == 2
+    assert idle.current_workers == 1  # already at min_workers
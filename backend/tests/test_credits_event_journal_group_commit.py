@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+import app.modules.credits.event_sourcing.event_journal as event_journal_module
+from app.modules.credits.event_sourcing.event_journal import EventJournal, EventJournalError
+from app.modules.credits.event_sourcing.events import EventEnvelope, EventType
+
+
+def _event(key: str, amount: float = 10.0) -> EventEnvelope:
+    return EventEnvelope(
+        event_id=str(uuid4()),
+        event_type=EventType.CREDIT_ALLOCATED,
+        timestamp=datetime.now(timezone.utc),
+        actor_id="system",
+        correlation_id="agent_1",
+        payload={
+            "entity_id": "agent_1",
+            "entity_type": "agent",
+            "amount": amount,
+            "reason": "test",
+            "balance_after": amount,
+        },
+        idempotency_key=key,
+    )
+
+
+@pytest.mark.asyncio
+async def test_group_commit_batches_concurrent_appends_into_few_fsyncs(tmp_path, monkeypatch) -> None:
+    fsync_calls = []
+    monkeypatch.setattr(event_journal_module.os, "fsync", lambda fd: fsync_calls.append(fd))
+
+    journal = EventJournal(
+        file_path=tmp_path / "credits.jsonl",
+        group_commit=True,
+        group_commit_max_batch=64,
+        group_commit_max_delay_ms=5.0,
+    )
+    await journal.initialize()
+
+    results = await asyncio.gather(*(journal.append_event(_event(f"key-{i}")) for i in range(200)))
+    await journal.close()
+
+    assert all(results)
+    lines = (tmp_path / "credits.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 200
+    assert {json.loads(line)["idempotency_key"] for line in lines} == {f"key-{i}" for i in range(200)}
+    assert 1 <= len(fsync_calls) < 200
+
+    metrics = journal.get_metrics()
+    assert metrics["total_events"] == 200
+    assert metrics["group_commit"]["fsyncs"] == len(fsync_calls)
+
+
+@pytest.mark.asyncio
+async def test_group_commit_returns_only_after_event_is_written(tmp_path) -> None:
+    path = tmp_path / "credits.jsonl"
+    journal = EventJournal(file_path=path, enable_fsync=False, group_commit=True)
+    await journal.initialize()
+
+    assert await journal.append_event(_event("durable-1")) is True
+    assert "durable-1" in path.read_text(encoding="utf-8")
+
+    await journal.close()
+
+
+@pytest.mark.asyncio
+async def test_group_commit_rejects_concurrent_and_later_duplicates(tmp_path) -> None:
+    journal = EventJournal(file_path=tmp_path / "credits.jsonl", enable_fsync=False, group_commit=True)
+    await journal.initialize()
+
+    first, second = await asyncio.gather(
+        journal.append_event(_event("dup")),
+        journal.append_event(_event("dup")),
+    )
+    third = await journal.append_event(_event("dup"))
+    await journal.close()
+
+    assert sorted([first, second]) == [False, True]
+    assert third is False
+    assert len((tmp_path / "credits.jsonl").read_text(encoding="utf-8").splitlines()) == 1
+    assert journal.get_metrics()["idempotency_violations"] == 2
+
+
+@pytest.mark.asyncio
+async def test_group_commit_journal_reloads_like_per_event_journal(tmp_path) -> None:
+    path = tmp_path / "credits.jsonl"
+    journal = EventJournal(file_path=path, enable_fsync=False, group_commit=True)
+    await journal.initialize()
+    await asyncio.gather(*(journal.append_event(_event(f"k-{i}")) for i in range(10)))
+    await journal.close()
+
+    reopened = EventJournal(file_path=path, enable_fsync=False)
+    await reopened.initialize()
+
+    assert reopened.get_metrics()["total_events"] == 10
+    assert await reopened.append_event(_event("k-3")) is False
+
+
+@pytest.mark.asyncio
+async def test_append_after_close_raises_instead_of_waiting_on_stopped_writer(tmp_path) -> None:
+    journal = EventJournal(file_path=tmp_path / "credits.jsonl", enable_fsync=False, group_commit=True)
+    await journal.initialize()
+    assert await journal.append_event(_event("before-close")) is True
+
+    closing = asyncio.create_task(journal.close())
+    await asyncio.sleep(0)  # close() has queued the shutdown sentinel
+
+    with pytest.raises(EventJournalError):
+        await asyncio.wait_for(journal.append_event(_event("during-close")), timeout=5)
+    await closing
+    with pytest.raises(EventJournalError):
+        await journal.append_event(_event("after-close"))
+
+    assert len((tmp_path / "credits.jsonl").read_text(encoding="utf-8").splitlines()) == 1
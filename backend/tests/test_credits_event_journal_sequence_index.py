@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.modules.credits.event_sourcing.base_journal import BaseEventJournal
+from app.modules.credits.event_sourcing.event_journal import EventJournal
+from app.modules.credits.event_sourcing.events import EventEnvelope, EventType
+from app.modules.credits.event_sourcing.projections import ProjectionManager
+from app.modules.credits.event_sourcing.replay import ReplayEngine
+from app.modules.credits.event_sourcing.snapshot_scheduler import SnapshotScheduler
+
+
+def _event(index: int) -> EventEnvelope:
+    return EventEnvelope(
+        event_id=str(uuid4()),
+        event_type=EventType.CREDIT_ALLOCATED,
+        timestamp=datetime.now(timezone.utc),
+        actor_id="system",
+        correlation_id=f"agent_{index % 3}",
+        payload={
+            "entity_id": f"agent_{index % 3}",
+            "entity_type": "agent",
+            "amount": 1.0,
+            "reason": "test",
+            "balance_after": float(index // 3 + 1),
+        },
+        idempotency_key=f"seq-{index}",
+    )
+
+
+async def _journal_with_events(tmp_path, count: int, interval: int = 10) -> EventJournal:
+    journal = EventJournal(file_path=tmp_path / "credits.jsonl", enable_fsync=False, index_interval=interval)
+    await journal.initialize()
+    for i in range(count):
+        await journal.append_event(_event(i))
+    return journal
+
+
+@pytest.mark.asyncio
+async def test_read_events_from_sequence_yields_only_delta(tmp_path) -> None:
+    journal = await _journal_with_events(tmp_path, 45)
+
+    keys = [event.idempotency_key async for event in journal.read_events(from_sequence=23)]
+
+    assert keys == [f"seq-{i}" for i in range(23, 45)]
+    assert await journal.get_last_sequence() == 45
+    assert journal.get_metrics()["index_entries"] == 5
+
+
+@pytest.mark.asyncio
+async def test_sidecar_index_records_offsets_and_is_rebuilt_when_stale(tmp_path) -> None:
+    journal = await _journal_with_events(tmp_path, 25)
+    assert await journal.get_last_sequence() == 25
+    index_path = tmp_path / "credits.jsonl.idx"
+
+    entries = [tuple(map(int, line.split())) for line in index_path.read_text().splitlines()]
+    assert [sequence for sequence, _ in entries] == [1, 11, 21]
+
+    raw = (tmp_path / "credits.jsonl").read_bytes()
+    for _, offset in entries:
+        assert offset == 0 or raw[offset - 1 : offset] == b"\n"
+
+    index_path.write_text("1 0\n11 999999\n")
+    reopened = EventJournal(file_path=tmp_path / "credits.jsonl", enable_fsync=False, index_interval=10)
+    await reopened.initialize()
+
+    assert [tuple(map(int, line.split())) for line in index_path.read_text().splitlines()] == entries
+    keys = [event.idempotency_key async for event in reopened.read_events(from_sequence=20)]
+    assert keys == [f"seq-{i}" for i in range(20, 25)]
+
+
+@pytest.mark.asyncio
+async def test_sequence_skips_corrupted_lines(tmp_path) -> None:
+    journal = await _journal_with_events(tmp_path, 5, interval=2)
+    with open(tmp_path / "credits.jsonl", "a", encoding="utf-8") as f:
+        f.write("{not json\n")
+    for i in range(5, 8):
+        await journal.append_event(_event(i))
+
+    reopened = EventJournal(file_path=tmp_path / "credits.jsonl", enable_fsync=False, index_interval=2)
+    await reopened.initialize()
+
+    assert await reopened.get_last_sequence() == 8
+    keys = [event.idempotency_key async for event in reopened.read_events(from_sequence=5)]
+    assert keys == ["seq-5", "seq-6", "seq-7"]
+
+
+class _FakeSnapshot:
+    snapshot_id = "snap-1"
+    sequence_number = 30
+    event_count = 30
+    state_data = {"balance": {}, "ledger": {}, "approval": {}, "synergie": {}}
+
+
+class _FakeSnapshotManager:
+    async def load_latest_snapshot(self, snapshot_type: str = "all"):
+        return _FakeSnapshot()
+
+    def restore_balance_projection(self, projection, state) -> None:
+        pass
+
+    def restore_ledger_projection(self, projection, state) -> None:
+        pass
+
+    def restore_approval_projection(self, projection, state) -> None:
+        pass
+
+    def restore_synergie_projection(self, projection, state) -> None:
+        pass
+
+    def restore_snapshot(self, projection_manager, snapshot) -> None:
+        pass
+
+
+@pytest.mark.asyncio
+async def test_replay_reads_only_events_after_snapshot_sequence(tmp_path) -> None:
+    journal = await _journal_with_events(tmp_path, 40)
+    engine = ReplayEngine(
+        journal,
+        ProjectionManager(),
+        snapshot_manager=_FakeSnapshotManager(),
+        verify_integrity=False,
+    )
+
+    metrics = await engine.replay_all()
+
+    assert metrics["snapshot_used"] == "snap-1"
+    assert metrics["total_events"] == 10
+
+
+class _RowIdJournal(BaseEventJournal):
+    """Postgres-like journal: the sequence is a row id with gaps"""
+
+    def __init__(self) -> None:
+        self.rows: list[tuple[int, EventEnvelope]] = []
+        self._next_id = 0
+
+    async def initialize(self) -> None:
+        pass
+
+    async def append_event(self, event: EventEnvelope, burned_ids: int = 0) -> bool:
+        # Rolled-back inserts and ON CONFLICT DO NOTHING consume ids
+        self._next_id += burned_ids + 1
+        self.rows.append((self._next_id, event))
+        return True
+
+    async def read_events(self, skip_corrupted: bool = True, from_sequence: int = 0):
+        for row_id, event in self.rows:
+            if row_id > from_sequence:
+                yield event
+
+    async def get_last_sequence(self) -> int:
+        return self.rows[-1][0] if self.rows else 0
+
+    def get_metrics(self) -> dict:
+        return {"total_events": len(self.rows)}
+
+
+class _RecordingSnapshotManager(_FakeSnapshotManager):
+    def __init__(self) -> None:
+        self.snapshots = []
+
+    async def create_snapshot(self, projection_manager, sequence_number: int, event_count: int = 0):
+        snapshot = _FakeSnapshot()
+        snapshot.snapshot_id = f"snap-{len(self.snapshots) + 1}"
+        snapshot.sequence_number = sequence_number
+        snapshot.event_count = event_count
+        snapshot.is_delta = False
+        snapshot.size_bytes = 0
+        self.snapshots.append(snapshot)
+        return snapshot
+
+    async def load_latest_snapshot(self, snapshot_type: str = "all"):
+        return self.snapshots[-1]
+
+    async def list_snapshots(self, *args, **kwargs):
+        return []
+
+
+@pytest.mark.asyncio
+async def test_snapshot_stores_row_id_so_replay_skips_exactly_its_events_despite_id_gaps() -> None:
+    journal = _RowIdJournal()
+    for i in range(8):
+        await journal.append_event(_event(i), burned_ids=1 if i % 3 == 0 else 0)
+    snapshots = _RecordingSnapshotManager()
+    scheduler = SnapshotScheduler(journal, ProjectionManager(), snapshots)
+
+    should_create, _ = await scheduler._should_create_snapshot()
+    assert should_create
+    await scheduler._create_snapshot()
+
+    last_id = journal.rows[-1][0]
+    assert last_id > 8  # ids have gaps, a count would point into the snapshot's events
+    assert snapshots.snapshots[0].sequence_number == last_id
+
+    for i in range(8, 11):
+        await journal.append_event(_event(i), burned_ids=2)
+    engine = ReplayEngine(journal, ProjectionManager(), snapshot_manager=snapshots, verify_integrity=False)
+
+    metrics = await engine.replay_all()
+
+    assert metrics["snapshot_used"] == "snap-1"
+    assert metrics["total_events"] == 3
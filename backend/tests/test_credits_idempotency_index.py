@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.modules.credits.event_sourcing.event_journal import EventJournal
+from app.modules.credits.event_sourcing.events import EventEnvelope, EventType
+from app.modules.credits.event_sourcing.idempotency_index import (
+    BloomFilter,
+    IdempotencyCheck,
+    IdempotencyIndex,
+    ScalableBloomFilter,
+)
+
+
+def _event(key: str) -> EventEnvelope:
+    return EventEnvelope(
+        event_id=str(uuid4()),
+        event_type=EventType.CREDIT_ALLOCATED,
+        timestamp=datetime.now(timezone.utc),
+        actor_id="system",
+        correlation_id="agent_1",
+        payload={"entity_id": "agent_1", "entity_type": "agent", "amount": 1.0, "reason": "t", "balance_after": 1.0},
+        idempotency_key=key,
+    )
+
+
+def test_bloom_filter_has_no_false_negatives_and_low_fp_rate() -> None:
+    bloom = BloomFilter.for_capacity(5000, error_rate=0.01)
+    for i in range(5000):
+        bloom.add(f"key-{i}")
+
+    assert all(f"key-{i}" in bloom for i in range(5000))
+    false_positives = sum(1 for i in range(5000) if f"other-{i}" in bloom)
+    assert false_positives < 150
+
+
+def test_index_window_is_bounded_and_bloom_covers_evicted_keys() -> None:
+    index = IdempotencyIndex(lru_capacity=10, bloom_capacity=1000)
+    for i in range(100):
+        index.add(f"key-{i}", sequence=i + 1)
+
+    assert index.check("key-99") == IdempotencyCheck.RECENT
+    assert index.check("key-0") == IdempotencyCheck.MAYBE
+    assert index.check("never-seen") in (IdempotencyCheck.ABSENT, IdempotencyCheck.MAYBE)
+
+    metrics = index.get_metrics()
+    assert metrics["lru_size"] == 10
+    assert metrics["lru_hits"] == 1
+
+
+def test_index_without_bloom_defers_misses_to_fallback() -> None:
+    index = IdempotencyIndex(lru_capacity=2, use_bloom=False)
+    index.add("a")
+
+    assert index.check("a") == IdempotencyCheck.RECENT
+    assert index.check("b") == IdempotencyCheck.MAYBE
+    index.record_fallback(is_duplicate=False)
+    assert index.get_metrics()["false_positives"] == 0
+
+
+def test_from_memory_budget_respects_budget() -> None:
+    index = IdempotencyIndex.from_memory_budget(memory_budget_mb=1)
+    for i in range(index.lru_capacity * 2):
+        index.add(f"key-{i}")
+
+    assert index.get_metrics()["estimated_memory_bytes"] <= 1024 * 1024 * 1.05
+
+
+@pytest.mark.asyncio
+async def test_journal_rejects_old_duplicates_outside_window(tmp_path) -> None:
+    journal = EventJournal(
+        file_path=tmp_path / "credits.jsonl",
+        enable_fsync=False,
+        idempotency_index=IdempotencyIndex(lru_capacity=5, bloom_capacity=1000),
+    )
+    await journal.initialize()
+    for i in range(20):
+        assert await journal.append_event(_event(f"key-{i}")) is True
+
+    assert await journal.append_event(_event("key-0")) is False
+    assert await journal.append_event(_event("key-19")) is False
+
+    index_metrics = journal.get_metrics()["idempotency_index"]
+    assert index_metrics["fallback_duplicates"] == 1
+    assert index_metrics["lru_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_startup_scans_only_tail_after_checkpoint(tmp_path) -> None:
+    path = tmp_path / "credits.jsonl"
+    journal = EventJournal(file_path=path, enable_fsync=False, index_interval=4)
+    await journal.initialize()
+    for i in range(10):
+        await journal.append_event(_event(f"key-{i}"))
+    await journal.close()
+
+    # Events appended by a process that crashed before checkpointing
+    crashed = EventJournal(file_path=path, enable_fsync=False, index_interval=4)
+    await crashed.initialize()
+    for i in range(10, 13):
+        await crashed.append_event(_event(f"key-{i}"))
+
+    reopened = EventJournal(file_path=path, enable_fsync=False, index_interval=4)
+    scanned = []
+    original_scan = reopened._scan_events
+
+    def _tracking_scan(start_offset, start_sequence, skip_corrupted):
+        scanned.append(start_sequence)
+        return original_scan(start_offset, start_sequence, skip_corrupted)
+
+    reopened._scan_events = _tracking_scan
+    await reopened.initialize()
+
+    assert scanned == [10]
+    assert await reopened.get_last_sequence() == 13
+    assert await reopened.append_event(_event("key-2")) is False
+    assert await reopened.append_event(_event("key-12")) is False
+    assert await reopened.append_event(_event("key-13")) is True
+
+
+@pytest.mark.asyncio
+async def test_stale_checkpoint_falls_back_to_full_scan(tmp_path) -> None:
+    path = tmp_path / "credits.jsonl"
+    journal = EventJournal(file_path=path, enable_fsync=False)
+    await journal.initialize()
+    for i in range(5):
+        await journal.append_event(_event(f"key-{i}"))
+    await journal.close()
+
+    # Journal replaced behind the checkpoint's back (shorter than checkpoint offset)
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    path.write_text("".join(lines[:2]), encoding="utf-8")
+
+    reopened = EventJournal(file_path=path, enable_fsync=False)
+    await reopened.initialize()
+
+    assert await reopened.get_last_sequence() == 2
+    assert await reopened.append_event(_event("key-1")) is False
+    assert await reopened.append_event(_event("key-3")) is True
+
+
+def test_scalable_bloom_keeps_fp_rate_bounded_past_initial_capacity() -> None:
+    bloom = ScalableBloomFilter(initial_capacity=1000, error_rate=0.01)
+    for i in range(20_000):
+        bloom.add(f"key-{i}")
+
+    assert len(bloom.stages) > 1
+    assert all(f"key-{i}" in bloom for i in range(20_000))
+    false_positives = sum(1 for i in range(20_000) if f"other-{i}" in bloom)
+    assert false_positives < 20_000 * 0.02
+    assert bloom.estimated_false_positive_rate() < 0.01
+
+
+@pytest.mark.asyncio
+async def test_bloom_is_sized_from_journal_at_load_and_growth_survives_checkpoint(tmp_path) -> None:
+    path = tmp_path / "credits.jsonl"
+    journal = EventJournal(
+        file_path=path, enable_fsync=False, idempotency_index=IdempotencyIndex(lru_capacity=5, bloom_capacity=10)
+    )
+    await journal.initialize()
+    for i in range(100):
+        await journal.append_event(_event(f"key-{i}"))
+    await journal.close()
+    grown = journal.get_metrics()["idempotency_index"]["bloom_stages"]
+    assert grown > 1
+
+    # Checkpoint restores the grown filter as it was
+    reopened = EventJournal(
+        file_path=path, enable_fsync=False, idempotency_index=IdempotencyIndex(lru_capacity=5, bloom_capacity=10)
+    )
+    await reopened.initialize()
+    assert reopened.get_metrics()["idempotency_index"]["bloom_stages"] == grown
+    assert await reopened.append_event(_event("key-3")) is False
+
+    # Without a checkpoint the first stage is sized for the whole journal
+    (tmp_path / "credits.jsonl.bloom").unlink()
+    rescanned = EventJournal(
+        file_path=path, enable_fsync=False, idempotency_index=IdempotencyIndex(lru_capacity=5, bloom_capacity=10)
+    )
+    await rescanned.initialize()
+    assert rescanned.get_metrics()["idempotency_index"]["bloom_stages"] == 1
+    assert await rescanned.append_event(_event("key-7")) is False
+
+
+@pytest.mark.asyncio
+async def test_journal_fallback_scan_runs_off_the_loop_and_is_serialised(tmp_path) -> None:
+    journal = EventJournal(
+        file_path=tmp_path / "credits.jsonl",
+        enable_fsync=False,
+        idempotency_index=IdempotencyIndex(lru_capacity=2, use_bloom=False),  # every miss is MAYBE
+    )
+    await journal.initialize()
+    for i in range(5):
+        await journal.append_event(_event(f"key-{i}"))
+
+    scan_threads = []
+    original_scan = journal._key_exists_on_disk
+
+    def _tracking_scan(key):
+        scan_threads.append(threading.get_ident())
+        return original_scan(key)
+
+    journal._key_exists_on_disk = _tracking_scan
+
+    results = await asyncio.gather(*(journal.append_event(_event("key-new")) for _ in range(4)))
+    old = await asyncio.gather(*(journal.append_event(_event("key-0")) for _ in range(2)))
+
+    assert sorted(results) == [False, False, False, True]
+    assert old == [False, False]
+    assert scan_threads and threading.get_ident() not in scan_threads
+    lines = (tmp_path / "credits.jsonl").read_text(encoding="utf-8").splitlines()
+    assert sum('"key-new"' in line for line in lines) == 1
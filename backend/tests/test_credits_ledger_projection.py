@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.modules.credits.event_sourcing.events import EventEnvelope, EventType
+from app.modules.credits.event_sourcing.projections import (
+    InvalidCursorError,
+    LedgerProjection,
+)
+
+BASE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _event(entity_id: str, second: int, amount: float = 1.0) -> EventEnvelope:
+    return EventEnvelope(
+        event_id=str(uuid4()),
+        event_type=EventType.CREDIT_ALLOCATED,
+        timestamp=BASE_TIME + timedelta(seconds=second),
+        actor_id="system",
+        correlation_id=entity_id,
+        payload={
+            "entity_id": entity_id,
+            "entity_type": "agent",
+            "amount": amount,
+            "reason": "test",
+            "balance_after": amount,
+        },
+        idempotency_key=str(uuid4()),
+    )
+
+
+def _seconds(entries) -> list:
+    return [int((entry.timestamp - BASE_TIME).total_seconds()) for entry in entries]
+
+
+def test_ledger_ring_evicts_oldest_and_returns_newest_first() -> None:
+    ledger = LedgerProjection(max_entries_per_entity=3)
+    for second in range(5):
+        ledger.apply_event(_event("agent_1", second))
+
+    assert _seconds(ledger.get_history("agent_1")) == [4, 3, 2]
+    assert _seconds(ledger.get_history("agent_1", limit=2)) == [4, 3]
+    assert ledger.get_history("missing") == []
+
+
+def test_ledger_keeps_order_for_late_events() -> None:
+    ledger = LedgerProjection(max_entries_per_entity=3)
+    for second in (10, 30, 20):
+        ledger.apply_event(_event("agent_1", second))
+
+    assert _seconds(ledger.get_history("agent_1")) == [30, 20, 10]
+
+    # Full ring: a late event evicts the oldest, one older than all is dropped
+    ledger.apply_event(_event("agent_1", 15))
+    ledger.apply_event(_event("agent_1", 1))
+    assert _seconds(ledger.get_history("agent_1")) == [30, 20, 15]
+
+
+def test_get_all_entries_merges_entities_newest_first() -> None:
+    ledger = LedgerProjection()
+    for second in range(0, 12, 3):
+        ledger.apply_event(_event("agent_a", second))
+        ledger.apply_event(_event("agent_b", second + 1))
+        ledger.apply_event(_event("agent_c", second + 2))
+
+    assert _seconds(ledger.get_all_entries()) == list(range(11, -1, -1))
+    assert _seconds(ledger.get_all_entries(limit=4)) == [11, 10, 9, 8]
+
+
+@pytest.mark.parametrize("entity_id", ["agent_a", None])
+def test_get_page_cursor_walks_every_entry_once(entity_id) -> None:
+    ledger = LedgerProjection()
+    for second in range(25):
+        ledger.apply_event(_event("agent_a" if second % 2 else "agent_b", second))
+    ledger.apply_event(_event("agent_a", 24))  # Timestamp tie, split by event_id
+
+    expected = ledger.get_history(entity_id) if entity_id else ledger.get_all_entries()
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = ledger.get_page(entity_id, limit=4, cursor=cursor)
+        seen.extend(page)
+        if cursor is None:
+            break
+
+    assert [entry.event_id for entry in seen] == [entry.event_id for entry in expected]
+
+
+def test_get_page_rejects_malformed_cursor() -> None:
+    ledger = LedgerProjection()
+
+    with pytest.raises(InvalidCursorError):
+        ledger.get_page("agent_1", cursor="not-a-cursor")
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.modules.credits.event_sourcing.event_journal import EventJournal
+from app.modules.credits.event_sourcing.events import EventEnvelope, EventType
+from app.modules.credits.event_sourcing.projections import ProjectionManager
+from app.modules.credits.event_sourcing.replay import ReplayEngine
+
+
+BASE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _credit_event(index: int, entity: str, balance_after: float) -> EventEnvelope:
+    return EventEnvelope(
+        event_id=str(uuid4()),
+        event_type=EventType.CREDIT_ALLOCATED,
+        timestamp=BASE_TIME + timedelta(seconds=index),
+        actor_id="system",
+        correlation_id=entity,
+        payload={
+            "entity_id": entity,
+            "entity_type": "agent",
+            "amount": 1.0,
+            "reason": "test",
+            "balance_after": balance_after,
+        },
+        idempotency_key=f"credit-{index}",
+    )
+
+
+def _approval_event(index: int) -> EventEnvelope:
+    return EventEnvelope(
+        event_id=str(uuid4()),
+        event_type=EventType.APPROVAL_REQUESTED,
+        timestamp=BASE_TIME + timedelta(seconds=index),
+        actor_id="system",
+        correlation_id=f"req-{index}",
+        payload={"request_id": f"req-{index}", "action_type": "deploy", "requester_id": "a", "risk_level": "high"},
+        idempotency_key=f"approval-{index}",
+    )
+
+
+async def _build_journal(tmp_path) -> EventJournal:
+    journal = EventJournal(file_path=tmp_path / "credits.jsonl", enable_fsync=False, index_interval=16)
+    await journal.initialize()
+    balances: dict[str, float] = {}
+    for i in range(300):
+        if i % 10 == 0:
+            await journal.append_event(_approval_event(i))
+            continue
+        entity = f"agent_{i % 7}"
+        balances[entity] = balances.get(entity, 0.0) + 1.0
+        await journal.append_event(_credit_event(i, entity, balances[entity]))
+    return journal
+
+
+async def _replay(journal: EventJournal, **kwargs) -> tuple[ProjectionManager, dict]:
+    projections = ProjectionManager()
+    engine = ReplayEngine(journal, projections, use_snapshots=False, **kwargs)
+    return projections, await engine.replay_all()
+
+
+@pytest.mark.asyncio
+async def test_pipelined_replay_matches_sequential_replay(tmp_path) -> None:
+    journal = await _build_journal(tmp_path)
+
+    sequential, sequential_metrics = await _replay(journal, pipelined=False)
+    pipelined, pipelined_metrics = await _replay(journal, batch_size=32)
+
+    assert pipelined_metrics["total_events"] == sequential_metrics["total_events"] == 300
+    assert pipelined_metrics["integrity_valid"] is True
+    assert pipelined.balance.get_all_balances() == sequential.balance.get_all_balances()
+    assert [e.event_id for e in pipelined.ledger.get_all_entries()] == [
+        e.event_id for e in sequential.ledger.get_all_entries()
+    ]
+    assert len(pipelined.approval.get_pending_approvals()) == 30
+
+    stages = pipelined_metrics["stages"]
+    assert stages["decode"]["events"] == 300
+    assert stages["balance"]["events"] == 270
+    assert stages["approval"]["events"] == 30
+
+
+@pytest.mark.asyncio
+async def test_pipelined_replay_preserves_per_entity_order(tmp_path) -> None:
+    journal = await _build_journal(tmp_path)
+
+    projections, _ = await _replay(journal, batch_size=7)
+
+    for entity in (f"agent_{i}" for i in range(7)):
+        history = projections.ledger.get_history(entity)
+        balances = [entry.balance_after for entry in reversed(history)]
+        assert balances == sorted(balances)
+        assert projections.balance.get_balance(entity) == balances[-1]
+
+
+@pytest.mark.asyncio
+async def test_pipelined_replay_with_decode_process_pool(tmp_path) -> None:
+    journal = await _build_journal(tmp_path)
+
+    projections, metrics = await _replay(journal, batch_size=50, decode_workers=2)
+
+    assert metrics["total_events"] == 300
+    assert len(projections.ledger.get_all_entries()) == 270
+
+
+@pytest.mark.asyncio
+async def test_read_event_batches_honours_from_sequence(tmp_path) -> None:
+    journal = await _build_journal(tmp_path)
+
+    batches = [batch async for batch in journal.read_event_batches(from_sequence=41, batch_size=10)]
+    keys = [event.idempotency_key for batch in batches for event in batch]
+    expected = [event.idempotency_key async for event in journal.read_events(from_sequence=41)]
+
+    assert keys == expected
+    assert len(keys) == 259
+
+
+def _fail_ledger_on(projections: ProjectionManager, idempotency_key: str) -> None:
+    apply_batch = projections.ledger.apply_batch
+
+    def _apply_batch(events):
+        if any(event.idempotency_key == idempotency_key for event in events):
+            raise RuntimeError("ledger write failed")
+        apply_batch(events)
+
+    projections.ledger.apply_batch = _apply_batch
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("failing_key", ["credit-21", "credit-299"])
+async def test_pipelined_replay_raises_projection_failures(tmp_path, failing_key) -> None:
+    journal = await _build_journal(tmp_path)
+    projections = ProjectionManager()
+    _fail_ledger_on(projections, failing_key)
+    engine = ReplayEngine(
+        journal,
+        projections,
+        use_snapshots=False,
+        verify_integrity=False,
+        batch_size=10,
+        queue_depth=1,
+    )
+
+    # A failure in the last batch used to be swallowed; mid-replay ones must not hang
+    with pytest.raises(RuntimeError, match="ledger write failed"):
+        await asyncio.wait_for(engine.replay_all(), timeout=10)
+
+    assert not [task for task in asyncio.all_tasks() if task.get_name().startswith("replay-")]
+
+
+@pytest.mark.asyncio
+async def test_pipelined_replay_leaves_gc_enabled_by_default(tmp_path) -> None:
+    journal = await _build_journal(tmp_path)
+    projections = ProjectionManager()
+    seen = []
+    apply_batch = projections.balance.apply_batch
+
+    def _apply_batch(events):
+        seen.append(gc.isenabled())
+        apply_batch(events)
+
+    projections.balance.apply_batch = _apply_batch
+    engine = ReplayEngine(journal, projections, use_snapshots=False, batch_size=50)
+
+    await engine.replay_all()
+
+    assert seen and all(seen)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core.auth_deps import Principal, PrincipalType
+from app.modules.knowledge_engine import service as knowledge_service
+from app.modules.knowledge_engine.ingest_service import generate_embeddings, generate_embeddings_batch
+from app.modules.knowledge_engine.schemas import KnowledgeIngestRequest
+from app.modules.knowledge_engine.service import KnowledgeEngineService
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class _Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class _FakeDB:
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency  # simulated round trip
+        self.statements = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def execute(self, statement, params=None):  # noqa: ANN001
+        sql = str(statement)
+        self.statements.append((sql, params))
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if "INSERT INTO knowledge_items" in sql:
+            return _Result(
+                [
+                    {
+                        "id": item_id,
+                        "tenant_id": params["tenant_id"],
+                        "title": title,
+                        "content": content,
+                        "type": "doc",
+                        "tags": [],
+                        "visibility": "tenant",
+                        "metadata": {},
+                        "created_at": NOW,
+                        "updated_at": NOW,
+                    }
+                    for item_id, title, content in zip(params["ids"], params["titles"], params["contents"])
+                ]
+            )
+        if "INSERT INTO knowledge_chunks" in sql:
+            return _Result([{"created_at": NOW} for _ in params["ids"]])
+        return _Result([])
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+def _principal() -> Principal:
+    return Principal(
+        principal_id="operator-1",
+        principal_type=PrincipalType.HUMAN,
+        email="operator@example.com",
+        name="Operator",
+        roles=["operator"],
+        scopes=["read", "write"],
+        tenant_id="tenant-a",
+    )
+
+
+@pytest.fixture
+def service(monkeypatch) -> KnowledgeEngineService:
+    monkeypatch.setattr(knowledge_service, "QDRANT_AVAILABLE", False)
+    return KnowledgeEngineService()
+
+
+def test_batch_embeddings_match_single_text_embeddings() -> None:
+    texts = ["Redis queue tuning and redis cluster", "", "postgres VACUUM analyze", "!!"]
+
+    batch = generate_embeddings_batch(texts)
+
+    for text, vector in zip(texts, batch):
+        assert vector == pytest.approx(generate_embeddings(text), abs=1e-12)
+    assert generate_embeddings_batch([]) == []
+
+
+@pytest.mark.asyncio
+async def test_ingest_many_uses_constant_statements_per_batch(service: KnowledgeEngineService) -> None:
+    db = _FakeDB()
+    documents = [KnowledgeIngestRequest(raw_text=f"document {i} " + "lorem ipsum " * 200) for i in range(5)]
+    documents.insert(2, KnowledgeIngestRequest())  # nothing to ingest
+
+    events = [event async for event in service.ingest_many(db, _principal(), documents, batch_size=3)]
+
+    # Two batches: items + scores + chunks per batch, one commit each
+    assert len(db.statements) == 6
+    assert db.commits == 2
+    assert [event["index"] for event in events if event["status"] == "failed"] == [2]
+    ingested = [event for event in events if event["status"] == "ingested"]
+    assert len(ingested) == 5
+    assert all(event["chunk_count"] == 3 for event in ingested)
+
+    chunk_params = [params for sql, params in db.statements if "knowledge_chunks" in sql]
+    assert sum(len(params["ids"]) for params in chunk_params) == 15
+
+
+@pytest.mark.asyncio
+async def test_ingest_updates_loaded_vector_index(service: KnowledgeEngineService) -> None:
+    pytest.importorskip("numpy")
+    from app.modules.knowledge_engine.vector_index import VectorIndexStore
+
+    service._vector_indexes = VectorIndexStore()
+    index = service._vector_indexes.create("tenant-a")
+    db = _FakeDB()
+
+    item, chunk_count = await service.ingest(db, _principal(), KnowledgeIngestRequest(raw_text="redis queue tuning"))
+
+    assert chunk_count == 1
+    assert index.fingerprint == (1, str(NOW))
+    assert index.search(generate_embeddings("redis queue"), 1)[0][0] == item["id"]
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from app.core.auth_deps import Principal, PrincipalType
+from app.modules.knowledge_engine.schemas import KnowledgeItemUpdate
+from app.modules.knowledge_engine.service import KnowledgeEngineService
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _item(item_id: str, title: str, tenant_id: str = "tenant-a") -> dict:
+    return {
+        "id": item_id,
+        "tenant_id": tenant_id,
+        "title": title,
+        "content": title,
+        "type": "note",
+        "tags": [],
+        "visibility": "tenant",
+        "metadata": {},
+        "created_at": NOW,
+        "updated_at": NOW,
+    }
+
+
+class _Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+    def one(self):
+        return self.rows[0]
+
+    def one_or_none(self):
+        return self.rows[0] if self.rows else None
+
+    def scalar_one(self):
+        return 1
+
+
+class _FakeDB:
+    def __init__(self, items):
+        self.items = items
+        self.statements = []
+
+    async def execute(self, statement, params=None):  # noqa: ANN001
+        sql = str(statement)
+        self.statements.append((sql, params))
+        if "ANY(CAST(:item_ids AS uuid[]))" in sql:
+            return _Result([self.items[item_id] for item_id in params["item_ids"] if item_id in self.items])
+        if sql.strip().startswith("SELECT id, tenant_id") or "UPDATE knowledge_items" in sql:
+            return _Result([self.items[params["item_id"]]])
+        if "INSERT INTO knowledge_versions" in sql:
+            return _Result([{"id": str(uuid4()), "item_id": params["item_id"], "version": 1, "diff": {}, "created_at": NOW}])
+        return _Result([])
+
+    async def commit(self):
+        return None
+
+    def hydrations(self) -> int:
+        return sum("ANY(CAST(:item_ids AS uuid[]))" in sql for sql, _ in self.statements)
+
+
+class _FakeQdrant:
+    def __init__(self, points):
+        self.points = points
+
+    def search(self, **_kwargs):
+        return self.points
+
+
+def _point(item_id: str, score: float, tenant_id: str = "tenant-a") -> SimpleNamespace:
+    return SimpleNamespace(payload={"item_id": item_id, "tenant_id": tenant_id}, score=score)
+
+
+def _principal() -> Principal:
+    return Principal(
+        principal_id="operator-1",
+        principal_type=PrincipalType.HUMAN,
+        email="operator@example.com",
+        name="Operator",
+        roles=["operator"],
+        scopes=["read", "write"],
+        tenant_id="tenant-a",
+    )
+
+
+def _service(points) -> KnowledgeEngineService:
+    service = KnowledgeEngineService()
+
+    async def _client():
+        return _FakeQdrant(points)
+
+    service._get_qdrant_client = _client  # type: ignore[method-assign]
+    return service
+
+
+@pytest.mark.asyncio
+async def test_qdrant_search_hydrates_all_hits_with_one_query_and_one_score_upsert() -> None:
+    a, b, c, foreign = (str(uuid4()) for _ in range(4))
+    db = _FakeDB({a: _item(a, "a"), b: _item(b, "b"), c: _item(c, "c")})
+    points = [_point(b, 0.9), _point(b, 0.8), _point(foreign, 0.85, tenant_id="tenant-b"), _point(a, 0.7), _point(c, 0.6)]
+
+    results = await _service(points).semantic_search(db, _principal(), "query", limit=2)
+
+    assert [item["title"] for item in results] == ["b", "a"]
+    assert db.hydrations() == 1
+    assert [params["item_ids"] for sql, params in db.statements if "ANY(" in sql] == [[b, a, c]]
+
+    score_writes = [params for sql, params in db.statements if "INSERT INTO knowledge_scores" in sql]
+    assert len(score_writes) == 1
+    assert score_writes[0]["item_ids"] == [b, a]
+    assert score_writes[0]["scores"] == [0.9, 0.7]
+
+
+@pytest.mark.asyncio
+async def test_hydrated_items_are_cached_until_updated() -> None:
+    a = str(uuid4())
+    db = _FakeDB({a: _item(a, "before")})
+    service = _service([_point(a, 0.9)])
+
+    await service.semantic_search(db, _principal(), "query", limit=5)
+    await service.semantic_search(db, _principal(), "query", limit=5)
+    assert db.hydrations() == 1
+
+    db.items[a] = _item(a, "after")
+    await service.update_knowledge_item(db, _principal(), a, KnowledgeItemUpdate(title="after"))
+    results = await service.semantic_search(db, _principal(), "query", limit=5)
+
+    assert db.hydrations() == 2
+    assert results[0]["title"] == "after"
+
+
+@pytest.mark.asyncio
+async def test_cached_items_respect_tenant_scope() -> None:
+    a = str(uuid4())
+    service = _service([])
+    service._item_cache.put(a, _item(a, "a", tenant_id="tenant-b"))
+    db = _FakeDB({})
+
+    assert await service._get_items_by_ids(db, "tenant-a", [a]) == {}
+    assert db.hydrations() == 0
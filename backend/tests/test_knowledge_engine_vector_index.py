@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.core.auth_deps import Principal, PrincipalType
+from app.modules.knowledge_engine import service as knowledge_service
+from app.modules.knowledge_engine.ingest_service import generate_embeddings
+from app.modules.knowledge_engine.service import KnowledgeEngineService, _cosine
+from app.modules.knowledge_engine.vector_index import VectorIndex, VectorIndexStore
+
+BASE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _random_vectors(count: int, dim: int = 256, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).standard_normal((count, dim)).astype(np.float32)
+
+
+def _brute_force(query, item_ids, vectors, limit):
+    best: dict[str, float] = {}
+    for item_id, vector in zip(item_ids, vectors):
+        score = _cosine(query, vector)
+        if item_id not in best or score > best[item_id]:
+            best[item_id] = score
+    return sorted(best.items(), key=lambda pair: pair[1], reverse=True)[:limit]
+
+
+def test_exact_search_matches_python_cosine_ranking() -> None:
+    items = [str(uuid4()) for _ in range(50)]
+    item_ids = [items[i % 50] for i in range(300)]
+    vectors = _random_vectors(300).tolist()
+    index = VectorIndex(initial_capacity=16)
+    index.add_many(item_ids, vectors)
+    query = _random_vectors(1, seed=1)[0].tolist()
+
+    hits = index.search(query, limit=10)
+    expected = _brute_force(query, item_ids, vectors, 10)
+
+    assert [item_id for item_id, _ in hits] == [item_id for item_id, _ in expected]
+    assert [score for _, score in hits] == pytest.approx([score for _, score in expected], abs=1e-5)
+    assert index.capacity >= 300
+
+
+def test_remove_and_replace_item() -> None:
+    keep, drop = str(uuid4()), str(uuid4())
+    index = VectorIndex()
+    index.add_many([keep, drop], [generate_embeddings("alpha beta"), generate_embeddings("gamma delta")], BASE_TIME)
+
+    assert index.remove_item(drop) == 1
+    assert [item for item, _ in index.search(generate_embeddings("gamma delta"), 5)] == [keep]
+
+    index.replace_item(keep, [generate_embeddings("gamma delta")], BASE_TIME + timedelta(seconds=1))
+    assert index.search(generate_embeddings("gamma delta"), 5)[0] == (keep, pytest.approx(1.0))
+    assert index.fingerprint == (1, str(BASE_TIME + timedelta(seconds=1)))
+
+
+def test_memory_mapped_index_survives_reload(tmp_path) -> None:
+    store = VectorIndexStore(directory=tmp_path)
+    index = store.create("tenant-a", capacity=4)
+    item_ids = [str(uuid4()) for _ in range(10)]
+    index.add_many(item_ids, _random_vectors(10).tolist(), BASE_TIME)
+    index.remove_item(item_ids[0])
+    index.flush()
+
+    reloaded = VectorIndexStore(directory=tmp_path).get("tenant-a")
+    query = _random_vectors(1, seed=3)[0].tolist()
+
+    assert reloaded is not None
+    assert reloaded.fingerprint == index.fingerprint == (9, str(BASE_TIME))
+    assert reloaded.search(query, 5) == index.search(query, 5)
+    assert VectorIndexStore(directory=tmp_path).get("tenant-b") is None
+
+
+def test_ivf_search_has_high_recall() -> None:
+    count = 20_000
+    item_ids = [str(uuid4()) for _ in range(count)]
+    # Clustered data, like real embeddings
+    centers = _random_vectors(64, seed=5)
+    labels = np.random.default_rng(6).integers(0, 64, count)
+    vectors = centers[labels] + 0.3 * _random_vectors(count, seed=7)
+
+    exact = VectorIndex(ann_min_vectors=0, initial_capacity=count)
+    approximate = VectorIndex(ann_min_vectors=1_000, initial_capacity=count)
+    exact.add_many(item_ids, vectors)
+    approximate.add_many(item_ids, vectors)
+
+    recalls = []
+    for seed in range(20):
+        query = (centers[seed] + 0.3 * _random_vectors(1, seed=100 + seed)[0]).tolist()
+        truth = {item for item, _ in exact.search(query, 10)}
+        found = {item for item, _ in approximate.search(query, 10)}
+        recalls.append(len(truth & found) / 10)
+
+    assert approximate._centroids is not None
+    assert sum(recalls) / len(recalls) >= 0.9
+
+
+class _Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+    def one(self):
+        return self.rows[0]
+
+
+class _FakeDB:
+    """Answers the fingerprint, chunk and item queries of the vector index path."""
+
+    def __init__(self, chunks, items):
+        self.chunks = chunks
+        self.items = items
+        self.statements = []
+
+    async def execute(self, statement, params=None):  # noqa: ANN001
+        sql = str(statement)
+        self.statements.append(sql)
+        if "COUNT(*)" in sql:
+            latest = max((chunk["created_at"] for chunk in self.chunks), default=None)
+            return _Result([{"chunk_count": len(self.chunks), "latest_created_at": latest}])
+        if "kc.embedding_json" in sql:
+            return _Result(self.chunks)
+        return _Result([self.items[item_id] for item_id in params["item_ids"] if item_id in self.items])
+
+
+def _principal() -> Principal:
+    return Principal(
+        principal_id="operator-1",
+        principal_type=PrincipalType.HUMAN,
+        email="operator@example.com",
+        name="Operator",
+        roles=["operator"],
+        scopes=["read", "write"],
+        tenant_id="tenant-a",
+    )
+
+
+@pytest.mark.asyncio
+async def test_fallback_search_builds_index_once_and_reuses_it(monkeypatch) -> None:
+    monkeypatch.setattr(knowledge_service, "QDRANT_AVAILABLE", False)
+    texts = {str(uuid4()): text for text in ("redis queue tuning", "postgres vacuum", "redis cluster failover")}
+    chunks = [
+        {"item_id": item_id, "embedding_json": generate_embeddings(text), "created_at": BASE_TIME}
+        for item_id, text in texts.items()
+    ]
+    items = {item_id: {"id": item_id, "tenant_id": "tenant-a", "title": text} for item_id, text in texts.items()}
+    db = _FakeDB(chunks, items)
+    service = KnowledgeEngineService()
+    service._vector_indexes = VectorIndexStore()
+
+    first = await service._semantic_search_fallback(db, _principal(), generate_embeddings("redis queue"), 2)
+    builds = sum("kc.embedding_json" in sql for sql in db.statements)
+    second = await service._semantic_search_fallback(db, _principal(), generate_embeddings("redis queue"), 2)
+
+    assert first[0][1]["title"] == "redis queue tuning"
+    assert [item["id"] for _, item in first] == [item["id"] for _, item in second]
+    assert builds == 1
+    assert sum("kc.embedding_json" in sql for sql in db.statements) == 1  # second search: index only
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import fakeredis.aioredis
+import httpx
+import pytest
+
+import app.modules.llm_router.service as module
+from app.modules.llm_router.cache import LLMResponseCache
+from app.modules.llm_router.health import ProviderHealthTracker
+from app.modules.llm_router.schemas import (
+    ChatMessage,
+    LLMProvider,
+    LLMRequest,
+    LLMResponse,
+    LLMRouterConfig,
+    MessageRole,
+)
+from app.modules.llm_router.service import LLMRouterService
+
+
+def _service_stub(cache: LLMResponseCache | None = None, **config) -> LLMRouterService:
+    service = LLMRouterService.__new__(LLMRouterService)
+    service.config = LLMRouterConfig(default_provider=LLMProvider.OPENAI, **config)
+    service.initialized = True
+    service._http_clients = {}
+    service._stream_samples = {}
+    service._health_cache = {}
+    service.cache = cache or LLMResponseCache()
+    service.health = ProviderHealthTracker()
+    return service
+
+
+def _request(content: str = "ping", temperature: float = 0.0, **metadata) -> LLMRequest:
+    return LLMRequest(
+        messages=[ChatMessage(role=MessageRole.USER, content=content)],
+        temperature=temperature,
+        metadata={"runtime_control_disable": True, **metadata},
+    )
+
+
+class _FakeLiteLLM:
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.calls = 0
+        self.delay = delay
+        self.fail = fail
+
+    async def acompletion(self, model, messages, **kwargs):  # noqa: ANN001
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("provider down")
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=f"pong {self.calls}"), finish_reason="stop")],
+            usage=SimpleNamespace(prompt_tokens=1, completion_tokens=1, total_tokens=2),
+        )
+
+
+def _response(content: str) -> LLMResponse:
+    return LLMResponse(content=content, provider=LLMProvider.OLLAMA, model="ollama/x", metadata={"latency_ms": 5.0})
+
+
+@pytest.mark.asyncio
+async def test_deterministic_requests_are_served_from_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeLiteLLM()
+    monkeypatch.setattr(module, "acompletion", fake.acompletion)
+    service = _service_stub()
+
+    first = await service.chat(_request(), agent_id="agent-a")
+    second = await service.chat(_request(), agent_id="agent-b")
+
+    assert fake.calls == 1
+    assert second.content == first.content == "pong 1"
+    assert second.metadata["cache"] == "hit"
+    assert second.metadata["agent_id"] == "agent-b"
+    stats = service.get_cache_stats()
+    assert (stats.hits, stats.misses, stats.hit_rate) == (1, 1, 0.5)
+    assert stats.latency_saved_ms == pytest.approx(first.metadata["latency_ms"])
+
+
+@pytest.mark.asyncio
+async def test_sampled_requests_bypass_cache_unless_opted_in(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeLiteLLM()
+    monkeypatch.setattr(module, "acompletion", fake.acompletion)
+    service = _service_stub()
+
+    await service.chat(_request(temperature=0.7))
+    await service.chat(_request(temperature=0.7))
+    assert fake.calls == 2
+
+    await service.chat(_request(temperature=0.7, cache=True))
+    await service.chat(_request(temperature=0.7, cache=True))
+    await service.chat(_request(cache=False))
+    assert fake.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_upstream_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeLiteLLM(delay=0.05)
+    monkeypatch.setattr(module, "acompletion", fake.acompletion)
+    service = _service_stub()
+
+    responses = await asyncio.gather(*(service.chat(_request()) for _ in range(5)))
+
+    assert fake.calls == 1
+    assert {r.content for r in responses} == {"pong 1"}
+    assert sorted((r.metadata or {}).get("cache", "miss") for r in responses) == ["coalesced"] * 4 + ["miss"]
+    assert service.get_cache_stats().coalesced == 4
+
+
+@pytest.mark.asyncio
+async def test_failed_call_reaches_every_waiter_and_is_not_cached() -> None:
+    cache = LLMResponseCache()
+    calls = 0
+
+    async def _fail() -> LLMResponse:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise ConnectionError("provider down")
+
+    results = await asyncio.gather(*(cache.get_or_call("k", _fail) for _ in range(3)), return_exceptions=True)
+
+    assert calls == 1
+    assert all(isinstance(r, ConnectionError) for r in results)
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used_and_expires(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = LLMResponseCache(max_entries=2, ttl_seconds=10)
+    for key in ("a", "b"):
+        await cache.get_or_call(key, lambda key=key: asyncio.sleep(0, _response(key)))
+    await cache.get_or_call("a", lambda: asyncio.sleep(0, _response("unused")))  # touch "a"
+    await cache.get_or_call("c", lambda: asyncio.sleep(0, _response("c")))
+
+    assert cache._get_local("b") is None
+    assert cache._get_local("a").content == "a"
+
+    clock = module.time.monotonic() + 11
+    monkeypatch.setattr("app.modules.llm_router.cache.time.monotonic", lambda: clock)
+    assert cache._get_local("a") is None
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_is_shared_between_instances() -> None:
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+    async def _redis():
+        return redis
+
+    await LLMResponseCache(redis_getter=_redis).get_or_call("k", lambda: asyncio.sleep(0, _response("shared")))
+    other = LLMResponseCache(redis_getter=_redis)
+
+    async def _never() -> LLMResponse:
+        raise AssertionError("expected a Redis hit")
+
+    response = await other.get_or_call("k", _never)
+
+    assert response.content == "shared"
+    assert response.metadata["cache"] == "hit"
+
+
+@pytest.mark.asyncio
+async def test_health_check_probes_model_list_and_reuses_result(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def _no_completion(**kwargs):  # noqa: ANN003
+        raise AssertionError("health checks must not run completions")
+
+    monkeypatch.setattr(module, "acompletion", _no_completion)
+    probed = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        probed.append(str(request.url))
+        return httpx.Response(200, json={"models": []})
+
+    service = _service_stub(health_check_ttl=60)
+    service._http_clients[LLMProvider.OLLAMA] = SimpleNamespace(
+        client=httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    )
+
+    first = await service.check_provider_health(LLMProvider.OLLAMA)
+    second = await service.check_provider_health(LLMProvider.OLLAMA)
+    missing_key = await service.check_provider_health(LLMProvider.OPENAI)
+
+    assert first.available and second is first
+    assert probed == ["http://localhost:11434/api/tags"]
+    assert not missing_key.available and "API key" in missing_key.error
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+import app.modules.llm_router.service as module
+from app.modules.llm_router.health import ProviderHealthTracker
+from app.modules.llm_router.schemas import (
+    AnthropicConfig,
+    ChatMessage,
+    LLMProvider,
+    LLMRequest,
+    LLMRouterConfig,
+    MessageRole,
+    OpenAIConfig,
+)
+from app.modules.llm_router.service import LLMRouterService
+
+
+def _service_stub(health: ProviderHealthTracker | None = None, **config) -> LLMRouterService:
+    service = LLMRouterService.__new__(LLMRouterService)
+    service.config = LLMRouterConfig(
+        default_provider=LLMProvider.OPENAI,
+        openai=OpenAIConfig(api_key="sk-test", fallback_providers=[LLMProvider.ANTHROPIC]),
+        anthropic=AnthropicConfig(api_key="sk-test"),
+        **config,
+    )
+    service.initialized = True
+    service._http_clients = {}
+    service._stream_samples = {}
+    service._health_cache = {}
+    service.cache = None
+    service.health = health or ProviderHealthTracker()
+    return service
+
+
+def _request(metadata: dict | None = None, **kwargs) -> LLMRequest:
+    return LLMRequest(
+        messages=[ChatMessage(role=MessageRole.USER, content="hi")],
+        metadata={"runtime_control_disable": True, **(metadata or {})},
+        **kwargs,
+    )
+
+
+class _StubProviders:
+    """acompletion stand-in with per-provider latency and failures (by model prefix)."""
+
+    def __init__(self, delays=None, failing=()):
+        self.delays = delays or {}
+        self.failing = set(failing)
+        self.calls = []
+        self.cancelled = []
+
+    async def acompletion(self, model, messages, **kwargs):  # noqa: ANN001
+        provider = model.split("/")[0]
+        self.calls.append(provider)
+        try:
+            await asyncio.sleep(self.delays.get(provider, 0.0))
+        except asyncio.CancelledError:
+            self.cancelled.append(provider)
+            raise
+        if provider in self.failing:
+            raise ConnectionError(f"{provider} down")
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=f"from {provider}"), finish_reason="stop")],
+            usage=None,
+        )
+
+
+def _seed_latency(health: ProviderHealthTracker, provider: LLMProvider, latency_ms: float, samples: int = 10) -> None:
+    for _ in range(samples):
+        health.record_success(provider, latency_ms)
+
+
+@pytest.mark.asyncio
+async def test_failed_provider_falls_through_candidates_in_policy_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    stubs = _StubProviders(failing={"openai", "anthropic"})
+    monkeypatch.setattr(module, "acompletion", stubs.acompletion)
+    service = _service_stub()
+
+    response = await service.chat(_request())
+
+    assert stubs.calls == ["openai", "anthropic", "ollama"]
+    assert response.provider == LLMProvider.OLLAMA
+    assert response.model == "ollama/llama3.2:latest"
+    assert service.health.get(LLMProvider.OPENAI).consecutive_failures == 1
+
+    # An explicitly requested provider only falls back to Ollama
+    stubs.calls.clear()
+    await service.chat(_request(provider=LLMProvider.OPENAI))
+    assert stubs.calls == ["openai", "ollama"]
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_is_skipped_until_recovery(monkeypatch: pytest.MonkeyPatch) -> None:
+    stubs = _StubProviders(failing={"openai"})
+    monkeypatch.setattr(module, "acompletion", stubs.acompletion)
+    service = _service_stub(health=ProviderHealthTracker(failure_threshold=2, recovery_seconds=30))
+
+    for _ in range(2):
+        await service.chat(_request())
+    assert [s.state for s in service.get_routing_health() if s.provider == LLMProvider.OPENAI] == ["open"]
+
+    stubs.calls.clear()
+    await service.chat(_request())
+    assert stubs.calls == ["anthropic"]
+
+    # After recovery one trial request goes through; success closes the circuit
+    breaker = service.health.get(LLMProvider.OPENAI).breaker
+    breaker.state.next_retry_at = datetime.now(timezone.utc)
+    stubs.failing.clear()
+    stubs.calls.clear()
+    response = await service.chat(_request())
+    assert stubs.calls == ["openai"] and response.provider == LLMProvider.OPENAI
+    assert service.health.get(LLMProvider.OPENAI).state.value == "closed"
+
+
+@pytest.mark.asyncio
+async def test_adaptive_routing_prefers_the_fastest_healthy_candidate(monkeypatch: pytest.MonkeyPatch) -> None:
+    stubs = _StubProviders()
+    monkeypatch.setattr(module, "acompletion", stubs.acompletion)
+    service = _service_stub(adaptive_routing=True)
+    _seed_latency(service.health, LLMProvider.OPENAI, 900.0)
+    _seed_latency(service.health, LLMProvider.ANTHROPIC, 150.0)
+    _seed_latency(service.health, LLMProvider.OLLAMA, 10.0)
+
+    response = await service.chat(_request())
+    assert response.provider == LLMProvider.ANTHROPIC  # Ollama stays the last resort
+
+    route, _ = service._route(_request(provider=LLMProvider.OPENAI), None)
+    assert [provider for provider, _ in route] == [LLMProvider.OPENAI, LLMProvider.OLLAMA]
+
+    # Without adaptive routing the policy order is kept
+    service.config.adaptive_routing = False
+    assert (await service.chat(_request())).provider == LLMProvider.OPENAI
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_starts_backup_after_p95_and_cancels_loser(monkeypatch: pytest.MonkeyPatch) -> None:
+    stubs = _StubProviders(delays={"openai": 1.0, "anthropic": 0.0})
+    monkeypatch.setattr(module, "acompletion", stubs.acompletion)
+    service = _service_stub(enable_hedging=True)
+    _seed_latency(service.health, LLMProvider.OPENAI, 20.0)
+
+    start = time.perf_counter()
+    response = await service.chat(_request())
+    await asyncio.sleep(0)
+
+    assert time.perf_counter() - start < 0.5
+    assert response.provider == LLMProvider.ANTHROPIC
+    assert response.metadata["hedged"] == "backup"
+    assert stubs.calls == ["openai", "anthropic"]
+    assert stubs.cancelled == ["openai"]
+    # A cancelled hedge is not counted against the primary
+    assert service.health.get(LLMProvider.OPENAI).consecutive_failures == 0
+
+    # Hedging can be switched off per request
+    stubs.calls.clear()
+    stubs.delays["openai"] = 0.0
+    await service.chat(_request(metadata={"hedge": False}))
+    assert stubs.calls == ["openai"]
+
+
+@pytest.mark.asyncio
+async def test_deadline_bounds_the_whole_request(monkeypatch: pytest.MonkeyPatch) -> None:
+    stubs = _StubProviders(delays={"openai": 1.0, "ollama": 1.0})
+    monkeypatch.setattr(module, "acompletion", stubs.acompletion)
+    service = _service_stub()
+
+    start = time.perf_counter()
+    with pytest.raises(asyncio.TimeoutError):
+        await service.chat(_request(deadline_ms=50))
+    with pytest.raises(asyncio.TimeoutError):
+        [chunk async for chunk in service.chat_stream(_request(deadline_ms=50))]
+
+    assert time.perf_counter() - start < 0.5
+    assert stubs.calls == ["openai", "openai"]
+
+
+def test_only_provider_side_failures_open_the_circuit() -> None:
+    health = ProviderHealthTracker(failure_threshold=2)
+    bad_request = SimpleNamespace(status_code=400)
+
+    for _ in range(3):
+        health.record_failure(LLMProvider.OPENAI, bad_request)  # type: ignore[arg-type]
+    assert health.get(LLMProvider.OPENAI).state.value == "closed"
+    assert health.get(LLMProvider.OPENAI).error_rate > 0
+
+    health.record_failure(LLMProvider.OPENAI, ConnectionError("refused"))
+    health.record_failure(LLMProvider.OPENAI, SimpleNamespace(status_code=503))  # type: ignore[arg-type]
+    assert health.healthy([LLMProvider.OPENAI, LLMProvider.ANTHROPIC]) == [LLMProvider.ANTHROPIC]
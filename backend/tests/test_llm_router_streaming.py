@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import app.modules.llm_router.service as module
+from app.core.auth_deps import require_auth
+from app.modules.llm_router.health import ProviderHealthTracker
+from app.modules.llm_router.router import router as llm_router_api
+from app.modules.llm_router.schemas import ChatMessage, LLMProvider, LLMRequest, LLMRouterConfig, MessageRole
+from app.modules.llm_router.service import LLMRouterService
+
+
+def _service_stub(default_provider: LLMProvider = LLMProvider.OPENAI) -> LLMRouterService:
+    service = LLMRouterService.__new__(LLMRouterService)
+    service.config = LLMRouterConfig(default_provider=default_provider)
+    service.initialized = True
+    service._http_clients = {}
+    service._stream_samples = {}
+    service.health = ProviderHealthTracker()
+    return service
+
+
+def _request(**kwargs) -> LLMRequest:
+    return LLMRequest(
+        messages=[ChatMessage(role=MessageRole.USER, content="hi")],
+        metadata={"runtime_control_disable": True},
+        **kwargs,
+    )
+
+
+def _chunk(content=None, finish_reason=None, usage=None):
+    choices = [SimpleNamespace(delta=SimpleNamespace(content=content), finish_reason=finish_reason)]
+    return SimpleNamespace(choices=choices if usage is None else [], usage=usage)
+
+
+class _FakeLiteLLM:
+    """Records acompletion calls and streams canned chunks per provider prefix."""
+
+    def __init__(self, failing_prefixes=(), delay: float = 0.0):
+        self.calls = []
+        self.failing_prefixes = failing_prefixes
+        self.delay = delay
+
+    async def acompletion(self, model, messages, stream=False, **kwargs):  # noqa: ANN001
+        self.calls.append({"model": model, "stream": stream, **kwargs})
+        if model.startswith(self.failing_prefixes):
+            raise ConnectionError("provider down")
+        assert stream is True
+
+        async def _chunks():
+            for token in ("Hel", "lo", "!"):
+                await asyncio.sleep(self.delay)
+                yield _chunk(token)
+            yield _chunk(finish_reason="stop")
+            yield _chunk(usage=SimpleNamespace(prompt_tokens=3, completion_tokens=3, total_tokens=6))
+
+        return _chunks()
+
+
+async def _collect(service: LLMRouterService, request: LLMRequest) -> list:
+    return [chunk async for chunk in service.chat_stream(request)]
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_yields_deltas_then_timing(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeLiteLLM(delay=0.01)
+    monkeypatch.setattr(module, "acompletion", fake.acompletion)
+    service = _service_stub()
+
+    chunks = await _collect(service, _request())
+
+    assert [c.content for c in chunks[:-1]] == ["Hel", "lo", "!"]
+    final = chunks[-1]
+    assert final.done and final.finish_reason == "stop"
+    assert final.usage == {"prompt_tokens": 3, "completion_tokens": 3, "total_tokens": 6}
+    assert 0 < final.metadata["ttft_ms"] < final.metadata["latency_ms"]
+    assert final.metadata["tokens_per_second"] > 0
+    [metrics] = service.get_stream_metrics()
+    assert metrics.provider == LLMProvider.OPENAI and metrics.streams == 1
+    assert metrics.ttft_ms_p95 == pytest.approx(final.metadata["ttft_ms"])
+
+
+@pytest.mark.asyncio
+async def test_chat_with_stream_flag_collects_the_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(module, "acompletion", _FakeLiteLLM().acompletion)
+    service = _service_stub()
+
+    response = await service.chat(_request(stream=True))
+
+    assert response.content == "Hello!"
+    assert response.metadata["streamed"] is True
+    assert response.usage["completion_tokens"] == 3
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_falls_back_before_first_token(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeLiteLLM(failing_prefixes=("openai/",))
+    monkeypatch.setattr(module, "acompletion", fake.acompletion)
+    service = _service_stub()
+
+    chunks = await _collect(service, _request())
+
+    assert [call["model"].split("/")[0] for call in fake.calls] == ["openai", "ollama"]
+    assert chunks[-1].provider == LLMProvider.OLLAMA
+    assert "".join(c.content for c in chunks) == "Hello!"
+
+
+@pytest.mark.asyncio
+async def test_pooled_client_is_shared_across_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    fake = _FakeLiteLLM()
+    monkeypatch.setattr(module, "acompletion", fake.acompletion)
+    service = _service_stub(default_provider=LLMProvider.OLLAMA)
+
+    await _collect(service, _request())
+    await _collect(service, _request())
+
+    assert fake.calls[0]["client"] is fake.calls[1]["client"]
+    assert fake.calls[0]["client"] is service._http_clients[LLMProvider.OLLAMA]
+    await service.close()
+    assert service._http_clients == {}
+
+
+def test_chat_route_streams_server_sent_events(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(module, "acompletion", _FakeLiteLLM().acompletion)
+    monkeypatch.setattr(module, "_llm_router", _service_stub())
+    app = FastAPI()
+    app.include_router(llm_router_api)
+    app.dependency_overrides[require_auth] = lambda: None
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/api/llm-router/chat",
+            json={"messages": [{"role": "user", "content": "hi"}], "stream": True, "metadata": {"runtime_control_disable": True}},
+        )
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = [json.loads(line[len("data: "):]) for line in response.text.splitlines() if line.startswith("data: ")]
+    assert [e["content"] for e in events if not e["done"]] == ["Hel", "lo", "!"]
+    assert events[-1]["done"] is True
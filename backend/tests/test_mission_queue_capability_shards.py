@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import time
+
+import pytest
+
+from modules.mission_system.models import AgentRequirement, Mission, MissionPriority, MissionType
+from modules.mission_system.queue import MissionQueueManager
+
+fakeredis = pytest.importorskip("fakeredis")
+
+LOAD_TEST_REDIS_URL = os.getenv("MISSION_QUEUE_TEST_REDIS_URL")
+
+
+def _mission(mission_id: str, skills: list[str], priority: MissionPriority = MissionPriority.NORMAL) -> Mission:
+    return Mission(
+        id=mission_id,
+        name=mission_id,
+        description="capability shard test",
+        mission_type=MissionType.ANALYSIS,
+        priority=priority,
+        agent_requirements=AgentRequirement(agent_type="worker", skills_required=skills),
+    )
+
+
+@pytest.fixture
+def manager() -> MissionQueueManager:
+    queue = MissionQueueManager()
+    queue.redis_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    return queue
+
+
+@pytest.mark.asyncio
+async def test_missions_are_sharded_by_required_capability_set(manager: MissionQueueManager) -> None:
+    await manager.enqueue_mission(_mission("m1", ["python", "sql"]))
+    await manager.enqueue_mission(_mission("m2", ["sql", "python", "sql"]))
+    await manager.enqueue_mission(_mission("m3", []))
+
+    shards = await manager.redis_client.hgetall(manager.QUEUE_SHARDS)
+
+    assert shards == {
+        manager.QUEUE_SHARD_PREFIX + "python,sql": "python,sql",
+        manager.QUEUE_SHARD_PREFIX + "*": "",
+    }
+    assert await manager.redis_client.zcard(manager.QUEUE_SHARD_PREFIX + "python,sql") == 2
+    assert await manager.redis_client.zcard(manager.MISSION_QUEUE) == 3
+
+
+@pytest.mark.asyncio
+async def test_dequeue_pops_best_mission_the_agent_qualifies_for(manager: MissionQueueManager) -> None:
+    await manager.enqueue_mission(_mission("gpu-critical", ["gpu"], MissionPriority.CRITICAL))
+    await manager.enqueue_mission(_mission("python-normal", ["python"]))
+    await manager.enqueue_mission(_mission("python-high", ["python"], MissionPriority.HIGH))
+    await manager.enqueue_mission(_mission("open-normal", []))
+
+    mission = await manager.dequeue_mission("agent-1", ["python", "sql"])
+
+    assert mission.id == "python-high"
+    assert mission.assigned_agent_id == "agent-1"
+    assert await manager.redis_client.hget(manager.AGENT_ASSIGNMENTS, "agent-1") == "python-high"
+    stored = Mission.parse_raw(await manager.redis_client.hget(manager.MISSION_STATE, "python-high"))
+    assert stored.status.value == "assigned"
+
+    # Busy agents get nothing until their assignment is released
+    assert await manager.dequeue_mission("agent-1", ["python"]) is None
+
+    # Equal priorities are served FIFO
+    assert (await manager.dequeue_mission("agent-2", ["python"])).id == "python-normal"
+    assert (await manager.dequeue_mission("agent-3", ["python"])).id == "open-normal"
+    assert await manager.dequeue_mission("agent-4", ["python"]) is None
+    assert (await manager.dequeue_mission("agent-5", ["gpu"])).id == "gpu-critical"
+
+    assert await manager.redis_client.hlen(manager.QUEUE_SHARDS) == 0  # drained shards are dropped
+    assert await manager.redis_client.zcard(manager.MISSION_QUEUE) == 0
+
+
+@pytest.mark.asyncio
+async def test_dequeue_skips_orphaned_queue_entries(manager: MissionQueueManager) -> None:
+    await manager.enqueue_mission(_mission("orphan", ["python"], MissionPriority.URGENT))
+    await manager.enqueue_mission(_mission("valid", ["python"]))
+    await manager.redis_client.hdel(manager.MISSION_STATE, "orphan")
+
+    mission = await manager.dequeue_mission("agent-1", ["python"])
+
+    assert mission.id == "valid"
+    assert await manager.redis_client.zscore(manager.MISSION_QUEUE, "orphan") is None
+
+
+@pytest.mark.asyncio
+async def test_rebuild_moves_legacy_queue_entries_into_shards(manager: MissionQueueManager) -> None:
+    legacy = _mission("legacy", ["python"])
+    await manager.redis_client.hset(manager.MISSION_STATE, legacy.id, legacy.json())
+    await manager.redis_client.zadd(manager.MISSION_QUEUE, {legacy.id: 7})
+
+    assert await manager.rebuild_capability_shards(only_if_missing=True) == 1
+    assert await manager.rebuild_capability_shards(only_if_missing=True) == 0
+    assert (await manager.dequeue_mission("agent-1", ["python"])).id == "legacy"
+
+
+@pytest.mark.skipif(
+    not LOAD_TEST_REDIS_URL,
+    reason="MISSION_QUEUE_TEST_REDIS_URL (redis://...) not set",
+)
+@pytest.mark.asyncio
+async def test_100_agents_drain_100k_missions_without_double_assignment() -> None:
+    import redis.asyncio as redis
+
+    manager = MissionQueueManager(redis_url=LOAD_TEST_REDIS_URL)
+    manager.redis_client = redis.from_url(LOAD_TEST_REDIS_URL, encoding="utf-8", decode_responses=True)
+    await manager.redis_client.flushdb()
+
+    skills = ["python", "sql", "gpu", "web", "nlp", "vision"]
+    rng = random.Random(7)
+    missions, agents = 100_000, 100
+
+    try:
+        pipe = manager.redis_client.pipeline(transaction=False)
+        for i in range(missions):
+            mission = _mission(
+                f"load-{i}",
+                rng.sample(skills, rng.randint(0, 2)),
+                rng.choice(list(MissionPriority)),
+            )
+            pipe.hset(manager.MISSION_STATE, mission.id, mission.json())
+            manager._queue_mission(pipe, mission, manager._queue_score(mission))
+            if i % 5000 == 4999:
+                await pipe.execute()
+        await pipe.execute()
+
+        assigned: list[str] = []
+
+        async def _agent(n: int) -> None:
+            agent_id = f"agent-{n}"
+            while True:
+                # every agent holds all skills, so the queue fully drains
+                mission = await manager.dequeue_mission(agent_id, skills)
+                if mission is None:
+                    return
+                assigned.append(mission.id)
+                await manager.redis_client.hdel(manager.AGENT_ASSIGNMENTS, agent_id)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(_agent(n) for n in range(agents)))
+        elapsed = time.perf_counter() - start
+
+        assert len(assigned) == missions
+        assert len(set(assigned)) == missions  # no mission assigned twice
+        print(f"{agents} agents drained {missions} missions in {elapsed:.2f}s ({missions / elapsed:.0f}/s)")
+    finally:
+        await manager.redis_client.flushdb()
+        await manager.redis_client.close()
@@ -0,0 +1,204 @@
+"""
+Tests for the compiled policy decision index.
+
+Covers: equivalence with straightforward priority-ordered evaluation,
+action bucketing (exact / prefix / wildcard), the decision LRU and its
+invalidation. Timings are in scripts/benchmark_policy_decision_index.py.
+"""
+
+import fnmatch
+import random
+import re
+
+import pytest
+
+import app.modules.policy.service as policy_service
+from app.modules.policy.decision_index import PolicyDecisionIndex
+from app.modules.policy.schemas import (
+    Policy,
+    PolicyCondition,
+    PolicyConditionOperator,
+    PolicyEffect,
+    PolicyEvaluationContext,
+    PolicyRule,
+)
+from app.modules.policy.service import PolicyEngine
+
+
+ACTIONS = ["data.read", "data.write", "data.delete", "robot.move", "robot.stop", "mission.create"]
+ACTION_PATTERNS = ["*", "data.*", "data.read", "robot.*", "robot.?ove", "mission.create", "*.delete"]
+RESOURCE_PATTERNS = ["*", "zone_a", "zone_*"]
+ROLES = ["admin", "guest", "fleet_member", None]
+
+
+def _policy(
+    policy_id: str,
+    rules: list,
+    action_pattern: str = "*",
+    resource_pattern: str = "*",
+    default_effect: PolicyEffect = PolicyEffect.DENY,
+) -> Policy:
+    return Policy(
+        policy_id=policy_id,
+        name=policy_id,
+        rules=rules,
+        default_effect=default_effect,
+        metadata={"action_pattern": action_pattern, "resource_pattern": resource_pattern},
+    )
+
+
+def _rule(rule_id: str, priority: int, effect: PolicyEffect = PolicyEffect.ALLOW, **conditions) -> PolicyRule:
+    return PolicyRule(
+        rule_id=rule_id,
+        name=rule_id,
+        effect=effect,
+        priority=priority,
+        conditions=[
+            PolicyCondition(field=field.replace("__", "."), operator=operator, value=value)
+            for field, (operator, value) in conditions.items()
+        ],
+    )
+
+
+def _reference_decision(policies: list, context: PolicyEvaluationContext):
+    """Uncompiled evaluation: fnmatch every policy, sort every rule"""
+
+    def field_value(name):
+        root, _, key = name.partition(".")
+        if not key:
+            return getattr(context, name, None)
+        if root == "agent":
+            return getattr(context, f"agent_{key}", None)
+        return getattr(context, root).get(key)
+
+    def condition_matches(condition):
+        value = field_value(condition.field)
+        op, expected = condition.operator, condition.value
+        if op == PolicyConditionOperator.EQUALS:
+            return value == expected
+        if op == PolicyConditionOperator.MATCHES:
+            return value is not None and bool(re.match(expected, str(value)))
+        if op == PolicyConditionOperator.IN:
+            return value in expected
+        raise AssertionError(op)
+
+    active = [
+        p for p in policies
+        if fnmatch.fnmatch(context.resource or "*", p.metadata["resource_pattern"])
+        and fnmatch.fnmatch(context.action, p.metadata["action_pattern"])
+    ]
+    if not active:
+        return None, None
+    rules = sorted(((p, r) for p in active for r in p.rules if r.enabled), key=lambda pr: pr[1].priority, reverse=True)
+    for policy, rule in rules:
+        if all(condition_matches(c) for c in rule.conditions):
+            return policy.policy_id, rule.rule_id
+    default = sorted(active, key=lambda p: p.rules[0].priority if p.rules else 0, reverse=True)[0]
+    return default.policy_id, None
+
+
+def _random_policies(rng: random.Random, count: int) -> list:
+    policies = []
+    for i in range(count):
+        rules = []
+        for j in range(rng.randint(0, 3)):
+            conditions = {}
+            if rng.random() < 0.6:
+                conditions["agent__role"] = (PolicyConditionOperator.EQUALS, rng.choice(ROLES[:-1]))
+            if rng.random() < 0.3:
+                conditions["environment__region"] = (PolicyConditionOperator.IN, rng.sample(["eu", "us", "ap"], 2))
+            if rng.random() < 0.2:
+                conditions["agent_id"] = (PolicyConditionOperator.MATCHES, r"robot_\d+")
+            rules.append(
+                _rule(f"r{i}_{j}", rng.randint(0, 5), rng.choice(list(PolicyEffect)), **conditions)
+            )
+        policies.append(
+            _policy(
+                f"p{i}",
+                rules,
+                action_pattern=rng.choice(ACTION_PATTERNS),
+                resource_pattern=rng.choice(RESOURCE_PATTERNS),
+            )
+        )
+    return policies
+
+
+def _random_context(rng: random.Random) -> PolicyEvaluationContext:
+    return PolicyEvaluationContext(
+        agent_id=rng.choice(["robot_1", "robot_22", "human_7"]),
+        agent_role=rng.choice(ROLES),
+        action=rng.choice(ACTIONS),
+        resource=rng.choice(["zone_a", "zone_b", "depot", None]),
+        environment={"region": rng.choice(["eu", "us", "ap"])},
+    )
+
+
+def test_index_matches_uncompiled_evaluation_order() -> None:
+    rng = random.Random(11)
+    for _ in range(20):
+        policies = _random_policies(rng, rng.randint(1, 25))
+        index = PolicyDecisionIndex(policies)
+        for _ in range(50):
+            context = _random_context(rng)
+            decision = index.decide(context)
+            got = (
+                decision.policy.policy_id if decision.policy else None,
+                decision.rule.rule_id if decision.rule else None,
+            )
+            assert got == _reference_decision(policies, context), context
+
+
+def test_lookup_only_considers_matching_action_buckets() -> None:
+    index = PolicyDecisionIndex(
+        [
+            _policy("exact", [_rule("read", 1)], action_pattern="data.read"),
+            _policy("prefix", [_rule("data", 5, PolicyEffect.DENY)], action_pattern="data.*"),
+            _policy("glob", [_rule("robots", 9)], action_pattern="robot.?ove"),
+        ]
+    )
+
+    assert [b.rules[0].rule.rule_id for b in index._candidate_buckets("data.read")] == ["read", "data"]
+    assert [b.rules[0].rule.rule_id for b in index._candidate_buckets("robot.move")] == ["robots"]
+    assert index._candidate_buckets("mission.create") == []
+
+    decision = index.decide(PolicyEvaluationContext(agent_id="a", action="data.read"))
+    assert decision.rule.rule_id == "data"  # higher priority wins across buckets
+
+
+def test_decision_cache_is_keyed_by_condition_fields_and_bounded() -> None:
+    index = PolicyDecisionIndex(
+        [_policy("roles", [_rule("admin", 10, agent__role=(PolicyConditionOperator.EQUALS, "admin"))])],
+        cache_size=2,
+    )
+
+    admin = PolicyEvaluationContext(agent_id="a1", agent_role="admin", action="data.read")
+    guest = PolicyEvaluationContext(agent_id="a2", agent_role="guest", action="data.read")
+    assert index.decide(admin).rule.rule_id == "admin"
+    assert index.decide(guest).rule is None
+    # agent_id is not read by any condition, so another admin shares the entry
+    assert index.decide(admin.model_copy(update={"agent_id": "a3"})).rule.rule_id == "admin"
+    assert (index.cache_hits, index.cache_misses) == (1, 2)
+
+    index.decide(PolicyEvaluationContext(agent_id="a", action="data.write"))
+    assert len(index._cache) == 2
+
+    unhashable = PolicyEvaluationContext(agent_id="a", action="x", params={"tags": ["a"]})
+    assert index._cache_key(unhashable) is not None  # params.tags isn't a condition field
+
+
+@pytest.mark.asyncio
+async def test_engine_rebuilds_index_after_invalidation(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(policy_service, "FOUNDATION_AVAILABLE", False)
+    engine = PolicyEngine()
+    engine._policy_cache = {"deny": _policy("deny", [_rule("deny_all", 1, PolicyEffect.DENY)])}
+    context = PolicyEvaluationContext(agent_id="a", action="data.read")
+
+    assert (await engine.evaluate(context)).allowed is False
+    assert (await engine.evaluate(context)).matched_rule == "deny_all"
+    assert (await engine.get_cache_stats())["decision_cache_hits"] == 1
+
+    await engine._invalidate_cache()
+    engine._policy_cache = {"allow": _policy("allow", [_rule("allow_all", 1)])}
+
+    result = await engine.evaluate(context)
+    assert result.allowed is True and result.matched_rule == "allow_all"
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.modules.task_queue.models import TaskModel, TaskStatus
+from app.modules.task_queue.service import TaskQueueService
+
+LOAD_TEST_DATABASE_URL = os.getenv("TASK_QUEUE_TEST_DATABASE_URL")
+
+
+def _task(task_id: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        task_id=task_id,
+        status=TaskStatus.PENDING,
+        scheduled_at=None,
+        created_at=datetime.now(timezone.utc).replace(tzinfo=None),
+        priority=50,
+        claimed_by=None,
+        claimed_at=None,
+        updated_at=None,
+        wait_time_ms=None,
+    )
+
+
+class _Scalars:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+
+class _Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalars(self):
+        return _Scalars(self.rows)
+
+
+class _FakeDB:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+        self.commit_calls = 0
+
+    async def execute(self, query):  # noqa: ANN001
+        self.queries.append(query)
+        return _Result(self.rows)
+
+    async def commit(self):
+        self.commit_calls += 1
+
+
+def _sql(query) -> str:  # noqa: ANN001
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_claim_tasks_claims_whole_batch_with_one_query_and_commit() -> None:
+    tasks = [_task("task-1"), _task("task-2"), _task("task-3")]
+    db = _FakeDB(tasks)
+
+    claimed = await TaskQueueService().claim_tasks(db=db, agent_id="openclaw-agent-1", limit=3)
+
+    assert claimed == tasks
+    assert len(db.queries) == 1
+    assert db.commit_calls == 1
+    assert all(task.status == TaskStatus.CLAIMED for task in tasks)
+    assert all(task.claimed_by == "openclaw-agent-1" for task in tasks)
+
+
+@pytest.mark.asyncio
+async def test_claim_tasks_query_skips_locked_rows_and_filters_eligibility() -> None:
+    db = _FakeDB([])
+
+    claimed = await TaskQueueService().claim_tasks(db=db, agent_id="miniworker-1", limit=5)
+
+    assert claimed == []
+    assert db.commit_calls == 0
+    sql = _sql(db.queries[0])
+    assert "FOR UPDATE OF tasks SKIP LOCKED" in sql
+    assert "tasks.remaining_dependencies = " in sql  # dependency readiness
+    assert "tasks.config ->>" in sql  # required worker filter
+    assert "LIMIT" in sql
+
+
+@pytest.mark.skipif(
+    not LOAD_TEST_DATABASE_URL,
+    reason="TASK_QUEUE_TEST_DATABASE_URL (postgresql+asyncpg://...) not set",
+)
+@pytest.mark.asyncio
+async def test_concurrent_claimers_never_double_claim() -> None:
+    from sqlalchemy import delete
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    engine = create_async_engine(LOAD_TEST_DATABASE_URL, pool_size=50, max_overflow=10)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    service = TaskQueueService()
+
+    async with engine.begin() as conn:
+        await conn.run_sync(TaskModel.metadata.create_all)
+
+    async def _seed(count: int) -> None:
+        async with session_factory() as db:
+            await db.execute(delete(TaskModel))
+            db.add_all(
+                TaskModel(task_id=f"load-{i}", name=f"load {i}", priority=50, depends_on=[])
+                for i in range(count)
+            )
+            await db.commit()
+
+    async def _drain(claimers: int) -> tuple[list, float]:
+        claimed: list = []
+
+        async def _claimer(n: int) -> None:
+            async with session_factory() as db:
+                while True:
+                    tasks = await service.claim_tasks(db=db, agent_id=f"load-agent-{n}", limit=5)
+                    if not tasks:
+                        return
+                    claimed.extend(task.task_id for task in tasks)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(_claimer(n) for n in range(claimers)))
+        return claimed, time.perf_counter() - start
+
+    try:
+        await _seed(500)
+        _, single_seconds = await _drain(1)
+
+        await _seed(500)
+        claimed, concurrent_seconds = await _drain(50)
+
+        assert len(claimed) == 500
+        assert len(set(claimed)) == 500  # no task claimed twice
+        assert 500 / concurrent_seconds >= 500 / single_seconds
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(TaskModel.metadata.drop_all)
+        await engine.dispose()
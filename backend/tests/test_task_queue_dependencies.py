@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import os
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.modules.task_queue.models import TaskModel, TaskStatus
+from app.modules.task_queue.schemas import TaskComplete, TaskCreate, TaskFail
+from app.modules.task_queue.service import TaskQueueService
+
+LOAD_TEST_DATABASE_URL = os.getenv("TASK_QUEUE_TEST_DATABASE_URL")
+
+
+class _Result:
+    def __init__(self, task=None, rows=None):
+        self.task = task
+        self.rows = rows or []
+
+    def scalar_one_or_none(self):
+        return self.task
+
+    def all(self):
+        return self.rows
+
+
+class _FakeDB:
+    def __init__(self, task=None, dependency_rows=None):
+        self.task = task
+        self.dependency_rows = dependency_rows or []
+        self.queries = []
+        self.added = []
+        self.commit_calls = 0
+
+    async def execute(self, query):  # noqa: ANN001
+        self.queries.append(query)
+        if self.task is None and len(self.queries) == 2:
+            return _Result(rows=self.dependency_rows)
+        return _Result(task=self.task)
+
+    def add(self, row):  # noqa: ANN001
+        self.added.append(row)
+
+    async def commit(self):
+        self.commit_calls += 1
+
+    async def refresh(self, _row):  # noqa: ANN001
+        return None
+
+
+def _sql(query) -> str:  # noqa: ANN001
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+def _running_task(task_id: str, status: TaskStatus = TaskStatus.RUNNING) -> SimpleNamespace:
+    return SimpleNamespace(
+        task_id=task_id,
+        claimed_by="agent-1",
+        status=status,
+        started_at=datetime.now(timezone.utc).replace(tzinfo=None),
+        completed_at=None,
+        result=None,
+        error_message=None,
+        error_details=None,
+        execution_time_ms=None,
+        wait_time_ms=None,
+        retry_count=0,
+        max_retries=0,
+        retry_delay_seconds=60,
+        scheduled_at=None,
+        skill_run_id=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_task_counts_unfinished_dependencies() -> None:
+    db = _FakeDB(dependency_rows=[("a", TaskStatus.COMPLETED), ("b", TaskStatus.RUNNING)])
+
+    task = await TaskQueueService().create_task(
+        db, TaskCreate(task_id="c", name="c", depends_on=["a", "b", "missing"])
+    )
+
+    assert task.remaining_dependencies == 1
+    assert task.status == TaskStatus.PENDING
+
+
+@pytest.mark.asyncio
+async def test_create_task_locks_dependency_rows_until_commit() -> None:
+    db = _FakeDB(dependency_rows=[("a", TaskStatus.RUNNING)])
+
+    await TaskQueueService().create_task(db, TaskCreate(task_id="c", name="c", depends_on=["a"]))
+
+    # A completion of "a" must wait for this insert to commit, otherwise its
+    # counter release misses the new task
+    assert _sql(db.queries[1]).endswith("FOR SHARE")
+    assert db.commit_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_create_task_with_failed_dependency_is_cancelled() -> None:
+    db = _FakeDB(dependency_rows=[("a", TaskStatus.FAILED)])
+
+    task = await TaskQueueService().create_task(
+        db, TaskCreate(task_id="c", name="c", depends_on=["a"])
+    )
+
+    assert task.status == TaskStatus.CANCELLED
+    assert task.error_details["cascade_from"] == "a"
+
+
+@pytest.mark.asyncio
+async def test_complete_task_releases_dependents_once() -> None:
+    task = _running_task("a")
+    db = _FakeDB(task=task)
+    service = TaskQueueService()
+
+    await service.complete_task(db, "a", "agent-1", TaskComplete(result={}))
+
+    release = _sql(db.queries[1])
+    assert release.startswith("UPDATE tasks SET remaining_dependencies=(tasks.remaining_dependencies - ")
+    assert "tasks.depends_on ? " in release
+
+    await service.complete_task(db, "a", "agent-1", TaskComplete(result={}))
+    assert len(db.queries) == 3  # second completion only re-reads the task
+
+
+@pytest.mark.asyncio
+async def test_terminal_failure_cascades_to_dependents() -> None:
+    db = _FakeDB(task=_running_task("a"))
+
+    await TaskQueueService().fail_task(db, "a", "agent-1", TaskFail(error_message="boom", retry=False))
+
+    cascade = _sql(db.queries[1])
+    assert cascade.startswith("WITH RECURSIVE blocked")
+    assert "UPDATE tasks SET status=" in cascade
+
+
+@pytest.mark.asyncio
+async def test_repeated_fallback_finalize_releases_dependents_once() -> None:
+    class _FallbackDB(_FakeDB):
+        finalized = False
+
+        async def execute(self, query):  # noqa: ANN001
+            self.queries.append(query)
+            sql = _sql(query)
+            if sql.startswith("UPDATE tasks SET status="):
+                # NOT IN (terminal statuses) only matches until the first update
+                changed, self.finalized = not self.finalized, True
+                return SimpleNamespace(rowcount=int(changed))
+            if "FROM skill_runs" in sql:
+                return _Result()
+            return _Result(task=self.task)
+
+    db = _FallbackDB(task=_running_task("a"))
+    service = TaskQueueService()
+
+    for _ in range(2):
+        await service._fallback_finalize_linked_skill_run(db=db, task_id="a", skill_run_id=uuid4(), success=True)
+
+    finalize = _sql(db.queries[1])
+    assert "tasks.status NOT IN" in finalize
+    releases = [q for q in db.queries if _sql(q).startswith("UPDATE tasks SET remaining_dependencies=")]
+    assert len(releases) == 1
+
+
+@pytest.mark.asyncio
+async def test_cancel_task_cascades_and_reports_previous_status() -> None:
+    events = []
+
+    class _Stream:
+        async def publish(self, event):  # noqa: ANN001
+            events.append(event)
+
+    db = _FakeDB(task=_running_task("a", status=TaskStatus.PENDING))
+
+    assert await TaskQueueService(event_stream=_Stream()).cancel_task(db, "a", "operator")
+
+    assert _sql(db.queries[1]).startswith("WITH RECURSIVE blocked")
+    assert events[0]["data"]["previous_status"] == "pending"
+
+
+@pytest.mark.skipif(
+    not LOAD_TEST_DATABASE_URL,
+    reason="TASK_QUEUE_TEST_DATABASE_URL (postgresql+asyncpg://...) not set",
+)
+@pytest.mark.asyncio
+async def test_10k_node_dag_drains_in_dependency_order() -> None:
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    engine = create_async_engine(LOAD_TEST_DATABASE_URL)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    service = TaskQueueService()
+
+    # 100 layers x 100 nodes, each node depends on two nodes of the previous layer
+    layers, width = 100, 100
+
+    async with engine.begin() as conn:
+        await conn.run_sync(TaskModel.metadata.drop_all)
+        await conn.run_sync(TaskModel.metadata.create_all)
+
+    try:
+        async with session_factory() as db:
+            db.add_all(
+                TaskModel(
+                    task_id=f"n-{layer}-{i}",
+                    name=f"n-{layer}-{i}",
+                    depends_on=(
+                        [f"n-{layer - 1}-{i}", f"n-{layer - 1}-{(i + 1) % width}"]
+                        if layer
+                        else []
+                    ),
+                    remaining_dependencies=2 if layer else 0,
+                )
+                for layer in range(layers)
+                for i in range(width)
+            )
+            await db.commit()
+
+            completed = set()
+            start = time.perf_counter()
+            while True:
+                tasks = await service.claim_tasks(db, agent_id="dag-agent", limit=100)
+                if not tasks:
+                    break
+                for task in tasks:
+                    assert all(dep in completed for dep in task.depends_on)
+                    await service.complete_task(db, task.task_id, "dag-agent", TaskComplete(result={}))
+                    completed.add(task.task_id)
+            elapsed = time.perf_counter() - start
+
+        assert len(completed) == layers * width
+        print(f"10k-node DAG drained in {elapsed:.2f}s ({len(completed) / elapsed:.0f} tasks/s)")
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(TaskModel.metadata.drop_all)
+        await engine.dispose()
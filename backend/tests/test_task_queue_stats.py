@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from app.modules.task_queue.models import TaskStatus
+from app.modules.task_queue.service import TaskQueueService
+from app.modules.task_queue.stats import LatencyHistogram, TaskQueueStatsEngine
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_histogram_percentiles_within_bucket_error() -> None:
+    histogram = LatencyHistogram()
+    for value in range(1, 1001):
+        histogram.add(float(value))
+
+    assert histogram.percentile(0.50) == pytest.approx(500, rel=0.1)
+    assert histogram.percentile(0.95) == pytest.approx(950, rel=0.1)
+    assert histogram.percentile(0.99) == pytest.approx(990, rel=0.1)
+    assert histogram.mean() == pytest.approx(500.5)
+    assert LatencyHistogram().percentile(0.5) is None
+
+
+def test_engine_throughput_and_window_eviction() -> None:
+    clock = _Clock()
+    engine = TaskQueueStatsEngine(window_seconds=60, bucket_seconds=10, clock=clock)
+
+    for _ in range(30):
+        engine.record_claim("generic", 50, wait_time_ms=100.0)
+        engine.record_completion("generic", 50, execution_time_ms=200.0)
+    clock.now += 50
+
+    snapshot = engine.get_snapshot()
+    assert snapshot["completed"] == 30
+    assert snapshot["throughput_per_minute"] == pytest.approx(36.0)  # 30 in the first 50s
+    assert snapshot["wait_time_percentiles_ms"]["p50"] == pytest.approx(100, rel=0.1)
+
+    clock.now += 10
+    assert engine.get_snapshot()["completed"] == 0
+
+
+def test_engine_filters_by_task_type_and_priority() -> None:
+    engine = TaskQueueStatsEngine(clock=_Clock())
+    engine.record_claim("a", 25, wait_time_ms=1.0)
+    engine.record_claim("b", 75, wait_time_ms=1.0)
+    engine.record_failure("b", 75, retrying=True)
+    engine.record_failure("b", 75)
+
+    assert engine.aggregate(task_type="a").claimed == 1
+    assert engine.aggregate(min_priority=50).claimed == 1
+    assert engine.aggregate(task_type="b").retried == 1
+    assert engine.aggregate(task_type="b").failed == 1
+
+
+def test_wait_estimate_uses_claim_rate() -> None:
+    clock = _Clock()
+    engine = TaskQueueStatsEngine(window_seconds=60, bucket_seconds=10, clock=clock)
+
+    assert engine.estimate_wait_seconds(10) is None
+    assert engine.estimate_wait_seconds(0) == 0.0
+
+    clock.now += 40
+    for _ in range(120):
+        engine.record_claim("generic", 50, wait_time_ms=None)
+    clock.now += 20
+
+    assert engine.estimate_wait_seconds(10) == pytest.approx(5.0)  # 2 claims/s
+
+
+class _Result:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+
+class _FakeDB:
+    def __init__(self, rows):
+        self.rows = rows
+        self.execute_calls = 0
+
+    async def execute(self, _query):  # noqa: ANN001
+        self.execute_calls += 1
+        return _Result(self.rows)
+
+
+@pytest.mark.asyncio
+async def test_queue_stats_are_cached_and_include_per_priority_eta() -> None:
+    clock = _Clock()
+    service = TaskQueueService()
+    service.stats = TaskQueueStatsEngine(window_seconds=60, bucket_seconds=10, clock=clock)
+    clock.now += 50
+    for _ in range(60):
+        service.stats.record_claim("generic", 50, wait_time_ms=None)
+
+    oldest = datetime(2026, 1, 1)
+    db = _FakeDB([(100, 2, oldest), (50, 8, datetime(2026, 1, 2))])
+    clock.now += 10
+
+    stats = await service.get_queue_stats(db)
+    await service.get_queue_stats(db)
+
+    assert db.execute_calls == 1
+    assert stats.queue_length == 10
+    assert stats.oldest_pending == oldest
+    assert stats.estimated_wait_seconds == 10  # 10 tasks ahead at 1 claim/s
+    assert stats.estimated_wait_seconds_by_priority[100] == 2
+    assert stats.estimated_wait_seconds_by_priority[10] == 10
+
+
+@pytest.mark.asyncio
+async def test_task_stats_combine_cached_counts_and_rolling_window() -> None:
+    service = TaskQueueService()
+    service.stats.record_completion("generic", 50, execution_time_ms=40.0)
+    db = _FakeDB([(TaskStatus.PENDING, 3), (TaskStatus.COMPLETED, 5)])
+
+    stats = await service.get_stats(db)
+
+    assert stats.total_tasks == 8
+    assert stats.pending_count == 3
+    assert stats.throughput_per_minute is not None
+    assert stats.execution_time_percentiles_ms["p99"] == pytest.approx(40, rel=0.1)
@@ -0,0 +1,141 @@
+"""
+Tests for BaseWorker task consumption.
+
+Covers: concurrent dispatch up to the concurrency limit, reliable-queue
+acknowledgement and orphan recovery, graceful drain on stop(). Throughput is measured by
+scripts/benchmark_worker_throughput.py.
+"""
+
+import asyncio
+import json
+import time
+
+import fakeredis
+import fakeredis.aioredis
+import pytest
+
+from app.workers.base_worker import BaseWorker
+
+QUEUE = "brain:test_tasks"
+
+
+class _StubWorker(BaseWorker):
+    """process_task that just awaits (I/O-bound) and tracks parallelism"""
+
+    def __init__(self, server: fakeredis.FakeServer, delay: float = 0.05, **kwargs):
+        super().__init__(queue_name=QUEUE, block_timeout=0.05, **kwargs)
+        self.redis = fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self.seen = []
+
+    async def process_task(self, task):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        self.seen.append(task["id"])
+        return {"ok": True}
+
+
+def _client(server: fakeredis.FakeServer) -> fakeredis.aioredis.FakeRedis:
+    return fakeredis.aioredis.FakeRedis(server=server, decode_responses=True)
+
+
+async def _push(redis, count: int, queue: str = QUEUE) -> None:
+    await redis.rpush(queue, *(json.dumps({"id": f"t{i}", "type": "stub", "payload": {}}) for i in range(count)))
+
+
+async def _run_until(worker: BaseWorker, condition, timeout: float = 5.0) -> asyncio.Task:
+    runner = asyncio.create_task(worker.start())
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        assert time.perf_counter() < deadline, "condition not reached"
+        await asyncio.sleep(0.005)
+    return runner
+
+
+@pytest.mark.asyncio
+async def test_tasks_run_concurrently_up_to_the_limit() -> None:
+    server = fakeredis.FakeServer()
+    redis = _client(server)
+    await _push(redis, 20)
+    worker = _StubWorker(server, worker_id="w1", concurrency=5)
+
+    start = time.perf_counter()
+    runner = await _run_until(worker, lambda: worker.tasks_processed == 20)
+    elapsed = time.perf_counter() - start
+    await worker.stop()
+    await runner
+
+    assert worker.max_active == 5
+    assert elapsed < 20 * worker.delay / 2  # sequential would take 1s
+    assert sorted(worker.seen) == sorted(f"t{i}" for i in range(20))
+    assert await redis.llen(f"{QUEUE}:processing:w1") == 0
+    assert json.loads(await redis.get("brain:task:t0:result"))["success"] is True
+    assert await redis.get("brain:worker:w1:heartbeat") is None
+
+
+@pytest.mark.asyncio
+async def test_orphaned_tasks_of_dead_workers_are_requeued() -> None:
+    server = fakeredis.FakeServer()
+    redis = _client(server)
+    await _push(redis, 3)
+    # A worker without heartbeat crashed holding two tasks
+    for _ in range(2):
+        await redis.lmove(QUEUE, f"{QUEUE}:processing:dead", "LEFT", "LEFT")
+    # A live worker's in-flight task must not be touched
+    await _push(redis, 1, queue=f"{QUEUE}:processing:alive")
+    await redis.setex("brain:worker:alive:heartbeat", 60, "{}")
+
+    worker = _StubWorker(server, worker_id="w1", concurrency=1, delay=0.0)
+    runner = await _run_until(worker, lambda: worker.tasks_processed == 3)
+    await worker.stop()
+    await runner
+
+    assert worker.tasks_recovered == 2
+    assert worker.seen == ["t0", "t1", "t2"]  # recovered tasks keep their order
+    assert await redis.llen(f"{QUEUE}:processing:dead") == 0
+    assert await redis.llen(f"{QUEUE}:processing:alive") == 1
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_in_flight_tasks() -> None:
+    server = fakeredis.FakeServer()
+    redis = _client(server)
+    await _push(redis, 3)
+    worker = _StubWorker(server, worker_id="w1", concurrency=3, delay=0.2)
+
+    runner = await _run_until(worker, lambda: worker.active == 3)
+    await worker.stop()
+    await runner
+
+    assert worker.tasks_processed == 3
+    assert await redis.llen(f"{QUEUE}:processing:w1") == 0
+
+
+@pytest.mark.asyncio
+async def test_tasks_cut_off_by_drain_timeout_stay_in_processing_list() -> None:
+    server = fakeredis.FakeServer()
+    redis = _client(server)
+    await _push(redis, 1)
+    worker = _StubWorker(server, worker_id="w1", concurrency=1, delay=10.0, drain_timeout=0.05)
+
+    runner = await _run_until(worker, lambda: worker.active == 1)
+    await worker.stop()
+    await runner
+
+    assert worker.tasks_processed == 0
+    assert await redis.lrange(f"{QUEUE}:processing:w1", 0, -1) == [
+        json.dumps({"id": "t0", "type": "stub", "payload": {}})
+    ]
+
+    # The next incarnation of the worker picks it up again
+    restarted = _StubWorker(server, worker_id="w1", concurrency=1, delay=0.0)
+    runner = await _run_until(restarted, lambda: restarted.tasks_processed == 1)
+    await restarted.stop()
+    await runner
+    assert restarted.seen == ["t0"]